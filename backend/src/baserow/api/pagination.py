@@ -1,6 +1,15 @@
-from typing import Protocol
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, List, Protocol, Tuple
+from uuid import UUID
 
 from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import F, Q, QuerySet
+from django.db.models.expressions import OrderBy
 
 from rest_framework.exceptions import APIException
 from rest_framework.pagination import (
@@ -150,3 +159,254 @@ class LimitOffsetPaginationWithoutCount(LimitOffsetPagination):
                 "results": schema,
             },
         }
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    """
+    Converts a sort key value into something that can be JSON encoded, tagging the
+    types that JSON doesn't support so that they can be restored exactly.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_encode_cursor_value(v) for v in value]
+    if isinstance(value, Decimal):
+        return {"t": "decimal", "v": str(value)}
+    if isinstance(value, datetime):
+        return {"t": "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": "date", "v": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": "time", "v": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"t": "timedelta", "v": value.total_seconds()}
+    if isinstance(value, UUID):
+        return {"t": "uuid", "v": str(value)}
+    return {"t": "json", "v": value}
+
+
+_CURSOR_VALUE_DECODERS = {
+    "decimal": Decimal,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+    "timedelta": lambda v: timedelta(seconds=v),
+    "uuid": UUID,
+    "json": lambda v: v,
+}
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_cursor_value(v) for v in value]
+    if isinstance(value, dict):
+        return _CURSOR_VALUE_DECODERS[value["t"]](value["v"])
+    return value
+
+
+class CursorPagination(PageNumberPagination):
+    """
+    Keyset pagination that, instead of skipping an offset, continues right after the
+    sort key values of the last row of the previous page. Fetching any page is
+    therefore as fast as fetching the first one, and rows that are created or
+    deleted in the meantime don't cause rows to be skipped or returned twice.
+
+    Works with any ordering of the queryset, including annotated and aggregated
+    expressions, because the values of the ordering expressions are selected for
+    every row. The primary key is added as the last sort key if it's not already
+    part of the ordering, so that every row has a unique position. The count is never
+    calculated.
+    """
+
+    cursor_query_param = "cursor"
+
+    def get_order_bys(self, queryset: QuerySet) -> List[OrderBy]:
+        """
+        Returns the ordering of the queryset as `OrderBy` expressions, ending with the
+        primary key.
+        """
+
+        query = queryset.query
+        if query.order_by:
+            ordering = query.order_by
+        elif query.default_ordering:
+            ordering = query.get_meta().ordering or []
+        else:
+            ordering = []
+
+        pk_name = queryset.model._meta.pk.name
+        order_bys = []
+        for order in ordering:
+            if isinstance(order, str):
+                name = order.lstrip("-")
+                order = OrderBy(
+                    F(pk_name if name == "pk" else name),
+                    descending=order.startswith("-"),
+                )
+            elif not isinstance(order, OrderBy):
+                order = order.asc()
+            order_bys.append(order)
+
+        if not any(
+            isinstance(order.expression, F) and order.expression.name == pk_name
+            for order in order_bys
+        ):
+            order_bys.append(OrderBy(F(pk_name)))
+
+        return order_bys
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.next_cursor = None
+        page_size = self.get_page_size(request)
+
+        order_bys = self.get_order_bys(queryset)
+        keys = [
+            (f"_cursor_{index}", order.descending, self._nulls_first(order))
+            for index, order in enumerate(order_bys)
+        ]
+        signature = self.get_ordering_signature(queryset, order_bys, keys)
+
+        queryset = queryset.annotate(
+            **{name: order.expression for (name, _, _), order in zip(keys, order_bys)}
+        ).order_by(*order_bys)
+
+        raw_cursor = request.query_params.get(self.cursor_query_param)
+        if raw_cursor:
+            values = self.decode_cursor(raw_cursor, signature, len(keys))
+            queryset = queryset.filter(self._get_after_filter(keys, values))
+
+        rows = list(queryset[: page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_row = rows[-1]
+            self.next_cursor = self.encode_cursor(
+                [getattr(last_row, name) for name, _, _ in keys], signature
+            )
+
+        return rows
+
+    @staticmethod
+    def get_ordering_signature(
+        queryset: QuerySet,
+        order_bys: List[OrderBy],
+        keys: List[Tuple[str, bool, bool]],
+    ) -> str:
+        """
+        Returns a string identifying the ordering the cursor values belong to. It
+        contains the direction and the nulls ordering of every sort key, followed by
+        a digest of the compiled `ORDER BY` clause, so that a cursor created for
+        other sort fields with the same shape is rejected as well.
+        """
+
+        directions = "".join(
+            ("d" if descending else "a") + ("f" if nulls_first else "l")
+            for _, descending, nulls_first in keys
+        )
+
+        compiler = queryset.order_by(*order_bys).query.get_compiler(queryset.db)
+        _, compiled_order_by, _ = compiler.pre_sql_setup()
+        order_by_spec = json.dumps(
+            [
+                [sql, [str(param) for param in params]]
+                for _, (sql, params, _) in compiled_order_by
+            ]
+        )
+        digest = hashlib.sha256(order_by_spec.encode("utf-8")).hexdigest()[:16]
+
+        return f"{directions}:{digest}"
+
+    @staticmethod
+    def _nulls_first(order: OrderBy) -> bool:
+        if order.nulls_first:
+            return True
+        if order.nulls_last:
+            return False
+        # PostgreSQL sorts nulls as if they're larger than any other value.
+        return order.descending
+
+    @staticmethod
+    def _get_after_filter(keys: List[Tuple[str, bool, bool]], values: List[Any]) -> Q:
+        """
+        Builds the filter matching all the rows that come after the row having the
+        provided sort key values. A row comes after if it has the same values for
+        the first n keys and a later value for key n + 1.
+        """
+
+        after_filter = Q(pk__in=[])
+        equal_filter = Q()
+        for (name, descending, nulls_first), value in zip(keys, values):
+            if value is None:
+                if nulls_first:
+                    after_filter |= equal_filter & Q(**{f"{name}__isnull": False})
+                equal_filter &= Q(**{f"{name}__isnull": True})
+            else:
+                lookup = "lt" if descending else "gt"
+                later = Q(**{f"{name}__{lookup}": value})
+                if not nulls_first:
+                    later |= Q(**{f"{name}__isnull": True})
+                after_filter |= equal_filter & later
+                equal_filter &= Q(**{name: value})
+        return after_filter
+
+    def encode_cursor(self, values: List[Any], signature: str) -> str:
+        data = json.dumps(
+            {"o": signature, "v": [_encode_cursor_value(v) for v in values]},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(
+        self, raw_cursor: str, signature: str, key_count: int
+    ) -> List[Any]:
+        """
+        Decodes the cursor provided by the client. The cursor must have been created
+        for the same ordering, otherwise the values can't be compared.
+
+        :param raw_cursor: The cursor provided by the client.
+        :param signature: The signature of the current ordering.
+        :param key_count: The number of sort keys of the current ordering.
+        :raises APIException: If the cursor is invalid or belongs to another ordering.
+        """
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(raw_cursor.encode("ascii")))
+            if data["o"] != signature or len(data["v"]) != key_count:
+                raise ValueError("The cursor doesn't match the ordering.")
+            return [_decode_cursor_value(v) for v in data["v"]]
+        except (
+            binascii.Error,
+            InvalidOperation,
+            KeyError,
+            TypeError,
+            UnicodeError,
+            ValueError,
+        ):
+            exception = APIException(
+                {
+                    "error": "ERROR_INVALID_PAGINATION_CURSOR",
+                    "detail": "The provided cursor is invalid or doesn't match the "
+                    "ordering of the results.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+    def get_paginated_response(self, data):
+        return Response({"next_cursor": self.next_cursor, "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["next_cursor", "results"],
+            "properties": {
+                "next_cursor": {
+                    "type": "string",
+                    "nullable": True,
+                    "description": "The cursor to provide to fetch the next page. "
+                    "Is `null` if there are no more results.",
+                },
+                "results": schema,
+            },
+        }
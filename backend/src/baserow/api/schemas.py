@@ -42,6 +42,15 @@ CLIENT_SESSION_ID_SCHEMA_PARAMETER = OpenApiParameter(
     "can be undone/redone.",
 )
 
+IF_NONE_MATCH_SCHEMA_PARAMETER = OpenApiParameter(
+    name="If-None-Match",
+    location=OpenApiParameter.HEADER,
+    type=OpenApiTypes.STR,
+    required=False,
+    description="The `ETag` header of a previous response of this endpoint. If "
+    "nothing has changed since, an empty response with status code 304 is returned.",
+)
+
 CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER = OpenApiParameter(
     name=settings.CLIENT_UNDO_REDO_ACTION_GROUP_ID_HEADER,
     location=OpenApiParameter.HEADER,
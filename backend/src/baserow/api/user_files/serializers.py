@@ -64,6 +64,7 @@ class UserFileSerializer(
             "uploaded_at",
             "url",
             "thumbnails",
+            "thumbnails_pending",
             "name",
             "original_name",
         )
@@ -113,7 +114,7 @@ class UserFileField(serializers.Field):
             self.fail("invalid_value")
 
         try:
-            user_file = UserFile.objects.all().name(data["name"]).get()
+            user_file = UserFileHandler().get_user_file_by_name(data["name"])
         except UserFile.DoesNotExist:
             self.fail("invalid_user_file")
 
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
@@ -12,12 +14,15 @@ from typing import (
     Union,
 )
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Model
 from django.utils.encoding import force_str
+from django.utils.http import parse_etags, quote_etag
 
 from rest_framework import serializers, status
 from rest_framework.exceptions import APIException
 from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.serializers import ModelSerializer
 
 from baserow.core.exceptions import InstanceTypeDoesNotExist
@@ -500,3 +505,40 @@ class DiscriminatorMappingSerializer:
     # doesn't attempt to use its own customized list serializer extension code which
     # doesn't work with our custom extension
     to_representation = serializers.ListSerializer.to_representation
+
+
+def get_etag(*parts: Any) -> str:
+    """
+    Returns a strong ETag for the provided JSON serializable parts. The same parts
+    always result in the same ETag.
+
+    :param parts: Everything the response depends on, like the versions of the
+        cached data or the data itself.
+    :return: The quoted ETag, ready to be used in the `ETag` header.
+    """
+
+    payload = json.dumps(parts, cls=DjangoJSONEncoder, sort_keys=True)
+    return quote_etag(hashlib.sha256(payload.encode("utf-8")).hexdigest())
+
+
+def get_not_modified_response(request: Request, etag: str) -> Optional[Response]:
+    """
+    Returns an empty 304 response if the `If-None-Match` header of the request
+    matches the provided ETag, meaning that the client already has the latest version
+    of the response. The view can return it right away, without computing the
+    response.
+
+    :param request: The request that possibly has an `If-None-Match` header.
+    :param etag: The ETag of the response the view would return.
+    :return: The 304 response, or None if the response must be computed.
+    """
+
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return None
+
+    # `If-None-Match` uses the weak comparison, so the weakness indicator is ignored.
+    etags = [e[2:] if e.startswith("W/") else e for e in parse_etags(if_none_match)]
+    if "*" in etags or etag in etags:
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
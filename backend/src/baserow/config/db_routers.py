@@ -1,11 +1,45 @@
+import hashlib
 import random
+import threading
+import time
+from typing import Dict, Optional
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
 
 from asgiref.local import Local
+from loguru import logger
+from opentelemetry import metrics
 
 DATABASE_READ_REPLICAS = settings.DATABASE_READ_REPLICAS
 DEFAULT_DB_ALIAS = "default"
+STICKY_TO_PRIMARY_CACHE_KEY_PREFIX = "db_router_sticky_to_primary_"
+
+# Returns the number of seconds the replica is behind. If the replica has replayed
+# everything it received, it's considered up-to-date, because the last replay
+# timestamp doesn't change when nothing is written on the primary.
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+"""
+
+meter = metrics.get_meter(__name__)
+db_reads_routed_counter = meter.create_counter(
+    "baserow.db_router.reads_routed",
+    unit="1",
+    description="The number of read queries routed per database alias and reason.",
+)
+replica_health_checks_counter = meter.create_counter(
+    "baserow.db_router.replica_health_checks",
+    unit="1",
+    description="The number of read replica health checks per alias and result.",
+)
 
 _db_state = Local()
 
@@ -18,11 +52,161 @@ def is_write_mode():
     return getattr(_db_state, "pinned", False)
 
 
+def set_sticky_key(sticky_key: Optional[str]):
+    """
+    Sets the key identifying who is making the current request. If a write happens
+    while the key is set, all reads with the same key will be routed to the primary
+    for `BASEROW_READ_REPLICA_STICKY_SECONDS` seconds, even in subsequent requests, so
+    that a client always reads its own writes.
+    """
+
+    _db_state.sticky_key = sticky_key
+
+
+def get_sticky_key_for_credentials(credentials: str) -> str:
+    """
+    Returns a sticky key for the provided credentials, like the authorization header,
+    without storing the credentials themselves.
+    """
+
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
+
+def _get_sticky_to_primary_cache_key(sticky_key: str) -> str:
+    return f"{STICKY_TO_PRIMARY_CACHE_KEY_PREFIX}{sticky_key}"
+
+
+def is_sticky_to_primary() -> bool:
+    """
+    Returns whether the reads of the current request must go to the primary because
+    a recent request with the same sticky key wrote something. The result is
+    remembered until the db state is cleared, so that the cache is only checked once.
+    """
+
+    sticky = getattr(_db_state, "sticky", None)
+    if sticky is None:
+        sticky_key = getattr(_db_state, "sticky_key", None)
+        sticky = bool(
+            sticky_key
+            and settings.BASEROW_READ_REPLICA_STICKY_SECONDS > 0
+            and cache.get(_get_sticky_to_primary_cache_key(sticky_key))
+        )
+        _db_state.sticky = sticky
+    return sticky
+
+
 def clear_db_state():
     """Should be called when a request or celery finishes."""
 
-    if hasattr(_db_state, "pinned"):
-        del _db_state.pinned
+    sticky_key = getattr(_db_state, "sticky_key", None)
+    sticky_seconds = settings.BASEROW_READ_REPLICA_STICKY_SECONDS
+    if DATABASE_READ_REPLICAS and sticky_key and sticky_seconds > 0 and is_write_mode():
+        cache.set(
+            _get_sticky_to_primary_cache_key(sticky_key), True, timeout=sticky_seconds
+        )
+
+    for attr in ["pinned", "sticky", "sticky_key"]:
+        if hasattr(_db_state, attr):
+            delattr(_db_state, attr)
+
+
+class ReplicaHealthTracker:
+    """
+    Keeps track of the health and replication lag of the read replicas. The lag of
+    every replica is measured using `pg_last_xact_replay_timestamp` at most once
+    every `BASEROW_READ_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS` per process. A replica
+    that can't be reached is considered unhealthy until the next check.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = None
+        self._lags: Dict[str, Optional[float]] = {}
+
+    def reset(self):
+        with self._lock:
+            self._checked_at = None
+            self._lags = {}
+
+    def get_lags(self) -> Dict[str, Optional[float]]:
+        """
+        Returns the last measured lag in seconds per replica alias. The lag is `None`
+        if the replica is unhealthy.
+        """
+
+        return dict(self._lags)
+
+    def get_available_replicas(self) -> Dict[str, float]:
+        """
+        Returns the replicas that are healthy and not lagging behind more than
+        `BASEROW_READ_REPLICA_MAX_LAG_SECONDS`, with their lag in seconds.
+        """
+
+        self._refresh_if_outdated()
+        max_lag = settings.BASEROW_READ_REPLICA_MAX_LAG_SECONDS
+        return {
+            alias: lag
+            for alias, lag in self._lags.items()
+            if lag is not None and lag <= max_lag
+        }
+
+    def _refresh_if_outdated(self):
+        interval = settings.BASEROW_READ_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < interval:
+            return
+
+        # Only one thread has to measure the lags, the others continue with the
+        # previously measured ones.
+        if not self._lock.acquire(blocking=False):
+            return
+
+        try:
+            self._lags = {
+                alias: self._measure_lag(alias) for alias in DATABASE_READ_REPLICAS
+            }
+            self._checked_at = time.monotonic()
+        finally:
+            self._lock.release()
+
+    def _measure_lag(self, alias: str) -> Optional[float]:
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(REPLICA_LAG_SQL)
+                row = cursor.fetchone()
+        except DatabaseError as exc:
+            logger.warning(f"Read replica {alias} is unhealthy: {exc}")
+            replica_health_checks_counter.add(
+                1, {"alias": alias, "result": "unhealthy"}
+            )
+            return None
+
+        replica_health_checks_counter.add(1, {"alias": alias, "result": "healthy"})
+        return float(row[0] or 0)
+
+
+replica_health_tracker = ReplicaHealthTracker()
+
+
+def choose_replica(replicas: Dict[str, float]) -> str:
+    """
+    Picks one of the provided replicas, where replicas lagging further behind get
+    a proportionally smaller share of the reads.
+
+    :param replicas: The lag in seconds per replica alias.
+    :return: The chosen replica alias.
+    """
+
+    aliases = list(replicas.keys())
+    if len(aliases) == 1:
+        return aliases[0]
+    weights = [1 / (1 + replicas[alias]) for alias in aliases]
+    return random.choices(aliases, weights=weights)[0]  # nosec
+
+
+def _route_read(alias: str, reason: str) -> str:
+    db_reads_routed_counter.add(1, {"alias": alias, "reason": reason})
+    return alias
 
 
 class ReadReplicaRouter:
@@ -31,16 +215,25 @@ class ReadReplicaRouter:
     if a read query is executed, it will use one of the read replicas. If a write query
     is must be executed, then it switches to the write node, and sticks with it until
     the db state is cleared. That is currently happening when a request or celery task
-    is completed.
+    is completed. If the request has a sticky key, reads of the following requests
+    with the same key will use the write node for a short while as well.
+
+    Only replicas that are healthy and not lagging too far behind are used, and the
+    ones that lag more receive fewer reads.
     """
 
     def db_for_read(self, model, **hints):
-        if is_write_mode():
+        if not DATABASE_READ_REPLICAS:
             return DEFAULT_DB_ALIAS
-        if DATABASE_READ_REPLICAS:
-            read = random.choice(DATABASE_READ_REPLICAS)  # nosec
-            return read
-        return DEFAULT_DB_ALIAS
+        if is_write_mode():
+            return _route_read(DEFAULT_DB_ALIAS, "write_mode")
+        if is_sticky_to_primary():
+            return _route_read(DEFAULT_DB_ALIAS, "sticky")
+
+        replicas = replica_health_tracker.get_available_replicas()
+        if not replicas:
+            return _route_read(DEFAULT_DB_ALIAS, "no_available_replica")
+        return _route_read(choose_replica(replicas), "replica")
 
     def db_for_write(self, model, **hints):
         set_write_mode()
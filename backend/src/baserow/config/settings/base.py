@@ -272,6 +272,18 @@ for key, value in os.environ.items():
 
         DATABASE_READ_REPLICAS.append(db_key)
 
+# Replicas lagging further behind than this are not used for reads.
+BASEROW_READ_REPLICA_MAX_LAG_SECONDS = float(
+    os.getenv("BASEROW_READ_REPLICA_MAX_LAG_SECONDS") or 10
+)
+BASEROW_READ_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS = float(
+    os.getenv("BASEROW_READ_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS") or 5
+)
+# After a write, the reads of the same client are routed to the primary for this
+# many seconds, so that it reads its own writes. Set to 0 to disable.
+BASEROW_READ_REPLICA_STICKY_SECONDS = int(
+    os.getenv("BASEROW_READ_REPLICA_STICKY_SECONDS") or 5
+)
 
 DATABASE_ROUTERS = ["baserow.config.db_routers.ReadReplicaRouter"]
 
@@ -304,6 +316,16 @@ BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = int(
     os.getenv("BASEROW_BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS")
     or 300
 )
+VIEW_METADATA_CACHE_TTL_SECONDS = int(
+    # Default TTL is 10 minutes
+    os.getenv("BASEROW_VIEW_METADATA_CACHE_TTL_SECONDS")
+    or 60 * 10
+)
+LINK_ROW_DISPLAY_VALUE_CACHE_TTL_SECONDS = int(
+    # Default TTL is 10 minutes, setting it to 0 disables the cache.
+    os.getenv("BASEROW_LINK_ROW_DISPLAY_VALUE_CACHE_TTL_SECONDS")
+    or 60 * 10
+)
 
 
 CELERY_SINGLETON_BACKEND_CLASS = (
@@ -575,6 +597,12 @@ BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB = int(
     Decimal(os.getenv("BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB", 1024 * 1024)) * 1024 * 1024
 )  # ~1TB by default
 
+# The maximum number of files that are read, downloaded and stored concurrently when
+# importing many user files at once, like when importing an Airtable base.
+BASEROW_USER_FILES_IMPORT_MAX_CONCURRENCY = int(
+    os.getenv("BASEROW_USER_FILES_IMPORT_MAX_CONCURRENCY", "") or 4
+)
+
 BASEROW_OPENAI_UPLOADED_FILE_SIZE_LIMIT_MB = int(
     os.getenv("BASEROW_OPENAI_UPLOADED_FILE_SIZE_LIMIT_MB", 512)
 )
@@ -786,6 +814,10 @@ ROW_PAGE_SIZE_LIMIT = int(os.getenv("BASEROW_ROW_PAGE_SIZE_LIMIT", 200))
 BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
+# How many generated row serializer classes every process keeps in memory.
+ROW_SERIALIZER_CLASS_CACHE_SIZE = int(
+    os.getenv("BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE", 256)
+)
 
 # Maximum count of records considered as a 'small table' during field rule operations.
 FIELD_RULE_ROWS_LIMIT = int(os.getenv("FIELD_RULE_ROWS_LIMIT", BATCH_ROWS_SIZE_LIMIT))
@@ -807,6 +839,21 @@ AUTOMATION_WORKFLOW_RATE_LIMIT_CACHE_EXPIRY_SECONDS = int(
 AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS = int(
     os.getenv("BASEROW_AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS", 5)
 )
+# Events of the same live workflow happening within this window are combined
+# into a single workflow run. Set to 0 to start a run for every event.
+AUTOMATION_WORKFLOW_EVENT_BATCH_WINDOW_SECONDS = float(
+    os.getenv("BASEROW_AUTOMATION_WORKFLOW_EVENT_BATCH_WINDOW_SECONDS", "") or 1
+)
+# The maximum number of independent branches of a workflow of which the HTTP
+# requests and emails are sent concurrently. Set to 1 to dispatch them one by one.
+AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES = int(
+    os.getenv("BASEROW_AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES", "") or 4
+)
+# The maximum number of tables and trigger types kept in the in-memory trigger
+# routing index per process.
+AUTOMATION_TRIGGER_ROUTING_SIZE = int(
+    os.getenv("BASEROW_AUTOMATION_TRIGGER_ROUTING_SIZE", "") or 10000
+)
 
 TRASH_PAGE_SIZE_LIMIT = 200  # How many trash entries can be requested at once.
 
@@ -945,6 +992,25 @@ BASEROW_LOGIN_ACTION_LOG_LIMIT = (
 # Configurable thumbnails that are going to be generated when a user uploads an image
 # file.
 USER_THUMBNAILS = {"tiny": [None, 21], "small": [48, 48], "card_cover": [300, 160]}
+# When enabled, the thumbnails of uploaded images are generated in a background task
+# instead of during the upload request. Until the task has finished, the thumbnails of
+# those images don't exist yet.
+BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND = str_to_bool(
+    os.getenv("BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND", "false")
+)
+# The thumbnails are shown right after uploading an image, so they're generated in
+# the fast queue by default instead of waiting behind long-running exports.
+BASEROW_USER_FILE_THUMBNAILS_QUEUE_NAME = os.getenv(
+    "BASEROW_USER_FILE_THUMBNAILS_QUEUE_NAME", "celery"
+)
+# The maximum number of images of which the thumbnails are generated concurrently by
+# the background task.
+BASEROW_USER_FILE_THUMBNAILS_MAX_CONCURRENCY = int(
+    os.getenv("BASEROW_USER_FILE_THUMBNAILS_MAX_CONCURRENCY", "") or 2
+)
+BASEROW_USER_FILE_THUMBNAILS_SOFT_TIME_LIMIT = int(
+    os.getenv("BASEROW_USER_FILE_THUMBNAILS_SOFT_TIME_LIMIT", "") or 60 * 10
+)
 
 # The directory that contains the all the templates in JSON format. When for example
 # the `sync_templates` management command is called, then the templates in the
@@ -971,6 +1037,11 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = int(
     os.getenv("HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3)
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The maximum number of trashed items, like rows, that are permanently deleted at once
+# in a single transaction.
+BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE", "") or 1000
+)
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
@@ -1104,6 +1175,12 @@ BASEROW_MAX_PENDING_WORKSPACE_INVITES = int(
     os.getenv("BASEROW_MAX_PENDING_WORKSPACE_INVITES", 0)
 )
 
+# The maximum number of concurrent requests made to Airtable when downloading the
+# table and view data of a base that's being imported.
+BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS = int(
+    os.getenv("BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS", "") or 4
+)
+
 BASEROW_IMPORT_EXPORT_RESOURCE_CLEANUP_INTERVAL_MINUTES = int(
     os.getenv("BASEROW_IMPORT_EXPORT_RESOURCE_CLEANUP_INTERVAL_MINUTES", 5)
 )
@@ -1116,6 +1193,16 @@ BASEROW_IMPORT_EXPORT_RESOURCE_REMOVAL_AFTER_DAYS = int(
 BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT = int(
     os.getenv("BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT", 0)
 )
+# The number of rows that are fetched from the database, written to the export
+# archive and inserted in bulk at once when exporting or importing table rows.
+BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE = int(
+    os.getenv("BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE", "") or 2000
+)
+# The maximum number of files that are extracted from, or of which the checksums are
+# verified in, a workspace import archive at the same time.
+BASEROW_IMPORT_EXPORT_FILES_MAX_CONCURRENCY = int(
+    os.getenv("BASEROW_IMPORT_EXPORT_FILES_MAX_CONCURRENCY", "") or 4
+)
 
 PERMISSION_MANAGERS = [
     "view_ownership",
@@ -1146,6 +1233,15 @@ OLD_ACTION_CLEANUP_INTERVAL_MINUTES = os.getenv(
     "OLD_ACTION_CLEANUP_INTERVAL_MINUTES", 5
 )
 MINUTES_UNTIL_ACTION_CLEANED_UP = os.getenv("MINUTES_UNTIL_ACTION_CLEANED_UP", "120")
+# The number of old actions deleted per transaction by the action cleanup task.
+BASEROW_ACTION_CLEANUP_BATCH_SIZE = int(
+    os.getenv("BASEROW_ACTION_CLEANUP_BATCH_SIZE", "") or 5000
+)
+# After this many seconds the action cleanup task stops deleting more batches, the
+# next run continues where it stopped.
+BASEROW_ACTION_CLEANUP_MAX_SECONDS = int(
+    os.getenv("BASEROW_ACTION_CLEANUP_MAX_SECONDS", "") or 240
+)
 
 LOGGING = {
     "version": 1,
@@ -1337,6 +1433,11 @@ BASEROW_POSTGRESQL_DATA_SYNC_BLACKLIST = (
 # save resources when compressing media files with the need to save space when
 # compressing text files.
 BASEROW_DEFAULT_ZIP_COMPRESS_LEVEL = 5
+# Whether already compressed files, like images, videos and archives, are stored in
+# exported zip files without compressing them again.
+BASEROW_EXPORT_ZIP_STORE_COMPRESSED_FILES = str_to_bool(
+    os.getenv("BASEROW_EXPORT_ZIP_STORE_COMPRESSED_FILES", "true")
+)
 
 BASEROW_MAX_HEALTHY_CELERY_QUEUE_SIZE = int(
     os.getenv("BASEROW_MAX_HEALTHY_CELERY_QUEUE_SIZE", "") or 10
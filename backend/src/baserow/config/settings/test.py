@@ -91,6 +91,8 @@ BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS = 10
 BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = 300
 
 AUTO_INDEX_VIEW_ENABLED = False
+# Start a workflow run for every event, so that the tests don't depend on timing.
+AUTOMATION_WORKFLOW_EVENT_BATCH_WINDOW_SECONDS = 0
 # For ease of testing tests assume this setting is set to this. Set it explicitly to
 # prevent any dev env config from breaking the tests.
 BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = "VIEWER"
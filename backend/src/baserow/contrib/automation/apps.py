@@ -208,8 +208,14 @@ class AutomationConfig(AppConfig):
             import baserow.contrib.automation.workflows.signals  # noqa: F403, F401
             import baserow.contrib.automation.workflows.ws.signals  # noqa: F403, F401
             import baserow.contrib.integrations.tasks  # noqa: F403, F401
+            from baserow.contrib.automation.history.receivers import (
+                connect_to_history_post_save_signal,
+            )
             from baserow.contrib.automation.nodes.receivers import (
                 connect_to_node_pre_delete_signal,
+                connect_to_trigger_routing_signals,
             )
 
             connect_to_node_pre_delete_signal()
+            connect_to_trigger_routing_signals()
+            connect_to_history_post_save_signal()
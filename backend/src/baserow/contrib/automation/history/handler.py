@@ -3,10 +3,24 @@ from typing import Optional
 
 from django.db.models import QuerySet
 
+from django_redis import get_redis_connection
+
 from baserow.contrib.automation.history.constants import HistoryStatusChoices
 from baserow.contrib.automation.history.models import AutomationWorkflowHistory
 from baserow.contrib.automation.workflows.models import AutomationWorkflow
 
+WORKFLOW_ERROR_STREAK_CACHE_KEY = "automation_workflow_error_streak_{}"
+WORKFLOW_ERROR_STREAK_CACHE_SECONDS = 60 * 60 * 24
+
+incr_if_exists_lua_script = """
+if redis.call("exists", KEYS[1]) == 1 then
+  local value = redis.call("incr", KEYS[1])
+  redis.call("expire", KEYS[1], tonumber(ARGV[1]))
+  return value
+end
+return false
+"""
+
 
 class AutomationHistoryHandler:
     def get_workflow_history(
@@ -35,3 +49,66 @@ class AutomationHistoryHandler:
             is_test_run=is_test_run,
             status=HistoryStatusChoices.STARTED,
         )
+
+    def _get_error_streak_cache_key(self, workflow_id: int) -> str:
+        return WORKFLOW_ERROR_STREAK_CACHE_KEY.format(workflow_id)
+
+    def get_error_streak(self, workflow: AutomationWorkflow, limit: int) -> int:
+        """
+        Returns the number of consecutive errors of the most recent runs of the
+        workflow. The number is kept up to date in Redis by `update_error_streak`,
+        and is only calculated from the history if it's not known yet.
+
+        :param workflow: The workflow to get the error streak of.
+        :param limit: The maximum number of errors to look for in the history.
+        :return: The number of consecutive errors. Can be higher than the limit.
+        """
+
+        redis = get_redis_connection("default")
+        cache_key = self._get_error_streak_cache_key(workflow.id)
+
+        error_streak = redis.get(cache_key)
+        if error_streak is not None:
+            return int(error_streak)
+
+        statuses = list(
+            AutomationWorkflowHistory.objects.filter(workflow=workflow).order_by(
+                "-started_on"
+            )
+            # +1 because we will ignore the latest entry, since the workflow may
+            # have just started.
+            .values_list("status", flat=True)[: limit + 1]
+        )
+        if statuses and statuses[0] == HistoryStatusChoices.STARTED:
+            statuses = statuses[1:]
+
+        error_streak = 0
+        for status in statuses:
+            if status != HistoryStatusChoices.ERROR:
+                break
+            error_streak += 1
+
+        redis.set(cache_key, error_streak, ex=WORKFLOW_ERROR_STREAK_CACHE_SECONDS)
+        return error_streak
+
+    def update_error_streak(self, history: AutomationWorkflowHistory) -> None:
+        """
+        Updates the error streak of the workflow after a run has completed. An error
+        increases it, any other result resets it. If the streak isn't known yet, it's
+        left untouched so that `get_error_streak` calculates it from the history.
+
+        :param history: The history entry of the completed run.
+        """
+
+        cache_key = self._get_error_streak_cache_key(history.workflow_id)
+        redis = get_redis_connection("default")
+
+        if history.status == HistoryStatusChoices.ERROR:
+            redis.eval(
+                incr_if_exists_lua_script,
+                1,
+                cache_key,
+                WORKFLOW_ERROR_STREAK_CACHE_SECONDS,
+            )
+        elif history.status != HistoryStatusChoices.STARTED:
+            redis.set(cache_key, 0, ex=WORKFLOW_ERROR_STREAK_CACHE_SECONDS)
@@ -0,0 +1,43 @@
+from django.db import transaction
+from django.db.models.signals import post_init, post_save
+
+from baserow.contrib.automation.history.handler import AutomationHistoryHandler
+from baserow.contrib.automation.history.models import AutomationWorkflowHistory
+
+
+def remember_saved_status(sender, instance: AutomationWorkflowHistory, **kwargs):
+    # Read from `__dict__` so that a deferred status isn't fetched for every
+    # loaded history entry.
+    instance._saved_status = instance.__dict__.get("status")
+
+
+def update_error_streak(
+    sender,
+    instance: AutomationWorkflowHistory,
+    created: bool,
+    update_fields=None,
+    **kwargs,
+):
+    """
+    Updates the error streak of the workflow when the status of a history entry
+    changes. Saving an entry again without changing its status must not count the
+    same run twice, and the streak is only updated once the transaction is
+    committed, so that a rolled back run doesn't change it.
+    """
+
+    if update_fields is not None and "status" not in update_fields:
+        return
+
+    previous_status = None if created else getattr(instance, "_saved_status", None)
+    instance._saved_status = instance.status
+    if previous_status == instance.status:
+        return
+
+    transaction.on_commit(
+        lambda: AutomationHistoryHandler().update_error_streak(instance)
+    )
+
+
+def connect_to_history_post_save_signal():
+    post_init.connect(remember_saved_status, AutomationWorkflowHistory)
+    post_save.connect(update_error_streak, AutomationWorkflowHistory)
@@ -1,7 +1,10 @@
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, Iterable, List, Optional, Type, Union
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connections
 from django.db.models import QuerySet
 
 from baserow.contrib.automation.automation_dispatch_context import (
@@ -34,6 +37,7 @@ from baserow.core.services.exceptions import (
 )
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
+from baserow.core.services.types import DispatchResult
 from baserow.core.storage import ExportZipFile
 from baserow.core.utils import MirrorDict, extract_allowed
 
@@ -629,7 +633,10 @@ class AutomationNodeHandler:
         return node_instance
 
     def dispatch_node(
-        self, node: "AutomationNode", dispatch_context: AutomationDispatchContext
+        self,
+        node: "AutomationNode",
+        dispatch_context: AutomationDispatchContext,
+        dispatched: Optional["Future[DispatchResult]"] = None,
     ):
         """
         Dispatch one node and recursively dispatch the next nodes.
@@ -637,11 +644,16 @@ class AutomationNodeHandler:
         :param node: The node to start with.
         :param dispatch_context: The context in which the workflow is being dispatched,
             which contains the event payload and other relevant data.
+        :param dispatched: If the node was already dispatched concurrently with the
+            other branches, the future holding its result.
         """
 
         node_type: Type[AutomationNodeActionNodeType] = node.get_type()
         try:
-            dispatch_result = node_type.dispatch(node, dispatch_context)
+            if dispatched is not None:
+                dispatch_result = dispatched.result()
+            else:
+                dispatch_result = node_type.dispatch(node, dispatch_context)
             dispatch_context.after_dispatch(node, dispatch_result)
 
             # Return early if this is a simulated dispatch
@@ -653,11 +665,85 @@ class AutomationNodeHandler:
                     automation_node_updated.send(self, user=None, node=node)
                     return
 
-            next_nodes = node.get_next_nodes(dispatch_result.output_uid)
+            next_nodes = list(node.get_next_nodes(dispatch_result.output_uid))
+            dispatched_next_nodes = self._dispatch_in_parallel(
+                next_nodes, dispatch_context
+            )
 
             for next_node in next_nodes:
-                self.dispatch_node(next_node, dispatch_context)
+                self.dispatch_node(
+                    next_node,
+                    dispatch_context,
+                    dispatched=dispatched_next_nodes.get(next_node.id),
+                )
         except ServiceImproperlyConfiguredDispatchException as e:
             raise AutomationNodeMisconfiguredService(
                 f"The node {node.id} has a misconfigured service."
             ) from e
+
+    def _dispatch_in_parallel(
+        self,
+        nodes: List["AutomationNode"],
+        dispatch_context: AutomationDispatchContext,
+    ) -> Dict[int, "Future[DispatchResult]"]:
+        """
+        Concurrently dispatches the nodes, of the provided independent branches, that
+        only wait for an external service, like sending an HTTP request or an email.
+        Because those side effects can't be rolled back, a branch is only started
+        before the branches in front of it have finished if all of those consist of
+        a single node that can be dispatched in parallel. A node that is followed by
+        other nodes, or that must be dispatched in order, ends the parallel branches,
+        so the branches after it are only dispatched if it succeeds.
+
+        Every node gets its own copy of the dispatch context, so that the branches
+        can't see each other's results. The results are registered in the context
+        afterwards in the original order of the branches by `dispatch_node`, which
+        also raises the error of a failed node when its branch is reached.
+
+        :param nodes: The first nodes of the branches.
+        :param dispatch_context: The context the branches are dispatched in.
+        :return: A future holding the dispatch result per node id. Nodes that must
+            be dispatched in order aren't included.
+        """
+
+        max_workers = settings.AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES
+        if (
+            max_workers <= 1
+            or len(nodes) <= 1
+            or dispatch_context.simulate_until_node is not None
+        ):
+            return {}
+
+        followed_node_ids = set(
+            AutomationNode.objects.filter(
+                previous_node_id__in=[node.id for node in nodes]
+            ).values_list("previous_node_id", flat=True)
+        )
+        parallel_nodes = []
+        for node in nodes:
+            if not node.get_type().can_dispatch_in_parallel:
+                break
+            parallel_nodes.append(node)
+            if node.id in followed_node_ids:
+                break
+
+        if len(parallel_nodes) <= 1:
+            return {}
+
+        def dispatch(node, node_dispatch_context):
+            try:
+                return node.get_type().dispatch(node, node_dispatch_context)
+            finally:
+                connections.close_all()
+
+        # Load the services before, so that the threads don't have to.
+        for node in parallel_nodes:
+            node.service.specific
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(parallel_nodes))
+        ) as executor:
+            return {
+                node.id: executor.submit(dispatch, node, dispatch_context.clone())
+                for node in parallel_nodes
+            }
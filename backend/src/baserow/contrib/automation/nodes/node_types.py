@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.db import router
@@ -32,6 +32,7 @@ from baserow.contrib.automation.nodes.models import (
     LocalBaserowUpdateRowActionNode,
 )
 from baserow.contrib.automation.nodes.registries import AutomationNodeType
+from baserow.contrib.automation.nodes.trigger_routing import trigger_routing_index
 from baserow.contrib.automation.workflows.constants import WorkflowState
 from baserow.contrib.integrations.core.service_types import (
     CoreHTTPRequestServiceType,
@@ -55,6 +56,9 @@ from baserow.core.registry import Instance
 from baserow.core.services.models import Service
 from baserow.core.services.registries import service_type_registry
 
+if TYPE_CHECKING:
+    from baserow.contrib.database.table.models import Table
+
 
 class AutomationNodeActionNodeType(AutomationNodeType):
     is_workflow_action = True
@@ -107,12 +111,14 @@ class CoreHttpRequestNodeType(AutomationNodeActionNodeType):
     type = "http_request"
     model_class = CoreHTTPRequestActionNode
     service_type = CoreHTTPRequestServiceType.type
+    can_dispatch_in_parallel = True
 
 
 class CoreSMTPEmailNodeType(AutomationNodeActionNodeType):
     type = "smtp_email"
     model_class = CoreSMTPEmailActionNode
     service_type = CoreSMTPEmailServiceType.type
+    can_dispatch_in_parallel = True
 
 
 class CoreRouterActionNodeType(AutomationNodeActionNodeType):
@@ -239,31 +245,51 @@ class AutomationNodeTriggerType(AutomationNodeType):
     def on_event(
         self,
         services: QuerySet[Service],
-        event_payload: Optional[List[Dict]] = None,
+        event_payload: Optional[Union[List[Dict], Callable[[], List[Dict]]]] = None,
         user: Optional[AbstractUser] = None,
+        table: Optional["Table"] = None,
     ):
+        """
+        Starts the workflows having a trigger that uses one of the provided services.
+
+        :param services: The services related to the event.
+        :param event_payload: The payload of the event, or a callable returning it,
+            so that it's only computed if a workflow must be started.
+        :param user: The user that caused the event, if any.
+        :param table: If the event happened in a table, the workflows are looked up
+            in the trigger routing index instead of querying the triggers of the
+            services.
+        """
+
         from baserow.contrib.automation.workflows.handler import (
             AutomationWorkflowHandler,
         )
 
-        triggers = (
-            self.model_class.objects.filter(
-                service__in=services,
-            )
-            .using(router.db_for_write(self.model_class))
-            .filter(
-                Q(
-                    Q(workflow__state=WorkflowState.LIVE)
-                    | Q(workflow__allow_test_run_until__gte=timezone.now())
-                    | Q(workflow__simulate_until_node__isnull=False)
-                ),
-            )
-            .select_related("workflow__automation__workspace")
-        )
-
-        for trigger in triggers:
-            workflow = trigger.workflow
-
+        if table is not None:
+            workflows = trigger_routing_index.get_workflows(self, table.id)
+        else:
+            workflows = [
+                trigger.workflow
+                for trigger in self.model_class.objects.filter(service__in=services)
+                .using(router.db_for_write(self.model_class))
+                .select_related("workflow__automation__workspace")
+            ]
+
+        now = timezone.now()
+        workflows = [
+            workflow
+            for workflow in workflows
+            if workflow.state == WorkflowState.LIVE
+            or (workflow.allow_test_run_until and workflow.allow_test_run_until >= now)
+            or workflow.simulate_until_node_id is not None
+        ]
+        if not workflows:
+            return
+
+        if callable(event_payload):
+            event_payload = event_payload()
+
+        for workflow in workflows:
             AutomationWorkflowHandler().async_start_workflow(
                 workflow,
                 event_payload,
@@ -1,9 +1,41 @@
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
-from baserow.contrib.automation.nodes.models import AutomationNode
+from baserow.contrib.automation.models import Automation
+from baserow.contrib.automation.nodes.models import (
+    AutomationNode,
+    LocalBaserowRowsCreatedTriggerNode,
+    LocalBaserowRowsDeletedTriggerNode,
+    LocalBaserowRowsUpdatedTriggerNode,
+)
+from baserow.contrib.automation.nodes.trigger_routing import (
+    invalidate_trigger_routing_index,
+)
+from baserow.contrib.automation.workflows.models import AutomationWorkflow
+from baserow.contrib.integrations.local_baserow.models import (
+    LocalBaserowRowsCreated,
+    LocalBaserowRowsDeleted,
+    LocalBaserowRowsUpdated,
+)
+from baserow.core.models import Application, Workspace
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 
+# Changing or trashing any of these models can change which workflows are started
+# by row events.
+TRIGGER_ROUTING_MODELS = [
+    Workspace,
+    Application,
+    Automation,
+    AutomationWorkflow,
+    AutomationNode,
+    LocalBaserowRowsCreatedTriggerNode,
+    LocalBaserowRowsUpdatedTriggerNode,
+    LocalBaserowRowsDeletedTriggerNode,
+    LocalBaserowRowsCreated,
+    LocalBaserowRowsUpdated,
+    LocalBaserowRowsDeleted,
+]
+
 
 def after_permanently_deleted(sender, instance, **kwargs):
     """
@@ -24,3 +56,13 @@ def after_permanently_deleted(sender, instance, **kwargs):
 
 def connect_to_node_pre_delete_signal():
     post_delete.connect(after_permanently_deleted, AutomationNode)
+
+
+def invalidate_trigger_routing(sender, **kwargs):
+    invalidate_trigger_routing_index()
+
+
+def connect_to_trigger_routing_signals():
+    for model in TRIGGER_ROUTING_MODELS:
+        post_save.connect(invalidate_trigger_routing, model)
+        post_delete.connect(invalidate_trigger_routing, model)
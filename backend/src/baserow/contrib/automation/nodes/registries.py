@@ -64,6 +64,11 @@ class AutomationNodeType(
     # Actions are executed as part of workflows.
     is_workflow_action = False
 
+    # Whether the dispatch of this node type mostly waits for an external service
+    # and doesn't write to the database, so that it can be dispatched in another
+    # thread concurrently with the nodes of the other branches.
+    can_dispatch_in_parallel = False
+
     class SerializedDict(AutomationNodeDict):
         label: str
         service: Dict
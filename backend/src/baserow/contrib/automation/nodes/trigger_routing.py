@@ -0,0 +1,105 @@
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
+
+from baserow.core.services.registries import service_type_registry
+
+if TYPE_CHECKING:
+    from baserow.contrib.automation.nodes.node_types import AutomationNodeTriggerType
+    from baserow.contrib.automation.workflows.models import AutomationWorkflow
+
+TRIGGER_ROUTING_VERSION_CACHE_KEY = "automation_trigger_routing_version"
+
+
+def invalidate_trigger_routing_index():
+    """
+    Invalidates the trigger routing index of all processes. Must be called whenever
+    a trigger, its service or its workflow changes. It's invalidated immediately and
+    again when the transaction commits, so that no process can cache the state
+    before the commit in the meantime.
+    """
+
+    def invalidate():
+        cache.set(TRIGGER_ROUTING_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+class TriggerRoutingIndex:
+    """
+    An in-memory index from a trigger node type and table to the workflows that have
+    a trigger of that type listening to the table. Row events happen a lot and most
+    tables are not used by any workflow, so instead of querying the triggers for
+    every event, they're fetched once per table and kept until a trigger, service
+    or workflow changes. The index is shared by all processes using a version in
+    the cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._routes: Dict[Tuple[str, int], List["AutomationWorkflow"]] = {}
+
+    def _get_version(self) -> str:
+        version = cache.get(TRIGGER_ROUTING_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(TRIGGER_ROUTING_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+            version = cache.get(TRIGGER_ROUTING_VERSION_CACHE_KEY)
+        return version
+
+    def clear(self):
+        with self._lock:
+            self._version = None
+            self._routes = {}
+
+    def get_workflows(
+        self, node_type: "AutomationNodeTriggerType", table_id: int
+    ) -> List["AutomationWorkflow"]:
+        """
+        Returns the workflows having a trigger of the provided type listening to the
+        table, regardless of their state. The same instances are returned until the
+        index is invalidated.
+
+        :param node_type: The trigger node type.
+        :param table_id: The id of the table where the event happened.
+        :return: The workflows with the workspace selected.
+        """
+
+        version = self._get_version()
+        key = (node_type.type, table_id)
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._routes = {}
+            workflows = self._routes.get(key)
+
+        if workflows is None:
+            workflows = self._fetch_workflows(node_type, table_id)
+            with self._lock:
+                if version == self._version:
+                    if len(self._routes) >= settings.AUTOMATION_TRIGGER_ROUTING_SIZE:
+                        self._routes = {}
+                    self._routes[key] = workflows
+
+        return workflows
+
+    def _fetch_workflows(
+        self, node_type: "AutomationNodeTriggerType", table_id: int
+    ) -> List["AutomationWorkflow"]:
+        service_model = service_type_registry.get(node_type.service_type).model_class
+        triggers = (
+            node_type.model_class.objects.filter(
+                service__in=service_model.objects.filter(table_id=table_id)
+            )
+            .using(router.db_for_write(node_type.model_class))
+            .select_related("workflow__automation__workspace")
+        )
+        return [trigger.workflow for trigger in triggers]
+
+
+trigger_routing_index = TriggerRoutingIndex()
@@ -1,16 +1,21 @@
+import json
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any, Dict, List, Optional, Union
+from uuid import uuid4
 from zipfile import ZipFile
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.files.storage import Storage
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import IntegrityError
 from django.db.models import QuerySet
 from django.utils import timezone
 
+from django_redis import get_redis_connection
 from loguru import logger
+from opentelemetry import metrics
 
 from baserow.contrib.automation.automation_dispatch_context import (
     AutomationDispatchContext,
@@ -21,10 +26,12 @@ from baserow.contrib.automation.constants import (
 )
 from baserow.contrib.automation.history.constants import HistoryStatusChoices
 from baserow.contrib.automation.history.handler import AutomationHistoryHandler
-from baserow.contrib.automation.history.models import AutomationWorkflowHistory
 from baserow.contrib.automation.models import Automation
 from baserow.contrib.automation.nodes.models import AutomationNode
 from baserow.contrib.automation.nodes.signals import automation_node_updated
+from baserow.contrib.automation.nodes.trigger_routing import (
+    invalidate_trigger_routing_index,
+)
 from baserow.contrib.automation.nodes.types import AutomationNodeDict
 from baserow.contrib.automation.types import AutomationWorkflowDict
 from baserow.contrib.automation.workflows.constants import (
@@ -41,9 +48,12 @@ from baserow.contrib.automation.workflows.exceptions import (
 )
 from baserow.contrib.automation.workflows.models import AutomationWorkflow
 from baserow.contrib.automation.workflows.signals import automation_workflow_updated
-from baserow.contrib.automation.workflows.tasks import start_workflow_celery_task
+from baserow.contrib.automation.workflows.tasks import (
+    flush_workflow_events_celery_task,
+    start_workflow_celery_task,
+)
 from baserow.contrib.automation.workflows.types import UpdatedAutomationWorkflow
-from baserow.core.cache import global_cache, local_cache
+from baserow.core.cache import local_cache
 from baserow.core.exceptions import IdDoesNotExist
 from baserow.core.registries import ImportExportConfig
 from baserow.core.services.exceptions import DispatchException
@@ -58,8 +68,37 @@ from baserow.core.utils import (
 )
 
 WORKFLOW_RATE_LIMIT_CACHE_PREFIX = "automation_workflow_{}"
+WORKFLOW_EVENTS_QUEUE_KEY = "automation_workflow_events_{}"
+WORKFLOW_EVENTS_FLUSH_SCHEDULED_KEY = "automation_workflow_events_flush_{}"
 AUTOMATION_WORKFLOW_CACHE_LOCK_SECONDS = 5
 
+# Removes the runs that left the window and adds the new run if there's still room.
+# Returns 1 if the run is allowed and 0 otherwise.
+is_allowed_in_sliding_window_lua_script = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local max_runs = tonumber(ARGV[3])
+local run_id = ARGV[4]
+
+redis.call("zremrangebyscore", key, "-inf", now - window)
+if redis.call("zcard", key) >= max_runs then
+  return 0
+end
+
+redis.call("zadd", key, now, run_id)
+redis.call("expire", key, math.ceil(window))
+return 1
+"""
+
+meter = metrics.get_meter(__name__)
+workflow_event_queue_depth_histogram = meter.create_histogram(
+    "baserow.automation.workflow_event_queue_depth",
+    unit="1",
+    description="The number of events waiting to be combined into a single run of "
+    "a workflow, measured every time an event is added.",
+)
+
 
 class AutomationWorkflowHandler:
     allowed_fields = ["name", "allow_test_run_until", "state"]
@@ -715,45 +754,32 @@ class AutomationWorkflowHandler:
         return WORKFLOW_RATE_LIMIT_CACHE_PREFIX.format(workflow_id)
 
     def _check_is_rate_limited(self, workflow_id: int) -> None:
-        """Uses a global cache key to track recent runs for the given workflow."""
-
-        expiry_seconds = settings.AUTOMATION_WORKFLOW_RATE_LIMIT_CACHE_EXPIRY_SECONDS
-        cache_key = self._get_rate_limit_cache_key(workflow_id)
-
-        global_cache.update(
-            cache_key,
-            self._check_is_rate_limited_value,
-            default_value=lambda: [],
-            timeout=expiry_seconds,
-        )
-
-    def _check_is_rate_limited_value(self, data: List[datetime]) -> List[datetime]:
         """
-        Given a list of recent workflow run timestamps, determines whether
-        the workflow run should be rate limited. If so, raises the
-        AutomationWorkflowRateLimited error.
+        Atomically records the run in a sliding window of the recent runs of the
+        workflow, unless the window is already full, in which case the
+        AutomationWorkflowRateLimited error is raised.
         """
 
-        now = timezone.now()
-        expiry_seconds = settings.AUTOMATION_WORKFLOW_RATE_LIMIT_CACHE_EXPIRY_SECONDS
-        start_window = now - timedelta(seconds=expiry_seconds)
+        # Registering only calculates the hash, the script is executed with EVALSHA.
+        is_allowed_in_sliding_window = get_redis_connection("default").register_script(
+            is_allowed_in_sliding_window_lua_script
+        )
 
-        # Check the number of past runs that are in the window
-        runs_in_window = [
-            timestamp
-            for timestamp in data
-            if isinstance(timestamp, datetime) and timestamp > start_window
-        ]
+        allowed = is_allowed_in_sliding_window(
+            keys=[self._get_rate_limit_cache_key(workflow_id)],
+            args=[
+                timezone.now().timestamp(),
+                settings.AUTOMATION_WORKFLOW_RATE_LIMIT_CACHE_EXPIRY_SECONDS,
+                settings.AUTOMATION_WORKFLOW_RATE_LIMIT_MAX_RUNS,
+                uuid4().hex,
+            ],
+        )
 
-        if len(runs_in_window) >= settings.AUTOMATION_WORKFLOW_RATE_LIMIT_MAX_RUNS:
+        if not allowed:
             raise AutomationWorkflowRateLimited(
                 "The workflow was rate limited due to too many recent runs."
             )
 
-        runs_in_window.append(now)
-
-        return runs_in_window
-
     def _check_too_many_errors(self, workflow: AutomationWorkflow) -> None:
         """
         Checks if the given workflow has too many consecutive errors. If so,
@@ -761,25 +787,9 @@ class AutomationWorkflowHandler:
         """
 
         max_errors = settings.AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS
+        error_streak = AutomationHistoryHandler().get_error_streak(workflow, max_errors)
 
-        statuses = (
-            AutomationWorkflowHistory.objects.filter(workflow=workflow).order_by(
-                "-started_on"
-            )
-            # +1 because we will ignore the latest entry, since the workflow may
-            # have just started.
-            .values_list("status", flat=True)[: max_errors + 1]
-        )
-
-        # Ignore the latest status if it is 'started'
-        if statuses and statuses[0] == HistoryStatusChoices.STARTED:
-            statuses = statuses[1:]
-
-        # Not enough history to exceed threshold
-        if len(statuses) < max_errors:
-            return
-
-        if all(status == HistoryStatusChoices.ERROR for status in statuses):
+        if error_streak >= max_errors:
             raise AutomationWorkflowTooManyErrors(
                 f"The workflow {workflow.id} was disabled due to too "
                 "many consecutive errors."
@@ -797,6 +807,7 @@ class AutomationWorkflowHandler:
         AutomationWorkflow.objects.filter(id__in=workflow_ids).update(
             state=WorkflowState.DISABLED
         )
+        invalidate_trigger_routing_index()
 
     def set_workflow_temporary_states(self, workflow, simulate_until_node=None):
         """
@@ -859,12 +870,74 @@ class AutomationWorkflowHandler:
         :param event_payload: The payload from the action.
         """
 
+        window = settings.AUTOMATION_WORKFLOW_EVENT_BATCH_WINDOW_SECONDS
+        if (
+            window > 0
+            and isinstance(event_payload, list)
+            and workflow.state == WorkflowState.LIVE
+            and workflow.simulate_until_node_id is None
+        ):
+            self._enqueue_workflow_event(workflow.id, event_payload, window)
+            return
+
         start_workflow_celery_task.delay(
             workflow.id,
             event_payload,
             simulate_until_node_id=workflow.simulate_until_node_id,
         )
 
+    def _enqueue_workflow_event(
+        self, workflow_id: int, event_payload: List[Dict], window: float
+    ) -> None:
+        """
+        Adds the event to the queue of the workflow. The first event of a window
+        schedules a task that, when the window has passed, starts the workflow once
+        with the payloads of all the queued events combined. This prevents starting
+        thousands of runs when many rows are for example imported one by one.
+        """
+
+        redis = get_redis_connection("default")
+        queue_key = WORKFLOW_EVENTS_QUEUE_KEY.format(workflow_id)
+        expiry_seconds = int(window) + 3600
+
+        pipeline = redis.pipeline()
+        pipeline.rpush(queue_key, json.dumps(event_payload, cls=DjangoJSONEncoder))
+        pipeline.expire(queue_key, expiry_seconds)
+        depth, _ = pipeline.execute()
+        workflow_event_queue_depth_histogram.record(depth, {"workflow_id": workflow_id})
+
+        if redis.set(
+            WORKFLOW_EVENTS_FLUSH_SCHEDULED_KEY.format(workflow_id),
+            1,
+            nx=True,
+            ex=expiry_seconds,
+        ):
+            flush_workflow_events_celery_task.apply_async(
+                args=(workflow_id,), countdown=window
+            )
+
+    def pop_workflow_events(self, workflow_id: int) -> Optional[List[Dict]]:
+        """
+        Removes all the queued events of the workflow.
+
+        :param workflow_id: The id of the workflow to pop the events of.
+        :return: The combined payload of the events, or `None` if there are none.
+        """
+
+        redis = get_redis_connection("default")
+        queue_key = WORKFLOW_EVENTS_QUEUE_KEY.format(workflow_id)
+
+        # Events added from now on schedule a new flush, so they're never lost.
+        redis.delete(WORKFLOW_EVENTS_FLUSH_SCHEDULED_KEY.format(workflow_id))
+        pipeline = redis.pipeline()
+        pipeline.lrange(queue_key, 0, -1)
+        pipeline.delete(queue_key)
+        events, _ = pipeline.execute()
+
+        if not events:
+            return None
+        return [item for event in events for item in json.loads(event)]
+
     def toggle_test_run(
         self, workflow: AutomationWorkflow, simulate_until_node: bool = None
     ):
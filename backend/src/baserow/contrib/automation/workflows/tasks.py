@@ -28,3 +28,12 @@ def start_workflow_celery_task(
         event_payload,
         simulate_until_node=simulate_until_node,
     )
+
+
+@app.task(bind=True, queue="automation_workflow")
+def flush_workflow_events_celery_task(self, workflow_id: int):
+    from baserow.contrib.automation.workflows.handler import AutomationWorkflowHandler
+
+    event_payload = AutomationWorkflowHandler().pop_workflow_events(workflow_id)
+    if event_payload is not None:
+        start_workflow_celery_task.delay(workflow_id, event_payload)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.db import transaction
@@ -16,7 +16,11 @@ from baserow.api.applications.serializers import (
 )
 from baserow.api.decorators import map_exceptions
 from baserow.api.errors import ERROR_PERMISSION_DENIED
-from baserow.api.schemas import CLIENT_SESSION_ID_SCHEMA_PARAMETER, get_error_schema
+from baserow.api.schemas import (
+    CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+    IF_NONE_MATCH_SCHEMA_PARAMETER,
+    get_error_schema,
+)
 from baserow.api.services.errors import (
     ERROR_SERVICE_FILTER_PROPERTY_DOES_NOT_EXIST,
     ERROR_SERVICE_IMPROPERLY_CONFIGURED,
@@ -28,6 +32,8 @@ from baserow.api.services.errors import (
 from baserow.api.utils import (
     DiscriminatorCustomFieldsMappingSerializer,
     apply_exception_mapping,
+    get_etag,
+    get_not_modified_response,
 )
 from baserow.contrib.builder.api.data_sources.errors import (
     ERROR_DATA_DOES_NOT_EXIST,
@@ -40,6 +46,7 @@ from baserow.contrib.builder.api.data_sources.serializers import (
 from baserow.contrib.builder.api.domains.serializers import (
     PublicDataSourceSerializer,
     PublicElementSerializer,
+    PublicPageBootstrapSerializer,
 )
 from baserow.contrib.builder.api.elements.errors import ERROR_ELEMENT_DOES_NOT_EXIST
 from baserow.contrib.builder.api.pages.errors import ERROR_PAGE_DOES_NOT_EXIST
@@ -65,6 +72,7 @@ from baserow.contrib.builder.exceptions import BuilderDoesNotExist
 from baserow.contrib.builder.handler import BuilderHandler
 from baserow.contrib.builder.pages.exceptions import PageDoesNotExist
 from baserow.contrib.builder.pages.handler import PageHandler
+from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.service import BuilderService
 from baserow.contrib.builder.workflow_actions.registries import (
     builder_workflow_action_type_registry,
@@ -92,6 +100,130 @@ BUILDER_PUBLIC_RECORDS_CACHE_TTL_SECONDS = 60 * 60
 # The duration of the cached public `get_public_builder_by_domain_name` view.
 BUILDER_PUBLIC_BUILDER_BY_DOMAIN_TTL_SECONDS = 60 * 60
 
+PUBLIC_DISPATCH_ERROR_MAPPING = {
+    DataSourceDoesNotExist: ERROR_DATA_SOURCE_DOES_NOT_EXIST,
+    ServiceImproperlyConfiguredDispatchException: ERROR_SERVICE_IMPROPERLY_CONFIGURED,
+    InvalidContextDispatchException: ERROR_SERVICE_INVALID_DISPATCH_CONTEXT,
+    InvalidContextContentDispatchException: ERROR_SERVICE_INVALID_DISPATCH_CONTEXT_CONTENT,
+    UnexpectedDispatchException: ERROR_SERVICE_UNEXPECTED_DISPATCH_ERROR,
+    DoesNotExist: ERROR_DATA_DOES_NOT_EXIST,
+    PermissionException: ERROR_PERMISSION_DENIED,
+}
+
+
+def get_cached_public_page_records(
+    page_id: int,
+    user_source_user: UserSourceUser,
+    record_name: str,
+    default: Callable[[], List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Returns the serialized records of a published page from the global cache,
+    computing them with `default` if the cache is stale.
+    """
+
+    return global_cache.get(
+        PageHandler.get_page_public_records_cache_key(
+            page_id, user_source_user, record_name
+        ),
+        default=default,
+        timeout=BUILDER_PUBLIC_RECORDS_CACHE_TTL_SECONDS,
+    )
+
+
+def get_public_page_elements(user: AbstractUser, page: Page) -> List[Dict[str, Any]]:
+    """
+    Returns a list of serialized elements that belong to the given page.
+
+    :param user: the user requesting the elements.
+    :param page: the page.
+    :return: a list of serialized elements.
+    """
+
+    elements = ElementService().get_elements(user, page)
+    workspace = page.builder.get_workspace()
+
+    return [
+        element_type_registry.get_serializer(element, PublicElementSerializer).data
+        for element in elements
+        if not element.get_type().is_deactivated(workspace)
+    ]
+
+
+def get_public_page_data_sources(
+    user: AbstractUser, user_source_user: UserSourceUser, page: Page
+) -> List[Dict[str, Any]]:
+    """
+    Returns a list of serialized data sources that belong to the given page.
+
+    :param user: the user requesting the data sources.
+    :param user_source_user: the user source user we want the data for.
+    :param page: the page.
+    :return: a list of serialized data sources.
+    """
+
+    data_sources = DataSourceService().get_data_sources(user, page)
+
+    public_properties = BuilderHandler().get_builder_public_properties(
+        user_source_user, page.builder
+    )
+    allowed_fields = []
+    for fields in public_properties["external"].values():
+        allowed_fields.extend(fields)
+
+    return [
+        service_type_registry.get_serializer(
+            data_source.service,
+            PublicDataSourceSerializer,
+            context={"data_source": data_source, "allowed_fields": allowed_fields},
+        ).data
+        for data_source in data_sources
+        if data_source.service and data_source.service.integration_id
+    ]
+
+
+def get_public_page_workflow_actions(
+    user: AbstractUser, page: Page
+) -> List[Dict[str, Any]]:
+    """
+    Returns a list of serialized workflow actions that belong to the given page.
+
+    :param user: the user requesting the actions.
+    :param page: the page.
+    :return: a list of serialized workflow actions.
+    """
+
+    workflow_actions = BuilderWorkflowActionService().get_workflow_actions(user, page)
+
+    return [
+        builder_workflow_action_type_registry.get_serializer(
+            workflow_action,
+            BuilderWorkflowActionSerializer,
+            extra_params={"public": True},
+        ).data
+        for workflow_action in workflow_actions
+    ]
+
+
+def serialize_public_dispatch_contents(
+    service_contents: Dict[int, Any],
+) -> Dict[int, Any]:
+    """
+    Replaces the exceptions of the dispatched data sources with their serialized
+    error, so that one failing data source doesn't fail the others.
+    """
+
+    responses = {}
+    for service_id, content in service_contents.items():
+        if isinstance(content, Exception):
+            _, error, detail = apply_exception_mapping(
+                PUBLIC_DISPATCH_ERROR_MAPPING, content, with_fallback=True
+            )
+            responses[service_id] = {"_error": error, "detail": detail}
+        else:
+            responses[service_id] = content
+    return responses
+
 
 class ForcedPublicPolymorphicApplicationResponseSerializer(
     PublicPolymorphicApplicationResponseSerializer
@@ -233,14 +365,13 @@ class PublicElementsView(APIView):
         """
 
         if PageHandler().is_published_page(page_id):
-            data = global_cache.get(
-                PageHandler.get_page_public_records_cache_key(
-                    page_id, request.user_source_user, "elements"
-                ),
-                default=lambda: self._get_public_page_elements(
+            data = get_cached_public_page_records(
+                page_id,
+                request.user_source_user,
+                "elements",
+                lambda: self._get_public_page_elements(
                     request.user_source_user, page_id
                 ),
-                timeout=BUILDER_PUBLIC_RECORDS_CACHE_TTL_SECONDS,
             )
         else:
             data = self._get_public_page_elements(request.user, page_id)
@@ -261,15 +392,7 @@ class PublicElementsView(APIView):
         :return: a list of serialized elements.
         """
 
-        page = PageHandler().get_page(page_id)
-        elements = ElementService().get_elements(user, page)
-        workspace = page.builder.get_workspace()
-
-        return [
-            element_type_registry.get_serializer(element, PublicElementSerializer).data
-            for element in elements
-            if not element.get_type().is_deactivated(workspace)
-        ]
+        return get_public_page_elements(user, PageHandler().get_page(page_id))
 
 
 class PublicDataSourcesView(APIView):
@@ -310,14 +433,13 @@ class PublicDataSourcesView(APIView):
         """
 
         if PageHandler().is_published_page(page_id):
-            data = global_cache.get(
-                PageHandler.get_page_public_records_cache_key(
-                    page_id, request.user_source_user, "data_sources"
-                ),
-                default=lambda: self._get_public_page_data_sources(
+            data = get_cached_public_page_records(
+                page_id,
+                request.user_source_user,
+                "data_sources",
+                lambda: self._get_public_page_data_sources(
                     request.user_source_user, request.user_source_user, page_id
                 ),
-                timeout=BUILDER_PUBLIC_RECORDS_CACHE_TTL_SECONDS,
             )
         else:
             data = self._get_public_page_data_sources(
@@ -341,25 +463,9 @@ class PublicDataSourcesView(APIView):
         :return: a list of serialized data sources.
         """
 
-        page = PageHandler().get_page(page_id)
-        data_sources = DataSourceService().get_data_sources(user, page)
-
-        public_properties = BuilderHandler().get_builder_public_properties(
-            user_source_user, page.builder
+        return get_public_page_data_sources(
+            user, user_source_user, PageHandler().get_page(page_id)
         )
-        allowed_fields = []
-        for fields in public_properties["external"].values():
-            allowed_fields.extend(fields)
-
-        return [
-            service_type_registry.get_serializer(
-                data_source.service,
-                PublicDataSourceSerializer,
-                context={"data_source": data_source, "allowed_fields": allowed_fields},
-            ).data
-            for data_source in data_sources
-            if data_source.service and data_source.service.integration_id
-        ]
 
 
 class PublicBuilderWorkflowActionsView(APIView):
@@ -405,14 +511,13 @@ class PublicBuilderWorkflowActionsView(APIView):
         """
 
         if PageHandler().is_published_page(page_id):
-            data = global_cache.get(
-                PageHandler.get_page_public_records_cache_key(
-                    page_id, request.user_source_user, "workflow_actions"
-                ),
-                default=lambda: self._get_public_page_workflow_actions(
+            data = get_cached_public_page_records(
+                page_id,
+                request.user_source_user,
+                "workflow_actions",
+                lambda: self._get_public_page_workflow_actions(
                     request.user_source_user, page_id
                 ),
-                timeout=BUILDER_PUBLIC_RECORDS_CACHE_TTL_SECONDS,
             )
         else:
             data = self._get_public_page_workflow_actions(request.user, page_id)
@@ -431,19 +536,7 @@ class PublicBuilderWorkflowActionsView(APIView):
         :return: a list of serialized workflow actions.
         """
 
-        page = PageHandler().get_page(page_id)
-        workflow_actions = BuilderWorkflowActionService().get_workflow_actions(
-            user, page
-        )
-
-        return [
-            builder_workflow_action_type_registry.get_serializer(
-                workflow_action,
-                BuilderWorkflowActionSerializer,
-                extra_params={"public": True},
-            ).data
-            for workflow_action in workflow_actions
-        ]
+        return get_public_page_workflow_actions(user, PageHandler().get_page(page_id))
 
 
 class PublicDispatchDataSourceView(APIView):
@@ -563,25 +656,117 @@ class PublicDispatchDataSourcesView(APIView):
             request.user, page, dispatch_context
         )
 
-        responses = {}
-
-        for service_id, content in service_contents.items():
-            if isinstance(content, Exception):
-                _, error, detail = apply_exception_mapping(
-                    {
-                        DataSourceDoesNotExist: ERROR_DATA_SOURCE_DOES_NOT_EXIST,
-                        ServiceImproperlyConfiguredDispatchException: ERROR_SERVICE_IMPROPERLY_CONFIGURED,
-                        InvalidContextDispatchException: ERROR_SERVICE_INVALID_DISPATCH_CONTEXT,
-                        InvalidContextContentDispatchException: ERROR_SERVICE_INVALID_DISPATCH_CONTEXT_CONTENT,
-                        UnexpectedDispatchException: ERROR_SERVICE_UNEXPECTED_DISPATCH_ERROR,
-                        DoesNotExist: ERROR_DATA_DOES_NOT_EXIST,
-                        PermissionException: ERROR_PERMISSION_DENIED,
-                    },
-                    content,
-                    with_fallback=True,
-                )
-                responses[service_id] = {"_error": error, "detail": detail}
-            else:
-                responses[service_id] = content
-
-        return Response(responses)
+        return Response(serialize_public_dispatch_contents(service_contents))
+
+
+class PublicPageBootstrapView(APIView):
+    permission_classes = (AllowAny,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="page_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The page we want to load.",
+            ),
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Builder public"],
+        operation_id="bootstrap_public_builder_page",
+        description=(
+            "Returns everything needed to render the page in a single response: the "
+            "public elements, data sources and workflow actions of the page and the "
+            "result of dispatching its data sources. Accepts the same body as the "
+            "`dispatch_public_builder_page_data_sources` endpoint. The response has "
+            "an `ETag` header which can be provided in the `If-None-Match` header "
+            "of the next request to receive a 304 response if nothing has changed."
+        ),
+        request=DispatchDataSourceRequestSerializer,
+        responses={
+            200: PublicPageBootstrapSerializer,
+            304: None,
+            404: get_error_schema(
+                [
+                    "ERROR_DATA_DOES_NOT_EXIST",
+                    "ERROR_PAGE_DOES_NOT_EXIST",
+                ]
+            ),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            PageDoesNotExist: ERROR_PAGE_DOES_NOT_EXIST,
+            DoesNotExist: ERROR_DATA_DOES_NOT_EXIST,
+        }
+    )
+    def post(self, request: Request, page_id: int):
+        """
+        Resolves the page once and responds with the page definition, which comes
+        from the same cache as the separate public endpoints, and the initial data
+        source dispatch results.
+        """
+
+        page = PageHandler().get_page(int(page_id))
+        user_source_user = request.user_source_user
+        is_published = PageHandler().is_published_page(page.id)
+
+        if is_published:
+            definition = {
+                "elements": get_cached_public_page_records(
+                    page.id,
+                    user_source_user,
+                    "elements",
+                    lambda: get_public_page_elements(user_source_user, page),
+                ),
+                "data_sources": get_cached_public_page_records(
+                    page.id,
+                    user_source_user,
+                    "data_sources",
+                    lambda: get_public_page_data_sources(
+                        user_source_user, user_source_user, page
+                    ),
+                ),
+                "workflow_actions": get_cached_public_page_records(
+                    page.id,
+                    user_source_user,
+                    "workflow_actions",
+                    lambda: get_public_page_workflow_actions(user_source_user, page),
+                ),
+            }
+        else:
+            definition = {
+                "elements": get_public_page_elements(request.user, page),
+                "data_sources": get_public_page_data_sources(
+                    request.user, user_source_user, page
+                ),
+                "workflow_actions": get_public_page_workflow_actions(
+                    request.user, page
+                ),
+            }
+
+        dispatch_context = BuilderDispatchContext(
+            request, page, only_expose_public_allowed_properties=True
+        )
+        data_source_contents = serialize_public_dispatch_contents(
+            DataSourceService().dispatch_page_data_sources(
+                request.user, page, dispatch_context
+            )
+        )
+
+        # The definition is hashed as well, because it depends on the role of the
+        # user source user and the cached records of a published page are never
+        # invalidated, they only expire. Because the data source contents are part of
+        # the ETag, the data sources are always dispatched, so a 304 response only
+        # saves sending the response, not computing it.
+        etag = get_etag(page.id, definition, data_source_contents)
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        return Response(
+            {**definition, "data_source_contents": data_source_contents},
+            headers={"ETag": etag},
+        )
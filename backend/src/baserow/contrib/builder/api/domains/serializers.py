@@ -350,3 +350,25 @@ class PublicDataSourceSerializer(PublicServiceSerializer):
             "order": {"read_only": True, "help_text": "Lowest first."},
             "context_data": {"read_only": True},
         }
+
+
+class PublicPageBootstrapSerializer(serializers.Serializer):
+    elements = serializers.ListField(
+        child=serializers.DictField(),
+        help_text="The public elements of the page, like returned by "
+        "`list_public_builder_page_elements`.",
+    )
+    data_sources = serializers.ListField(
+        child=serializers.DictField(),
+        help_text="The public data sources of the page, like returned by "
+        "`list_public_builder_page_data_sources`.",
+    )
+    workflow_actions = serializers.ListField(
+        child=serializers.DictField(),
+        help_text="The public workflow actions of the page, like returned by "
+        "`list_public_builder_page_workflow_actions`.",
+    )
+    data_source_contents = serializers.DictField(
+        help_text="The result of dispatching the data sources of the page by data "
+        "source id, like returned by `dispatch_public_builder_page_data_sources`.",
+    )
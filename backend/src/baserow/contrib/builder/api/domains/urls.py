@@ -8,6 +8,7 @@ from baserow.contrib.builder.api.domains.public_views import (
     PublicDispatchDataSourcesView,
     PublicDispatchDataSourceView,
     PublicElementsView,
+    PublicPageBootstrapView,
 )
 from baserow.contrib.builder.api.domains.views import (
     AskPublicBuilderDomainExistsView,
@@ -75,4 +76,9 @@ urlpatterns_without_builder_id = [
         PublicDispatchDataSourcesView.as_view(),
         name="public_dispatch_all",
     ),
+    re_path(
+        r"published/page/(?P<page_id>[0-9]+)/bootstrap/$",
+        PublicPageBootstrapView.as_view(),
+        name="public_page_bootstrap",
+    ),
 ]
@@ -1,11 +1,13 @@
 import json
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from io import BytesIO, IOBase
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.storage import Storage
@@ -351,6 +353,49 @@ class AirtableHandler:
         )
         return response
 
+    @staticmethod
+    def fetch_json_concurrently(
+        fetch: Callable[..., Response], arguments: List[Dict[str, Any]]
+    ) -> Iterator[dict]:
+        """
+        Executes the provided fetch function for every item in the arguments list
+        using a bounded pool of threads, because most of the time is spent waiting
+        for Airtable to respond. Every response is parsed and closed in the thread
+        that fetched it, so that only the parsed JSON is kept in memory.
+
+        :param fetch: The function making the request to Airtable, like
+            `fetch_table_data`.
+        :param arguments: A list of keyword arguments, the fetch function is called
+            once for every item.
+        :return: An iterator yielding the parsed JSON responses in the same order as
+            the provided arguments.
+        """
+
+        def fetch_json(kwargs):
+            response = fetch(**kwargs, stream=False)
+            try:
+                return parse_json_and_remove_invalid_surrogate_characters(response)
+            finally:
+                response.close()
+
+        max_workers = min(
+            settings.BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS, len(arguments)
+        )
+        if max_workers <= 1:
+            for kwargs in arguments:
+                yield fetch_json(kwargs)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch_json, kwargs) for kwargs in arguments]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                # Don't start the remaining requests if one of them failed.
+                for future in futures:
+                    future.cancel()
+
     @staticmethod
     def extract_schema(exports: List[dict]) -> Tuple[dict, dict]:
         """
@@ -713,6 +758,7 @@ class AirtableHandler:
         field_mapping_per_table: dict,
         config: AirtableImportConfig,
         import_report: AirtableImportReport,
+        release_raw_rows: bool = False,
     ):
         # A list containing all the exported table in Baserow format.
         exported_tables = []
@@ -755,6 +801,12 @@ class AirtableHandler:
                 )
                 converting_progress.increment(state=AIRTABLE_EXPORT_JOB_CONVERTING)
 
+            if release_raw_rows:
+                # The raw rows are not needed anymore after they've been converted.
+                # Releasing them table by table prevents keeping two full copies of
+                # all the rows in memory.
+                tables[table["id"]]["rows"] = []
+
             # Loop over all views to add them to them as failed to the import report
             # because the views are not yet supported.
             exported_views = []
@@ -837,6 +889,7 @@ class AirtableHandler:
         config: AirtableImportConfig,
         progress_builder: Optional[ChildProgressBuilder] = None,
         download_files_buffer: Union[None, IOBase] = None,
+        release_raw_rows: bool = False,
     ) -> Tuple[dict, IOBase]:
         """
         Converts the provided raw Airtable database dict to a Baserow export format and
@@ -857,6 +910,9 @@ class AirtableHandler:
             and report on this methods progress to the parent of the progress_builder.
         :param download_files_buffer: Optionally a file buffer can be provided to store
             the downloaded files in. They will be stored in memory if not provided.
+        :param release_raw_rows: If True, the raw rows of every table are removed
+            from the provided tables after they've been converted to reduce the memory
+            usage. The tables can't be converted again afterward.
         :return: The converted Airtable base in Baserow export format and a zip file
             containing the user files.
         """
@@ -910,6 +966,7 @@ class AirtableHandler:
             field_mapping_per_table,
             config,
             import_report,
+            release_raw_rows=release_raw_rows,
         )
 
         # Just to be really clear that the automations and interfaces are not included.
@@ -986,35 +1043,34 @@ class AirtableHandler:
         )
         progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE)
 
-        # Loop over all the tables and make a request for each table to obtain the raw
-        # Airtable table data.
+        # Make a request for each table to obtain the raw Airtable table data. The
+        # requests are made concurrently because most of the time is spent waiting
+        # for Airtable to respond.
         tables = []
         raw_tables = list(
             init_data["singleApplicationScaffoldingData"]["tableById"].keys()
         )
-        for index, table_id in enumerate(
-            progress.track(
-                represents_progress=49,
-                state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
-                iterable=raw_tables,
-            )
+        tables_progress = progress.create_child(
+            represents_progress=49, total=len(raw_tables)
+        )
+        for json_decoded_content in cls.fetch_json_concurrently(
+            cls.fetch_table_data,
+            [
+                {
+                    "table_id": table_id,
+                    "init_data": init_data,
+                    "request_id": request_id,
+                    "cookies": cookies,
+                    # At least one request must also fetch the application structure
+                    # that contains the schema of all the tables, so we do this for
+                    # the first table.
+                    "fetch_application_structure": index == 0,
+                }
+                for index, table_id in enumerate(raw_tables)
+            ],
         ):
-            response = cls.fetch_table_data(
-                table_id=table_id,
-                init_data=init_data,
-                request_id=request_id,
-                cookies=cookies,
-                # At least one request must also fetch the application structure that
-                # contains the schema of all the tables, so we do this for the first
-                # table.
-                fetch_application_structure=index == 0,
-                stream=False,
-            )
-            json_decoded_content = parse_json_and_remove_invalid_surrogate_characters(
-                response
-            )
-
             tables.append(json_decoded_content)
+            tables_progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE)
 
         # Split database schema from the tables because we need this to be separated
         # later on.
@@ -1036,22 +1092,26 @@ class AirtableHandler:
 
         # Fetch the missing view data, and add them to the table object so that we have
         # a complete object.
-        for table_id, view_id in progress.track(
-            represents_progress=50,
-            state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE,
-            iterable=view_data_to_fetch,
+        views_progress = progress.create_child(
+            represents_progress=50, total=len(view_data_to_fetch)
+        )
+        for (table_id, _), json_decoded_content in zip(
+            view_data_to_fetch,
+            cls.fetch_json_concurrently(
+                cls.fetch_view_data,
+                [
+                    {
+                        "view_id": view_id,
+                        "init_data": init_data,
+                        "request_id": request_id,
+                        "cookies": cookies,
+                    }
+                    for _, view_id in view_data_to_fetch
+                ],
+            ),
         ):
-            response = cls.fetch_view_data(
-                view_id=view_id,
-                init_data=init_data,
-                request_id=request_id,
-                cookies=cookies,
-                stream=False,
-            )
-            json_decoded_content = parse_json_and_remove_invalid_surrogate_characters(
-                response
-            )
             tables[table_id]["viewDatas"].append(json_decoded_content["data"])
+            views_progress.increment(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE)
 
         return init_data, request_id, cookies, schema, tables
 
@@ -1109,6 +1169,7 @@ class AirtableHandler:
             config,
             progress.create_child_builder(represents_progress=300),
             download_files_buffer,
+            release_raw_rows=True,
         )
 
         import_export_config = ImportExportConfig(
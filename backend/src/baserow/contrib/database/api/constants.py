@@ -48,6 +48,19 @@ EXCLUDE_COUNT_API_PARAM = OpenApiParameter(
         "number of results is slow."
     ),
 )
+CURSOR_PAGINATION_API_PARAM = OpenApiParameter(
+    name="cursor",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "If provided, keyset pagination is used instead of page or limit/offset "
+        "pagination. Provide an empty value to fetch the first page and the "
+        "`next_cursor` of the response to fetch the next one. Every page is as fast "
+        "as the first one, which makes this the preferred way to iterate over large "
+        "tables. The `size` parameter defines how many rows are returned and the "
+        "count is never included."
+    ),
+)
 INCLUDE_OPERATION_METADATA = OpenApiParameter(
     name="include_metadata",
     location=OpenApiParameter.QUERY,
@@ -245,9 +258,10 @@ PAGINATION_API_PARAMS = (
         name="size",
         location=OpenApiParameter.QUERY,
         type=OpenApiTypes.INT,
-        description="Can only be used in combination with the `page` parameter "
-        "and defines how many rows should be returned.",
+        description="Can only be used in combination with the `page` or `cursor` "
+        "parameter and defines how many rows should be returned.",
     ),
+    CURSOR_PAGINATION_API_PARAM,
 )
 
 INCLUDE_FIELDS_API_PARAM = OpenApiParameter(
@@ -26,11 +26,13 @@ from baserow.api.jobs.serializers import JobSerializer
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
+    IF_NONE_MATCH_SCHEMA_PARAMETER,
     get_error_schema,
 )
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
 from baserow.api.utils import (
     DiscriminatorCustomFieldsMappingSerializer,
+    get_not_modified_response,
     type_from_data_or_registry,
     validate_data_custom_fields,
 )
@@ -67,6 +69,7 @@ from baserow.contrib.database.api.tables.errors import (
 )
 from baserow.contrib.database.api.tokens.authentications import TokenAuthentication
 from baserow.contrib.database.api.tokens.errors import ERROR_NO_PERMISSION_TO_TABLE
+from baserow.contrib.database.api.utils import get_table_etag
 from baserow.contrib.database.fields.actions import (
     ChangePrimaryFieldActionType,
     CreateFieldActionType,
@@ -111,6 +114,7 @@ from baserow.contrib.database.fields.operations import (
 )
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.table.cache import TABLE_SCHEMA_WATERMARK
 from baserow.contrib.database.table.exceptions import (
     FailedToLockTableDueToConflict,
     TableDoesNotExist,
@@ -161,7 +165,8 @@ class FieldsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Returns only the fields of the table related to the "
                 "provided value.",
-            )
+            ),
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table fields"],
         operation_id="list_database_table_fields",
@@ -177,6 +182,7 @@ class FieldsView(APIView):
             200: DiscriminatorCustomFieldsMappingSerializer(
                 field_type_registry, FieldSerializer, many=True
             ),
+            304: None,
             400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
             401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
             404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
@@ -209,6 +215,11 @@ class FieldsView(APIView):
             request, ["read", "create", "update"], table, False
         )
 
+        etag = get_table_etag(request, table, [TABLE_SCHEMA_WATERMARK])
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
         base_field_queryset = FieldHandler().get_base_fields_queryset()
         fields = specific_iterator(
             base_field_queryset.filter(table=table),
@@ -223,7 +234,7 @@ class FieldsView(APIView):
             field_type_registry.get_serializer(field, FieldSerializer).data
             for field in fields
         ]
-        return Response(data)
+        return Response(data, headers={"ETag": etag})
 
     @extend_schema(
         parameters=[
@@ -1,12 +1,17 @@
+import threading
+from collections import OrderedDict
 from copy import deepcopy
-from typing import Dict, List
+from typing import Any, Dict, Hashable, List, Optional, Type
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import models
 from django.db.models.base import ModelBase
 
 from loguru import logger
 from rest_framework import serializers
+from rest_framework.fields import SkipField, is_simple_callable
+from rest_framework.relations import PKOnlyObject
 
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import get_serializer_class
@@ -80,6 +85,128 @@ class BatchUpdateRowsSerializer(serializers.Serializer):
     )
 
 
+def _represent_field(field: serializers.Field, instance: Any) -> Any:
+    """
+    Returns the representation of the value of the field for the provided instance,
+    exactly like `Serializer.to_representation` does.
+
+    :raises SkipField: If the field must be left out of the representation.
+    """
+
+    attribute = field.get_attribute(instance)
+    check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+    if check_for_none is None:
+        return None
+    return field.to_representation(attribute)
+
+
+class FastRowListSerializer(serializers.ListSerializer):
+    """
+    Serializes many rows without most of the per field overhead of DRF. How every
+    field of the child serializer gets its value is resolved once instead of for
+    every row, and fields with a plain attribute as source read the value directly
+    from the row. The other fields and rows of which the attribute can't be read
+    fall back on the regular DRF behaviour, so the result is the same as with the
+    regular list serializer.
+    """
+
+    def _get_attribute_name(self, field: serializers.Field) -> Optional[str]:
+        """
+        Returns the name of the row attribute from which the value of the field can
+        be read directly, or `None` if the regular DRF behaviour must be used.
+        """
+
+        if (
+            type(field).get_attribute is not serializers.Field.get_attribute
+            or len(field.source_attrs) != 1
+        ):
+            return None
+
+        attribute_name = field.source_attrs[0]
+        model = getattr(self.child.Meta, "model", None)
+        # Methods of the model are called by DRF, which isn't done by the fast path.
+        if model is not None and is_simple_callable(
+            getattr(model, attribute_name, None)
+        ):
+            return None
+
+        return attribute_name
+
+    def to_representation(self, data):
+        if (
+            type(self.child).to_representation
+            is not serializers.Serializer.to_representation
+        ):
+            return super().to_representation(data)
+
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        fields = [
+            (field.field_name, self._get_attribute_name(field), field)
+            for field in self.child._readable_fields
+        ]
+
+        result = []
+        for row in iterable:
+            serialized_row = {}
+            for field_name, attribute_name, field in fields:
+                try:
+                    if attribute_name is None:
+                        value = _represent_field(field, row)
+                    else:
+                        try:
+                            value = getattr(row, attribute_name)
+                        except Exception:
+                            value = _represent_field(field, row)
+                        else:
+                            if value is not None:
+                                value = field.to_representation(value)
+                except SkipField:
+                    continue
+                serialized_row[field_name] = value
+            result.append(serialized_row)
+        return result
+
+
+class RowSerializerClassCache:
+    """
+    A bounded, process wide cache of generated row serializer classes, where the
+    least recently used class is dropped when the cache is full. Generating the
+    serializer class of a table with many fields is expensive, and because the same
+    classes are needed for almost every request, they're reused.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._classes: OrderedDict[
+            Hashable, Type[serializers.Serializer]
+        ] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Type[serializers.Serializer]]:
+        with self._lock:
+            serializer_class = self._classes.get(key)
+            if serializer_class is not None:
+                self._classes.move_to_end(key)
+            return serializer_class
+
+    def set(self, key: Hashable, serializer_class: Type[serializers.Serializer]):
+        max_size = settings.ROW_SERIALIZER_CLASS_CACHE_SIZE
+        with self._lock:
+            self._classes[key] = serializer_class
+            self._classes.move_to_end(key)
+            while len(self._classes) > max_size:
+                self._classes.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._classes.clear()
+
+    def __len__(self):
+        return len(self._classes)
+
+
+row_serializer_class_cache = RowSerializerClassCache()
+
+
 def serialize_rows_for_response(
     rows, model, user_field_names=False, many=True, field_ids=None
 ):
@@ -89,6 +216,7 @@ def serialize_rows_for_response(
         is_response=True,
         user_field_names=user_field_names,
         field_ids=field_ids,
+        use_fast_list_serializer=True,
     )(rows, many=many).data
 
 
@@ -107,6 +235,7 @@ def get_row_serializer_class(
     include_id=False,
     required_fields=None,
     extra_kwargs=None,
+    use_fast_list_serializer=False,
 ):
     """
     Generates a Django rest framework model serializer based on the available fields
@@ -114,6 +243,9 @@ def get_row_serializer_class(
     a serializer field will be added via the `get_serializer_field` method of the field
     type.
 
+    The generated classes are cached per table version and set of fields, unless
+    `field_kwargs` are provided or `extra_kwargs` can't be hashed.
+
     :param model: The model for which to generate a serializer.
     :type model: Model
     :param base_class: The base serializer class that will be extended when
@@ -145,63 +277,165 @@ def get_row_serializer_class(
         passed to the field serializer, the key in this dictionary must be listed in the
         fieldType.serializer_extra_args list.
     :type extra_kwargs: dict
+    :param use_fast_list_serializer: Whether the `FastRowListSerializer` must be used
+        when serializing many rows.
+    :type use_fast_list_serializer: bool
     :return: The generated serializer.
     :rtype: ModelSerializer
     """
 
+    field_objects = [
+        field
+        for field in model._field_objects.values()
+        if (field_ids is None or field["field"].id in field_ids)
+        and (
+            field_names_to_include is None
+            or field["field"].name in field_names_to_include
+        )
+    ]
+
+    cache_key = _get_row_serializer_class_cache_key(
+        model,
+        field_objects,
+        base_class,
+        is_response,
+        user_field_names,
+        field_kwargs,
+        include_id,
+        required_fields,
+        extra_kwargs,
+        use_fast_list_serializer,
+    )
+    if cache_key is not None:
+        serializer_class = row_serializer_class_cache.get(cache_key)
+        if serializer_class is not None:
+            return serializer_class
+
+    serializer_class = _generate_row_serializer_class(
+        model,
+        field_objects,
+        base_class,
+        is_response,
+        user_field_names,
+        field_kwargs,
+        include_id,
+        required_fields,
+        extra_kwargs,
+    )
+
+    if use_fast_list_serializer:
+        serializer_class.Meta.list_serializer_class = FastRowListSerializer
+
+    if cache_key is not None:
+        row_serializer_class_cache.set(cache_key, serializer_class)
+
+    return serializer_class
+
+
+def _get_row_serializer_class_cache_key(
+    model,
+    field_objects,
+    base_class,
+    is_response,
+    user_field_names,
+    field_kwargs,
+    include_id,
+    required_fields,
+    extra_kwargs,
+    use_fast_list_serializer,
+) -> Optional[Hashable]:
+    """
+    Returns the key of the generated row serializer class in the
+    `row_serializer_class_cache`, or `None` if the class can't be cached.
+
+    Every schema change bumps the table version, but the version of the table
+    instance of the model might not have been refreshed yet, so the fields' last
+    update dates are part of the key as well.
+    """
+
+    if field_kwargs or settings.ROW_SERIALIZER_CLASS_CACHE_SIZE <= 0:
+        return None
+
+    key = (
+        model.baserow_table_id,
+        model.baserow_table.version,
+        tuple(
+            (field["field"].id, field["field"].updated_on) for field in field_objects
+        ),
+        base_class,
+        is_response,
+        user_field_names,
+        include_id,
+        tuple(required_fields) if required_fields else None,
+        tuple(sorted(extra_kwargs.items())) if extra_kwargs else None,
+        use_fast_list_serializer,
+    )
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _generate_row_serializer_class(
+    model,
+    field_objects,
+    base_class,
+    is_response,
+    user_field_names,
+    field_kwargs,
+    include_id,
+    required_fields,
+    extra_kwargs,
+):
     if not field_kwargs:
         field_kwargs = {}
 
-    field_objects = model._field_objects
     field_names = []
     field_overrides = {}
 
-    for field in field_objects.values():
-        field_id_matches = field_ids is None or (field["field"].id in field_ids)
-        field_name_matches = field_names_to_include is None or (
-            field["field"].name in field_names_to_include
-        )
-
-        if field_id_matches and field_name_matches:
-            name = field["field"].name if user_field_names else field["name"]
-            field_extra_kwargs = field_kwargs.get(field["name"], {})
-            # If the field is configured to be read-only, then we want the API to
-            # respond with an error if the key is provided. It should be possible to
-            # update the cell value via handlers because the value is then managed by
-            # something internally.
-            if field["field"].read_only:
-                if "validators" not in field_extra_kwargs:
-                    field_extra_kwargs["validators"] = []
-                field_extra_kwargs["validators"].append(is_read_only)
-                field_extra_kwargs.pop("required", None)
-
-            if field["name"] != name:
-                # If we are building a serializer with names which do not match the
-                # database column then we have to set the source.
-                # We don't always do this if user_field_names is True as a user could
-                # have named fields "field_1" etc, in which case if we also set source
-                # DRF would crash as it only wants source set if the db column differs.
-                field_extra_kwargs["source"] = field["name"]
-
-            if extra_kwargs is not None:
-                field_extra_kwargs.update(
-                    {
-                        key: value
-                        for key, value in extra_kwargs.items()
-                        if key in field["type"].serializer_extra_args
-                    }
-                )
-
-            if is_response:
-                serializer = field["type"].get_response_serializer_field(
-                    field["field"], **field_extra_kwargs
-                )
-            else:
-                serializer = field["type"].get_serializer_field(
-                    field["field"], **field_extra_kwargs
-                )
-            field_overrides[name] = serializer
-            field_names.append(name)
+    for field in field_objects:
+        name = field["field"].name if user_field_names else field["name"]
+        field_extra_kwargs = field_kwargs.get(field["name"], {})
+        # If the field is configured to be read-only, then we want the API to
+        # respond with an error if the key is provided. It should be possible to
+        # update the cell value via handlers because the value is then managed by
+        # something internally.
+        if field["field"].read_only:
+            if "validators" not in field_extra_kwargs:
+                field_extra_kwargs["validators"] = []
+            field_extra_kwargs["validators"].append(is_read_only)
+            field_extra_kwargs.pop("required", None)
+
+        if field["name"] != name:
+            # If we are building a serializer with names which do not match the
+            # database column then we have to set the source.
+            # We don't always do this if user_field_names is True as a user could
+            # have named fields "field_1" etc, in which case if we also set source
+            # DRF would crash as it only wants source set if the db column differs.
+            field_extra_kwargs["source"] = field["name"]
+
+        if extra_kwargs is not None:
+            field_extra_kwargs.update(
+                {
+                    key: value
+                    for key, value in extra_kwargs.items()
+                    if key in field["type"].serializer_extra_args
+                }
+            )
+
+        if is_response:
+            serializer = field["type"].get_response_serializer_field(
+                field["field"], **field_extra_kwargs
+            )
+        else:
+            serializer = field["type"].get_serializer_field(
+                field["field"], **field_extra_kwargs
+            )
+        field_overrides[name] = serializer
+        field_names.append(name)
 
     if include_id:
         field_names.append("id")
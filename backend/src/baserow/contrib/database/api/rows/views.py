@@ -25,18 +25,20 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import CursorPagination, PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
+    IF_NONE_MATCH_SCHEMA_PARAMETER,
     get_error_schema,
 )
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
-from baserow.api.utils import validate_data
+from baserow.api.utils import get_not_modified_response, validate_data
 from baserow.config.settings.utils import str_to_bool
 from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS,
+    CURSOR_PAGINATION_API_PARAM,
     INCLUDE_OPERATION_METADATA,
     SEARCH_MODE_API_PARAM,
 )
@@ -68,6 +70,7 @@ from baserow.contrib.database.api.utils import (
     extract_send_webhook_events_from_params,
     extract_user_field_names_from_params,
     get_include_exclude_fields,
+    get_table_etag,
 )
 from baserow.contrib.database.api.views.errors import (
     ERROR_VIEW_DOES_NOT_EXIST,
@@ -106,6 +109,11 @@ from baserow.contrib.database.rows.operations import (
     ReadDatabaseRowHistoryOperationType,
 )
 from baserow.contrib.database.rows.signals import rows_loaded
+from baserow.contrib.database.table.cache import (
+    TABLE_ROWS_WATERMARK,
+    TABLE_SCHEMA_WATERMARK,
+    TABLE_VIEWS_WATERMARK,
+)
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import Table
@@ -207,6 +215,7 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Defines how many rows should be returned per page.",
             ),
+            CURSOR_PAGINATION_API_PARAM,
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -307,6 +316,7 @@ class RowsView(APIView):
                 description="Includes all the filters and sorts of the provided view.",
             ),
             SEARCH_MODE_API_PARAM,
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
@@ -326,11 +336,13 @@ class RowsView(APIView):
         ),
         responses={
             200: example_pagination_row_serializer_class,
+            304: None,
             400: get_error_schema(
                 [
                     "ERROR_USER_NOT_IN_GROUP",
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -382,6 +394,18 @@ class RowsView(APIView):
         )
 
         TokenHandler().check_table_permissions(request, "read", table, False)
+
+        etag = get_table_etag(
+            request,
+            table,
+            [TABLE_ROWS_WATERMARK, TABLE_SCHEMA_WATERMARK, TABLE_VIEWS_WATERMARK],
+            include_linked_tables=True,
+        )
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            rows_loaded.send(sender=self, table=table)
+            return not_modified_response
+
         search = query_params.get("search")
         search_mode = query_params.get("search_mode")
         order_by = query_params.get("order_by")
@@ -428,7 +452,9 @@ class RowsView(APIView):
             # queryset. Unrequested fields will be filtered out later in the serializer.
 
             model = table.get_model()
-            queryset = model.objects.all().enhance_by_fields(**field_kwargs)
+            queryset = model.objects.all().enhance_by_fields(
+                link_row_display_values_only=True, **field_kwargs
+            )
             queryset = view_handler.apply_filters(view, queryset)
             queryset = view_handler.apply_sorting(view, queryset)
         else:
@@ -436,7 +462,9 @@ class RowsView(APIView):
                 fields=fields,
                 field_ids=[] if fields else None,
             )
-            queryset = model.objects.all().enhance_by_fields(**field_kwargs)
+            queryset = model.objects.all().enhance_by_fields(
+                link_row_display_values_only=True, **field_kwargs
+            )
 
         adhoc_filters = AdHocFilters.from_request(
             request, user_field_names=user_field_names
@@ -450,7 +478,12 @@ class RowsView(APIView):
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if CURSOR_PAGINATION_API_PARAM.name in request.GET:
+            paginator = CursorPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model,
@@ -459,12 +492,15 @@ class RowsView(APIView):
             field_ids=[f.id for f in fields] if fields else None,
             user_field_names=user_field_names,
             field_kwargs=field_kwargs,
+            use_fast_list_serializer=True,
         )
         serializer = serializer_class(page, many=True)
 
         rows_loaded.send(sender=self, table=table)
 
-        return paginator.get_paginated_response(serializer.data)
+        response = paginator.get_paginated_response(serializer.data)
+        response["ETag"] = etag
+        return response
 
     @extend_schema(
         parameters=[
@@ -5,7 +5,9 @@ from typing import List
 from django.db.models import QuerySet
 
 from rest_framework import serializers
+from rest_framework.request import Request
 
+from baserow.api.utils import get_etag
 from baserow.config.settings.utils import str_to_bool
 from baserow.contrib.database.api.rows.exceptions import InvalidJoinParameterException
 from baserow.contrib.database.fields.exceptions import (
@@ -17,8 +19,14 @@ from baserow.contrib.database.fields.models import (
     DEFAULT_THOUSAND_SEPARATOR,
     NUMBER_SEPARATORS,
     Field,
+    LinkRowField,
 )
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
+from baserow.contrib.database.table.cache import (
+    TABLE_ROWS_WATERMARK,
+    get_table_watermarks,
+)
+from baserow.contrib.database.table.models import Table
 from baserow.core.db import specific_iterator
 from baserow.core.utils import split_comma_separated_string
 
@@ -305,3 +313,48 @@ def get_thousand_and_decimal_separator(value):
             DEFAULT_DECIMAL_SEPARATOR,
         )
     return thousand_sep.value, decimal_sep.value
+
+
+def get_table_etag(
+    request: Request,
+    table: Table,
+    watermark_names: List[str],
+    include_linked_tables: bool = False,
+) -> str:
+    """
+    Returns the ETag of a response that only depends on the provided table, like the
+    rows, fields or views of the table. It's computed from the version and the
+    watermarks of the table, so that a conditional request can be answered without
+    querying or serializing the rows. The user and the full path, including the
+    query parameters, are part of the ETag because they change the response too.
+
+    :param request: The request for which the response is returned.
+    :param table: The table the response depends on.
+    :param watermark_names: The names of the table watermarks the response depends
+        on, like `TABLE_ROWS_WATERMARK`.
+    :param include_linked_tables: Whether the response contains the primary values
+        of the rows in the tables linked to via a link row field. If so, the rows
+        watermarks of those tables are also part of the ETag.
+    :return: The quoted ETag.
+    """
+
+    watermarks = {
+        name: get_table_watermarks([table.id], name) for name in watermark_names
+    }
+    if include_linked_tables:
+        linked_table_ids = sorted(
+            set(
+                LinkRowField.objects.filter(table=table).values_list(
+                    "link_row_table_id", flat=True
+                )
+            )
+            - {table.id}
+        )
+        watermarks["linked_rows"] = [
+            linked_table_ids,
+            get_table_watermarks(linked_table_ids, TABLE_ROWS_WATERMARK),
+        ]
+
+    return get_etag(
+        request.user.id, request.get_full_path(), table.id, table.version, watermarks
+    )
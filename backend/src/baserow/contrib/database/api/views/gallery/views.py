@@ -13,12 +13,14 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
+from baserow.api.pagination import CursorPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS,
     ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
+    CURSOR_PAGINATION_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     LIMIT_LINKED_ITEMS_API_PARAM,
     ONLY_COUNT_API_PARAM,
@@ -134,6 +136,7 @@ class GalleryViewView(APIView):
             ),
             *ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
             SEARCH_MODE_API_PARAM,
+            CURSOR_PAGINATION_API_PARAM,
             LIMIT_LINKED_ITEMS_API_PARAM,
         ],
         tags=["Database table gallery view"],
@@ -165,6 +168,7 @@ class GalleryViewView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                 ]
             ),
@@ -235,7 +239,10 @@ class GalleryViewView(APIView):
         if ONLY_COUNT_API_PARAM.name in request.GET:
             return Response({"count": queryset.count()})
 
-        paginator = GalleryLimitOffsetPagination()
+        if CURSOR_PAGINATION_API_PARAM.name in request.GET:
+            paginator = CursorPagination()
+        else:
+            paginator = GalleryLimitOffsetPagination()
         page = paginator.paginate_queryset(queryset, request, self)
 
         limit_linked_items = parse_limit_linked_items_params(request)
@@ -376,6 +383,7 @@ class PublicGalleryViewRowsView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            CURSOR_PAGINATION_API_PARAM,
             LIMIT_LINKED_ITEMS_API_PARAM,
         ],
         tags=["Database table gallery view"],
@@ -486,7 +494,10 @@ class PublicGalleryViewRowsView(APIView):
         if count:
             return Response({"count": queryset.count()})
 
-        paginator = GalleryLimitOffsetPagination()
+        if CURSOR_PAGINATION_API_PARAM.name in request.GET:
+            paginator = CursorPagination()
+        else:
+            paginator = GalleryLimitOffsetPagination()
         page = paginator.paginate_queryset(queryset, request, self)
 
         limit_linked_items = parse_limit_linked_items_params(request)
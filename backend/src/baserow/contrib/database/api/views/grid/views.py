@@ -184,6 +184,7 @@ class GridViewView(APIView):
                 [
                     "ERROR_USER_NOT_IN_GROUP",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
@@ -226,14 +227,7 @@ class GridViewView(APIView):
         order_by = request.GET.get("order_by")
 
         view_handler = ViewHandler()
-        view = view_handler.get_view_as_user(
-            request.user,
-            view_id,
-            GridView,
-            base_queryset=GridView.objects.prefetch_related(
-                "viewsort_set", "viewgroupby_set"
-            ),
-        )
+        view = view_handler.get_view_as_user(request.user, view_id, GridView)
         view_type = view_type_registry.get_by_model(view)
 
         workspace = view.table.database.workspace
@@ -247,10 +241,16 @@ class GridViewView(APIView):
             view.table, include_fields, exclude_fields
         )
 
+        model = view.table.get_model()
+        view_handler.prefetch_view_metadata(view)
         queryset = get_view_filtered_queryset(
-            view, adhoc_filters, order_by, query_params
+            view,
+            adhoc_filters,
+            order_by,
+            query_params,
+            model=model,
+            link_row_display_values_only=True,
         )
-        model = queryset.model
 
         if ONLY_COUNT_API_PARAM.name in request.GET:
             return Response({"count": queryset.count()})
@@ -270,7 +270,9 @@ class GridViewView(APIView):
             response.data.update(group_by_metadata=serialized_group_by_metadata)
 
         if field_options:
-            response.data.update(**serialize_view_field_options(view, model))
+            response.data.update(
+                **serialize_view_field_options(view, model, use_cache=True)
+            )
 
         if row_metadata:
             response.data.update(
@@ -758,6 +760,7 @@ class PublicGridViewRowsView(APIView):
                 [
                     "ERROR_USER_NOT_IN_GROUP",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
@@ -9,6 +9,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from baserow.api.pagination import (
+    CursorPagination,
     LimitOffsetPagination,
     LimitOffsetPaginationWithoutCount,
     Pageable,
@@ -16,6 +17,7 @@ from baserow.api.pagination import (
     PageNumberPaginationWithoutCount,
 )
 from baserow.contrib.database.api.constants import (
+    CURSOR_PAGINATION_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     LIMIT_LINKED_ITEMS_API_PARAM,
 )
@@ -54,6 +56,7 @@ def get_view_filtered_queryset(
     order_by: Optional[str] = None,
     query_params: Optional[Dict[str, Any]] = None,
     model: Optional[GeneratedTableModel] = None,
+    link_row_display_values_only: bool = False,
 ) -> QuerySet:
     """
     Returns a queryset that is filtered based on the provided view, adhoc filters, and
@@ -64,6 +67,8 @@ def get_view_filtered_queryset(
     :param order_by: The order by string to apply to the queryset.
     :param query_params: The query parameters to apply to the queryset.
     :param model: The model to filter the queryset by.
+    :param link_row_display_values_only: Indicates that the related rows of the link
+        row fields are only going to be used to display the cell values.
     :return: The filtered queryset.
     """
 
@@ -85,6 +90,7 @@ def get_view_filtered_queryset(
         search=search_value,
         search_mode=search_mode,
         model=model,
+        link_row_display_values_only=link_row_display_values_only,
     )
 
     if has_adhoc_sorts:
@@ -162,7 +168,9 @@ def _get_paginator(request: Request) -> Pageable:
     :return: The paginator to use.
     """
 
-    if EXCLUDE_COUNT_API_PARAM.name in request.GET:
+    if CURSOR_PAGINATION_API_PARAM.name in request.GET:
+        paginator = CursorPagination()
+    elif EXCLUDE_COUNT_API_PARAM.name in request.GET:
         if LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPaginationWithoutCount()
         else:
@@ -223,6 +231,7 @@ def paginate_and_serialize_queryset(
         is_response=True,
         field_ids=field_ids,
         extra_kwargs=extra_kwargs,
+        use_fast_list_serializer=True,
     )
     serializer = serializer_class(page, many=True)
 
@@ -235,6 +244,7 @@ def serialize_view_field_options(
     model: GeneratedTableModel,
     create_if_missing: bool = True,
     context: Optional[Dict[str, Any]] = None,
+    use_cache: bool = False,
 ) -> Dict[str, Any]:
     """
     Serializes the view field options for the provided view and the given model.
@@ -243,9 +253,19 @@ def serialize_view_field_options(
     :param model: The model to serialize the field options for.
     :param create_if_missing: Whether to create the field options if they are missing.
     :param context: The context to serialize the field options with.
+    :param use_cache: Whether the serialized field options can be taken from the
+        view metadata cache. Only the field options serialized with the default
+        arguments are cached.
     :return: The serialized view field options.
     """
 
+    if use_cache and create_if_missing and context is None:
+        return ViewHandler().get_cached_view_metadata(
+            view,
+            "field_options",
+            lambda: serialize_view_field_options(view, model),
+        )
+
     if context is None:
         context = {"fields": [o["field"] for o in model._field_objects.values()]}
 
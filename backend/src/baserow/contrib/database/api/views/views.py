@@ -27,6 +27,7 @@ from baserow.api.pagination import PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
+    IF_NONE_MATCH_SCHEMA_PARAMETER,
     get_error_schema,
 )
 from baserow.api.search.serializers import SearchQueryParamSerializer
@@ -35,6 +36,7 @@ from baserow.api.utils import (
     CustomFieldRegistryMappingSerializer,
     DiscriminatorCustomFieldsMappingSerializer,
     MappingSerializer,
+    get_not_modified_response,
     validate_data,
     validate_data_custom_fields,
 )
@@ -50,6 +52,7 @@ from baserow.contrib.database.api.rows.serializers import (
     get_row_serializer_class,
 )
 from baserow.contrib.database.api.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
+from baserow.contrib.database.api.utils import get_table_etag
 from baserow.contrib.database.api.views.serializers import (
     CreateViewGroupBySerializer,
     PublicViewInfoSerializer,
@@ -63,6 +66,10 @@ from baserow.contrib.database.fields.exceptions import (
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.table.cache import (
+    TABLE_SCHEMA_WATERMARK,
+    TABLE_VIEWS_WATERMARK,
+)
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.views.actions import (
@@ -251,6 +258,7 @@ class ViewsView(APIView):
                     "containing a list of the views filters and sortings respectively."
                 ),
             ),
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table views"],
         operation_id="list_database_table_views",
@@ -267,6 +275,7 @@ class ViewsView(APIView):
             200: DiscriminatorCustomFieldsMappingSerializer(
                 view_type_registry, ViewSerializer, many=True
             ),
+            304: None,
             400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
             404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
         },
@@ -295,6 +304,13 @@ class ViewsView(APIView):
             context=table,
         )
 
+        etag = get_table_etag(
+            request, table, [TABLE_SCHEMA_WATERMARK, TABLE_VIEWS_WATERMARK]
+        )
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
         views = ViewHandler().list_views(
             request.user,
             table,
@@ -322,7 +338,7 @@ class ViewsView(APIView):
                 group_bys=group_bys,
                 many=True,
             ).data
-        return Response(serialized_views)
+        return Response(serialized_views, headers={"ETag": etag})
 
     @extend_schema(
         parameters=[
@@ -445,6 +461,7 @@ class ViewView(APIView):
                     "a list of the views filters and sortings respectively."
                 ),
             ),
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table views"],
         operation_id="get_database_table_view",
@@ -456,6 +473,7 @@ class ViewView(APIView):
             200: DiscriminatorCustomFieldsMappingSerializer(
                 view_type_registry, ViewSerializer
             ),
+            304: None,
             400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
             404: get_error_schema(["ERROR_VIEW_DOES_NOT_EXIST"]),
         },
@@ -472,6 +490,13 @@ class ViewView(APIView):
 
         view = ViewHandler().get_view_as_user(request.user, view_id)
 
+        etag = get_table_etag(
+            request, view.table, [TABLE_SCHEMA_WATERMARK, TABLE_VIEWS_WATERMARK]
+        )
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
         serializer = view_type_registry.get_serializer(
             view,
             ViewSerializer,
@@ -481,7 +506,7 @@ class ViewView(APIView):
             group_bys=group_bys,
             context={"user": request.user},
         )
-        return Response(serializer.data)
+        return Response(serializer.data, headers={"ETag": etag})
 
     @extend_schema(
         parameters=[
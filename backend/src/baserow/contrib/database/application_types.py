@@ -1,8 +1,12 @@
+import hashlib
+import json
+import tempfile
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import partial
-from typing import Any, Dict, List, Optional, Set, Tuple
+from io import TextIOWrapper
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from zipfile import ZipFile
 
 from django.conf import settings
@@ -14,6 +18,7 @@ from django.db.models import Prefetch, QuerySet
 from django.db.transaction import Atomic
 from django.urls import include, path
 from django.utils import translation
+from django.utils.encoding import force_bytes
 from django.utils.translation import gettext as _
 
 from baserow.contrib.database.api.serializers import DatabaseSerializer
@@ -29,7 +34,9 @@ from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.views.registries import view_type_registry
 from baserow.core.db import specific_queryset
 from baserow.core.handler import CoreHandler
+from baserow.core.import_export.utils import temporary_file_chunk_generator
 from baserow.core.models import Application, Workspace
+from baserow.core.psycopg import sql
 from baserow.core.registries import (
     ApplicationType,
     ImportExportConfig,
@@ -50,7 +57,9 @@ from .export_serialized import DatabaseExportSerializedStructure
 from .field_rules.handlers import FieldRuleHandler
 from .field_rules.models import FieldRule
 from .fields.utils import DeferredFieldImporter, DeferredForeignKeyUpdater
+from .fields.utils.row_copy import get_workspace_user_id_sql
 from .search.handler import SearchHandler
+from .table.constants import CREATED_BY_COLUMN_NAME, LAST_MODIFIED_BY_COLUMN_NAME
 from .table.models import GeneratedTableModel, Table
 
 
@@ -139,38 +148,25 @@ class DatabaseApplicationType(ApplicationType):
                 )
 
             serialized_rows = []
-            row_count_limit = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
+            rows_file_name, rows_count = None, None
             export_all_table_rows = not import_export_config.only_structure
-            if export_all_table_rows:
+            copy_rows_in_database = (
+                export_all_table_rows and import_export_config.copy_rows_in_database
+            )
+            if export_all_table_rows and not copy_rows_in_database:
                 model = table.get_model(fields=fields, add_dependencies=False)
-                row_queryset = model.objects.all()[: row_count_limit or None]
-
-                row_progress = progress.create_child(1, row_queryset.count())
-                if table.created_by_column_added:
-                    row_queryset = row_queryset.select_related("created_by")
-                if table.last_modified_by_column_added:
-                    row_queryset = row_queryset.select_related("last_modified_by")
-                for row in row_queryset:
-                    serialized_row = DatabaseExportSerializedStructure.row(
-                        id=row.id,
-                        order=str(row.order),
-                        created_on=row.created_on.isoformat(),
-                        updated_on=row.updated_on.isoformat(),
-                        created_by=getattr(row, "created_by", None),
-                        last_modified_by=getattr(row, "last_modified_by", None),
-                    )
-                    for field_object in model._field_objects.values():
-                        field_name = field_object["name"]
-                        field_type = field_object["type"]
-                        serialized_row[
-                            field_name
-                        ] = field_type.get_export_serialized_value(
-                            row, field_name, table_cache, files_zip, storage
-                        )
-                    serialized_rows.append(serialized_row)
-                    row_progress.increment(
-                        state=EXPORT_SERIALIZED_EXPORTING_TABLE + str(table.name)
+                rows_iterator = self._iter_table_rows_serialized(
+                    table, model, table_cache, files_zip, storage, progress
+                )
+                if (
+                    import_export_config.stream_rows_to_files_zip
+                    and files_zip is not None
+                ):
+                    rows_file_name, rows_count = self._export_table_rows_to_files_zip(
+                        table, rows_iterator, files_zip
                     )
+                else:
+                    serialized_rows = list(rows_iterator)
             else:
                 progress.increment()
 
@@ -202,6 +198,13 @@ class DatabaseApplicationType(ApplicationType):
                 field_rules=serialized_field_rules,
             )
 
+            if copy_rows_in_database:
+                # The rows are copied from this table when the export is imported.
+                structure["copy_rows_from_table_id"] = table.id
+            elif rows_file_name is not None:
+                structure["rows_file"] = rows_file_name
+                structure["rows_count"] = rows_count
+
             for serialized_structure in serialization_processor_registry.get_all():
                 extra_data = serialized_structure.export_serialized(
                     workspace, table, import_export_config
@@ -212,6 +215,123 @@ class DatabaseApplicationType(ApplicationType):
 
         return serialized_tables
 
+    def _export_table_rows_serialized(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        table_cache: Dict[str, Any],
+        files_zip: Optional[ExportZipFile],
+        storage: Optional[Storage],
+        progress: Progress,
+    ) -> List[Dict[str, Any]]:
+        """
+        Exports the rows of the table to a serialized format that can later be
+        imported via the `import_tables_serialized`.
+
+        :param table: The table of which the rows must be exported.
+        :param model: The model of the table.
+        :param table_cache: An in memory dictionary that is shared between all fields
+            while exporting the table.
+        :param files_zip: A zip file buffer where the files can be copied into.
+        :param storage: The storage where the files can be loaded from.
+        :param progress: A progress used to report progress of the export.
+        :return: The serialized rows.
+        """
+
+        return list(
+            self._iter_table_rows_serialized(
+                table, model, table_cache, files_zip, storage, progress
+            )
+        )
+
+    def _iter_table_rows_serialized(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        table_cache: Dict[str, Any],
+        files_zip: Optional[ExportZipFile],
+        storage: Optional[Storage],
+        progress: Progress,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily serializes the rows of the table. The rows are fetched from the
+        database in chunks using a server side cursor, so that only one chunk of rows
+        is kept in memory at the same time.
+
+        :param table: The table of which the rows must be exported.
+        :param model: The model of the table.
+        :param table_cache: An in memory dictionary that is shared between all fields
+            while exporting the table.
+        :param files_zip: A zip file buffer where the files can be copied into.
+        :param storage: The storage where the files can be loaded from.
+        :param progress: A progress used to report progress of the export.
+        :return: An iterator yielding the serialized rows.
+        """
+
+        row_count_limit = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
+        row_queryset = model.objects.all()[: row_count_limit or None]
+
+        row_progress = progress.create_child(1, row_queryset.count())
+        if table.created_by_column_added:
+            row_queryset = row_queryset.select_related("created_by")
+        if table.last_modified_by_column_added:
+            row_queryset = row_queryset.select_related("last_modified_by")
+
+        chunk_size = settings.BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE
+        for row in row_queryset.iterator(chunk_size=chunk_size):
+            serialized_row = DatabaseExportSerializedStructure.row(
+                id=row.id,
+                order=str(row.order),
+                created_on=row.created_on.isoformat(),
+                updated_on=row.updated_on.isoformat(),
+                created_by=getattr(row, "created_by", None),
+                last_modified_by=getattr(row, "last_modified_by", None),
+            )
+            for field_object in model._field_objects.values():
+                field_name = field_object["name"]
+                field_type = field_object["type"]
+                serialized_row[field_name] = field_type.get_export_serialized_value(
+                    row, field_name, table_cache, files_zip, storage
+                )
+            row_progress.increment(
+                state=EXPORT_SERIALIZED_EXPORTING_TABLE + str(table.name)
+            )
+            yield serialized_row
+
+    def _export_table_rows_to_files_zip(
+        self,
+        table: Table,
+        serialized_rows: Iterable[Dict[str, Any]],
+        files_zip: ExportZipFile,
+    ) -> Tuple[str, int]:
+        """
+        Writes the serialized rows as newline delimited JSON to a temporary file and
+        adds it to the zip file. The zip file is consumed lazily after the export
+        transaction has been closed, so the rows are written to disk instead of
+        being kept in memory until then.
+
+        :param table: The table of which the rows are exported.
+        :param serialized_rows: The serialized rows that must be written.
+        :param files_zip: The zip file where the rows file must be added to.
+        :return: The name of the rows file in the zip file and the number of rows
+            that were written.
+        """
+
+        rows_file = tempfile.TemporaryFile()
+        sha256 = hashlib.sha256()
+        rows_count = 0
+        for serialized_row in serialized_rows:
+            line = force_bytes(json.dumps(serialized_row) + "\n")
+            sha256.update(line)
+            rows_file.write(line)
+            rows_count += 1
+
+        # The checksum is part of the name, so that it can be extracted from it when
+        # creating the manifest like it's done for the user files.
+        rows_file_name = f"database_table_{table.id}_rows_{sha256.hexdigest()}.ndjson"
+        files_zip.add(temporary_file_chunk_generator(rows_file), rows_file_name)
+        return rows_file_name, rows_count
+
     def export_serialized(
         self,
         database: Database,
@@ -281,9 +401,9 @@ class DatabaseApplicationType(ApplicationType):
                     # Inserting every field
                     len(table["views"]) +
                     # Converting every row
-                    len(table["rows"]) +
+                    table.get("rows_count", len(table["rows"])) +
                     # Inserting every row
-                    len(table["rows"]) +
+                    table.get("rows_count", len(table["rows"])) +
                     # After each field
                     len(table["fields"])
                     for table in serialized_tables
@@ -578,6 +698,7 @@ class DatabaseApplicationType(ApplicationType):
             serialized_tables,
             imported_fields,
             user_email_mapping,
+            workspace_id_for_user_references,
             deferred_fk_update_collector,
             id_mapping,
             files_zip,
@@ -639,6 +760,7 @@ class DatabaseApplicationType(ApplicationType):
         serialized_tables: List[Dict[str, Any]],
         imported_fields: ImportedFields,
         user_email_mapping: Dict[str, Any],
+        workspace_id_for_user_references: Optional[int],
         deferred_fk_update_collector: DeferredForeignKeyUpdater,
         id_mapping: Dict[str, Any],
         files_zip: ZipFile | None,
@@ -651,6 +773,8 @@ class DatabaseApplicationType(ApplicationType):
         :param serialized_tables: The serialized tables to import the rows into.
         :param imported_fields: The imported fields that were created during the import.
         :param user_email_mapping: A mapping of user emails to user instances.
+        :param workspace_id_for_user_references: The id of the workspace of which
+            the members can be referenced by the imported rows.
         :param deferred_fk_update_collector: A collector that collects all the foreign
             keys to update them later when the model with all the fields is created.
         :param id_mapping: A mapping of any table ids that might be referenced in
@@ -666,13 +790,13 @@ class DatabaseApplicationType(ApplicationType):
         already_filled_up_through_table_names = set()
         now = datetime.now(tz=timezone.utc)
 
+        chunk_size = settings.BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE
+
         for serialized_table in serialized_tables:
             table_model = serialized_table["_model"]
-            rows_to_be_inserted = []
-            # Holds a mapping where the key is a model, and the value a list of
-            # objects that must be inserted. These objects are returned by the
-            # `set_import_serialized_value`, and will typically hold m2m relationships.
-            additional_objects_to_be_inserted = defaultdict(list)
+            progress_state = (
+                f"{IMPORT_SERIALIZED_IMPORTING_TABLE_DATA}{serialized_table['name']}"
+            )
 
             m2m_fields_to_not_import_as_already_done = set()
             for field in table_model._meta.get_fields():
@@ -684,57 +808,94 @@ class DatabaseApplicationType(ApplicationType):
                     else:
                         already_filled_up_through_table_names.add(db_table)
 
-            for serialized_row in serialized_table["rows"]:
-                (
-                    created_on,
-                    updated_on,
-                    created_by,
-                    last_modified_by,
-                ) = self._prepare_base_row_fields(
-                    serialized_row, now, user_email_mapping
-                )
-
-                row_instance = table_model(
-                    id=serialized_row["id"],
-                    order=serialized_row["order"],
-                    created_on=created_on,
-                    updated_on=updated_on,
-                    created_by=created_by,
-                    last_modified_by=last_modified_by,
+            if serialized_table.get("copy_rows_from_table_id") is not None:
+                rows_copied = self._copy_table_rows_in_database(
+                    serialized_table,
+                    id_mapping,
+                    workspace_id_for_user_references,
+                    m2m_fields_to_not_import_as_already_done,
                 )
+                if not rows_copied:
+                    source_table = Table.objects.get(
+                        id=serialized_table["copy_rows_from_table_id"]
+                    )
+                    serialized_table["rows"] = self._export_table_rows_serialized(
+                        source_table,
+                        source_table.get_model(add_dependencies=False),
+                        {},
+                        files_zip,
+                        storage,
+                        Progress(1),
+                    )
 
-                self._import_serialized_fields_values_to_row(
-                    row_instance,
-                    serialized_row,
+            # The rows are converted and inserted in chunks because there could
+            # potentially be hundreds of thousands of rows in there. Inserting them in
+            # bulk results in better performance, and only keeping one chunk in memory
+            # keeps the memory usage bounded regardless of the size of the table.
+            serialized_rows = self._iter_serialized_table_rows(
+                serialized_table, files_zip
+            )
+            for serialized_rows_chunk in grouper(chunk_size, serialized_rows):
+                rows_to_be_inserted = []
+                # Holds a mapping where the key is a model, and the value a list of
+                # objects that must be inserted. These objects are returned by the
+                # `set_import_serialized_value`, and will typically hold m2m
+                # relationships.
+                additional_objects_to_be_inserted = defaultdict(list)
+
+                self._prepare_serialized_fields_values(
+                    serialized_rows_chunk,
                     serialized_table["fields"],
+                    table_model,
                     table_cache,
-                    additional_objects_to_be_inserted,
-                    m2m_fields_to_not_import_as_already_done,
                     id_mapping,
                     files_zip,
                     storage,
                 )
 
-                rows_to_be_inserted.append(row_instance)
-                progress.increment(
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE_DATA}{serialized_table['name']}"
-                )
+                for serialized_row in serialized_rows_chunk:
+                    (
+                        created_on,
+                        updated_on,
+                        created_by,
+                        last_modified_by,
+                    ) = self._prepare_base_row_fields(
+                        serialized_row, now, user_email_mapping
+                    )
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                table_model.objects.bulk_create(chunk, batch_size=512)
-                progress.increment(
-                    len(chunk),
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE_DATA}{serialized_table['name']}",
-                )
+                    row_instance = table_model(
+                        id=serialized_row["id"],
+                        order=serialized_row["order"],
+                        created_on=created_on,
+                        updated_on=updated_on,
+                        created_by=created_by,
+                        last_modified_by=last_modified_by,
+                    )
+
+                    self._import_serialized_fields_values_to_row(
+                        row_instance,
+                        serialized_row,
+                        serialized_table["fields"],
+                        table_cache,
+                        additional_objects_to_be_inserted,
+                        m2m_fields_to_not_import_as_already_done,
+                        id_mapping,
+                        files_zip,
+                        storage,
+                    )
+
+                    rows_to_be_inserted.append(row_instance)
+                    progress.increment(state=progress_state)
+
+                table_model.objects.bulk_create(rows_to_be_inserted, batch_size=512)
+                progress.increment(len(rows_to_be_inserted), state=progress_state)
 
-            # Every row import can have additional objects that must be inserted,
-            # like for example the m2m relationships. We want to efficiently import
-            # them in bulk here.
-            for model, objects in additional_objects_to_be_inserted.items():
-                model.objects.bulk_create(objects, batch_size=512)
+                # Every row import can have additional objects that must be inserted,
+                # like for example the m2m relationships. We want to efficiently
+                # import them in bulk here. The foreign key constraints are deferred,
+                # so the related rows don't have to exist yet.
+                for model, objects in additional_objects_to_be_inserted.items():
+                    model.objects.bulk_create(objects, batch_size=512)
 
             # When the rows are inserted we keep the provide the old ids and because of
             # that the auto increment is still set at `1`. This needs to be set to the
@@ -753,6 +914,239 @@ class DatabaseApplicationType(ApplicationType):
         # total progress of this import.
         self._after_rows_imported(imported_fields, progress)
 
+    def _iter_serialized_table_rows(
+        self, serialized_table: Dict[str, Any], files_zip: Optional[ZipFile]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over the serialized rows of the table. If the rows were exported to a
+        separate newline delimited JSON file in the zip file, they're read from it
+        line by line, so that they don't have to be loaded in memory at once.
+
+        :param serialized_table: The serialized table of which the rows must be
+            iterated over.
+        :param files_zip: The zip file containing the rows file, if any.
+        :return: An iterator yielding the serialized rows.
+        """
+
+        yield from serialized_table["rows"]
+
+        rows_file_name = serialized_table.get("rows_file")
+        if rows_file_name is None:
+            return
+
+        if files_zip is None:
+            raise ValueError(
+                f"The rows of table {serialized_table['name']} can't be imported "
+                f"without the zip file containing {rows_file_name}."
+            )
+
+        with files_zip.open(rows_file_name) as rows_file:
+            for line in TextIOWrapper(rows_file, encoding="utf-8"):
+                if line.strip():
+                    yield json.loads(line)
+
+    def _copy_table_rows_in_database(
+        self,
+        serialized_table: Dict[str, Any],
+        id_mapping: Dict[str, Any],
+        workspace_id_for_user_references: Optional[int],
+        m2m_fields_to_not_import_as_already_done: Set[str],
+    ) -> bool:
+        """
+        Copies the rows and the many to many relations of the table that was exported
+        with the `copy_rows_in_database` option from the source table into the
+        imported table with `INSERT INTO ... SELECT` queries. This is a lot faster
+        than serializing every row because the data never leaves the database.
+
+        :param serialized_table: The serialized table to copy the rows into.
+        :param id_mapping: A mapping of the exported ids to the newly created ids.
+        :param workspace_id_for_user_references: The id of the workspace of which
+            the members can be referenced by the copied rows.
+        :param m2m_fields_to_not_import_as_already_done: The names of the many to many
+            fields of which the relations have already been imported.
+        :return: False if any of the fields can't be copied in the database. Nothing
+            is copied then, and the rows must be serialized instead.
+        """
+
+        table_model = serialized_table["_model"]
+        source_table = Table.objects.get(id=serialized_table["copy_rows_from_table_id"])
+        source_model = source_table.get_model(add_dependencies=False)
+        source_model_fields = {f.name: f for f in source_model._meta.concrete_fields}
+        field_names = {
+            field_object["name"]
+            for field_object in [
+                *table_model._field_objects.values(),
+                *table_model._trashed_field_objects.values(),
+            ]
+        }
+
+        # The columns that don't belong to a field, like the order and the trashed
+        # state, are copied as well. Most of them are `NOT NULL` without a database
+        # default, so they must all be part of the insert.
+        columns = []
+        for model_field in table_model._meta.concrete_fields:
+            if model_field.name in field_names:
+                continue
+
+            source_model_field = source_model_fields.get(model_field.name)
+            if model_field.name == "trashed":
+                # Only the rows that are not trashed are copied.
+                expression = sql.Literal(False)
+            elif source_model_field is None:
+                if not model_field.has_default():
+                    continue
+                expression = sql.Literal(model_field.get_default())
+            elif model_field.name in [
+                CREATED_BY_COLUMN_NAME,
+                LAST_MODIFIED_BY_COLUMN_NAME,
+            ]:
+                expression = get_workspace_user_id_sql(
+                    workspace_id_for_user_references,
+                    sql.Identifier("source", source_model_field.column),
+                )
+            else:
+                expression = sql.Identifier("source", source_model_field.column)
+            columns.append((model_field.column, expression))
+
+        relations = []
+        for serialized_field in serialized_table["fields"]:
+            source_field_object = source_model._field_objects.get(
+                serialized_field["id"]
+            )
+            new_field_id = id_mapping["database_fields"][serialized_field["id"]]
+            field_object = table_model._field_objects.get(new_field_id)
+            if source_field_object is None or field_object is None:
+                return False
+
+            model_field = table_model._meta.get_field(field_object["name"])
+            source_model_field = source_model._meta.get_field(
+                source_field_object["name"]
+            )
+            is_many_to_many = isinstance(model_field, models.ManyToManyField)
+            if is_many_to_many:
+                if field_object["name"] in m2m_fields_to_not_import_as_already_done:
+                    continue
+                source_through_fields = (
+                    source_model_field.remote_field.through._meta.get_fields()
+                )
+                source_column = source_through_fields[2].column
+            else:
+                source_column = source_model_field.column
+
+            expression = field_object["type"].get_row_copy_sql_expression(
+                field_object["field"],
+                source_field_object["field"],
+                sql.Identifier("source", source_column),
+                id_mapping,
+                workspace_id_for_user_references,
+            )
+            if expression is None:
+                return False
+
+            if is_many_to_many:
+                relations.append((model_field, source_model_field, expression))
+            else:
+                columns.append((model_field.column, expression))
+
+        row_count_limit = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
+        rows_sql = sql.SQL(
+            """
+            INSERT INTO {table} ({columns})
+            SELECT {expressions} FROM {source_table} AS source
+            WHERE NOT source.trashed
+            {limit}
+            """
+        ).format(
+            table=sql.Identifier(table_model._meta.db_table),
+            columns=sql.SQL(",").join([sql.Identifier(c) for c, _ in columns]),
+            expressions=sql.SQL(",").join([expression for _, expression in columns]),
+            source_table=sql.Identifier(source_model._meta.db_table),
+            limit=(
+                sql.SQL('ORDER BY source."order", source.id LIMIT {}').format(
+                    sql.Literal(row_count_limit)
+                )
+                if row_count_limit
+                else sql.SQL("")
+            ),
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(rows_sql)
+
+            for model_field, source_model_field, expression in relations:
+                through_fields = model_field.remote_field.through._meta.get_fields()
+                source_through = source_model_field.remote_field.through
+                source_through_fields = source_through._meta.get_fields()
+                # Only the relations of the copied rows are copied, in the same order
+                # as they were created.
+                cursor.execute(
+                    sql.SQL(
+                        """
+                        INSERT INTO {through_table} ({row_column}, {related_column})
+                        SELECT row_id, related_id FROM (
+                            SELECT
+                                source.id,
+                                source.{source_row_column} AS row_id,
+                                {expression} AS related_id
+                            FROM {source_through_table} AS source
+                            WHERE source.{source_row_column} IN (
+                                SELECT id FROM {table}
+                            )
+                        ) relations
+                        WHERE related_id IS NOT NULL
+                        ORDER BY id
+                        """
+                    ).format(
+                        through_table=sql.Identifier(
+                            model_field.remote_field.through._meta.db_table
+                        ),
+                        row_column=sql.Identifier(through_fields[1].column),
+                        related_column=sql.Identifier(through_fields[2].column),
+                        source_row_column=sql.Identifier(
+                            source_through_fields[1].column
+                        ),
+                        expression=expression,
+                        source_through_table=sql.Identifier(
+                            source_through._meta.db_table
+                        ),
+                        table=sql.Identifier(table_model._meta.db_table),
+                    )
+                )
+
+        return True
+
+    def _prepare_serialized_fields_values(
+        self,
+        serialized_rows: List[Dict[str, Any]],
+        serialized_table_fields: List[Dict[str, Any]],
+        table_model: GeneratedTableModel,
+        table_cache: Dict[str, Any],
+        id_mapping: Dict[str, Any],
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ):
+        """
+        Gives every field type the chance to prepare the serialized values of a chunk
+        of rows at once, before they're set on the row instances one by one.
+        """
+
+        for serialized_field in serialized_table_fields:
+            new_field_id = id_mapping["database_fields"][serialized_field["id"]]
+            field_object = table_model._field_objects.get(new_field_id)
+            if field_object is None:
+                continue
+
+            field_name = f'field_{serialized_field["id"]}'
+            values = [
+                serialized_row[field_name]
+                for serialized_row in serialized_rows
+                if field_name in serialized_row
+            ]
+            if values:
+                field_object["type"].prepare_import_serialized_values(
+                    field_object["field"], values, table_cache, files_zip, storage
+                )
+
     def _import_serialized_fields_values_to_row(
         self,
         row_instance: GeneratedTableModel,
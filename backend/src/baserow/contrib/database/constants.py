@@ -4,3 +4,5 @@ IMPORT_SERIALIZED_IMPORTING_TABLE_DATA = "importing-table-data-"
 EXPORT_SERIALIZED_EXPORTING = "exporting"
 EXPORT_SERIALIZED_EXPORTING_TABLE = "exporting-table-"
 EXPORT_WORKSPACE_CREATE_ARCHIVE = "create-archive"
+IMPORT_WORKSPACE_EXTRACTING_FILES = "extracting-files"
+IMPORT_WORKSPACE_VERIFYING_FILES = "verifying-files"
@@ -181,6 +181,18 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
         if backup_data is not None:
             FieldDataBackupHandler.clean_up_backup_data(backup_data)
 
+    @classmethod
+    def clean_up_any_extra_action_data_in_bulk(
+        cls, actions_being_cleaned_up: List[Action]
+    ):
+        FieldDataBackupHandler.clean_up_backup_data_in_bulk(
+            [
+                action.params["backup_data"]
+                for action in actions_being_cleaned_up
+                if action.params.get("backup_data") is not None
+            ]
+        )
+
     @classmethod
     def _backup_field_if_required(
         cls,
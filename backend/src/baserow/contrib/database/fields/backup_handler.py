@@ -1,5 +1,6 @@
+from collections import defaultdict
 from copy import deepcopy
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from django.core.management.color import no_style
 from django.db import connection
@@ -217,6 +218,35 @@ class FieldDataBackupHandler:
                 # so there is nothing for us to do.
                 pass
 
+    @classmethod
+    def clean_up_backup_data_in_bulk(cls, backup_datas: List[BackupData]):
+        """
+        Deletes the backup data of many backups at once. All backup m2m tables are
+        dropped in a single statement and all backup columns of the same table are
+        dropped in a single statement per table.
+        """
+
+        m2m_table_names = []
+        columns_per_table_id = defaultdict(list)
+        for backup_data in backup_datas:
+            if "backed_up_m2m_table_name" in backup_data:
+                m2m_table_names.append(backup_data["backed_up_m2m_table_name"])
+            else:
+                columns_per_table_id[
+                    backup_data["table_id_containing_backup_column"]
+                ].append(backup_data["backed_up_column_name"])
+
+        if m2m_table_names:
+            cls._drop_tables(m2m_table_names)
+
+        # Tables that have already been permanently deleted by the trash system are
+        # not returned, so there is nothing for us to do for them.
+        tables = Table.objects_and_trash.filter(id__in=columns_per_table_id.keys())
+        for table in tables:
+            cls._drop_columns(
+                table.get_database_table_name(), columns_per_table_id[table.id]
+            )
+
     @staticmethod
     def _create_duplicate_m2m_table(
         model: GeneratedTableModel,
@@ -247,6 +277,17 @@ class FieldDataBackupHandler:
                 )
             )
 
+    @staticmethod
+    def _drop_tables(backup_names: List[str]):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("DROP TABLE {backup_tables}").format(
+                    backup_tables=sql.SQL(", ").join(
+                        sql.Identifier(backup_name) for backup_name in backup_names
+                    ),
+                )
+            )
+
     @classmethod
     def _get_source_column_sql_with_mapping(
         cls, source_column: str, mapping: Optional[Dict[int, int]] = None
@@ -347,3 +388,18 @@ class FieldDataBackupHandler:
                     column_to_drop=sql.Identifier(column_to_drop),
                 )
             )
+
+    @staticmethod
+    def _drop_columns(table_name: str, columns_to_drop: List[str]):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("ALTER TABLE {table_name} {drop_columns}").format(
+                    table_name=sql.Identifier(table_name),
+                    drop_columns=sql.SQL(", ").join(
+                        sql.SQL("DROP COLUMN {column_to_drop}").format(
+                            column_to_drop=sql.Identifier(column_to_drop)
+                        )
+                        for column_to_drop in columns_to_drop
+                    ),
+                )
+            )
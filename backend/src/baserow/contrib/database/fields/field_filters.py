@@ -1,6 +1,7 @@
 import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from django.db.models import BooleanField, Q
 from django.db.models.expressions import F, Value
@@ -101,6 +102,106 @@ class AnnotatedQ:
 
 OptionallyAnnotatedQ = Union[Q, AnnotatedQ]
 
+# An in-memory equivalent of a Q filter. It's called with an already loaded row
+# instance and returns `True` if the row matches, `False` if it doesn't or `None` if
+# it can't be decided without querying the database, for example because the
+# needed value hasn't been loaded.
+RowPredicate = Callable[[Any], Optional[bool]]
+
+
+def match_all_rows_predicate(row) -> Optional[bool]:
+    """
+    The row predicate equivalent of an empty `Q()`. Just like an empty `Q()`, it's
+    ignored when combined with other predicates.
+    """
+
+    return True
+
+
+def match_no_rows_predicate(row) -> Optional[bool]:
+    """The row predicate equivalent of `Q(pk__in=[])`."""
+
+    return False
+
+
+def row_value_predicate(
+    attname: str, value_predicate: Callable[[Any], Optional[bool]]
+) -> RowPredicate:
+    """
+    Returns a row predicate that calls the `value_predicate` with the value of the
+    `attname` attribute of the row. If the value has not been loaded, for example
+    because it's deferred, the result is undecided.
+
+    :param attname: The name of the model attribute that must be checked.
+    :param value_predicate: Called with the value, must return True, False or None.
+    :return: The row predicate.
+    """
+
+    def predicate(row) -> Optional[bool]:
+        try:
+            value = row.__dict__[attname]
+        except KeyError:
+            return None
+        return value_predicate(value)
+
+    return predicate
+
+
+def negate_row_predicate(
+    predicate: Optional[RowPredicate],
+) -> Optional[RowPredicate]:
+    """
+    Negates the provided row predicate while leaving undecided results undecided.
+    Just like `~Q()`, a negated match all predicate still matches all rows.
+    """
+
+    if predicate is None or predicate is match_all_rows_predicate:
+        return predicate
+
+    def negated_predicate(row) -> Optional[bool]:
+        result = predicate(row)
+        return None if result is None else not result
+
+    return negated_predicate
+
+
+def combine_row_predicates(
+    filter_type: str, predicates: List[RowPredicate]
+) -> RowPredicate:
+    """
+    Combines the provided row predicates using three-valued logic. With the AND
+    filter type a single `False` makes the result `False`, with the OR filter type a
+    single `True` makes it `True`. If no predicate settles the result, but one of them
+    is undecided, the combined result is undecided as well.
+
+    :param filter_type: Either FILTER_TYPE_AND or FILTER_TYPE_OR.
+    :param predicates: The row predicates that must be combined.
+    :return: The combined row predicate.
+    """
+
+    if filter_type not in [FILTER_TYPE_AND, FILTER_TYPE_OR]:
+        raise ValueError(f"Unknown filter type {filter_type}.")
+
+    predicates = [p for p in predicates if p is not match_all_rows_predicate]
+    if len(predicates) == 0:
+        return match_all_rows_predicate
+    elif len(predicates) == 1:
+        return predicates[0]
+
+    settling_result = filter_type == FILTER_TYPE_OR
+
+    def combined_predicate(row) -> Optional[bool]:
+        undecided = False
+        for predicate in predicates:
+            result = predicate(row)
+            if result is None:
+                undecided = True
+            elif result == settling_result:
+                return settling_result
+        return None if undecided else not settling_result
+
+    return combined_predicate
+
 
 class FilterBuilder:
     """
@@ -293,6 +394,14 @@ class GroupedFiltersAdapter(ABC):
         starting from a filter.
         """
 
+    def get_row_predicate_from_filter(self, _filter) -> Optional[RowPredicate]:
+        """
+        Returns the in-memory row predicate equivalent of the filter or `None` if it
+        can only be applied as SQL.
+        """
+
+        return None
+
 
 class AdvancedFilterBuilder(metaclass=baserow_trace_methods(tracer)):
     """
@@ -362,3 +471,40 @@ class AdvancedFilterBuilder(metaclass=baserow_trace_methods(tracer)):
                 filter_builder.filter(child_filter_builder)
 
         return filter_builder
+
+    def construct_row_predicate(self) -> Optional[RowPredicate]:
+        """
+        Constructs the in-memory equivalent of the filter builder, which can be used
+        to check if already loaded rows match the filters without querying the
+        database. The groups are combined exactly like in `construct_filter_builder`.
+
+        :return: The row predicate or `None` if at least one of the filters can't be
+            evaluated in Python.
+        """
+
+        adapter = self.adapter
+        filter_types = {None: adapter.filter_type}
+        child_group_ids = defaultdict(list)
+        predicates_by_group_id = defaultdict(list)
+
+        for group in adapter.groups:
+            filter_types[group.id] = group.filter_type
+            child_group_ids[group.parent_group_id].append(group.id)
+
+        for _filter in adapter.filters:
+            predicate = adapter.get_row_predicate_from_filter(_filter)
+            if predicate is None:
+                return None
+            predicates_by_group_id[_filter.group_id].append(predicate)
+
+        def construct_group_predicate(group_id) -> RowPredicate:
+            return combine_row_predicates(
+                filter_types[group_id],
+                predicates_by_group_id[group_id]
+                + [
+                    construct_group_predicate(child_group_id)
+                    for child_group_id in child_group_ids[group_id]
+                ],
+            )
+
+        return construct_group_predicate(None)
@@ -3,7 +3,6 @@ from typing import Any, Dict, List, Optional
 from baserow.contrib.database.export_serialized import DatabaseExportSerializedStructure
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.fields.utils.duration import D_H_M
-from baserow.core.import_export.utils import file_chunk_generator
 from baserow.core.storage import ExportZipFile, Storage
 from baserow.core.user_files.handler import UserFileHandler
 
@@ -364,11 +363,9 @@ def prepare_files_for_export(
                 item["name"] for item in files_zip.info_list()
             ]:
                 file_path = user_file_handler.user_file_path(record["name"])
-                # Create chunk generator for the file content and add it to the zip
-                # stream. That file will be read when zip stream is being
-                # written to final zip file
-                chunk_generator = file_chunk_generator(storage, file_path)
-                files_zip.add(chunk_generator, file_name)
+                # The file will be read in chunks when the zip stream is being
+                # written to the final zip file.
+                files_zip.add_storage_file(storage, file_path, file_name)
 
             # This is just used to avoid writing the same file twice.
             cache[cache_entry] = True
@@ -134,6 +134,7 @@ from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaURLType,
 )
 from baserow.contrib.database.models import Table
+from baserow.contrib.database.table.constants import USER_TABLE_DATABASE_NAME_PREFIX
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.types import SerializedRowHistoryFieldMetadata
 from baserow.contrib.database.validators import UnicodeRegexValidator
@@ -155,6 +156,7 @@ from baserow.core.formula import BaserowFormulaException
 from baserow.core.formula.parser.exceptions import FormulaFunctionTypeDoesNotExist
 from baserow.core.handler import CoreHandler
 from baserow.core.models import UserFile, WorkspaceUser
+from baserow.core.psycopg import sql
 from baserow.core.registries import ImportExportConfig
 from baserow.core.storage import ExportZipFile, get_default_storage
 from baserow.core.user_files.exceptions import UserFileDoesNotExist
@@ -251,7 +253,7 @@ from .registries import (
     StartingRowType,
     field_type_registry,
 )
-from .utils import DeferredForeignKeyUpdater
+from .utils import DeferredForeignKeyUpdater, LinkRowMultipleFieldPrefetch
 from .utils.duration import (
     DURATION_FORMATS,
     duration_value_sql_to_text,
@@ -262,6 +264,7 @@ from .utils.duration import (
     prepare_duration_value_for_db,
     text_value_sql_to_duration,
 )
+from .utils.row_copy import get_mapped_id_sql, get_workspace_user_id_sql
 
 User = get_user_model()
 
@@ -284,7 +287,39 @@ class CollationSortMixin:
         return OptionallyAnnotatedOrderBy(order=field_order_by, can_be_indexed=True)
 
 
-class TextFieldMatchingRegexFieldType(FieldType, ABC):
+class PrepareDistinctStringsOnceMixin:
+    """
+    Prepares every distinct string only once when the values of a column are
+    prepared in bulk. Meant for field types that parse or validate strings in
+    `prepare_value_for_db`, because imported columns often contain the same string
+    many times. The prepared values are shared between the rows, so they must be
+    immutable.
+    """
+
+    def prepare_value_for_db_in_bulk(
+        self, instance, values_by_row, continue_on_error=False
+    ):
+        prepared_strings = {}
+
+        for row_index, value in values_by_row.items():
+            try:
+                if not isinstance(value, str):
+                    prepared_value = self.prepare_value_for_db(instance, value)
+                elif value in prepared_strings:
+                    prepared_value = prepared_strings[value]
+                else:
+                    prepared_value = self.prepare_value_for_db(instance, value)
+                    prepared_strings[value] = prepared_value
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                prepared_value = e
+            values_by_row[row_index] = prepared_value
+
+        return values_by_row
+
+
+class TextFieldMatchingRegexFieldType(PrepareDistinctStringsOnceMixin, FieldType, ABC):
     """
     This is an abstract FieldType you can extend to create a field which is a TextField
     but restricted to only allow values passing a regex. Please implement the
@@ -564,7 +599,7 @@ class URLFieldType(CollationSortMixin, TextFieldMatchingRegexFieldType):
         return BaserowFormulaURLType(nullable=True)
 
 
-class NumberFieldType(FieldType):
+class NumberFieldType(PrepareDistinctStringsOnceMixin, FieldType):
     MAX_DIGITS = 50
 
     type = "number"
@@ -1072,7 +1107,7 @@ class BooleanFieldType(FieldType):
             raise ValueError(f"Invalid value for boolean field: {value}")
 
 
-class DateFieldType(FieldType):
+class DateFieldType(PrepareDistinctStringsOnceMixin, FieldType):
     type = "date"
     model_class = DateField
     allowed_fields = [
@@ -1720,6 +1755,18 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
         value = getattr(row, self.source_field_name)
         setattr(row, field_name, value)
 
+    def get_row_copy_sql_expression(
+        self,
+        field,
+        source_field,
+        source_column,
+        id_mapping,
+        workspace_id_for_user_references,
+    ):
+        return get_workspace_user_id_sql(
+            workspace_id_for_user_references, source_column
+        )
+
     def get_internal_value_from_db(
         self, row: "GeneratedTableModel", field_name: str
     ) -> Any:
@@ -1946,6 +1993,18 @@ class CreatedByFieldType(ReadOnlyFieldType):
         value = getattr(row, self.source_field_name)
         setattr(row, field_name, value)
 
+    def get_row_copy_sql_expression(
+        self,
+        field,
+        source_field,
+        source_column,
+        id_mapping,
+        workspace_id_for_user_references,
+    ):
+        return get_workspace_user_id_sql(
+            workspace_id_for_user_references, source_column
+        )
+
     def get_internal_value_from_db(
         self, row: "GeneratedTableModel", field_name: str
     ) -> Any:
@@ -2048,7 +2107,7 @@ class CreatedByFieldType(ReadOnlyFieldType):
         return f"{field_name}__first_name"
 
 
-class DurationFieldType(FieldType):
+class DurationFieldType(PrepareDistinctStringsOnceMixin, FieldType):
     type = "duration"
     model_class = DurationField
     allowed_fields = ["duration_format"]
@@ -2568,6 +2627,42 @@ class LinkRowFieldType(
             models.Prefetch(name, queryset=related_queryset)
         )
 
+    def enhance_queryset_in_bulk(
+        self,
+        queryset,
+        field_objects,
+        link_row_display_values_only: bool = False,
+        **kwargs,
+    ):
+        """
+        If the related rows are only going to be used to display the cell values,
+        the relations of all the link row fields are prefetched in one query and the
+        display values of the related rows are cached, so that they don't have to be
+        fetched for every field separately.
+
+        :param link_row_display_values_only: Indicates that only the `id`, `order`
+            and string representation of the related rows are going to be used.
+        """
+
+        if not link_row_display_values_only:
+            return super().enhance_queryset_in_bulk(queryset, field_objects, **kwargs)
+
+        link_row_prefetch = LinkRowMultipleFieldPrefetch()
+        for field_object in field_objects:
+            field_kwargs = kwargs.get(f"field_{field_object['field'].id}", {})
+            # Adhoc lookups need the joined fields of the related rows, so they
+            # can't use the cached display values.
+            if field_kwargs.get("link_row_join", None) is None:
+                link_row_prefetch.add_field_names([field_object["name"]])
+            else:
+                queryset = self.enhance_queryset(
+                    queryset, field_object["field"], field_object["name"], **kwargs
+                )
+
+        if link_row_prefetch.field_names:
+            queryset = queryset.multi_field_prefetch(link_row_prefetch)
+        return queryset
+
     def enhance_field_queryset(
         self, queryset: QuerySet[Field], field: Field
     ) -> QuerySet[Field]:
@@ -3503,6 +3598,25 @@ class LinkRowFieldType(
             for item in value
         ]
 
+    def get_row_copy_sql_expression(
+        self,
+        field,
+        source_field,
+        source_column,
+        id_mapping,
+        workspace_id_for_user_references,
+    ):
+        # The relations to trashed rows are not exported, so they must not be copied
+        # either.
+        return sql.SQL(
+            "(SELECT id FROM {related_table} WHERE id = {column} AND NOT trashed)"
+        ).format(
+            related_table=sql.Identifier(
+                f"{USER_TABLE_DATABASE_NAME_PREFIX}{source_field.link_row_table_id}"
+            ),
+            column=source_column,
+        )
+
     def get_other_fields_to_trash_restore_always_together(self, field) -> List[Field]:
         fields = []
         if field.link_row_related_field is not None:
@@ -3803,10 +3917,10 @@ class FileFieldType(FieldType):
 
         # Query the database for existing files
         files = UserFile.objects.all().name(*unique_names)
-        if len(files) != len(unique_names):
-            invalid_names = sorted(
-                list(unique_names - set((file.name) for file in files))
-            )
+        # User files with the same content can share the same name.
+        found_names = set(file.name for file in files)
+        if len(found_names) != len(unique_names):
+            invalid_names = sorted(list(unique_names - found_names))
             if continue_on_error:
                 for invalid_name in invalid_names:
                     for row_index in name_map[invalid_name]:
@@ -3815,7 +3929,9 @@ class FileFieldType(FieldType):
                 raise UserFileDoesNotExist(invalid_names)
 
         # Replacing file names by the actual file field dict
-        user_files_by_name = {file.name: file for file in files}
+        user_files_by_name = {}
+        for file in files:
+            user_files_by_name.setdefault(file.name, file)
         for row_index, value in values_by_row.items():
             # Ignore already raised exceptions
             if isinstance(value, Exception):
@@ -3963,6 +4079,7 @@ class FileFieldType(FieldType):
         storage: Optional[Storage],
     ) -> None:
         user_file_handler = UserFileHandler()
+        imported_user_files = cache.get("imported_user_files", {})
         files = []
 
         for file in value:
@@ -3971,12 +4088,17 @@ class FileFieldType(FieldType):
             if files_zip is None:
                 files.append(file)
             else:
-                with files_zip.open(file["name"]) as stream:
-                    # Try to upload the user file with the original name to make sure
-                    # that if the was already uploaded, it will not be uploaded again.
-                    user_file = user_file_handler.upload_user_file(
-                        None, file["original_name"], stream, storage=storage
-                    )
+                user_file = imported_user_files.get(
+                    (file["name"], file["original_name"])
+                )
+                if user_file is None:
+                    with files_zip.open(file["name"]) as stream:
+                        # Try to upload the user file with the original name to make
+                        # sure that if the was already uploaded, it will not be
+                        # uploaded again.
+                        user_file = user_file_handler.upload_user_file(
+                            None, file["original_name"], stream, storage=storage
+                        )
 
                 value = user_file.serialize()
                 value["visible_name"] = file["visible_name"]
@@ -3984,6 +4106,26 @@ class FileFieldType(FieldType):
 
         setattr(row, field_name, files)
 
+    def prepare_import_serialized_values(
+        self, field, values, cache, files_zip=None, storage=None
+    ):
+        if files_zip is None:
+            return
+
+        imported_user_files = cache.setdefault("imported_user_files", {})
+        serialized_user_files = [
+            file
+            for value in values
+            for file in value or []
+            if (file["name"], file["original_name"]) not in imported_user_files
+        ]
+        if serialized_user_files:
+            imported_user_files.update(
+                UserFileHandler().import_user_files(
+                    serialized_user_files, files_zip, storage
+                )
+            )
+
     def are_row_values_equal(self, value1: any, value2: any) -> bool:
         return {v["name"] for v in value1} == {v["name"] for v in value2}
 
@@ -4001,6 +4143,22 @@ class SelectOptionBaseFieldType(FieldType):
     def get_default_value(self, field: Field) -> Any:
         return getattr(field, self.get_default_options_field_name(), None)
 
+    def get_row_copy_sql_expression(
+        self,
+        field,
+        source_field,
+        source_column,
+        id_mapping,
+        workspace_id_for_user_references,
+    ):
+        new_select_option_ids = set(field.select_options.values_list("id", flat=True))
+        select_option_mapping = {
+            old_id: new_id
+            for old_id, new_id in id_mapping["database_field_select_options"].items()
+            if new_id in new_select_option_ids
+        }
+        return get_mapped_id_sql(select_option_mapping, source_column)
+
     def create_select_options(self, field, select_options):
         """
         Creates the select options for the field.
@@ -4382,8 +4540,6 @@ class SingleSelectFieldType(CollationSortMixin, SelectOptionBaseFieldType):
                 else:
                     raise error
 
-        invalid_values_by_index.update(invalid_values_by_index)
-
         # Query database with all these gathered values
         select_options = list(
             SelectOption.objects.filter(field=instance).filter(
@@ -4416,7 +4572,9 @@ class SingleSelectFieldType(CollationSortMixin, SelectOptionBaseFieldType):
             if value is None or isinstance(value, SelectOption):
                 continue
 
-            if continue_on_error and value not in option_map:
+            if row_index in invalid_values_by_index:
+                values_by_row[row_index] = invalid_values_by_index[row_index]
+            elif continue_on_error and value not in option_map:
                 values_by_row[row_index] = ValidationError(
                     f"The provided value {value} is not a valid option.",
                     code="invalid_option",
@@ -4892,7 +5050,7 @@ class MultipleSelectFieldType(
                     name_map[value].append(row_index)
                 else:
                     if continue_on_error:
-                        invalid_values.append(values)
+                        invalid_values.append(row_index)
                         break
                     else:
                         # Fail on first error
@@ -6998,6 +7156,18 @@ class MultipleCollaboratorsFieldType(
 
         return through_objects
 
+    def get_row_copy_sql_expression(
+        self,
+        field,
+        source_field,
+        source_column,
+        id_mapping,
+        workspace_id_for_user_references,
+    ):
+        return get_workspace_user_id_sql(
+            workspace_id_for_user_references, source_column
+        )
+
     def random_value(self, instance, fake, cache):
         """
         Selects a random sublist out of the possible collaborators.
@@ -53,6 +53,7 @@ from baserow.contrib.database.views.exceptions import (
     AggregationTypeDoesNotExist,
 )
 from baserow.contrib.database.views.utils import AnnotatedAggregation
+from baserow.core.psycopg import sql
 from baserow.core.registries import ImportExportConfig
 from baserow.core.registry import (
     APIUrlsInstanceMixin,
@@ -336,6 +337,11 @@ class FieldType(
             can be the exceptions raised during the values validation.
         """
 
+        if type(self).prepare_value_for_db is FieldType.prepare_value_for_db:
+            # The values are stored as they are, so there is no need to go over
+            # every row of the column.
+            return values_by_row
+
         for row_index, value in values_by_row.items():
             try:
                 values_by_row[row_index] = self.prepare_value_for_db(instance, value)
@@ -1228,6 +1234,60 @@ class FieldType(
 
         setattr(row, field_name, value)
 
+    def prepare_import_serialized_values(
+        self,
+        field: Field,
+        values: List[Any],
+        cache: Dict[str, Any],
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ):
+        """
+        Called with all the serialized values of a chunk of imported rows before
+        `set_import_serialized_value` is called for each of them. This can be used to
+        prepare something for many values at once, and store the result in the cache.
+        The file field type for example uses this to import all the files at once.
+
+        :param field: The imported field instance.
+        :param values: The serialized values of the rows that are going to be
+            imported.
+        :param cache: An in memory dictionary that is shared between all fields while
+            importing the table.
+        :param files_zip: A zip file buffer where files related to the template can
+            be extracted from.
+        :param storage: The storage where the files can be copied to.
+        """
+
+    def get_row_copy_sql_expression(
+        self,
+        field: Field,
+        source_field: Field,
+        source_column: sql.Composable,
+        id_mapping: Dict[str, Any],
+        workspace_id_for_user_references: Optional[int],
+    ) -> Optional[sql.Composable]:
+        """
+        Returns the SQL expression that selects the value of the duplicated field
+        from the column of the source field. This is used when the rows of a
+        duplicated table are copied inside the database, instead of being exported
+        with `get_export_serialized_value` and imported with
+        `set_import_serialized_value`, so the expression must result in the same
+        value. For many to many fields, the source column is the column of the
+        through table referencing the related object, and the relations where the
+        expression results in `NULL` are not copied.
+
+        :param field: The duplicated field that the value is copied into.
+        :param source_field: The field that the value is copied from.
+        :param source_column: The SQL reference to the column of the source field.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :param workspace_id_for_user_references: The id of the workspace of which
+            the members can be referenced by the copied values.
+        :return: The SQL expression, or None if the values can't be copied in the
+            database. The rows are then exported and imported instead.
+        """
+
+        return source_column
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
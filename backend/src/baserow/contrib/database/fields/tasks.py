@@ -16,6 +16,10 @@ from baserow.contrib.database.fields.periodic_field_update_handler import (
 )
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.cache import (
+    TABLE_ROWS_WATERMARK,
+    bump_table_watermark,
+)
 from baserow.contrib.database.table.models import RichTextFieldMention
 from baserow.contrib.database.views.handler import ViewSubscriptionHandler
 from baserow.contrib.database.views.models import View, ViewSubscription
@@ -135,6 +139,8 @@ def _run_periodic_field_type_update_per_workspace(
             updated_table_ids = list(
                 {field.table_id for field in database_updated_fields}
             )
+            for table_id in updated_table_ids:
+                bump_table_watermark(table_id, TABLE_ROWS_WATERMARK)
             notify_table_views_updates.delay(updated_table_ids)
 
 
@@ -0,0 +1,203 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from baserow.contrib.database.table.cache import (
+    get_cached_link_row_display_values,
+    get_link_row_display_values_versions,
+    set_cached_link_row_display_values,
+)
+from baserow.core.db import fetch_many_to_many_target_ids
+
+if TYPE_CHECKING:
+    from baserow.contrib.database.table.models import GeneratedTableModel
+
+
+class LinkRowMultipleFieldPrefetch:
+    """
+    This prefetch class can be used as argument of the `multi_field_prefetch` method
+    to prefetch the related rows of multiple link row fields, used to display the
+    cell values. The relations of all the fields are fetched in one single query,
+    and the related rows in one query per related table.
+
+    The order and display value of every related row are cached using a version of
+    the related table that changes whenever its cells or fields change. Related
+    rows found in the cache are not fetched at all, so a page of rows that links to
+    cached rows only needs one query, regardless of the number of link row fields.
+    Because only the display value is cached, the related rows must not be used for
+    anything else than their `id`, `order` and string representation.
+
+    Example:
+
+    results = list(
+        model
+        .objects.all()
+        .multi_field_prefetch(
+            LinkRowMultipleFieldPrefetch().add_field_names(["field_1", "field_2"])
+        )
+    )
+
+    str(results[0].field_1.all()[0])  # is prefetched
+    """
+
+    def __init__(self, field_names: Optional[Set[str]] = None):
+        """
+        :param field_names: The names of the link row fields that must be
+            prefetched.
+        """
+
+        self.field_names = set(field_names or [])
+
+    def add_field_names(self, field_names: Iterable[str]):
+        """
+        Adds additional link row field names to the prefetch.
+
+        :param field_names: The names of the link row fields that must be
+            prefetched.
+        :return: Self to allow chaining.
+        """
+
+        self.field_names.update(field_names)
+        return self
+
+    def __call__(self, queryset: QuerySet, result_set: List["GeneratedTableModel"]):
+        """
+        This method is called when the queryset resolved. It fetches the relations
+        of all the rows in the result set and sets the related rows as prefetched
+        values.
+
+        :param queryset: The queryset that is being resolved.
+        :param result_set: The fetched `result_set` where the prefetched results must
+            be added to.
+        """
+
+        model_fields = [
+            queryset.model._meta.get_field(field_name)
+            for field_name in sorted(self.field_names)
+        ]
+        row_id_to_field_name_to_target_ids = fetch_many_to_many_target_ids(
+            model_fields, [result.id for result in result_set]
+        )
+
+        target_ids_per_model = defaultdict(set)
+        for model_field in model_fields:
+            target_model = model_field.remote_field.model
+            for field_name_to_target_ids in row_id_to_field_name_to_target_ids.values():
+                target_ids_per_model[target_model].update(
+                    field_name_to_target_ids.get(model_field.name, [])
+                )
+
+        target_instances_per_model = self.fetch_target_instances(target_ids_per_model)
+
+        for result in result_set:
+            field_name_to_target_ids = row_id_to_field_name_to_target_ids.get(
+                result.id, {}
+            )
+            for model_field in model_fields:
+                target_instances = target_instances_per_model.get(
+                    model_field.remote_field.model, {}
+                )
+                qs = getattr(result, model_field.name).get_queryset()
+                # The related rows are ordered like the related table, just like
+                # when they're prefetched by Django.
+                qs._result_cache = sorted(
+                    (
+                        target_instances[target_id]
+                        for target_id in field_name_to_target_ids.get(
+                            model_field.name, []
+                        )
+                        # The relation can exist while the related row is trashed,
+                        # it must not be included then.
+                        if target_id in target_instances
+                    ),
+                    key=lambda instance: (instance.order, instance.id),
+                )
+                qs._prefetch_done = True
+                result._prefetched_objects_cache = getattr(
+                    result, "_prefetched_objects_cache", {}
+                )
+                result._prefetched_objects_cache[model_field.name] = qs
+
+    def fetch_target_instances(
+        self, target_ids_per_model: Dict["GeneratedTableModel", Set[int]]
+    ) -> Dict["GeneratedTableModel", Dict[int, "GeneratedTableModel"]]:
+        """
+        Returns the related rows of every related model. The rows found in the
+        cache only have their `id` and `order` set and return the cached display
+        value when converted to a string. The others are fetched in one query per
+        related model, and added to the cache.
+
+        :param target_ids_per_model: The ids of the rows to fetch per model.
+        :return: The rows per id per model.
+        """
+
+        use_cache = settings.LINK_ROW_DISPLAY_VALUE_CACHE_TTL_SECONDS > 0
+        table_versions = (
+            get_link_row_display_values_versions(
+                {model.baserow_table_id for model in target_ids_per_model.keys()}
+            )
+            if use_cache
+            else {}
+        )
+
+        target_instances_per_model = {}
+        for target_model, target_ids in target_ids_per_model.items():
+            if len(target_ids) == 0:
+                continue
+
+            table_id = target_model.baserow_table_id
+            table_version = table_versions.get(table_id)
+            cached_values = (
+                get_cached_link_row_display_values(table_id, table_version, target_ids)
+                if use_cache
+                else {}
+            )
+            target_instances = {
+                target_id: target_model.from_display_value(target_id, *cached_value)
+                for target_id, cached_value in cached_values.items()
+            }
+
+            missing_ids = target_ids - cached_values.keys()
+            if missing_ids:
+                fetched_instances = {
+                    instance.id: instance
+                    for instance in self.get_target_queryset(target_model).filter(
+                        id__in=missing_ids
+                    )
+                }
+                if use_cache:
+                    set_cached_link_row_display_values(
+                        table_id,
+                        table_version,
+                        {
+                            instance.id: (instance.order, str(instance))
+                            for instance in fetched_instances.values()
+                        },
+                    )
+                target_instances.update(fetched_instances)
+
+            target_instances_per_model[target_model] = target_instances
+
+        return target_instances_per_model
+
+    def get_target_queryset(self, target_model: "GeneratedTableModel") -> QuerySet:
+        """
+        Returns the queryset that fetches the related rows of the provided model,
+        including only the data needed to compute the display value.
+
+        :param target_model: The model of the related table.
+        :return: The queryset selecting the related rows.
+        """
+
+        queryset = target_model.objects.all()
+        primary_field_object = target_model._field_objects.get(
+            target_model._primary_field_id
+        )
+        if primary_field_object is not None:
+            queryset = queryset.only("order", primary_field_object["name"])
+            queryset = primary_field_object["type"].enhance_queryset(
+                queryset, primary_field_object["field"], primary_field_object["name"]
+            )
+        return queryset
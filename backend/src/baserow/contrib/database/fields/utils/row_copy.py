@@ -0,0 +1,57 @@
+from typing import Dict, Optional
+
+from baserow.core.models import WorkspaceUser
+from baserow.core.psycopg import sql
+
+
+def get_mapped_id_sql(
+    id_mapping: Dict[int, int], column: sql.Composable
+) -> sql.Composable:
+    """
+    Returns an SQL expression that converts the id in the provided column to the
+    new id according to the mapping. Ids that are not in the mapping result in
+    `NULL`.
+
+    :param id_mapping: The mapping of the old ids to the new ids.
+    :param column: The column containing the old id.
+    :return: The SQL expression resolving to the new id.
+    """
+
+    if len(id_mapping) == 0:
+        return sql.SQL("NULL")
+
+    old_ids, new_ids = zip(*id_mapping.items())
+    return sql.SQL(
+        "(ARRAY[{new_ids}]::bigint[])"
+        "[array_position(ARRAY[{old_ids}]::bigint[], {column}::bigint)]"
+    ).format(
+        new_ids=sql.SQL(",").join([sql.Literal(new_id) for new_id in new_ids]),
+        old_ids=sql.SQL(",").join([sql.Literal(old_id) for old_id in old_ids]),
+        column=column,
+    )
+
+
+def get_workspace_user_id_sql(
+    workspace_id: Optional[int], column: sql.Composable
+) -> sql.Composable:
+    """
+    Returns an SQL expression resolving to the user id in the provided column if
+    that user is a member of the workspace, and to `NULL` otherwise. This matches
+    how user references are imported by email address.
+
+    :param workspace_id: The id of the workspace the user must be a member of.
+    :param column: The column containing the user id.
+    :return: The SQL expression resolving to the user id.
+    """
+
+    if workspace_id is None:
+        return sql.SQL("NULL")
+
+    return sql.SQL(
+        "(SELECT user_id FROM {workspace_user_table} "
+        "WHERE workspace_id = {workspace_id} AND user_id = {column})"
+    ).format(
+        workspace_user_table=sql.Identifier(WorkspaceUser._meta.db_table),
+        workspace_id=sql.Literal(workspace_id),
+        column=column,
+    )
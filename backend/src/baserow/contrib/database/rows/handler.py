@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 from copy import deepcopy
 from decimal import Decimal
@@ -6,6 +7,7 @@ from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -101,6 +103,7 @@ from .types import (
     RowId,
     RowsForUpdate,
     UpdatedRowsData,
+    UpdatedRowsStreamStats,
 )
 
 if TYPE_CHECKING:
@@ -128,6 +131,16 @@ rows_deleted_counter = meter.create_counter(
     unit="1",
     description="The number of rows deleted in user tables.",
 )
+rows_stream_batch_size_histogram = meter.create_histogram(
+    "baserow.rows_stream_update.batch_size",
+    unit="1",
+    description="The number of rows updated per batch of a stream of row updates.",
+)
+rows_stream_batch_duration_histogram = meter.create_histogram(
+    "baserow.rows_stream_update.batch_duration",
+    unit="s",
+    description="The duration of updating a batch of a stream of row updates.",
+)
 
 
 def serialize_errors_recursive(error):
@@ -293,22 +306,21 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             passed in.
         """
 
-        field_ids = {}
-        prepared_values_by_field = defaultdict(dict)
+        prepared_values_by_field = {}
 
-        # organize values by field name
-        for index, row_value in enumerate(rows_values):
-            for field_id, field_obj in field_objects.items():
-                field_name = field_obj["name"]
-                field_type = field_obj["type"]
-                field = field_obj["field"]
-                field_ids[field_name] = field_id
-                if field_name in row_value:
-                    prepared_values_by_field[field_name][index] = row_value[field_name]
+        # Prepare the values column by column, so that every field type can prepare
+        # all the values of its field at once instead of being called for every
+        # cell.
+        for field_obj in field_objects.values():
+            field_name = field_obj["name"]
+            batch_values = {
+                index: row_value[field_name]
+                for index, row_value in enumerate(rows_values)
+                if field_name in row_value
+            }
+            if not batch_values:
+                continue
 
-        # bulk-prepare values per field
-        for field_name, batch_values in prepared_values_by_field.items():
-            field_obj = field_objects[field_ids[field_name]]
             field_type = field_obj["type"]
             field = field_obj["field"]
             prepared_values_by_field[
@@ -321,16 +333,22 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         prepared_rows = []
         failing_rows = {}
         for index, row_value in enumerate(rows_values):
-            new_values = deepcopy(row_value)
+            # Only the values that are not replaced by a prepared value are copied.
+            new_values = {
+                key: deepcopy(value)
+                for key, value in row_value.items()
+                if key not in prepared_values_by_field
+            }
             row_errors = {}
-            for field_id, field_obj in field_objects.items():
-                field_name = field_obj["name"]
-                if field_name in row_value:
-                    prepared_value = prepared_values_by_field[field_name][index]
-                    if isinstance(prepared_value, Exception):
-                        row_errors[field_name] = [prepared_value]
-                    else:
-                        new_values[field_name] = prepared_value
+            for field_name, prepared_values in prepared_values_by_field.items():
+                if index not in prepared_values:
+                    continue
+
+                prepared_value = prepared_values[index]
+                if isinstance(prepared_value, Exception):
+                    row_errors[field_name] = [prepared_value]
+                else:
+                    new_values[field_name] = prepared_value
             if not row_errors:
                 prepared_rows.append(new_values)
             else:
@@ -2468,6 +2486,195 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             signal_params=signal_params,
         )
 
+    def update_rows_stream(
+        self,
+        user: AbstractUser,
+        table: Table,
+        rows_values: Iterable[Dict[str, Any]],
+        model: Optional[Type[GeneratedTableModel]] = None,
+        batch_size: int = BATCH_SIZE,
+        send_realtime_update: bool = True,
+        send_webhook_events: bool = True,
+        skip_search_update: bool = False,
+        signal_params: Optional[Dict] = None,
+    ) -> UpdatedRowsStreamStats:
+        """
+        Checks if the user has permission to update the rows and the values of the
+        fields, and then updates the streamed rows in batches. See
+        `force_update_rows_stream` for more information.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table for which the rows must be updated.
+        :param rows_values: An iterable of rows with the id and new values that should
+            be set.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :param batch_size: The maximum number of rows updated in one batch.
+        :param send_realtime_update: If set to false then it is up to the caller to
+            send the rows_updated or similar signal. Defaults to True.
+        :param send_webhook_events: If set the false then the webhooks will not be
+            triggered. Defaults to true.
+        :param skip_search_update: If set to True, then it's up to the caller to
+            trigger the search update of the updated rows.
+        :param signal_params: Additional parameters that are added to the signal.
+        :raises PermissionDenied: When the user doesn't have permission to write the
+            values of any of the updated fields.
+        :return: The throughput statistics of the updated rows.
+        """
+
+        CoreHandler().check_permissions(
+            user,
+            UpdateDatabaseRowOperationType.type,
+            workspace=table.database.workspace,
+            context=table,
+        )
+
+        if model is None:
+            model = table.get_model()
+
+        return self.force_update_rows_stream(
+            user,
+            table,
+            rows_values,
+            model=model,
+            batch_size=batch_size,
+            send_realtime_update=send_realtime_update,
+            send_webhook_events=send_webhook_events,
+            skip_search_update=skip_search_update,
+            signal_params=signal_params,
+            before_batch_update=lambda batch: (
+                self._check_write_fields_values_permissions(user, model, batch)
+            ),
+        )
+
+    def force_update_rows_stream(
+        self,
+        user: AbstractUser,
+        table: Table,
+        rows_values: Iterable[Dict[str, Any]],
+        model: Optional[Type[GeneratedTableModel]] = None,
+        batch_size: int = BATCH_SIZE,
+        send_realtime_update: bool = True,
+        send_webhook_events: bool = True,
+        skip_search_update: bool = False,
+        signal_params: Optional[Dict] = None,
+        before_batch_update: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> UpdatedRowsStreamStats:
+        """
+        Updates a stream of rows without having to load all the changes in memory
+        first. The rows are grouped by the set of fields they update, so that every
+        batch only writes the touched columns and walks the field dependencies once
+        for all the rows in it, instead of once per row. A group is updated when it
+        reaches the `batch_size`, when a row that's already waiting in it is
+        streamed again, when too many rows are waiting in all the groups combined,
+        or when the stream ends. Every batch is updated in its own transaction.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table for which the rows must be updated.
+        :param rows_values: An iterable of rows with the id and new values that should
+            be set.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :param batch_size: The maximum number of rows updated in one batch.
+        :param send_realtime_update: If set to false then it is up to the caller to
+            send the rows_updated or similar signal. Defaults to True.
+        :param send_webhook_events: If set the false then the webhooks will not be
+            triggered. Defaults to true.
+        :param skip_search_update: If set to True, then it's up to the caller to
+            trigger the search update of the updated rows.
+        :param signal_params: Additional parameters that are added to the signal.
+        :param before_batch_update: Optional callable that is called with the rows
+            values of every batch right before it's updated.
+        :raises RowDoesNotExist: When any of the rows don't exist.
+        :raises FieldDataConstraintException: When a field data constraint is violated.
+        :return: The throughput statistics of the updated rows.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        # Limits the number of rows waiting in memory when the rows update many
+        # different sets of fields.
+        max_pending_rows = batch_size * 10
+        pending_rows_values = defaultdict(list)
+        pending_row_id_to_key = {}
+        updated_row_ids = []
+        stats = UpdatedRowsStreamStats()
+        start = time.perf_counter()
+
+        def update_batch(key):
+            batch = pending_rows_values.pop(key)
+            for row_values in batch:
+                del pending_row_id_to_key[row_values["id"]]
+
+            if before_batch_update is not None:
+                before_batch_update(batch)
+
+            batch_start = time.perf_counter()
+            with transaction.atomic():
+                result = self.force_update_rows(
+                    user,
+                    table,
+                    batch,
+                    model=model,
+                    send_realtime_update=send_realtime_update,
+                    send_webhook_events=send_webhook_events,
+                    # The search data is updated once for all the batches at the end.
+                    skip_search_update=True,
+                    signal_params=signal_params,
+                )
+            rows_stream_batch_duration_histogram.record(
+                time.perf_counter() - batch_start
+            )
+            rows_stream_batch_size_histogram.record(len(batch))
+
+            stats.batches += 1
+            stats.rows_updated += len(batch)
+            stats.updated_field_ids.update(result.updated_field_ids or [])
+            updated_row_ids.extend(row_values["id"] for row_values in batch)
+
+        try:
+            for row_values in rows_values:
+                row_id = row_values["id"]
+                # A row can only be updated once per batch, so any pending changes of
+                # the same row are updated first to respect the order of the stream.
+                if row_id in pending_row_id_to_key:
+                    update_batch(pending_row_id_to_key[row_id])
+
+                key = frozenset(name for name in row_values.keys() if name != "id")
+                pending_rows_values[key].append(row_values)
+                pending_row_id_to_key[row_id] = key
+
+                if len(pending_rows_values[key]) >= batch_size:
+                    update_batch(key)
+                elif len(pending_row_id_to_key) >= max_pending_rows:
+                    update_batch(
+                        max(
+                            pending_rows_values,
+                            key=lambda k: len(pending_rows_values[k]),
+                        )
+                    )
+
+            for key in list(pending_rows_values.keys()):
+                update_batch(key)
+        finally:
+            # Every batch is committed on its own, so the search data of the rows
+            # that have been updated must also be updated if a later batch, or the
+            # stream itself, fails.
+            if updated_row_ids and not skip_search_update:
+                SearchHandler.schedule_update_search_data(
+                    table,
+                    fields=[
+                        field_object["field"]
+                        for field_id, field_object in model._field_objects.items()
+                        if field_id in stats.updated_field_ids
+                    ],
+                    row_ids=updated_row_ids,
+                )
+
+        stats.duration = time.perf_counter() - start
+        return stats
+
     def _extract_field_ids_from_row_values(
         self, rows_values: List[Dict[str, Any]], model: GeneratedTableModel
     ) -> Set[int]:
@@ -1,5 +1,5 @@
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, NamedTuple, NewType, TypedDict, TypeVar
 
@@ -47,6 +47,23 @@ class UpdatedRowsData(NamedTuple):
     cascade_update: CascadeUpdatedRows | None = None
 
 
+@dataclass
+class UpdatedRowsStreamStats:
+    """
+    The throughput statistics of a stream of row updates, processed in batches
+    grouped by the fields that are updated.
+    """
+
+    rows_updated: int = 0
+    batches: int = 0
+    duration: float = 0.0
+    updated_field_ids: set[int] = field(default_factory=set)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_updated / self.duration if self.duration > 0 else 0.0
+
+
 class CreatedRowsData(NamedTuple):
     created_rows: list[GeneratedTableModel]
     errors: dict[int, dict[str, Any]] | None = None
@@ -4,7 +4,11 @@ from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.views.signals import view_loaded
 from baserow.core.models import Workspace
-from baserow.core.trash.signals import before_permanently_deleted, permanently_deleted
+from baserow.core.trash.signals import (
+    before_permanently_deleted,
+    before_permanently_deleted_in_bulk,
+    permanently_deleted,
+)
 
 
 @receiver(permanently_deleted, sender="workspace")
@@ -73,6 +77,28 @@ def handle_permanently_deleted_row(
         SearchHandler.delete_workspace_search_table_if_exists(workspace_id)
 
 
+@receiver(before_permanently_deleted_in_bulk, sender="row")
+def handle_permanently_deleted_rows_in_bulk(
+    sender, trash_item_ids, parent_id, *args, **kwargs
+):
+    """
+    When many trashed rows of a table are permanently deleted at once, then search
+    data should be cleaned from data for those rows.
+    """
+
+    table = (
+        Table.objects_and_trash.filter(id=parent_id).select_related("database").first()
+    )
+    if table is None:
+        return
+
+    if SearchHandler.full_text_enabled():
+        SearchHandler.mark_search_data_for_deletion(table, row_ids=trash_item_ids)
+    else:  # we can drop the entire search table if exists
+        workspace_id = table.database.workspace_id
+        SearchHandler.delete_workspace_search_table_if_exists(workspace_id)
+
+
 @receiver(before_permanently_deleted, sender="rows")
 def handle_permanently_deleted_rows(
     sender, trash_item_id, trash_item, parent_id, *args, **kwargs
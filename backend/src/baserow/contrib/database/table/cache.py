@@ -15,11 +15,12 @@ When we construct a model we:
 """
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.conf import settings
-from django.core.cache import caches
+from django.core.cache import cache, caches
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 
 from baserow.core.cache import local_cache
 from baserow.version import VERSION as BASEROW_VERSION
@@ -84,3 +85,135 @@ def invalidate_table_in_model_cache(table_id: int):
     # Make sure to invalidate ourselves and any directly connected tables.
 
     Table.objects_and_trash.filter(id=table_id).update(version=new_version)
+
+
+# The names of the table watermarks. The `rows` watermark changes when the cell
+# values of the table change, the `schema` watermark when its fields change and the
+# `views` watermark when its views, or anything they contain, change.
+TABLE_ROWS_WATERMARK = "rows"
+TABLE_SCHEMA_WATERMARK = "schema"
+TABLE_VIEWS_WATERMARK = "views"
+
+
+def _get_table_watermark_cache_key(table_id: int, name: str) -> str:
+    return f"table_{table_id}__{name}_watermark"
+
+
+def bump_table_watermark(table_id: int, name: str):
+    """
+    Changes the watermark with the provided name of the table, so that anything
+    depending on it, like the ETag of the API responses, is considered outdated.
+
+    :param table_id: The id of the table that changed.
+    :param name: The name of the watermark, like `TABLE_ROWS_WATERMARK`.
+    """
+
+    cache_key = _get_table_watermark_cache_key(table_id, name)
+
+    def bump():
+        cache.set(cache_key, uuid.uuid4().hex, timeout=None)
+
+    bump()
+    # A concurrent request could combine the new watermark with the old data before
+    # the transaction that changes it is committed, so it's bumped once more after
+    # the commit.
+    transaction.on_commit(bump)
+
+
+def get_table_watermarks(table_ids: Iterable[int], name: str) -> List[str]:
+    """
+    Returns the current watermark with the provided name of every table. The
+    watermarks are random, so if one is evicted from the cache, a new one is
+    generated instead of possibly repeating an old one.
+
+    :param table_ids: The ids of the tables.
+    :param name: The name of the watermark, like `TABLE_ROWS_WATERMARK`.
+    :return: The watermarks in the same order as the table ids.
+    """
+
+    cache_keys = [
+        _get_table_watermark_cache_key(table_id, name) for table_id in table_ids
+    ]
+    watermarks = cache.get_many(cache_keys)
+    missing_cache_keys = [key for key in cache_keys if key not in watermarks]
+    if missing_cache_keys:
+        for key in missing_cache_keys:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+        watermarks.update(cache.get_many(missing_cache_keys))
+    return [watermarks.get(key) for key in cache_keys]
+
+
+def _get_link_row_display_value_cache_key(
+    table_id: int, table_version: str, row_id: int
+) -> str:
+    return f"link_row_display_value_{table_id}_{table_version}_{row_id}"
+
+
+def get_link_row_display_values_versions(table_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Returns the version of the display values of the rows of every table. The
+    version changes whenever the cell values or the fields of the table change.
+
+    :param table_ids: The ids of the tables.
+    :return: A mapping containing the version per table id.
+    """
+
+    table_ids = list(table_ids)
+    rows_watermarks = get_table_watermarks(table_ids, TABLE_ROWS_WATERMARK)
+    schema_watermarks = get_table_watermarks(table_ids, TABLE_SCHEMA_WATERMARK)
+    return {
+        table_id: f"{rows_watermark}{schema_watermark}"
+        for table_id, rows_watermark, schema_watermark in zip(
+            table_ids, rows_watermarks, schema_watermarks
+        )
+    }
+
+
+def get_cached_link_row_display_values(
+    table_id: int, table_version: str, row_ids: Iterable[int]
+) -> Dict[int, Tuple[Any, str]]:
+    """
+    Returns the cached order and display value of the provided rows, as shown in
+    the link row fields pointing to the table.
+
+    :param table_id: The id of the table containing the rows.
+    :param table_version: The version returned by
+        `get_link_row_display_values_versions` for the table.
+    :param row_ids: The ids of the rows.
+    :return: The order and display value per row id. Rows that are not cached are
+        not included.
+    """
+
+    cache_keys = {
+        _get_link_row_display_value_cache_key(table_id, table_version, row_id): row_id
+        for row_id in row_ids
+    }
+    return {
+        cache_keys[cache_key]: value
+        for cache_key, value in cache.get_many(cache_keys.keys()).items()
+    }
+
+
+def set_cached_link_row_display_values(
+    table_id: int, table_version: str, values: Dict[int, Tuple[Any, str]]
+):
+    """
+    Caches the order and display value of the provided rows for the version of the
+    table. Because the version is part of the cache key, the values never have to
+    be invalidated, they expire after `LINK_ROW_DISPLAY_VALUE_CACHE_TTL_SECONDS`.
+
+    :param table_id: The id of the table containing the rows.
+    :param table_version: The version of the table retrieved before the rows were
+        fetched.
+    :param values: The order and display value per row id.
+    """
+
+    cache.set_many(
+        {
+            _get_link_row_display_value_cache_key(table_id, table_version, row_id): (
+                value
+            )
+            for row_id, value in values.items()
+        },
+        timeout=settings.LINK_ROW_DISPLAY_VALUE_CACHE_TTL_SECONDS,
+    )
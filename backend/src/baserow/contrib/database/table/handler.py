@@ -76,9 +76,18 @@ tracer = trace.get_tracer(__name__)
 class TableUsageHandler:
     @classmethod
     def calculate_table_storage_usage(cls, table_id):
-        return UserFile.objects.filter(
-            unique__in=BaserowTableFileUniques(table_id)
-        ).aggregate(tot_MB=Coalesce(Sum("size"), 0) / USAGE_UNIT_MB)["tot_MB"]
+        # User files with the same content share the same name and stored file, so
+        # only one of them is counted per name.
+        name_fields = ("unique", "sha256_hash", "original_extension")
+        user_file_ids = (
+            UserFile.objects.filter(unique__in=BaserowTableFileUniques(table_id))
+            .order_by(*name_fields, "id")
+            .distinct(*name_fields)
+            .values("id")
+        )
+        return UserFile.objects.filter(id__in=user_file_ids).aggregate(
+            tot_MB=Coalesce(Sum("size"), 0) / USAGE_UNIT_MB
+        )["tot_MB"]
 
     @classmethod
     def mark_table_for_usage_update(
@@ -766,6 +775,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             include_permission_data=True,
             reduce_disk_space_usage=False,
             is_duplicate=True,
+            copy_rows_in_database=True,
         )
 
         serialized_tables = database_type.export_tables_serialized([table], config)
@@ -2,6 +2,7 @@ import itertools
 import re
 import uuid
 from collections import defaultdict
+from decimal import Decimal
 from types import MethodType
 from typing import Iterable, Iterator, List, Optional, Type, TypedDict
 
@@ -646,6 +647,34 @@ class GeneratedTableModel(HierarchicalModelMixin, models.Model):
         except StopIteration:
             return None
 
+    @classmethod
+    def from_display_value(
+        cls, row_id: int, order: Decimal, display_value: str
+    ) -> "GeneratedTableModel":
+        """
+        Creates an instance of an existing row of which only the `id` and `order` are
+        loaded, and that returns the provided display value when rendered to a
+        string. This is used to represent a related row without fetching it.
+
+        :param row_id: The id of the row.
+        :param order: The order of the row.
+        :param display_value: The human readable value of the primary field.
+        :return: The row instance, having all other fields deferred.
+        """
+
+        values = {"id": row_id, "order": order}
+        instance = cls.from_db(
+            cls.objects.db,
+            list(values.keys()),
+            [
+                values[field.attname]
+                for field in cls._meta.concrete_fields
+                if field.attname in values
+            ],
+        )
+        instance._display_value = display_value
+        return instance
+
     class Meta:
         abstract = True
 
@@ -1029,6 +1058,9 @@ class Table(
             primary field value in human readable format.
             """
 
+            if "_display_value" in self.__dict__:
+                return self._display_value
+
             field = self._field_objects.get(self._primary_field_id, None)
 
             if not field:
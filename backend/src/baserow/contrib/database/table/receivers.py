@@ -3,16 +3,34 @@ from django.dispatch import receiver
 
 from baserow.contrib.database.application_types import DatabaseApplicationType
 from baserow.contrib.database.fields.models import FileField
-from baserow.contrib.database.fields.signals import field_deleted, field_restored
+from baserow.contrib.database.fields.signals import (
+    field_created,
+    field_deleted,
+    field_restored,
+    field_updated,
+)
 from baserow.contrib.database.rows.signals import (
+    row_orders_recalculated,
     rows_created,
     rows_deleted,
     rows_updated,
 )
-from baserow.contrib.database.table.signals import table_created, table_deleted
+from baserow.contrib.database.table.signals import (
+    table_created,
+    table_deleted,
+    table_schema_changed,
+    table_updated,
+)
+from baserow.contrib.database.views import signals as view_signals
 from baserow.core.registries import application_type_registry
 from baserow.core.signals import application_created
 
+from .cache import (
+    TABLE_ROWS_WATERMARK,
+    TABLE_SCHEMA_WATERMARK,
+    TABLE_VIEWS_WATERMARK,
+    bump_table_watermark,
+)
 from .tasks import create_tables_usage_for_new_database, update_table_usage
 
 
@@ -78,3 +96,109 @@ def on_application_created(sender, application, **kwargs):
 def on_field_restored(sender, field, **kwargs):
     if isinstance(field, FileField):
         transaction.on_commit(lambda: update_table_usage.delay(field.table_id))
+
+
+# Table watermarks used to detect changes, for example in the ETag of API responses.
+@receiver([rows_created, rows_updated, rows_deleted])
+def bump_rows_watermarks_on_rows_change(sender, table, dependant_fields, **kwargs):
+    table_ids = {table.id} | {field.table_id for field in dependant_fields}
+    for table_id in table_ids:
+        bump_table_watermark(table_id, TABLE_ROWS_WATERMARK)
+
+
+@receiver([row_orders_recalculated, table_updated])
+def bump_rows_watermark_on_table_change(sender, table, **kwargs):
+    bump_table_watermark(table.id, TABLE_ROWS_WATERMARK)
+
+
+@receiver(table_schema_changed)
+def bump_schema_watermark_on_schema_change(sender, table_id, **kwargs):
+    bump_table_watermark(table_id, TABLE_SCHEMA_WATERMARK)
+
+
+@receiver([field_created, field_updated, field_deleted, field_restored])
+def bump_watermarks_on_field_change(sender, field, related_fields, **kwargs):
+    # Changing a field can change the cell values of the field and of the fields
+    # depending on it.
+    table_ids = {field.table_id} | {f.table_id for f in related_fields}
+    for table_id in table_ids:
+        bump_table_watermark(table_id, TABLE_SCHEMA_WATERMARK)
+        bump_table_watermark(table_id, TABLE_ROWS_WATERMARK)
+
+
+@receiver(
+    [
+        view_signals.view_created,
+        view_signals.view_updated,
+        view_signals.view_deleted,
+        view_signals.view_field_options_updated,
+    ]
+)
+def bump_views_watermark_on_view_change(sender, view, **kwargs):
+    bump_table_watermark(view.table_id, TABLE_VIEWS_WATERMARK)
+
+
+@receiver(view_signals.views_reordered)
+def bump_views_watermark_on_views_reordered(sender, table, **kwargs):
+    bump_table_watermark(table.id, TABLE_VIEWS_WATERMARK)
+
+
+def _bump_views_watermark_of_view_child(view_child):
+    bump_table_watermark(view_child.view.table_id, TABLE_VIEWS_WATERMARK)
+
+
+@receiver(
+    [
+        view_signals.view_filter_created,
+        view_signals.view_filter_updated,
+        view_signals.view_filter_deleted,
+    ]
+)
+def bump_views_watermark_on_view_filter_change(sender, view_filter, **kwargs):
+    _bump_views_watermark_of_view_child(view_filter)
+
+
+@receiver(
+    [
+        view_signals.view_filter_group_created,
+        view_signals.view_filter_group_updated,
+        view_signals.view_filter_group_deleted,
+    ]
+)
+def bump_views_watermark_on_view_filter_group_change(
+    sender, view_filter_group, **kwargs
+):
+    _bump_views_watermark_of_view_child(view_filter_group)
+
+
+@receiver(
+    [
+        view_signals.view_sort_created,
+        view_signals.view_sort_updated,
+        view_signals.view_sort_deleted,
+    ]
+)
+def bump_views_watermark_on_view_sort_change(sender, view_sort, **kwargs):
+    _bump_views_watermark_of_view_child(view_sort)
+
+
+@receiver(
+    [
+        view_signals.view_group_by_created,
+        view_signals.view_group_by_updated,
+        view_signals.view_group_by_deleted,
+    ]
+)
+def bump_views_watermark_on_view_group_by_change(sender, view_group_by, **kwargs):
+    _bump_views_watermark_of_view_child(view_group_by)
+
+
+@receiver(
+    [
+        view_signals.view_decoration_created,
+        view_signals.view_decoration_updated,
+        view_signals.view_decoration_deleted,
+    ]
+)
+def bump_views_watermark_on_view_decoration_change(sender, view_decoration, **kwargs):
+    _bump_views_watermark_of_view_child(view_decoration)
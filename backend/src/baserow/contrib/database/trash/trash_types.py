@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.db import connection, router
+from django.db.models import Q
 
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.dependencies.update_collector import (
@@ -268,6 +269,7 @@ class FieldTrashableItemType(TrashableItemType):
 class RowTrashableItemType(TrashableItemType):
     type = "row"
     model_class = GeneratedTableModel
+    supports_bulk_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -348,27 +350,53 @@ class RowTrashableItemType(TrashableItemType):
         :return: An instance of the model_class with trashed_item_id
         """
 
-        # Cache the expensive table.get_model function call if we are looking up
-        # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = self._get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
         except model.DoesNotExist:
             raise TrashItemDoesNotExist()
 
+    def permanently_delete_items(
+        self, parent_id, trash_item_ids, trash_item_lookup_cache=None
+    ):
+        """
+        Deletes the trashed rows of the table and their many to many relations with
+        one query per relation, instead of deleting every row separately.
+        """
+
+        model = self._get_cached_table_model(parent_id, trash_item_lookup_cache)
+        rows_to_delete = model.trash.filter(id__in=trash_item_ids)
+        db = router.db_for_write(model)
+
+        for m2m_field in model._meta.many_to_many:
+            through = m2m_field.remote_field.through
+            relations = Q(**{f"{m2m_field.m2m_field_name()}__in": rows_to_delete})
+            if m2m_field.remote_field.model == model:
+                relations |= Q(
+                    **{f"{m2m_field.m2m_reverse_field_name()}__in": rows_to_delete}
+                )
+            through.objects.filter(relations)._raw_delete(using=db)
+
+        RichTextFieldMention.objects.filter(
+            table_id=parent_id, row_id__in=trash_item_ids
+        ).delete()
+        rows_to_delete._raw_delete(using=db)
+
+    def _get_cached_table_model(self, table_id, trash_item_lookup_cache=None):
+        # Cache the expensive table.get_model function call if we are looking up
+        # many trash items at once.
+        if trash_item_lookup_cache is None:
+            return self._get_table_model(table_id)
+
+        model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+        try:
+            return model_cache[table_id]
+        except KeyError:
+            return model_cache.setdefault(table_id, self._get_table_model(table_id))
+
     def _get_table_model(self, table_id):
         table = self._get_table(table_id)
         return table.get_model()
@@ -6,7 +6,18 @@ from collections import defaultdict, namedtuple
 from copy import deepcopy
 from dataclasses import dataclass
 from hashlib import shake_128
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
@@ -15,6 +26,7 @@ from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
+from django.db import transaction
 from django.db.models import Count, Q
 from django.db.models.expressions import OrderBy
 from django.db.models.query import QuerySet
@@ -30,6 +42,8 @@ from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_filters import (
     AdvancedFilterBuilder,
     FilterBuilder,
+    RowPredicate,
+    match_all_rows_predicate,
 )
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
 from baserow.contrib.database.fields.models import Field, LinkRowField
@@ -84,6 +98,7 @@ from baserow.contrib.database.views.registries import (
     view_ownership_type_registry,
 )
 from baserow.contrib.database.views.view_filter_groups import ViewGroupedFiltersAdapter
+from baserow.core.cache import global_cache
 from baserow.core.db import specific_iterator, sql, transaction_atomic
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
@@ -175,6 +190,15 @@ from .validators import value_is_empty_for_required_form_field
 
 FieldOptionsDict = Dict[int, Dict[str, Any]]
 
+# The related managers of the view that are cached by the view metadata cache, with
+# the model they return.
+VIEW_METADATA_RELATED_MODELS = {
+    "viewfilter_set": ViewFilter,
+    "filter_groups": ViewFilterGroup,
+    "viewsort_set": ViewSort,
+    "viewgroupby_set": ViewGroupBy,
+}
+
 
 ending_number_regex = re.compile(r"(.+) (\d+)$")
 
@@ -1519,6 +1543,30 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         adapter = ViewGroupedFiltersAdapter(view, model)
         return AdvancedFilterBuilder(adapter).construct_filter_builder()
 
+    def get_row_predicate(
+        self, view: View, model: Type[GeneratedTableModel]
+    ) -> Optional[RowPredicate]:
+        """
+        Constructs the in-memory equivalent of the view's filters, which can be used
+        to check if already loaded rows are visible in the view without querying the
+        database.
+
+        :param view: The view where to fetch the filters from.
+        :param model: The generated model containing all fields.
+        :return: A row predicate returning True, False or None if it can't be
+            decided in Python for a specific row. None is returned instead of a
+            predicate if at least one of the filters can only be applied as SQL.
+        """
+
+        if not hasattr(model, "_field_objects"):
+            raise ValueError("A queryset of the table model is required.")
+
+        if view.filters_disabled:
+            return match_all_rows_predicate
+
+        adapter = ViewGroupedFiltersAdapter(view, model)
+        return AdvancedFilterBuilder(adapter).construct_row_predicate()
+
     def apply_filters(self, view: View, queryset: QuerySet) -> QuerySet:
         """
         Applies the view's filter to the given queryset.
@@ -2776,6 +2824,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         apply_sorts: bool = True,
         apply_filters: bool = True,
         search_mode: Optional[SearchMode] = None,
+        link_row_display_values_only: bool = False,
     ) -> QuerySet:
         """
         Returns a queryset for the provided view which is appropriately sorted,
@@ -2796,6 +2845,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param apply_sorts: Whether to apply view sorts to the resulting queryset.
         :param apply_filters: Whether to apply view filters to the resulting queryset.
         :param search_mode: The type of search to perform if a search term is provided.
+        :param link_row_display_values_only: Indicates that the related rows of the
+            link row fields are only going to be used to display the cell values,
+            which allows prefetching them more efficiently.
         :return: The appropriate queryset for the provided view.
         :raises ViewDoesNotSupportListingRows: When the view type does not support
             listing rows (i.e. a form view).
@@ -2804,7 +2856,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if model is None:
             model = view.table.get_model()
 
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(
+            link_row_display_values_only=link_row_display_values_only
+        )
 
         view_type: ViewType = view_type_registry.get_by_model(view.specific_class)
         if not view_type.can_list_rows:
@@ -2827,6 +2881,91 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
         return queryset
 
+    @classmethod
+    def _get_view_metadata_invalidate_key(cls, view_id: int) -> str:
+        return f"view_{view_id}__metadata_invalidate_key"
+
+    @classmethod
+    def invalidate_view_metadata_cache(cls, view_id: int):
+        """
+        Invalidates the cached filters, filter groups, sorts, group bys and field
+        options of the view, so that they're fetched from the database again the next
+        time they're needed.
+
+        :param view_id: The id of the view for which the cache must be invalidated.
+        """
+
+        invalidate_key = cls._get_view_metadata_invalidate_key(view_id)
+        global_cache.invalidate(invalidate_key=invalidate_key)
+        # A concurrent request could cache the old metadata again before the
+        # transaction that changes it is committed, so it's invalidated once more
+        # after the commit.
+        transaction.on_commit(
+            lambda: global_cache.invalidate(invalidate_key=invalidate_key)
+        )
+
+    def get_cached_view_metadata(self, view: View, name: str, compute: Callable):
+        """
+        Returns the metadata with the provided name of the view from the cache, or
+        computes and caches it if it's not cached yet. The cache is invalidated when
+        the view, its filters, sorts, group bys or field options change, and because
+        the table version is part of the key, when any field of the table changes.
+
+        :param view: The view to which the metadata belongs.
+        :param name: The name of the metadata, unique for the view.
+        :param compute: Called without arguments to compute the metadata if it's not
+            cached. The return value must be picklable.
+        :return: The cached or computed metadata.
+        """
+
+        # The table version is only bumped when the model cache is enabled.
+        if settings.BASEROW_DISABLE_MODEL_CACHE:
+            return compute()
+
+        return global_cache.get(
+            f"view_{view.id}__metadata_{name}_{view.table.version}",
+            default=compute,
+            invalidate_key=self._get_view_metadata_invalidate_key(view.id),
+            timeout=settings.VIEW_METADATA_CACHE_TTL_SECONDS,
+        )
+
+    def prefetch_view_metadata(self, view: View):
+        """
+        Prefetches the filters, filter groups, sorts and group bys of the view from
+        the view metadata cache, so that the related managers of the view don't have
+        to query the database if they're cached. The table model must be generated
+        before calling this method, to make sure the table version is up to date.
+
+        :param view: The view for which the metadata must be prefetched.
+        """
+
+        def fetch_metadata():
+            return {
+                name: list(
+                    getattr(view, name).values_list(
+                        *[f.attname for f in model_class._meta.concrete_fields]
+                    )
+                )
+                for name, model_class in VIEW_METADATA_RELATED_MODELS.items()
+            }
+
+        metadata = self.get_cached_view_metadata(view, "definition", fetch_metadata)
+
+        if not hasattr(view, "_prefetched_objects_cache"):
+            view._prefetched_objects_cache = {}
+
+        for name, model_class in VIEW_METADATA_RELATED_MODELS.items():
+            field_names = [f.attname for f in model_class._meta.concrete_fields]
+            queryset = getattr(view, name).get_queryset()
+            # Mimic what `prefetch_related` does, so that `.all()` returns the
+            # cached instances without executing a query.
+            queryset._result_cache = [
+                model_class.from_db(view._state.db, field_names, values)
+                for values in metadata[name]
+            ]
+            queryset._prefetch_done = True
+            view._prefetched_objects_cache[name] = queryset
+
     def _get_aggregation_lock_cache_key(self, view: View):
         """
         Returns the aggregation lock cache key for the specified view.
@@ -3749,7 +3888,9 @@ class CachingPublicViewRowChecker:
     A helper class to check which public views a row is visible in. Will pre-calculate
     upfront for a specific table which public views are always visible, which public
     views can have row check results cached for and finally will pre-construct and
-    reuse querysets for performance reasons.
+    reuse querysets for performance reasons. If the filters of a view can be
+    evaluated in Python, the already loaded row values are checked without querying
+    the database and the queryset is only used for the undecided rows.
     """
 
     def __init__(
@@ -3792,6 +3933,7 @@ class CachingPublicViewRowChecker:
                     (
                         view,
                         filter_qs,
+                        handler.get_row_predicate(view, model),
                         self._view_row_checks_can_be_cached(view),
                     )
                 )
@@ -3812,15 +3954,15 @@ class CachingPublicViewRowChecker:
         """
 
         views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
+        for view, filter_qs, row_predicate, can_use_cache in self._views_with_filters:
             if can_use_cache:
                 if row.id not in self._view_row_check_cache[view.id]:
                     self._view_row_check_cache[view.id][
                         row.id
-                    ] = self._check_row_visible(filter_qs, row)
+                    ] = self._check_row_visible(filter_qs, row_predicate, row)
                 if self._view_row_check_cache[view.id][row.id]:
                     views.append(view)
-            elif self._check_row_visible(filter_qs, row):
+            elif self._check_row_visible(filter_qs, row_predicate, row):
                 views.append(view)
 
         return views + self._always_visible_views
@@ -3843,11 +3985,13 @@ class CachingPublicViewRowChecker:
 
         visible_views_rows = []
         row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
+        for view, filter_qs, row_predicate, can_use_cache in self._views_with_filters:
             if can_use_cache:
                 for id in row_ids:
                     if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
+                        visible_ids = set(
+                            self._check_rows_visible(filter_qs, row_predicate, rows)
+                        )
                         for visible_id in visible_ids:
                             self._view_row_check_cache[view.id][visible_id] = True
                         break
@@ -3858,7 +4002,9 @@ class CachingPublicViewRowChecker:
                     visible_views_rows.append(PublicViewRows(view, visible_ids))
 
             else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
+                visible_ids = set(
+                    self._check_rows_visible(filter_qs, row_predicate, rows)
+                )
                 if len(visible_ids) > 0:
                     visible_views_rows.append(PublicViewRows(view, visible_ids))
 
@@ -3870,14 +4016,32 @@ class CachingPublicViewRowChecker:
         return visible_views_rows
 
     # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
+    def _check_row_visible(self, filter_qs, row_predicate, row):
+        if row_predicate is not None:
+            visible = row_predicate(row)
+            if visible is not None:
+                return visible
         return filter_qs.filter(id=row.id).exists()
 
     # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
-        )
+    def _check_rows_visible(self, filter_qs, row_predicate, rows):
+        visible_ids = []
+        if row_predicate is None:
+            undecided_rows = rows
+        else:
+            undecided_rows = []
+            for row in rows:
+                visible = row_predicate(row)
+                if visible is None:
+                    undecided_rows.append(row)
+                elif visible:
+                    visible_ids.append(row.id)
+
+        if len(undecided_rows) > 0:
+            visible_ids += filter_qs.filter(
+                id__in=[row.id for row in undecided_rows]
+            ).values_list("id", flat=True)
+        return visible_ids
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
@@ -13,16 +13,23 @@ from baserow.contrib.database.rows.signals import (
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.signals import (
+    view_field_options_updated,
     view_filter_created,
     view_filter_deleted,
     view_filter_group_created,
     view_filter_group_deleted,
     view_filter_group_updated,
     view_filter_updated,
+    view_group_by_created,
+    view_group_by_deleted,
+    view_group_by_updated,
+    view_sort_created,
+    view_sort_deleted,
+    view_sort_updated,
     view_updated,
 )
 
-from .handler import ViewSubscriptionHandler
+from .handler import ViewHandler, ViewSubscriptionHandler
 
 
 def _notify_table_data_updated(table: Table, model: GeneratedTableModel | None = None):
@@ -96,3 +103,32 @@ def notify_field_updated(sender, field, related_fields, user, **kwargs):
 @receiver(field_deleted)
 def notify_field_deleted(sender, field_id, field, related_fields, user, **kwargs):
     _notify_tables_of_fields_updated_or_deleted(field, related_fields, user, **kwargs)
+
+
+@receiver([view_updated, view_field_options_updated])
+def invalidate_view_metadata_cache_on_view_change(sender, view, **kwargs):
+    ViewHandler.invalidate_view_metadata_cache(view.id)
+
+
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def invalidate_view_metadata_cache_on_filter_change(sender, view_filter, **kwargs):
+    ViewHandler.invalidate_view_metadata_cache(view_filter.view_id)
+
+
+@receiver(
+    [view_filter_group_created, view_filter_group_updated, view_filter_group_deleted]
+)
+def invalidate_view_metadata_cache_on_filter_group_change(
+    sender, view_filter_group, **kwargs
+):
+    ViewHandler.invalidate_view_metadata_cache(view_filter_group.view_id)
+
+
+@receiver([view_sort_created, view_sort_updated, view_sort_deleted])
+def invalidate_view_metadata_cache_on_sort_change(sender, view_sort, **kwargs):
+    ViewHandler.invalidate_view_metadata_cache(view_sort.view_id)
+
+
+@receiver([view_group_by_created, view_group_by_updated, view_group_by_deleted])
+def invalidate_view_metadata_cache_on_group_by_change(sender, view_group_by, **kwargs):
+    ViewHandler.invalidate_view_metadata_cache(view_group_by.view_id)
@@ -21,7 +21,11 @@ from django.db import models as django_models
 from rest_framework.fields import CharField
 from rest_framework.serializers import Serializer
 
-from baserow.contrib.database.fields.field_filters import OptionallyAnnotatedQ
+from baserow.contrib.database.fields.field_filters import (
+    OptionallyAnnotatedQ,
+    RowPredicate,
+    match_no_rows_predicate,
+)
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Workspace, WorkspaceUser
@@ -951,6 +955,35 @@ class ViewFilterType(Instance):
 
         raise NotImplementedError("Each must have his own get_filter method.")
 
+    def default_row_predicate_on_exception(self) -> RowPredicate:
+        """
+        The row predicate equivalent of `default_filter_on_exception`, used when the
+        filter value is of an incompatible type.
+        """
+
+        return match_no_rows_predicate
+
+    def get_row_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[RowPredicate]:
+        """
+        Optionally returns the in-memory equivalent of the filter returned by
+        `get_filter`. It's used to check if already loaded rows match the filter
+        without querying the database, for example to figure out in which public
+        views a changed row is visible. The predicate must match exactly the same
+        rows as the SQL filter, and return `None` for a row if that can't be
+        guaranteed for its values.
+
+        :param field_name: The name of the field that needs to be filtered.
+        :param value: The value that the field must be compared to.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: The row predicate, or `None` if this filter can only be applied as
+            SQL for the provided field.
+        """
+
+        return None
+
     def get_preload_values(self, view_filter) -> dict:
         """
         Optionally a view filter type can preload certain values for displaying
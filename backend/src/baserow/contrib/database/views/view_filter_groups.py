@@ -11,6 +11,7 @@ from baserow.contrib.database.fields.field_filters import (
     AnnotatedQ,
     FilterBuilder,
     GroupedFiltersAdapter,
+    RowPredicate,
 )
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.contrib.database.views.exceptions import (
@@ -55,6 +56,38 @@ def get_q_from_view_filter(
     )
 
 
+def get_row_predicate_from_view_filter(
+    view_filter: ViewFilter, table_model: GeneratedTableModel
+) -> Optional[RowPredicate]:
+    """
+    Returns the in-memory row predicate equivalent of the provided view filter.
+
+    :param view_filter: The view filter to convert to a row predicate.
+    :param table_model: The table model for which the row predicate should be
+        generated.
+    :return: The row predicate or `None` if the view filter can only be applied as
+        SQL, in which case `get_q_from_view_filter` must be used.
+    """
+
+    field_object = table_model._field_objects.get(view_filter.field_id)
+    if field_object is None:
+        return None
+
+    field_name = field_object["name"]
+    field_instance = field_object["field"]
+    view_filter_type = view_filter_type_registry.get(view_filter.type)
+
+    if not view_filter_type.field_is_compatible(field_instance):
+        return None
+
+    return view_filter_type.get_row_predicate(
+        field_name,
+        view_filter.value,
+        table_model._meta.get_field(field_name),
+        field_instance,
+    )
+
+
 class ViewGroupedFiltersAdapter(GroupedFiltersAdapter):
     def __init__(self, instance: View, model: GeneratedTableModel, **kwargs):
         super().__init__(instance, model)
@@ -70,6 +103,9 @@ class ViewGroupedFiltersAdapter(GroupedFiltersAdapter):
     def get_q_from_filter(self, _filter) -> Union[Q, AnnotatedQ]:
         return get_q_from_view_filter(_filter, self.model)
 
+    def get_row_predicate_from_filter(self, _filter) -> Optional[RowPredicate]:
+        return get_row_predicate_from_view_filter(_filter, self.model)
+
 
 class APIViewFilter:
     """
@@ -146,6 +182,9 @@ class APIGroupedFiltersAdapter(GroupedFiltersAdapter):
     def get_q_from_filter(self, _filter) -> Union[Q, AnnotatedQ]:
         return get_q_from_view_filter(_filter, self.model)
 
+    def get_row_predicate_from_filter(self, _filter) -> Optional[RowPredicate]:
+        return get_row_predicate_from_view_filter(_filter, self.model)
+
     @staticmethod
     def from_serialized_filter_tree(
         serialized_filter_tree: Dict[str, Any],
@@ -1,7 +1,9 @@
 import datetime as datetime_module
+import operator
 import zoneinfo
 from collections import defaultdict
 from datetime import date, datetime, timedelta
+from decimal import Decimal
 from enum import Enum
 from types import MappingProxyType
 from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
@@ -20,9 +22,13 @@ from baserow.contrib.database.fields.field_filters import (
     AnnotatedQ,
     FilterBuilder,
     OptionallyAnnotatedQ,
+    RowPredicate,
     filename_contains_filter,
     map_ids_from_csv_string,
+    match_all_rows_predicate,
+    negate_row_predicate,
     parse_ids_from_csv_string,
+    row_value_predicate,
 )
 from baserow.contrib.database.fields.field_types import (
     AutonumberFieldType,
@@ -78,14 +84,58 @@ from .registries import ViewFilterType
 DATE_FILTER_EMPTY_VALUE = ""
 DATE_FILTER_TIMEZONE_SEPARATOR = "?"
 
+# The field types where the row values are stored as is in the model instance, so
+# that their row predicates can mirror the SQL filters exactly.
+ROW_PREDICATE_TEXT_FIELD_TYPES = frozenset(
+    [
+        TextFieldType.type,
+        LongTextFieldType.type,
+        URLFieldType.type,
+        EmailFieldType.type,
+        PhoneNumberFieldType.type,
+    ]
+)
+ROW_PREDICATE_NUMBER_FIELD_TYPES = frozenset(
+    [NumberFieldType.type, RatingFieldType.type]
+)
+
+NUMERIC_COMPARISON_OPERATORS = MappingProxyType(
+    {"lt": operator.lt, "lte": operator.le, "gt": operator.gt, "gte": operator.ge}
+)
+
+
+def is_stored_text_value(value: Any) -> bool:
+    return value is None or isinstance(value, str)
+
+
+def is_stored_number_value(field: Field, value: Any) -> bool:
+    """
+    Checks if the in-memory number value is the same as the one stored in the
+    database. The database rounds decimals to the decimal places of the field, so
+    values having more decimal places can only be compared in SQL.
+    """
+
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return True
+    if isinstance(value, Decimal) and value.is_finite():
+        decimal_places = getattr(field, "number_decimal_places", 0)
+        return value.as_tuple().exponent >= -decimal_places
+    return False
+
 
 class NotViewFilterTypeMixin:
     def default_filter_on_exception(self):
         return Q()
 
+    def default_row_predicate_on_exception(self):
+        return match_all_rows_predicate
+
     def get_filter(self, *args, **kwargs):
         return ~super().get_filter(*args, **kwargs)
 
+    def get_row_predicate(self, *args, **kwargs):
+        return negate_row_predicate(super().get_row_predicate(*args, **kwargs))
+
 
 class EqualViewFilterType(ViewFilterType):
     """
@@ -131,6 +181,29 @@ class EqualViewFilterType(ViewFilterType):
 
         return Q(**{field_name: value})
 
+    def get_row_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[RowPredicate]:
+        field_type = field_type_registry.get_by_model(field)
+        if field_type.type in ROW_PREDICATE_TEXT_FIELD_TYPES:
+            is_stored_value = is_stored_text_value
+        elif field_type.type in ROW_PREDICATE_NUMBER_FIELD_TYPES:
+            is_stored_value = lambda v: is_stored_number_value(field, v)  # noqa: E731
+        else:
+            return None
+
+        try:
+            value = field_type.parse_filter_value(field, model_field, value.strip())
+        except ValueError:
+            return self.default_row_predicate_on_exception()
+
+        if value is None:
+            return match_all_rows_predicate
+
+        return row_value_predicate(
+            field_name, lambda v: v == value if is_stored_value(v) else None
+        )
+
 
 class NotEqualViewFilterType(NotViewFilterTypeMixin, EqualViewFilterType):
     type = "not_equal"
@@ -263,6 +336,35 @@ class ContainsViewFilterType(ViewFilterType):
         except Exception:
             return self.default_filter_on_exception()
 
+    def get_row_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[RowPredicate]:
+        field_type = field_type_registry.get_by_model(field)
+        # The case insensitive comparison of PostgreSQL only matches the one of
+        # Python for ASCII characters, so anything else is left to the database.
+        value = value.strip()
+        if field_type.type not in ROW_PREDICATE_TEXT_FIELD_TYPES or not value.isascii():
+            return None
+
+        if value == "":
+            return match_all_rows_predicate
+
+        try:
+            model_field.get_prep_value(value)
+        except Exception:
+            return self.default_row_predicate_on_exception()
+
+        value = value.upper()
+
+        def value_predicate(v) -> Optional[bool]:
+            if v is None:
+                return False
+            if not isinstance(v, str) or not v.isascii():
+                return None
+            return value in v.upper()
+
+        return row_value_predicate(field_name, value_predicate)
+
 
 class ContainsWordViewFilterType(ViewFilterType):
     """
@@ -394,6 +496,32 @@ class NumericComparisonViewFilterType(ViewFilterType):
 
         return Q(**{f"{field_name}__{self.operator}": filter_value})
 
+    def get_row_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[RowPredicate]:
+        field_type = field_type_registry.get_by_model(field)
+        if field_type.type not in ROW_PREDICATE_NUMBER_FIELD_TYPES:
+            return None
+
+        try:
+            filter_value = field_type.parse_filter_value(
+                field, model_field, value.strip()
+            )
+        except ValueError:
+            return self.default_row_predicate_on_exception()
+
+        if filter_value is None:
+            return match_all_rows_predicate
+
+        compare = NUMERIC_COMPARISON_OPERATORS[self.operator]
+
+        def value_predicate(v) -> Optional[bool]:
+            if not is_stored_number_value(field, v):
+                return None
+            return v is not None and compare(v, filter_value)
+
+        return row_value_predicate(field_name, value_predicate)
+
 
 class LowerThanViewFilterType(NumericComparisonViewFilterType):
     """
@@ -1107,6 +1235,20 @@ class SingleSelectEqualViewFilterType(ViewFilterType):
         filter_function = self.filter_functions[field_type.type]
         return filter_function(field_name, value, model_field, field)
 
+    def get_row_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[RowPredicate]:
+        field_type = field_type_registry.get_by_model(field)
+        if field_type.type != SingleSelectFieldType.type:
+            return None
+
+        try:
+            option_id = int(value.strip())
+        except ValueError:
+            return match_all_rows_predicate
+
+        return row_value_predicate(f"{field_name}_id", lambda v: v == option_id)
+
     def set_import_serialized_value(self, value, id_mapping):
         mapping = id_mapping["database_field_select_options"]
         try:
@@ -1163,6 +1305,22 @@ class SingleSelectIsAnyOfViewFilterType(ViewFilterType):
         filter_function = self.filter_functions[field_type.type]
         return filter_function(field_name, option_ids, model_field, field)
 
+    def get_row_predicate(
+        self, field_name, value: str, model_field, field
+    ) -> Optional[RowPredicate]:
+        field_type = field_type_registry.get_by_model(field)
+        if field_type.type != SingleSelectFieldType.type:
+            return None
+
+        value = value.strip()
+        if not value:
+            return match_all_rows_predicate
+
+        if not (option_ids := set(parse_ids_from_csv_string(value))):
+            return self.default_row_predicate_on_exception()
+
+        return row_value_predicate(f"{field_name}_id", lambda v: v in option_ids)
+
     def set_import_serialized_value(self, value: str | None, id_mapping: dict) -> str:
         select_option_map = id_mapping["database_field_select_options"]
         new_values = map_ids_from_csv_string(value or "", select_option_map)
@@ -1210,6 +1368,28 @@ class BooleanViewFilterType(ViewFilterType):
 
         return Q(**{field_name: filter_value})
 
+    def get_row_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[RowPredicate]:
+        field_type = field_type_registry.get_by_model(field)
+        if field_type.type != BooleanFieldType.type:
+            return None
+
+        if value == "":  # consider an empty string as False
+            filter_value = False
+        else:
+            try:
+                filter_value = BooleanFieldType().parse_filter_value(
+                    field, model_field, value
+                )
+            except ValueError:
+                return self.default_row_predicate_on_exception()
+
+        return row_value_predicate(
+            field_name,
+            lambda v: v is filter_value if isinstance(v, bool) else None,
+        )
+
 
 class ManyToManyHasBaseViewFilter(ViewFilterType):
     """
@@ -1628,6 +1808,28 @@ class EmptyViewFilterType(ViewFilterType):
         field_type = field_type_registry.get_by_model(field)
         return field_type.empty_query(field_name, model_field, field)
 
+    def get_row_predicate(
+        self, field_name, value, model_field, field
+    ) -> Optional[RowPredicate]:
+        field_type = field_type_registry.get_by_model(field)
+        if field_type.type in ROW_PREDICATE_TEXT_FIELD_TYPES:
+            return row_value_predicate(
+                field_name,
+                lambda v: v in (None, "") if is_stored_text_value(v) else None,
+            )
+        elif field_type.type in ROW_PREDICATE_NUMBER_FIELD_TYPES:
+            return row_value_predicate(
+                field_name,
+                lambda v: v is None if is_stored_number_value(field, v) else None,
+            )
+        elif field_type.type == BooleanFieldType.type:
+            return row_value_predicate(
+                field_name, lambda v: v is False if isinstance(v, bool) else None
+            )
+        elif field_type.type == SingleSelectFieldType.type:
+            return row_value_predicate(f"{field_name}_id", lambda v: v is None)
+        return None
+
 
 class NotEmptyViewFilterType(NotViewFilterTypeMixin, EmptyViewFilterType):
     type = "not_empty"
@@ -47,7 +47,6 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
 from baserow.core.handler import CoreHandler
-from baserow.core.import_export.utils import file_chunk_generator
 from baserow.core.storage import ExportZipFile
 from baserow.core.user_files.handler import UserFileHandler
 from baserow.core.user_files.models import UserFile
@@ -1132,9 +1131,7 @@ class FormViewType(ViewType):
             )
             if files_zip is not None and name not in namelist:
                 file_path = UserFileHandler().user_file_path(name)
-
-                chunk_generator = file_chunk_generator(storage, file_path)
-                files_zip.add(chunk_generator, name)
+                files_zip.add_storage_file(storage, file_path, name)
 
             return {"name": name, "original_name": user_file.original_name}
 
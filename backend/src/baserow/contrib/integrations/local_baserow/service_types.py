@@ -2241,15 +2241,21 @@ class LocalBaserowRowsSignalServiceType(
         model: "GeneratedTableModel",
         **kwargs,
     ):
-        serializer = get_row_serializer_class(
-            model,
-            RowSerializer,
-            is_response=True,
-        )
+        def get_event_payload():
+            serializer = get_row_serializer_class(
+                model,
+                RowSerializer,
+                is_response=True,
+            )
+            return serializer(rows, many=True).data
+
+        # The payload is only serialized if a workflow must be started, because
+        # most tables aren't used by any workflow.
         self._process_event(
             self.model_class.objects.filter(table=table),
-            serializer(rows, many=True).data,
+            get_event_payload,
             user=user,
+            table=table,
         )
 
     def _signal_receiver(self, *args, **kwargs):
@@ -1,4 +1,6 @@
+import time
 import traceback
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Set, Tuple
 
@@ -8,7 +10,7 @@ from django.db import transaction
 from django.db.models import Q
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from baserow.core.exceptions import LockConflict
 from baserow.core.telemetry.utils import baserow_trace, baserow_trace_methods
@@ -22,6 +24,17 @@ from .registries import (
 from .signals import ActionCommandType
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+cleaned_up_actions_counter = meter.create_counter(
+    "baserow.action.cleaned_up",
+    unit="1",
+    description="The number of old actions that have been cleaned up per action type.",
+)
+action_cleanup_backlog_histogram = meter.create_histogram(
+    "baserow.action.cleanup_backlog",
+    unit="1",
+    description="The number of old actions left to be cleaned up after a cleanup run.",
+)
 
 
 def scopes_to_q_filter(scopes: List[ActionScopeStr]):
@@ -271,87 +284,184 @@ class ActionHandler(metaclass=baserow_trace_methods(tracer)):
         Any actions which haven't been updated in
         settings.MINUTES_UNTIL_ACTION_CLEANED_UP will be deleted any have an extra
         data associated with them cleaned up.
+
+        The actions are deleted in batches of BASEROW_ACTION_CLEANUP_BATCH_SIZE, each
+        in its own transaction, until none are left or until
+        BASEROW_ACTION_CLEANUP_MAX_SECONDS have passed. Because the deleted batches
+        are committed, the next run simply continues with the remaining actions.
         """
 
         now = datetime.now(tz=timezone.utc)
         minutes = int(settings.MINUTES_UNTIL_ACTION_CLEANED_UP)
         cutoff = now - timedelta(minutes=minutes)
+        started = time.monotonic()
+        deadline = started + settings.BASEROW_ACTION_CLEANUP_MAX_SECONDS
 
         types_with_custom_clean_up = set()
         for action_type in action_type_registry.get_all():
             if isinstance(action_type, UndoableActionCustomCleanupMixin):
                 types_with_custom_clean_up.add(action_type.type)
 
-        # Delete in a separate atomic block so if we crash later we don't roll back
-        # these valid deletes.
-        with transaction.atomic():
-            # Here we delete all actions which have a type which doesn't have a custom
-            # `clean_up_any_extra_action_data` implementation. This means that all
-            # we need to do to clean them up is delete the actions, which we can do
-            # in a single DELETE WHERE query.
-            bulk_delete_count, _ = (
-                Action.objects.filter(updated_on__lte=cutoff)
-                .exclude(type__in=types_with_custom_clean_up)
-                .delete()
-            )
-
+        bulk_delete_count = cls._delete_actions_without_custom_cleanup_logic(
+            cutoff, types_with_custom_clean_up, deadline
+        )
         (
             custom_deleted_count,
             cleanup_error,
         ) = cls._cleanup_actions_with_custom_cleanup_logic(
-            cutoff, types_with_custom_clean_up
+            cutoff, types_with_custom_clean_up, deadline
         )
         total_deleted = bulk_delete_count + custom_deleted_count
 
-        logger.info(f"Cleaned up {total_deleted} actions.")
+        # Counting is only needed if the run stopped before everything was deleted.
+        backlog = 0
+        if time.monotonic() >= deadline:
+            backlog = Action.objects.filter(updated_on__lte=cutoff).count()
+        action_cleanup_backlog_histogram.record(backlog)
+
+        duration = time.monotonic() - started
+        logger.info(
+            f"Cleaned up {total_deleted} actions in {duration:.2f} seconds "
+            f"({total_deleted / max(duration, 0.001):.0f} per second), {backlog} "
+            "old actions are left for the next run."
+        )
 
         if cleanup_error:
             logger.error("However an error was encountered during an action cleanup: ")
             raise cleanup_error
 
+    @classmethod
+    def _delete_actions_without_custom_cleanup_logic(
+        cls,
+        cutoff: datetime,
+        types_with_custom_clean_up: Set[str],
+        deadline: float,
+    ) -> int:
+        """
+        Deletes the old actions which have a type which doesn't have a custom
+        `clean_up_any_extra_action_data` implementation. All we need to do to clean
+        them up is delete the actions, which we do with a single DELETE WHERE query
+        per batch. At least one batch is deleted, even if the deadline has passed.
+
+        :param cutoff: Any actions updated on or before this time will be deleted.
+        :param types_with_custom_clean_up: The action types to skip.
+        :param deadline: No new batch is started after this `time.monotonic()` value.
+        :return: The number of deleted actions.
+        """
+
+        batch_size = settings.BASEROW_ACTION_CLEANUP_BATCH_SIZE
+        actions_to_delete = (
+            Action.objects.filter(updated_on__lte=cutoff)
+            .exclude(type__in=types_with_custom_clean_up)
+            .order_by("updated_on", "id")
+        )
+
+        deleted_count = 0
+        while True:
+            # Delete every batch in a separate atomic block so if we crash later we
+            # don't roll back these valid deletes.
+            with transaction.atomic():
+                batch_count, _ = Action.objects.filter(
+                    id__in=actions_to_delete.values("id")[:batch_size]
+                ).delete()
+
+            deleted_count += batch_count
+            if batch_count:
+                cleaned_up_actions_counter.add(batch_count, {"type": "other"})
+            if batch_count < batch_size or time.monotonic() >= deadline:
+                return deleted_count
+
     @classmethod
     def _cleanup_actions_with_custom_cleanup_logic(
-        cls, cutoff: datetime, types_with_custom_clean_up: Set[str]
+        cls,
+        cutoff: datetime,
+        types_with_custom_clean_up: Set[str],
+        deadline: float,
     ) -> Tuple[int, Optional[Exception]]:
         """
         ActionTypes can implement a custom clean_up_any_extra_action_data method to
-        clean up any extra data associated with them. This method will loop over all
-        of those actions calling their custom clean_up_any_extra_action_data method
-        and deleting the action.
+        clean up any extra data associated with them. This method will loop over
+        batches of those actions, calling the clean_up_any_extra_action_data_in_bulk
+        method of their type and deleting the actions. At least one batch is
+        handled, even if the deadline has passed.
 
         :param cutoff: Any actions updated on or before this time will be cleaned up.
         :param types_with_custom_clean_up: The set of ActionType.type names which
             have custom clean_up_any_extra_action_data methods which need to be
             called to do some extra per type cleanup.
+        :param deadline: No new batch is started after this `time.monotonic()` value.
         :return: A tuple of the number of deleted actions and an optional Exception
             which is present when a custom cleanup failed.
         """
 
-        with transaction.atomic():
-            actions_to_cleanup_with_custom_logic = (
-                Action.objects.filter(
-                    updated_on__lte=cutoff, type__in=types_with_custom_clean_up
+        batch_size = settings.BASEROW_ACTION_CLEANUP_BATCH_SIZE
+        deleted_count = 0
+        while True:
+            with transaction.atomic():
+                # Actions locked by a concurrent cleanup are skipped, so that two runs
+                # never clean up the same actions.
+                actions = list(
+                    Action.objects.filter(
+                        updated_on__lte=cutoff, type__in=types_with_custom_clean_up
+                    )
+                    .select_for_update(of=("self",), skip_locked=True)
+                    .order_by("updated_on", "id")[:batch_size]
                 )
-                .select_for_update(of=("self",))
-                .order_by("updated_on", "id")
-            )
-            deleted_count = 0
-            for action in actions_to_cleanup_with_custom_logic:
-                try:
-                    with transaction.atomic():
-                        # Run each clean up in a single inside its own atomic block so
-                        # later cleanup for different action fails we don't roll back
-                        # previous successful clean ups.
-                        action_type = action_type_registry.get(action.type)
-                        action_type.clean_up_any_extra_action_data(action)
-                        action.delete()
-                        deleted_count += 1
-                except Exception as e:
-                    # We don't want to roll back the entire transaction if one of the
-                    # cleanup's failed. The failed cleanup has already been rolled
-                    # back due to its own inner atomic block so we can safely stop
-                    # , commit the outer transaction which persists the successful
-                    # cleanups and let the caller decide what to do with the error.
-                    return deleted_count, e
+                if not actions:
+                    return deleted_count, None
+
+                actions_per_type = defaultdict(list)
+                for action in actions:
+                    actions_per_type[action.type].append(action)
+
+                for action_type_name, actions_of_type in actions_per_type.items():
+                    action_type = action_type_registry.get(action_type_name)
+                    try:
+                        with transaction.atomic():
+                            action_type.clean_up_any_extra_action_data_in_bulk(
+                                actions_of_type
+                            )
+                            Action.objects.filter(
+                                id__in=[action.id for action in actions_of_type]
+                            ).delete()
+                        count = len(actions_of_type)
+                    except Exception:
+                        # Clean up the actions one by one to find the failing one,
+                        # without rolling back the cleanups which are successful.
+                        count, error = cls._cleanup_actions_one_by_one(
+                            action_type, actions_of_type
+                        )
+                        if error is not None:
+                            # The failed cleanup has already been rolled back due to
+                            # its own inner atomic block so we can safely stop,
+                            # commit the outer transaction which persists the
+                            # successful cleanups and let the caller decide what to
+                            # do with the error.
+                            cleaned_up_actions_counter.add(
+                                count, {"type": action_type_name}
+                            )
+                            return deleted_count + count, error
+
+                    deleted_count += count
+                    cleaned_up_actions_counter.add(count, {"type": action_type_name})
+
+            if len(actions) < batch_size or time.monotonic() >= deadline:
+                return deleted_count, None
 
+    @classmethod
+    def _cleanup_actions_one_by_one(
+        cls, action_type: UndoableActionCustomCleanupMixin, actions: List[Action]
+    ) -> Tuple[int, Optional[Exception]]:
+        deleted_count = 0
+        for action in actions:
+            try:
+                with transaction.atomic():
+                    # Run each clean up in a single inside its own atomic block so
+                    # later cleanup for different action fails we don't roll back
+                    # previous successful clean ups.
+                    action_type.clean_up_any_extra_action_data(action)
+                    action.delete()
+                    deleted_count += 1
+            except Exception as e:
+                return deleted_count, e
         return deleted_count, None
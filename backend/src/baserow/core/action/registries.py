@@ -2,7 +2,7 @@ import abc
 import dataclasses
 from copy import deepcopy
 from datetime import datetime, timezone
-from typing import Any, Dict, NewType, Optional
+from typing import Any, Dict, List, NewType, Optional
 from uuid import uuid4
 
 from django.contrib.auth.models import AbstractUser
@@ -382,6 +382,21 @@ class UndoableActionCustomCleanupMixin(abc.ABC):
 
         pass
 
+    @classmethod
+    def clean_up_any_extra_action_data_in_bulk(
+        cls, actions_being_cleaned_up: List[Action]
+    ):
+        """
+        Cleans up the extra data of many old actions of this type at once. Calls
+        `clean_up_any_extra_action_data` for every action by default, but can be
+        overridden to clean up the data of all the actions more efficiently.
+
+        :param actions_being_cleaned_up: The actions of this type being cleaned up.
+        """
+
+        for action in actions_being_cleaned_up:
+            cls.clean_up_any_extra_action_data(action)
+
 
 class UndoableActionType(
     UndoableActionTypeMixin,
@@ -1204,6 +1204,7 @@ class ExportApplicationsActionType(ActionType):
             include_permission_data=False,
             reduce_disk_space_usage=False,
             only_structure=only_structure,
+            stream_rows_to_files_zip=True,
         )
 
         resource = ImportExportHandler().export_workspace_applications(
@@ -204,6 +204,19 @@ class GlobalCache:
 
         return cache_key_to_use
 
+    def get_version(self, key: str, invalidate_key: None | str = None) -> int:
+        """
+        Returns the current version of the cached value. The version changes every
+        time the value is invalidated, so it can be used to detect changes, for
+        example in an ETag, without having to compare the value itself.
+
+        :param key: The cache key.
+        :param invalidate_key: The key used when this cache is invalidated.
+        :return: The current version.
+        """
+
+        return cache.get(self._get_version_cache_key(key, invalidate_key), 0)
+
     def get(
         self,
         key: str,
@@ -517,6 +517,83 @@ class MultiFieldPrefetchQuerysetMixin(Generic[ModelInstance]):
         return self._multi_field_prefetch_related_funcs
 
 
+def fetch_many_to_many_target_ids(
+    many_to_many_fields: List[ManyToManyField], row_ids: List[int]
+) -> Dict[int, Dict[str, List[int]]]:
+    """
+    Fetches the target ids of multiple many to many fields of the same model for the
+    provided rows. Even though each many to many field has its own through table,
+    the relations of all the fields are fetched in one single `UNION ALL` query.
+
+    :param many_to_many_fields: The many to many model fields of which the
+        relations must be fetched.
+    :param row_ids: The ids of the rows where the relations must be fetched for.
+    :return: A mapping containing the target ids, in the order the relations were
+        created, per row id and field name. Fields without relations are not
+        included.
+    """
+
+    row_id_to_field_name_to_target_ids = defaultdict(dict)
+
+    if len(many_to_many_fields) == 0 or len(row_ids) == 0:
+        return row_id_to_field_name_to_target_ids
+
+    row_ids_as_literal = sql.SQL(",").join(
+        [sql.Literal(str(row_id)) for row_id in row_ids]
+    )
+    sub_queries = []
+
+    for model_field in many_to_many_fields:
+        through_model = model_field.remote_field.through
+        through_fields = through_model._meta.get_fields()
+        row_column_name = through_fields[1].get_attname_column()[1]
+        target_column_name = through_fields[2].get_attname_column()[1]
+
+        subquery = sql.SQL(
+            """
+            (
+                SELECT
+                    id,
+                    {field_name} as field_name,
+                    {row_id_column} as row_id,
+                    {target_id_column} as target_id_column
+                FROM {m2m_table}
+                WHERE {row_id_column} IN ({row_ids})
+            )
+            """
+        ).format(
+            field_name=sql.Literal(model_field.name),
+            m2m_table=sql.Identifier(through_model._meta.db_table),
+            row_id_column=sql.Identifier(row_column_name),
+            target_id_column=sql.Identifier(target_column_name),
+            row_ids=row_ids_as_literal,
+        )
+        sub_queries.append(subquery)
+
+    # Every sub query selects a different field name, so `UNION ALL` can be used
+    # to avoid the deduplication of the combined results.
+    union_query = sql.SQL(" UNION ALL ").join(sub_queries)
+    union_sql = sql.SQL(
+        """
+        SELECT
+            row_id,
+            field_name,
+            ARRAY_AGG(target_id_column ORDER BY id)
+        FROM ({union_query}) sub
+        GROUP BY row_id, field_name
+        """
+    ).format(union_query=union_query)
+
+    with connection.cursor() as cursor:
+        cursor.execute(union_sql)
+        results = cursor.fetchall()
+
+    for row_id, field_name, target_ids in results:
+        row_id_to_field_name_to_target_ids[row_id][field_name] = target_ids
+
+    return row_id_to_field_name_to_target_ids
+
+
 class CombinedForeignKeyAndManyToManyMultipleFieldPrefetch:
     """
     This prefetch class can be used as argument of the `multi_field_prefetch` method.
@@ -749,21 +826,14 @@ class CombinedForeignKeyAndManyToManyMultipleFieldPrefetch:
         :return: An updated mapping, now also containing the many to many ids.
         """
 
-        sub_queries = []
-        row_ids_as_literal = [sql.Literal(str(result.id)) for result in result_set]
-
+        many_to_many_fields = []
         for field_name in self.field_names:
             model_field = queryset.model._meta.get_field(field_name)
 
             if not isinstance(model_field, ManyToManyField):
                 continue
 
-            through_model = model_field.remote_field.through
-            through_table_name = through_model._meta.db_table
-            through_fields = through_model._meta.get_fields()
-            row_column_name = through_fields[1].get_attname_column()[1]
-            target_column_name = through_fields[2].get_attname_column()[1]
-
+            through_fields = model_field.remote_field.through._meta.get_fields()
             if (
                 not self.skip_target_check
                 and through_fields[2].remote_field.model is not self.target_model
@@ -773,47 +843,13 @@ class CombinedForeignKeyAndManyToManyMultipleFieldPrefetch:
                     f"model {self.target_model}."
                 )
 
-            subquery = sql.SQL(
-                """
-                (
-                    SELECT
-                        id,
-                        {field_name} as field_name,
-                        {row_id_column} as row_id,
-                        {target_id_column} as target_id_column
-                    FROM {m2m_table}
-                    WHERE {row_id_column} IN ({row_ids})
-                )
-                """
-            ).format(
-                field_name=sql.Literal(field_name),
-                m2m_table=sql.Identifier(through_table_name),
-                row_id_column=sql.Identifier(row_column_name),
-                target_id_column=sql.Identifier(target_column_name),
-                row_ids=sql.SQL(",").join(row_ids_as_literal),
-            )
-            sub_queries.append(subquery)
+            many_to_many_fields.append(model_field)
 
-        if len(sub_queries) > 0 and len(result_set) > 0:
-            union_query = sql.SQL(" UNION ").join(sub_queries)
-            union_sql = sql.SQL(
-                """
-                SELECT
-                    row_id,
-                    field_name,
-                    ARRAY_AGG(target_id_column ORDER BY id)
-                FROM ({union_query}) sub
-                GROUP BY row_id, field_name
-                """
-            ).format(union_query=union_query)
-
-            with connection.cursor() as cursor:
-                cursor.execute(union_sql)
-                results = cursor.fetchall()
-
-            for result in results:
-                # 0=row_id, 1=field_name, 2=target ids
-                row_id_to_field_name_to_target_ids[result[0]][result[1]] = result[2]
+        fetched_target_ids = fetch_many_to_many_target_ids(
+            many_to_many_fields, [result.id for result in result_set]
+        )
+        for row_id, field_name_to_target_ids in fetched_target_ids.items():
+            row_id_to_field_name_to_target_ids[row_id].update(field_name_to_target_ids)
 
         return row_id_to_field_name_to_target_ids
 
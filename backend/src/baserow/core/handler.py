@@ -107,7 +107,7 @@ from .signals import (
     workspace_user_updated,
     workspaces_reordered,
 )
-from .storage import get_default_storage
+from .storage import ExportZipFile, get_default_storage
 from .telemetry.utils import baserow_trace_methods, disable_instrumentation
 from .trash.handler import TrashHandler
 from .types import (
@@ -1555,6 +1555,7 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
             reduce_disk_space_usage=False,
             is_duplicate=True,
             exclude_sensitive_data=False,
+            copy_rows_in_database=True,
         )
         # export the application
         specific_application = application.specific
@@ -1708,7 +1709,7 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         """
 
         storage = storage or get_default_storage()
-        zip_stream = zipstream.ZipStream(
+        zip_stream = ExportZipFile(
             compress_level=settings.BASEROW_DEFAULT_ZIP_COMPRESS_LEVEL,
             compress_type=zipstream.ZIP_DEFLATED,
         )
@@ -4,16 +4,17 @@ import json
 import os
 import uuid
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from io import IOBase
 from os.path import join
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from zipfile import ZipFile
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import SuspiciousOperation
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 from django.core.files.storage import Storage
 from django.db import transaction
 from django.db.models import Exists, OuterRef, QuerySet
@@ -30,7 +31,11 @@ from loguru import logger
 from opentelemetry import trace
 
 from baserow.config.settings.base import BASEROW_DEFAULT_ZIP_COMPRESS_LEVEL
-from baserow.contrib.database.constants import EXPORT_WORKSPACE_CREATE_ARCHIVE
+from baserow.contrib.database.constants import (
+    EXPORT_WORKSPACE_CREATE_ARCHIVE,
+    IMPORT_WORKSPACE_EXTRACTING_FILES,
+    IMPORT_WORKSPACE_VERIFYING_FILES,
+)
 from baserow.core.handler import CoreHandler
 from baserow.core.import_export.exceptions import (
     ImportExportApplicationIdsNotFound,
@@ -39,7 +44,7 @@ from baserow.core.import_export.exceptions import (
     ImportExportResourceInvalidFile,
     ImportExportResourceUntrustedSignature,
 )
-from baserow.core.import_export.utils import chunk_generator
+from baserow.core.import_export.utils import ChecksumValidatingZipFile, chunk_generator
 from baserow.core.jobs.constants import JOB_FINISHED
 from baserow.core.models import (
     Application,
@@ -109,10 +114,13 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         self, zip_file: ExportZipFile, storage: Storage
     ) -> Dict[str, str]:
         """
-        Computes the SHA-256 checksum for each file in the provided zip file.
+        Computes the SHA-256 checksum for each file in the provided zip file, except
+        for the manifest and its signature.
         * for files that are stored in UserFile model, the checksum is retrieved from
             file name as that file name contains checksum
         * for json data files, the checksum is also stored on file name
+        * for files that have already been streamed, the checksum computed while
+            streaming them is used
         * for all other files, the checksum is computed from the file content
 
         :param zip_file: The zip stream containing the files to compute checksums for.
@@ -123,13 +131,20 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
 
         checksums = {}
         user_file_handler = UserFileHandler()
+        streamed_checksums = zip_file.streamed_checksums
         for file_info in zip_file.info_list():
             file_name = file_info["name"]
+            if file_name in (MANIFEST_NAME, SIGNATURE_NAME):
+                continue
             try:
                 # UserFile name pattern is <unique>_<checksum>.<extension>
                 # so we can extract checksum from file name
                 checksums[file_name] = user_file_handler.user_file_sha256(file_name)
             except ValueError:
+                if file_name in streamed_checksums:
+                    checksums[file_name] = streamed_checksums[file_name]
+                    continue
+
                 file_path = user_file_handler.user_file_path(user_file_name=file_name)
                 if storage.exists(file_path):
                     checksums[file_name] = self.compute_checksum_from_file(
@@ -158,6 +173,22 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
                 computed_checksum.update(chunk)
         return computed_checksum.hexdigest()
 
+    def compute_checksum_from_zip(self, zip_file: ZipFile, file_name: str) -> str:
+        """
+        Computes the SHA-256 checksum for a file in the given zip file by streaming
+        it in chunks, without extracting it first.
+
+        :param zip_file: The zip file containing the file.
+        :param file_name: The name of the file in the zip file.
+        :return: The computed SHA-256 checksum as a hexadecimal string.
+        """
+
+        computed_checksum = hashlib.sha256()
+        with zip_file.open(file_name) as f:
+            for chunk in iter(lambda: f.read(4096 * 1024), b""):
+                computed_checksum.update(chunk)
+        return computed_checksum.hexdigest()
+
     def mark_resource_invalid(self, resource: ImportExportResource):
         """
         Marks a resource as invalid by setting the `is_valid` field to False.
@@ -300,6 +331,12 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         applications, such as their schema, contents, and configuration. The manifest
         file is saved to the specified storage.
 
+        The checksums are only computed when the manifest is streamed, after all the
+        other files have been streamed, so that the checksums computed while
+        streaming those can be used instead of reading the files again. The returned
+        manifest data is therefore only complete after the zip file has been
+        streamed.
+
         :param exported_applications: A list of dictionaries representing the exported
             applications.
         :param zip_file: The ExportZipFile instance where the manifest will be added.
@@ -309,14 +346,13 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         :return manifest_data: A dictionary containing the manifest data.
         """
 
-        checksums = self.compute_checksums(zip_file, storage)
         manifest_data = {
             "version": EXPORT_FORMAT_VERSION,
             "baserow_version": VERSION,
-            "total_files": len(checksums) + 2,
+            "total_files": 2,
             "configuration": {"only_structure": import_export_config.only_structure},
             "applications": {},
-            "checksums": checksums,
+            "checksums": {},
         }
 
         for application in exported_applications:
@@ -325,7 +361,13 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
                 {"version": EXPORT_FORMAT_VERSION, "configuration": {}, "items": []},
             )["items"].append(application)
 
-        zip_file.add(json.dumps(manifest_data, indent=INDENT), MANIFEST_NAME)
+        def manifest_chunks():
+            checksums = self.compute_checksums(zip_file, storage)
+            manifest_data["total_files"] = len(checksums) + 2
+            manifest_data["checksums"] = checksums
+            yield json.dumps(manifest_data, indent=INDENT).encode("utf-8")
+
+        zip_file.add(manifest_chunks(), MANIFEST_NAME)
         return manifest_data
 
     def _get_keys(
@@ -423,39 +465,40 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
 
         This method generates a digital signature for the manifest file using the user's
         private key. The signature, along with the public key and a timestamp, is saved
-        to a signature file in the specified storage.
+        to a signature file in the specified storage. The manifest is only signed when
+        the signature is streamed, after the manifest data has been completed.
 
         :param manifest_data: The manifest data to be signed.
         :param zip_file: The ExportZipFile instance where manifest signature
             will be added.
         """
 
-        manifest_bytes = json.dumps(manifest_data, sort_keys=True).encode()
-        digest = hashes.Hash(hashes.SHA256(), backend=default_backend())
-        digest.update(manifest_bytes)
-        manifest_hash = digest.finalize()
+        def signature_chunks():
+            manifest_bytes = json.dumps(manifest_data, sort_keys=True).encode()
+            digest = hashes.Hash(hashes.SHA256(), backend=default_backend())
+            digest.update(manifest_bytes)
+            manifest_hash = digest.finalize()
 
-        private_key, public_key_pem = self.get_or_create_key_pair()
-        signature = private_key.sign(
-            manifest_hash,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256(),
-        )
+            private_key, public_key_pem = self.get_or_create_key_pair()
+            signature = private_key.sign(
+                manifest_hash,
+                padding.PSS(
+                    mgf=padding.MGF1(hashes.SHA256()),
+                    salt_length=padding.PSS.MAX_LENGTH,
+                ),
+                hashes.SHA256(),
+            )
 
-        encoded_signature = base64.b64encode(signature).decode("utf-8")
+            encoded_signature = base64.b64encode(signature).decode("utf-8")
 
-        signature_data = {
-            "signature": encoded_signature,
-            "public_key_pem": base64.b64encode(public_key_pem).decode("utf-8"),
-            "timestamp": datetime.now().isoformat(),
-        }
+            signature_data = {
+                "signature": encoded_signature,
+                "public_key_pem": base64.b64encode(public_key_pem).decode("utf-8"),
+                "timestamp": datetime.now().isoformat(),
+            }
+            yield json.dumps(signature_data, indent=INDENT).encode("utf-8")
 
-        zip_file.add(
-            json.dumps(signature_data, indent=INDENT),
-            SIGNATURE_NAME,
-        )
+        zip_file.add(signature_chunks(), SIGNATURE_NAME)
 
     def export_workspace_applications(
         self,
@@ -738,7 +781,13 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
             except InvalidSignature:
                 raise ImportExportResourceInvalidFile("Signature verification failed.")
 
-    def validate_checksums(self, manifest: Dict, import_tmp_dir: str, storage: Storage):
+    def validate_checksums(
+        self,
+        manifest: Dict,
+        import_tmp_dir: str,
+        storage: Storage,
+        file_names: Optional[Iterable[str]] = None,
+    ):
         """
         Validates the checksums of the files extracted from the import zip file.
 
@@ -750,6 +799,8 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         :param import_tmp_dir: The temporary directory where the files have been
             extracted.
         :param storage: The storage instance used to read the files.
+        :param file_names: If provided, only the checksums of these files are
+            validated.
         :raises ImportWorkspaceFileCorruptedException: If any file's checksum does not
             match the expected checksum.
         """
@@ -757,6 +808,13 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         validation_results = {}
 
         checksums = manifest["checksums"]
+        if file_names is not None:
+            checksums = {
+                file_name: checksums[file_name]
+                for file_name in file_names
+                if file_name in checksums
+            }
+
         for file_path, checksum in checksums.items():
             full_path = join(import_tmp_dir, file_path)
 
@@ -772,6 +830,81 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         if not all(validation_results.values()):
             raise ImportExportResourceInvalidFile("Checksum validation failed")
 
+    def start_checksums_computation_from_zip(
+        self,
+        zip_file: ZipFile,
+        file_names: Iterable[str],
+        executor: ThreadPoolExecutor,
+    ) -> Dict[Future, str]:
+        """
+        Starts computing the checksums of the provided files in the zip file using
+        the threads of the executor. The files are streamed out of the zip file
+        instead of being extracted, so that the checksums can be computed while the
+        applications are being imported. Use `validate_computed_checksums` to wait
+        for and validate the result.
+
+        :param zip_file: The zip file containing the files.
+        :param file_names: The names of the files of which the checksums must be
+            computed.
+        :param executor: The executor whose threads compute the checksums.
+        :raises ImportExportResourceDoesNotExist: If a file does not exist in the zip
+            file.
+        :return: A dict where the key is the future computing the checksum and the
+            value the name of the file.
+        """
+
+        zip_file_names = set(zip_file.namelist())
+        futures = {}
+        for file_name in file_names:
+            if file_name not in zip_file_names:
+                for future in futures.keys():
+                    future.cancel()
+                raise ImportExportResourceDoesNotExist(
+                    f"The file {file_name} does not exist."
+                )
+            future = executor.submit(
+                self.compute_checksum_from_zip, zip_file, file_name
+            )
+            futures[future] = file_name
+        return futures
+
+    def validate_computed_checksums(
+        self,
+        manifest: Dict,
+        checksum_futures: Dict[Future, str],
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ):
+        """
+        Waits for the checksums started by `start_checksums_computation_from_zip` and
+        compares them with the expected checksums provided in the manifest.
+
+        :param manifest: The manifest data containing the expected checksums.
+        :param checksum_futures: The futures returned by
+            `start_checksums_computation_from_zip`.
+        :param progress_builder: A progress builder that allows for publishing progress.
+        :raises ImportExportResourceInvalidFile: If any file's checksum does not
+            match the expected checksum.
+        """
+
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=len(checksum_futures)
+        )
+        checksums = manifest["checksums"]
+        is_valid = True
+
+        try:
+            for future in as_completed(checksum_futures.keys()):
+                file_name = checksum_futures[future]
+                if future.result() != checksums[file_name]:
+                    is_valid = False
+                progress.increment(state=IMPORT_WORKSPACE_VERIFYING_FILES)
+        finally:
+            for future in checksum_futures.keys():
+                future.cancel()
+
+        if not is_valid:
+            raise ImportExportResourceInvalidFile("Checksum validation failed")
+
     def import_application(
         self,
         workspace: Workspace,
@@ -941,31 +1074,56 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
         zip_file: ZipFile,
         storage: Storage,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        file_names: Optional[Iterable[str]] = None,
     ):
         """
         Extracts files from a zip archive to a specified temporary import path.
 
-        This method iterates over the files in the provided zip archive and saves each
-        file to the specified temporary import path using the provided storage instance.
+        This method saves the files in the provided zip archive to the specified
+        temporary import path using the provided storage instance. The files are
+        extracted by a bounded pool of threads.
 
         :param tmp_import_path: The temporary directory where the files will be
             extracted.
         :param zip_file: The ZipFile instance containing the files to be extracted.
         :param storage: The storage instance used to save the extracted files.
         :param progress_builder: A progress builder that allows for publishing progress.
+        :param file_names: If provided, only these files are extracted.
         """
 
         file_list = zip_file.infolist()
+        if file_names is not None:
+            file_names = set(file_names)
+            file_list = [
+                file_info for file_info in file_list if file_info.filename in file_names
+            ]
         progress = ChildProgressBuilder.build(
             progress_builder, child_total=len(file_list)
         )
+        if not file_list:
+            return
 
-        for file_info in file_list:
+        def extract(file_info: zipfile.ZipInfo):
             extracted_file_path = join(tmp_import_path, file_info.filename)
             with zip_file.open(file_info) as extracted_file:
-                file_content = extracted_file.read()
-                storage.save(extracted_file_path, ContentFile(file_content))
-            progress.increment()
+                # The file is streamed to the storage in chunks instead of reading
+                # it in memory because the table rows files can be very large.
+                content = File(extracted_file)
+                content.size = file_info.file_size
+                storage.save(extracted_file_path, content)
+
+        max_workers = max(
+            1, min(settings.BASEROW_IMPORT_EXPORT_FILES_MAX_CONCURRENCY, len(file_list))
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(extract, file_info) for file_info in file_list]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    progress.increment(state=IMPORT_WORKSPACE_EXTRACTING_FILES)
+            finally:
+                for future in futures:
+                    future.cancel()
 
     def import_workspace_applications(
         self,
@@ -1036,40 +1194,95 @@ class ImportExportHandler(metaclass=baserow_trace_methods(tracer)):
                     self.mark_resource_invalid(resource)
                     raise
 
+                # Only the schema files of the applications are read from the
+                # temporary import path, the other files are read from the zip file
+                # directly, so they don't have to be extracted.
+                schema_file_names = [
+                    item["files"]["schema"]
+                    for application in manifest_data["applications"].values()
+                    for item in application["items"]
+                ]
                 self.extract_files_from_zip(
                     import_tmp_path,
                     zip_file,
                     storage,
-                    progress.create_child_builder(represents_progress=10),
+                    progress.create_child_builder(represents_progress=3),
+                    file_names=schema_file_names,
                 )
 
-                try:
-                    self.validate_checksums(manifest_data, import_tmp_path, storage)
-                except Exception as e:  # noqa
-                    self.mark_resource_invalid(resource)
-                    raise
+                with ThreadPoolExecutor(
+                    max_workers=settings.BASEROW_IMPORT_EXPORT_FILES_MAX_CONCURRENCY
+                ) as executor:
+                    try:
+                        self.validate_checksums(
+                            manifest_data,
+                            import_tmp_path,
+                            storage,
+                            file_names=schema_file_names,
+                        )
+                        # The checksums of the other files are computed while the
+                        # applications are being imported. A file is only opened
+                        # once its checksum has been validated, and the remaining
+                        # checksums are validated after the import.
+                        checksum_futures = self.start_checksums_computation_from_zip(
+                            zip_file,
+                            [
+                                file_name
+                                for file_name in manifest_data["checksums"].keys()
+                                if file_name not in schema_file_names
+                            ],
+                            executor,
+                        )
+                    except Exception as e:  # noqa
+                        self.mark_resource_invalid(resource)
+                        raise
 
-                only_structure = manifest_data["configuration"].get(
-                    "only_structure", False
-                )
+                    only_structure = manifest_data["configuration"].get(
+                        "only_structure", False
+                    )
 
-                import_export_config = ImportExportConfig(
-                    include_permission_data=False,
-                    reduce_disk_space_usage=False,
-                    only_structure=only_structure,
-                )
+                    import_export_config = ImportExportConfig(
+                        include_permission_data=False,
+                        reduce_disk_space_usage=False,
+                        only_structure=only_structure,
+                    )
 
-                imported_applications = self.import_multiple_applications(
-                    user,
-                    workspace,
-                    manifest_data,
-                    import_tmp_path,
-                    import_export_config,
-                    zip_file,
-                    storage,
-                    application_ids,
-                    progress.create_child_builder(represents_progress=80),
-                )
+                    try:
+                        imported_applications = self.import_multiple_applications(
+                            user,
+                            workspace,
+                            manifest_data,
+                            import_tmp_path,
+                            import_export_config,
+                            ChecksumValidatingZipFile(
+                                zip_file, manifest_data["checksums"], checksum_futures
+                            ),
+                            storage,
+                            application_ids,
+                            progress.create_child_builder(represents_progress=77),
+                        )
+                    except Exception as e:  # noqa
+                        for future in checksum_futures.keys():
+                            future.cancel()
+                        if isinstance(e, ImportExportResourceInvalidFile):
+                            self.mark_resource_invalid(resource)
+                        raise
+
+                    try:
+                        self.validate_computed_checksums(
+                            manifest_data,
+                            checksum_futures,
+                            progress.create_child_builder(represents_progress=10),
+                        )
+                    except Exception as e:  # noqa
+                        self.mark_resource_invalid(resource)
+                        # Trash the imported applications so the user won't see an
+                        # import of a corrupted file.
+                        for application in imported_applications:
+                            TrashHandler.trash(
+                                user, workspace, application, application
+                            )
+                        raise
 
                 for application in imported_applications:
                     application_type = application_type_registry.get_by_model(
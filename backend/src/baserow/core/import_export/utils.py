@@ -1,7 +1,13 @@
+from concurrent.futures import Future
+from typing import BinaryIO, Dict
+from zipfile import ZipFile
+
 from django.core.files.base import File
 from django.core.files.storage import Storage
 from django.utils.encoding import force_bytes
 
+from baserow.core.import_export.exceptions import ImportExportResourceInvalidFile
+
 DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
 
 
@@ -40,6 +46,25 @@ def file_chunk_generator(
             yield chunk
 
 
+def temporary_file_chunk_generator(
+    file_obj: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """
+    Generator that reads an already written temporary file from the start in chunks
+    and closes it afterward, which also removes it from the disk. This is typically
+    used to add a file that is lazily consumed to a zip stream.
+
+    :param file_obj: The temporary file object to read from.
+    :param chunk_size: The size of each chunk to read. Default is 4 MB.
+    :yield: Chunks of the file as bytes.
+    """
+
+    with file_obj:
+        file_obj.seek(0)
+        for chunk in chunk_iterator(file_obj, chunk_size):
+            yield chunk
+
+
 def chunk_generator(data: str | bytes, chunk_size: int = DEFAULT_CHUNK_SIZE):
     """
     Generates chunks of data of a specified size.
@@ -51,3 +76,41 @@ def chunk_generator(data: str | bytes, chunk_size: int = DEFAULT_CHUNK_SIZE):
 
     for i in range(0, len(data), chunk_size):
         yield force_bytes(data[i : i + chunk_size])
+
+
+class ChecksumValidatingZipFile:
+    """
+    Wraps the zip file of a workspace import, so that the checksum of a file is
+    validated before the file is opened. The checksums are computed in the
+    background, so opening a file waits until its checksum is known. This makes
+    sure that, for example, the content of a user file is never stored if it doesn't
+    match the checksum in the manifest.
+    """
+
+    def __init__(
+        self,
+        zip_file: ZipFile,
+        checksums: Dict[str, str],
+        checksum_futures: Dict[Future, str],
+    ):
+        """
+        :param zip_file: The zip file that must be wrapped.
+        :param checksums: The expected checksums by file name.
+        :param checksum_futures: The futures computing the checksums of the files,
+            where the key is the future and the value the name of the file.
+        """
+
+        self._zip_file = zip_file
+        self._checksums = checksums
+        self._futures_by_name = {
+            name: future for future, name in checksum_futures.items()
+        }
+
+    def open(self, name, *args, **kwargs):
+        future = self._futures_by_name.get(name)
+        if future is not None and future.result() != self._checksums[name]:
+            raise ImportExportResourceInvalidFile("Checksum validation failed")
+        return self._zip_file.open(name, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._zip_file, name)
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.13 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0105_trashentry_trash_operation_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userfile",
+            name="thumbnails_pending",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the thumbnails of the image are still being generated in the background.",
+            ),
+        ),
+    ]
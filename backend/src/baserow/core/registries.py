@@ -114,6 +114,22 @@ class ImportExportConfig:
     ensures that sensitive data are excluded from the exported workspace file.
     """
 
+    copy_rows_in_database: bool = False
+    """
+    When True, the rows of the exported tables are not serialized. Instead, they're
+    copied from the source tables into the imported tables inside the database.
+    This can only be used when the export is imported in the same instance, right
+    after it was exported, like when duplicating.
+    """
+
+    stream_rows_to_files_zip: bool = False
+    """
+    When True, the rows of the exported tables are written in chunks to a separate
+    newline delimited JSON file per table in the export zip file, instead of being
+    included in the serialized structure. This keeps the memory usage bounded
+    regardless of the size of the tables.
+    """
+
 
 class Plugin(APIUrlsInstanceMixin, Instance):
     """
@@ -396,6 +396,7 @@ class SnapshotHandler:
             workspace_for_user_references=workspace,
             is_duplicate=True,
             exclude_sensitive_data=False,
+            copy_rows_in_database=True,
         )
         try:
             exported_application = application_type.export_serialized(
@@ -460,6 +461,7 @@ class SnapshotHandler:
             reduce_disk_space_usage=False,
             is_duplicate=True,
             exclude_sensitive_data=False,
+            copy_rows_in_database=True,
         )
         # Temporary set the workspace for the application so that the permissions can
         # be correctly set during the import process.
@@ -1,12 +1,115 @@
+import hashlib
+import pathlib
 from io import BytesIO
-from typing import BinaryIO
+from typing import BinaryIO, Dict
 
+from django.conf import settings
 from django.core.files.storage import Storage, default_storage
 
-# This import is necessary to handle the creation of zip files in a standardized way
-# across the application. The ZipStream library is used to manage zip file streams
-# efficiently, and we alias it as ExportZipFile for clarity and consistency.
-from zipstream import ZipStream as ExportZipFile  # noqa
+from zipstream import ZIP_STORED, ZipStream
+
+from baserow.core.import_export.utils import DEFAULT_CHUNK_SIZE, file_chunk_generator
+
+# Files with these extensions are already compressed, so compressing them again
+# costs a lot of CPU time while barely making them smaller.
+COMPRESSED_FILE_EXTENSIONS = {
+    "7z",
+    "aac",
+    "avi",
+    "avif",
+    "br",
+    "bz2",
+    "docx",
+    "epub",
+    "flac",
+    "gif",
+    "gz",
+    "heic",
+    "heif",
+    "jpeg",
+    "jpg",
+    "m4a",
+    "m4v",
+    "mkv",
+    "mov",
+    "mp3",
+    "mp4",
+    "odp",
+    "ods",
+    "odt",
+    "ogg",
+    "opus",
+    "png",
+    "pptx",
+    "rar",
+    "tgz",
+    "webm",
+    "webp",
+    "woff",
+    "woff2",
+    "xlsx",
+    "xz",
+    "zip",
+    "zst",
+}
+
+
+def is_compressed_file(file_name: str) -> bool:
+    """
+    Indicates whether the file is already compressed based on its extension.
+
+    :param file_name: The name of the file.
+    :return: True if the file is already compressed.
+    """
+
+    return pathlib.Path(file_name).suffix[1:].lower() in COMPRESSED_FILE_EXTENSIONS
+
+
+class ExportZipFile(ZipStream):
+    """
+    Handles the creation of zip files in a standardized way across the application.
+    The ZipStream library is used to manage zip file streams efficiently, because
+    the files are only read when the stream is consumed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The sha256 checksums of the files added with `add_storage_file` that have
+        # been streamed, keyed by their name in the zip file.
+        self.streamed_checksums: Dict[str, str] = {}
+
+    def add_storage_file(
+        self,
+        storage: Storage,
+        file_path: str,
+        arcname: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Adds a file of the storage to the zip file. The file is read in chunks while
+        the zip file is streamed, and its sha256 checksum is computed in that same
+        pass. Already compressed files are stored without compressing them again if
+        `BASEROW_EXPORT_ZIP_STORE_COMPRESSED_FILES` is enabled.
+
+        :param storage: The storage to read the file from.
+        :param file_path: The path of the file in the storage.
+        :param arcname: The name of the file in the zip file.
+        :param chunk_size: The size of the chunks that are read from the storage.
+        """
+
+        def chunks():
+            checksum = hashlib.sha256()
+            for chunk in file_chunk_generator(storage, file_path, chunk_size):
+                checksum.update(chunk)
+                yield chunk
+            self.streamed_checksums[arcname] = checksum.hexdigest()
+
+        if settings.BASEROW_EXPORT_ZIP_STORE_COMPRESSED_FILES and is_compressed_file(
+            arcname
+        ):
+            self.add(chunks(), arcname, compress_type=ZIP_STORED)
+        else:
+            self.add(chunks(), arcname)
 
 
 def get_default_storage() -> Storage:
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
@@ -5,10 +6,10 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.db import IntegrityError, OperationalError, transaction
-from django.db.models import Q, QuerySet
+from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from baserow.core.exceptions import (
     ApplicationDoesNotExist,
@@ -38,11 +39,22 @@ from baserow.core.trash.registries import (
     trash_item_type_registry,
     trash_operation_type_registry,
 )
-from baserow.core.trash.signals import before_permanently_deleted, permanently_deleted
+from baserow.core.trash.signals import (
+    before_permanently_deleted,
+    before_permanently_deleted_in_bulk,
+    permanently_deleted,
+    permanently_deleted_in_bulk,
+)
 
 User = get_user_model()
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+permanently_deleted_trash_entries_counter = meter.create_counter(
+    "baserow.trash.permanently_deleted_entries",
+    unit="1",
+    description="The number of trash entries permanently deleted per trash item type.",
+)
 
 
 class TrashHandler(metaclass=baserow_trace_methods(tracer)):
@@ -311,15 +323,74 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
                 raise PermanentDeletionMaxLocksExceededException()
             raise e
 
+    @staticmethod
+    def try_perm_delete_trash_entries_in_bulk(
+        trash_item_type: TrashableItemType,
+        parent_id: Optional[int],
+        trash_item_ids: List[int],
+        trash_item_lookup_cache: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Permanently deletes many trashed items of the same type and parent at once
+        and sends the bulk permanent deletion signals. The trash item type must
+        support bulk permanent deletion.
+        """
+
+        _check_parent_id_valid(parent_id, trash_item_type)
+        try:
+            before_permanently_deleted_in_bulk.send(
+                sender=trash_item_type.type,
+                trash_item_ids=trash_item_ids,
+                parent_id=parent_id,
+            )
+            trash_item_type.permanently_delete_items(
+                parent_id, trash_item_ids, trash_item_lookup_cache
+            )
+            permanently_deleted_in_bulk.send(
+                sender=trash_item_type.type,
+                trash_item_ids=trash_item_ids,
+                parent_id=parent_id,
+            )
+        except TrashItemDoesNotExist:
+            # The parent has already been deleted together with the items.
+            pass
+        except OperationalError as e:
+            if is_max_lock_exceeded_exception(e):
+                raise PermanentDeletionMaxLocksExceededException()
+            raise e
+
     @staticmethod
     def permanently_delete_marked_trash():
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+
+        Items of a type supporting bulk permanent deletion, like rows, are deleted
+        per parent in batches of `BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE`.
+        They're handled last, so that the items belonging to a workspace,
+        application or table deleted before don't have to be looked up anymore.
         """
 
         trash_item_lookup_cache = {}
         deleted_count = 0
+        started = time.perf_counter()
+        batch_size = settings.BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE
+        bulk_trash_item_types = [
+            trash_item_type.type
+            for trash_item_type in trash_item_type_registry.get_all()
+            if trash_item_type.supports_bulk_permanent_deletion
+        ]
+        marked_trash_entries = TrashEntry.objects.filter(
+            should_be_permanently_deleted=True
+        ).order_by(
+            Case(
+                When(trash_item_type__in=bulk_trash_item_types, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            "id",
+        )
+
         while True:
             with transaction.atomic():
                 # Perm deleting a workspace or application can cause cascading deletion
@@ -327,20 +398,47 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
                 # looped over a single queryset lookup of all TrashEntries then we could
                 # end up trying to delete TrashEntries which have already been deleted
                 # by a previous cascading delete of a workspace or application.
-                trash_entry = TrashEntry.objects.filter(
-                    should_be_permanently_deleted=True
-                ).first()
+                trash_entry = marked_trash_entries.first()
                 if not trash_entry:
                     break
 
-                TrashHandler.try_perm_delete_trash_entry(
-                    trash_entry, trash_item_lookup_cache
+                trash_item_type = trash_item_type_registry.get(
+                    trash_entry.trash_item_type
                 )
-                trash_entry.delete()
-                deleted_count += 1
+                if trash_item_type.supports_bulk_permanent_deletion:
+                    entries = list(
+                        marked_trash_entries.filter(
+                            trash_item_type=trash_entry.trash_item_type,
+                            parent_trash_item_id=trash_entry.parent_trash_item_id,
+                        ).values_list("id", "trash_item_id")[:batch_size]
+                    )
+                    TrashHandler.try_perm_delete_trash_entries_in_bulk(
+                        trash_item_type,
+                        trash_entry.parent_trash_item_id,
+                        [trash_item_id for _, trash_item_id in entries],
+                        trash_item_lookup_cache,
+                    )
+                    TrashEntry.objects.filter(
+                        id__in=[entry_id for entry_id, _ in entries]
+                    ).delete()
+                    count = len(entries)
+                else:
+                    TrashHandler.try_perm_delete_trash_entry(
+                        trash_entry, trash_item_lookup_cache
+                    )
+                    trash_entry.delete()
+                    count = 1
+
+            deleted_count += count
+            permanently_deleted_trash_entries_counter.add(
+                count, {"trash_item_type": trash_item_type.type}
+            )
+
+        duration = time.perf_counter() - started
         logger.info(
             f"Successfully deleted {deleted_count} trash entries and their associated "
-            "trashed items."
+            f"trashed items in {duration:.2f} seconds "
+            f"({deleted_count / max(duration, 0.001):.0f} per second)."
         )
 
     @staticmethod
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.registry import (
@@ -20,6 +20,10 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
     A TrashableItemType specifies a baserow model which can be trashed.
     """
 
+    # Whether many trashed items of this type with the same parent can be
+    # permanently deleted at once using `permanently_delete_items`.
+    supports_bulk_permanent_deletion = False
+
     def lookup_trashed_item(
         self, trashed_entry, trash_item_lookup_cache: Dict[str, Any] = None
     ):
@@ -57,6 +61,30 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
 
         pass
 
+    def permanently_delete_items(
+        self,
+        parent_id: Optional[int],
+        trash_item_ids: List[int],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ):
+        """
+        Should be implemented if `supports_bulk_permanent_deletion` is True to delete
+        many trashed items of the same parent at once, using as few queries as
+        possible. Ids of items that don't exist anymore must be ignored.
+
+        :param parent_id: The parent id of the items if required for this type.
+        :param trash_item_ids: The ids of the trashed items to delete permanently.
+        :param trash_item_lookup_cache: If a cache is being used to speed up trash
+            item lookups it should be provided here.
+        :raises TrashItemDoesNotExist: If the parent doesn't exist anymore, in which
+            case the items have been deleted together with the parent.
+        """
+
+        raise NotImplementedError(
+            f"The {self.type} trashable item type doesn't support bulk permanent "
+            "deletion."
+        )
+
     @property
     def requires_parent_id(self) -> bool:
         """
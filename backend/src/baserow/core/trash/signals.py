@@ -21,3 +21,23 @@ Sent when any trashable item in Baserow is permanently deleted with kwargs conta
     None.
 :param parent_id: The parent id of the trashable item if required for that type.
 """
+
+before_permanently_deleted_in_bulk = django.dispatch.Signal()
+"""
+Sent immediately before many trashable items of the same type and parent are
+permanently deleted at once by a trashable item type supporting bulk permanent
+deletion. This signal is sent with kwargs containing:
+
+:param trash_item_ids: The ids of the items that are about to be deleted. Some of
+    them might not exist anymore.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
+
+permanently_deleted_in_bulk = django.dispatch.Signal()
+"""
+Sent when many trashable items of the same type and parent are permanently deleted at
+once with kwargs containing:
+
+:param trash_item_ids: The ids of the items that were deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
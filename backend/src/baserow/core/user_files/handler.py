@@ -1,18 +1,22 @@
 import hashlib
+import math
 import mimetypes
 import os
 import pathlib
 import re
 import secrets
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from os.path import join
-from typing import Any, Dict, Optional
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 from zipfile import ZipFile
 
 from django.conf import settings
 from django.core.files.storage import Storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 from django.db.models import QuerySet
 from django.utils.http import parse_header_parameters
 
@@ -22,14 +26,19 @@ from loguru import logger
 from PIL import Image, ImageOps
 from requests.exceptions import RequestException
 
-from baserow.core.import_export.utils import file_chunk_generator
 from baserow.core.models import UserFile
 from baserow.core.storage import (
     ExportZipFile,
     OverwritingStorageHandler,
     get_default_storage,
 )
-from baserow.core.utils import random_string, sha256_hash, stream_size, truncate_middle
+from baserow.core.utils import (
+    grouper,
+    random_string,
+    sha256_hash,
+    stream_size,
+    truncate_middle,
+)
 
 from .exceptions import (
     FileSizeTooLargeError,
@@ -41,6 +50,9 @@ from .exceptions import (
 from .models import deconstruct_user_file_regex
 
 MIME_TYPE_UNKNOWN = "application/octet-stream"
+# Files that are imported concurrently are kept in memory up to this size, larger
+# files are written to a temporary file on disk.
+USER_FILE_IMPORT_SPOOL_MAX_SIZE = 10 * 1024 * 1024
 
 
 class UserFileHandler:
@@ -65,7 +77,8 @@ class UserFileHandler:
         self, user_file_name: str, base_queryset: Optional[QuerySet] = None
     ) -> UserFile:
         """
-        Returns the user file with the provided id.
+        Returns the user file with the provided name. Because user files with the
+        same content can share the same name, the oldest one is returned.
 
         :param user_file_name: The name of the user file.
         :param base_queryset: The base queryset that will be used to get the user file.
@@ -76,7 +89,12 @@ class UserFileHandler:
         if base_queryset is None:
             base_queryset = UserFile.objects.all()
 
-        return base_queryset.name(user_file_name).get()
+        user_file = base_queryset.name(user_file_name).order_by("id").first()
+        if user_file is None:
+            raise UserFile.DoesNotExist(
+                f"The user file with name {user_file_name} does not exist."
+            )
+        return user_file
 
     def user_file_path(self, user_file_name):
         """
@@ -189,7 +207,9 @@ class UserFileHandler:
         storage = storage or get_default_storage()
         image_width = image.width
         image_height = image.height
+        image_format = image.format
 
+        sizes = {}
         for name, size in settings.USER_THUMBNAILS.items():
             if only_with_name and only_with_name != name:
                 continue
@@ -202,13 +222,26 @@ class UserFileHandler:
             elif size_copy[1] is None and size_copy[0] is not None:
                 size_copy[1] = round(image_height / image_width * size_copy[0])
 
+            sizes[name] = size_copy
+
+        if not sizes:
+            return
+
+        try:
+            # Decode the image only once, at the lowest resolution needed by all
+            # thumbnails, and generate all of them from that same image.
+            source = self._reduce_image_for_thumbnails(image, list(sizes.values()))
+        except OSError:
+            return
+
+        for name, size in sizes.items():
             try:
-                thumbnail = ImageOps.fit(image.copy(), size_copy, Image.LANCZOS)
+                thumbnail = ImageOps.fit(source, size, Image.LANCZOS)
             except OSError:
                 pass
             else:
                 thumbnail_stream = BytesIO()
-                thumbnail.save(thumbnail_stream, image.format)
+                thumbnail.save(thumbnail_stream, image_format)
                 thumbnail_stream.seek(0)
                 thumbnail_path = self.user_file_thumbnail_path(user_file_name, name)
 
@@ -218,6 +251,45 @@ class UserFileHandler:
                 del thumbnail
                 del thumbnail_stream
 
+    def _reduce_image_for_thumbnails(
+        self, image: Image, sizes: List[List[int]]
+    ) -> Image:
+        """
+        Loads the image at the lowest resolution from which all the thumbnails with
+        the provided sizes can still be generated in high quality. JPEG images are
+        directly decoded at a lower resolution, which is a lot faster and uses less
+        memory than decoding the full image. Other images are reduced with a fast box
+        filter after decoding.
+
+        :param image: The opened, but preferably not yet loaded, Pillow image.
+        :param sizes: The width and height of every thumbnail that must be generated.
+        :return: The loaded image, which can be smaller than the original.
+        """
+
+        # The thumbnails are cropped to cover the size, so the scale is based on the
+        # side that needs the most pixels. Twice the resolution is kept so that the
+        # quality of the LANCZOS resampling is not affected.
+        scale = min(
+            1, 2 * max(max(w / image.width, h / image.height) for w, h in sizes)
+        )
+        required_size = (
+            max(1, math.ceil(image.width * scale)),
+            max(1, math.ceil(image.height * scale)),
+        )
+
+        if image.format == "JPEG":
+            image.draft(image.mode, required_size)
+        image.load()
+
+        factor = min(image.width // required_size[0], image.height // required_size[1])
+        if factor > 1:
+            try:
+                image = image.reduce(factor)
+            except ValueError:
+                pass  # Not every image mode can be reduced.
+
+        return image
+
     def upload_user_file(self, user, file_name, stream, storage=None):
         """
         Saves the provided uploaded file in the provided storage. If no storage is
@@ -260,14 +332,66 @@ class UserFileHandler:
         if existing_user_file:
             return existing_user_file
 
-        extension = pathlib.Path(file_name).suffix[1:].lower()
+        # If the same content has been stored before, the new user file shares that
+        # file instead of storing the same bytes again.
+        content = (stream_hash, self._file_extension(file_name))
+        stored_user_file = self._find_stored_user_files_by_content(
+            [content], storage
+        ).get(content)
+        if stored_user_file is not None:
+            stream.close()
+            user_file = self._new_user_file_sharing_content(
+                user, file_name, stored_user_file
+            )
+            user_file.save()
+            if user_file.thumbnails_pending:
+                self.schedule_thumbnails_generation([user_file.id])
+            return user_file
+
+        user_file = self._new_user_file(user, file_name, stream, size, stream_hash)
+        self._generate_user_file_thumbnails(
+            user_file,
+            stream,
+            storage,
+            in_background=self._can_generate_thumbnails_in_background(storage),
+        )
+        user_file.save()
+
+        if user_file.thumbnails_pending:
+            self.schedule_thumbnails_generation([user_file.id])
+
+        # Save the file to the storage.
+        full_path = self.user_file_path(user_file)
+        handler = OverwritingStorageHandler(storage)
+        handler.save(full_path, stream)
+
+        # Close the stream because we don't need it anymore.
+        stream.close()
+
+        return user_file
+
+    def _new_user_file(
+        self, user, file_name: str, stream, size: int, stream_hash: str
+    ) -> UserFile:
+        """
+        Creates a new, not yet saved, user file instance for the provided stream.
+
+        :param user: The user on whose behalf the file is uploaded.
+        :param file_name: The already truncated name of the uploaded file.
+        :param stream: An IO stream containing the uploaded file.
+        :param size: The size of the stream in bytes.
+        :param stream_hash: The sha256 hash of the stream.
+        :return: The unsaved user file instance.
+        """
+
+        extension = self._file_extension(file_name)
         mime_type = (
             mimetypes.guess_type(file_name)[0]
             or getattr(stream, "content_type", None)
             or MIME_TYPE_UNKNOWN
         )
         unique = self.generate_unique(stream_hash, extension)
-        user_file = UserFile(
+        return UserFile(
             original_name=file_name,
             original_extension=extension,
             size=size,
@@ -277,39 +401,145 @@ class UserFileHandler:
             sha256_hash=stream_hash,
         )
 
+    def _file_extension(self, file_name: str) -> str:
+        return pathlib.Path(file_name).suffix[1:].lower()
+
+    def _find_stored_user_files_by_content(
+        self, contents: Iterable[Tuple[str, str]], storage: Storage
+    ) -> Dict[Tuple[str, str], UserFile]:
+        """
+        Finds, for every provided content, a user file with that content of which the
+        file is present in the storage. Because the name of a user file contains
+        the sha256 hash and the extension, new user files with the same content can
+        share its name, and with that the stored file and thumbnails.
+
+        The storage is only checked for the oldest user file, and if its file is
+        missing, for the newest one. When the file of the oldest user file is missing,
+        the content is stored again under a new name, which the newer user files
+        share.
+
+        :param contents: Tuples containing the sha256 hash and the extension.
+        :param storage: The storage in which the file must be present.
+        :return: A dict where the key is the tuple containing the sha256 hash and the
+            extension, and the value the user file with that content.
+        """
+
+        contents = set(contents)
+        if not contents:
+            return {}
+
+        candidates = UserFile.objects.filter(
+            sha256_hash__in={sha256 for sha256, _ in contents}
+        ).order_by("id")
+        oldest = {}
+        newest = {}
+        for user_file in candidates:
+            content = (user_file.sha256_hash, user_file.original_extension)
+            if content in contents:
+                oldest.setdefault(content, user_file)
+                newest[content] = user_file
+
+        found = {}
+        for content, user_file in oldest.items():
+            to_check = [user_file]
+            if newest[content].name != user_file.name:
+                to_check.append(newest[content])
+            for candidate in to_check:
+                if storage.exists(self.user_file_path(candidate)):
+                    found[content] = candidate
+                    break
+        return found
+
+    def _new_user_file_sharing_content(
+        self, user, file_name: str, stored_user_file: UserFile
+    ) -> UserFile:
+        """
+        Creates a new, not yet saved, user file instance that shares the name, and
+        with that the stored file, of an existing user file with the same content.
+
+        :param user: The user on whose behalf the file is uploaded.
+        :param file_name: The already truncated name of the uploaded file.
+        :param stored_user_file: The user file with the same content.
+        :return: The unsaved user file instance.
+        """
+
+        return UserFile(
+            original_name=file_name,
+            original_extension=stored_user_file.original_extension,
+            size=stored_user_file.size,
+            mime_type=stored_user_file.mime_type,
+            unique=stored_user_file.unique,
+            is_image=stored_user_file.is_image,
+            image_width=stored_user_file.image_width,
+            image_height=stored_user_file.image_height,
+            thumbnails_pending=stored_user_file.thumbnails_pending,
+            uploaded_by=user,
+            sha256_hash=stored_user_file.sha256_hash,
+        )
+
+    def _can_generate_thumbnails_in_background(self, storage: Storage) -> bool:
+        """
+        The background task can only read the files from the default storage, so the
+        thumbnails of files in another storage are always generated right away.
+        """
+
+        return (
+            settings.BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND
+            and storage is get_default_storage()
+        )
+
+    def _generate_user_file_thumbnails(
+        self,
+        user_file: UserFile,
+        stream,
+        storage: Storage,
+        in_background: bool = False,
+    ):
+        """
+        Generates the thumbnails of the user file if the stream contains an image and
+        sets the image related properties on the user file instance. This doesn't
+        make any database queries, so it can safely be called in another thread.
+
+        :param user_file: The user file instance of which the stream is the content.
+        :param stream: An IO stream containing the uploaded file.
+        :param storage: The storage where the thumbnails must be saved to.
+        :param in_background: If True, only the header of the image is read, and the
+            user file is marked as having pending thumbnails. They must then be
+            generated with `schedule_thumbnails_generation` after the user file has
+            been saved.
+        """
+
         image = None
         try:
             image = Image.open(stream)
+            image_width, image_height = image.size
             user_file.mime_type = f"image/{image.format}".lower()
-            self.generate_and_save_image_thumbnails(
-                image, user_file.name, storage=storage
-            )
+            if in_background:
+                Image.init()
+                if image.format not in Image.SAVE:
+                    raise ValueError(
+                        f"Thumbnails can't be saved in the {image.format} format."
+                    )
+                user_file.thumbnails_pending = True
+            else:
+                self.generate_and_save_image_thumbnails(
+                    image, user_file.name, storage=storage
+                )
             # Skip marking as images if thumbnails cannot be generated (i.e. PSD files).
             user_file.is_image = True
-            user_file.image_width = image.width
-            user_file.image_height = image.height
+            user_file.image_width = image_width
+            user_file.image_height = image_height
         except IOError:
             pass  # Not an image
         except Exception as exc:
             logger.warning(
-                f"Failed to generate thumbnails for user file of type {mime_type}: {exc}"
+                "Failed to generate thumbnails for user file of type "
+                f"{user_file.mime_type}: {exc}"
             )
         finally:
             if image is not None:
                 del image
 
-        user_file.save()
-
-        # Save the file to the storage.
-        full_path = self.user_file_path(user_file)
-        handler = OverwritingStorageHandler(storage)
-        handler.save(full_path, stream)
-
-        # Close the stream because we don't need it anymore.
-        stream.close()
-
-        return user_file
-
     def upload_user_file_by_url(self, user, url, file_name=None, storage=None):
         """
         Uploads a user file by downloading it from the provided URL.
@@ -433,15 +663,326 @@ class UserFileHandler:
                 # because it might not exist in the environment that it is going
                 # to be imported in.
                 file_path = self.user_file_path(name)
-
-                chunk_generator = file_chunk_generator(storage, file_path)
-                files_zip.add(chunk_generator, name)
+                files_zip.add_storage_file(storage, file_path, name)
 
             # Avoid writing the same file twice
             cache[cache_entry] = True
 
         return {"name": name, "original_name": user_file.original_name}
 
+    def _read_into_temporary_file(
+        self, files_zip: ZipFile, name: str
+    ) -> Tuple[IO[bytes], str, int]:
+        """
+        Copies the file with the provided name out of the files zip into a temporary
+        file while computing the sha256 hash, so that the source only has to be read
+        once. Files larger than the upload size limit are not copied completely.
+
+        :param files_zip: The zip file, or another object with a compatible `open`
+            method, containing the file.
+        :param name: The name of the file in the files zip.
+        :return: The temporary file positioned at the start, its sha256 hash and its
+            size.
+        :raises FileSizeTooLargeError: If the file is too large.
+        """
+
+        temporary_file = tempfile.SpooledTemporaryFile(
+            max_size=USER_FILE_IMPORT_SPOOL_MAX_SIZE
+        )
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with files_zip.open(name) as stream:
+                for chunk in iter(lambda: stream.read(65536), b""):
+                    size += len(chunk)
+                    if size > settings.BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB:
+                        raise FileSizeTooLargeError(
+                            settings.BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB,
+                            "The provided file is too large.",
+                        )
+                    hasher.update(chunk)
+                    temporary_file.write(chunk)
+        except Exception:
+            temporary_file.close()
+            raise
+
+        temporary_file.seek(0)
+        return temporary_file, hasher.hexdigest(), size
+
+    def _store_user_file(
+        self,
+        user_file: UserFile,
+        stream: IO[bytes],
+        storage: Storage,
+        thumbnails_in_background: bool = False,
+    ):
+        """
+        Generates the thumbnails and saves the content of a new user file to the
+        storage. The stream is closed afterward.
+        """
+
+        try:
+            self._generate_user_file_thumbnails(
+                user_file, stream, storage, in_background=thumbnails_in_background
+            )
+            handler = OverwritingStorageHandler(storage)
+            handler.save(self.user_file_path(user_file), stream)
+        finally:
+            stream.close()
+
+    def import_user_files(
+        self,
+        serialized_user_files: List[Dict[str, str]],
+        files_zip: ZipFile,
+        storage: Optional[Storage] = None,
+    ) -> Dict[Tuple[str, str], UserFile]:
+        """
+        Imports many user files out of the files zip at once. Because most of the time
+        is spent waiting on reading, downloading and storing the files, the files are
+        transferred by a bounded pool of threads. All the database queries are made
+        in the calling thread.
+
+        Files of which the sha256 hash is part of the name, like in Baserow exports,
+        are not read at all if a user file with the same name and content already
+        exists, or if the same content has been stored before. Other files are
+        deduplicated after they've been read, before they're stored.
+
+        :param serialized_user_files: The serialized user files containing the `name`
+            in the files zip and the `original_name`.
+        :param files_zip: The zip file, or another object with a compatible `open`
+            method like the `AirtableFileImport`, containing the files.
+        :param storage: The storage where the files must be saved to.
+        :return: A dict where the key is a tuple of the name and the original name of
+            the serialized user file, and the value the imported user file.
+        """
+
+        storage = storage or get_default_storage()
+        thumbnails_in_background = self._can_generate_thumbnails_in_background(storage)
+        imported = {}
+        to_transfer = {}
+        for serialized_user_file in serialized_user_files:
+            name = serialized_user_file.get("name")
+            original_name = serialized_user_file.get("original_name")
+            if name and original_name:
+                to_transfer[(name, original_name)] = truncate_middle(original_name, 64)
+
+        existing = {}
+        stored_by_content = {}
+        new_user_files = {}
+        looked_up = set()
+
+        def find_existing(pairs):
+            pairs = set(pairs) - looked_up
+            if not pairs:
+                return
+            looked_up.update(pairs)
+
+            user_files = UserFile.objects.filter(
+                original_name__in=[original_name for original_name, _ in pairs],
+                sha256_hash__in=[sha256 for _, sha256 in pairs],
+            ).order_by("id")
+            for user_file in user_files:
+                existing.setdefault(
+                    (user_file.original_name, user_file.sha256_hash), user_file
+                )
+            stored_by_content.update(
+                self._find_stored_user_files_by_content(
+                    {
+                        (sha256, self._file_extension(original_name))
+                        for original_name, sha256 in pairs
+                        if (original_name, sha256) not in existing
+                    },
+                    storage,
+                )
+            )
+
+        def get_without_storing(original_name, sha256):
+            """
+            Returns the user file for the provided content if it doesn't have to be
+            stored, either because it already exists or because its content has
+            been stored before.
+            """
+
+            pair = (original_name, sha256)
+            user_file = existing.get(pair) or new_user_files.get(pair)
+            if user_file is None:
+                content = (sha256, self._file_extension(original_name))
+                if content in stored_by_content:
+                    user_file = self._new_user_file_sharing_content(
+                        None, original_name, stored_by_content[content]
+                    )
+                    new_user_files[pair] = user_file
+            return user_file
+
+        # Avoid reading the files of which the hash is known upfront if they already
+        # exist, or if their content has been stored before.
+        known_hashes = {}
+        for key, original_name in to_transfer.items():
+            try:
+                known_hashes[key] = (original_name, self.user_file_sha256(key[0]))
+            except ValueError:
+                pass
+        find_existing(known_hashes.values())
+        for key, pair in known_hashes.items():
+            user_file = get_without_storing(*pair)
+            if user_file is not None:
+                imported[key] = user_file
+                del to_transfer[key]
+
+        max_workers = max(
+            1, min(settings.BASEROW_USER_FILES_IMPORT_MAX_CONCURRENCY, len(to_transfer))
+        )
+        stored_in_batch = {}
+        sharing_stored_in_batch = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # The files are read in chunks of the size of the pool, while the
+            # previous chunk is being stored. This keeps at most two chunks of
+            # temporary files around, no matter how many files are imported.
+            store_futures = []
+            for keys in grouper(max_workers, to_transfer.keys()):
+                read_futures = {
+                    key: executor.submit(
+                        self._read_into_temporary_file, files_zip, key[0]
+                    )
+                    for key in keys
+                }
+                try:
+                    for future in store_futures:
+                        future.result()
+                    read_files = {
+                        key: future.result() for key, future in read_futures.items()
+                    }
+                except Exception:
+                    # Don't start reading the remaining files, and close the
+                    # temporary files that were already read.
+                    for future in read_futures.values():
+                        if not future.cancel() and future.exception() is None:
+                            future.result()[0].close()
+                    raise
+
+                find_existing(
+                    (to_transfer[key], sha256)
+                    for key, (_, sha256, _) in read_files.items()
+                )
+                store_futures = []
+                for key, (stream, sha256, size) in read_files.items():
+                    original_name = to_transfer[key]
+                    content = (sha256, self._file_extension(original_name))
+                    user_file = get_without_storing(original_name, sha256)
+                    if user_file is not None:
+                        stream.close()
+                    elif content in stored_in_batch:
+                        # The image properties of the file that is being stored
+                        # are only known after it has been stored.
+                        stream.close()
+                        sharing_stored_in_batch.append((key, original_name, sha256))
+                        continue
+                    else:
+                        user_file = self._new_user_file(
+                            None, original_name, stream, size, sha256
+                        )
+                        new_user_files[(original_name, sha256)] = user_file
+                        stored_in_batch[content] = user_file
+                        store_futures.append(
+                            executor.submit(
+                                self._store_user_file,
+                                user_file,
+                                stream,
+                                storage,
+                                thumbnails_in_background,
+                            )
+                        )
+                    imported[key] = user_file
+
+            for future in store_futures:
+                future.result()
+
+        stored_by_content.update(stored_in_batch)
+        for key, original_name, sha256 in sharing_stored_in_batch:
+            imported[key] = get_without_storing(original_name, sha256)
+
+        UserFile.objects.bulk_create(new_user_files.values())
+        pending_thumbnail_ids = [
+            user_file.id
+            for user_file in new_user_files.values()
+            if user_file.thumbnails_pending
+        ]
+        if pending_thumbnail_ids:
+            self.schedule_thumbnails_generation(pending_thumbnail_ids)
+
+        return imported
+
+    def schedule_thumbnails_generation(self, user_file_ids: List[int]):
+        """
+        Generates the thumbnails of the provided user files in a background task
+        when the current transaction commits.
+
+        :param user_file_ids: The ids of the user files with pending thumbnails.
+        """
+
+        from .tasks import generate_pending_user_file_thumbnails
+
+        transaction.on_commit(
+            lambda: generate_pending_user_file_thumbnails.delay(list(user_file_ids))
+        )
+
+    def generate_pending_thumbnails(
+        self, user_file_ids: List[int], storage: Optional[Storage] = None
+    ):
+        """
+        Generates the thumbnails of the provided user files that are still pending.
+        The images are decoded and resized by a small pool of threads because Pillow
+        releases the GIL while doing so.
+
+        :param user_file_ids: The ids of the user files of which the thumbnails must
+            be generated.
+        :param storage: The storage where the files are stored and where the
+            thumbnails must be saved to.
+        """
+
+        storage = storage or get_default_storage()
+        user_files = list(
+            UserFile.objects.filter(id__in=user_file_ids, thumbnails_pending=True)
+        )
+        if not user_files:
+            return
+
+        def generate(user_file: UserFile):
+            try:
+                with storage.open(self.user_file_path(user_file), "rb") as stream:
+                    with Image.open(stream) as image:
+                        self.generate_and_save_image_thumbnails(
+                            image, user_file.name, storage=storage
+                        )
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to generate thumbnails for user file {user_file.id}: "
+                    f"{exc}"
+                )
+
+        # User files with the same name share the same thumbnails, so they only have
+        # to be generated once.
+        user_files_by_name = {}
+        for user_file in user_files:
+            user_files_by_name.setdefault(user_file.name, user_file)
+
+        max_workers = max(
+            1,
+            min(
+                settings.BASEROW_USER_FILE_THUMBNAILS_MAX_CONCURRENCY,
+                len(user_files_by_name),
+            ),
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(generate, user_files_by_name.values()))
+
+        # The `is_image` state is not changed if the thumbnails couldn't be generated
+        # because it has already been serialized into the cell values that reference
+        # the file, and those are never updated afterward.
+        UserFile.objects.filter(
+            id__in=[user_file.id for user_file in user_files]
+        ).update(thumbnails_pending=False)
+
     def import_user_file(
         self,
         serialized_user_file: Dict[str, str],
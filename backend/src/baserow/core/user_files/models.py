@@ -19,6 +19,11 @@ class UserFile(models.Model):
     is_image = models.BooleanField(default=False)
     image_width = models.PositiveIntegerField(null=True)
     image_height = models.PositiveIntegerField(null=True)
+    thumbnails_pending = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the thumbnails of the image are still being "
+        "generated in the background.",
+    )
     uploaded_at = models.DateTimeField(auto_now_add=True)
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     sha256_hash = models.CharField(max_length=64, db_index=True)
@@ -0,0 +1,16 @@
+from typing import List
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(
+    bind=True,
+    queue=settings.BASEROW_USER_FILE_THUMBNAILS_QUEUE_NAME,
+    soft_time_limit=settings.BASEROW_USER_FILE_THUMBNAILS_SOFT_TIME_LIMIT,
+)
+def generate_pending_user_file_thumbnails(self, user_file_ids: List[int]):
+    from baserow.core.user_files.handler import UserFileHandler
+
+    UserFileHandler().generate_pending_thumbnails(user_file_ids)
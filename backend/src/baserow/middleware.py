@@ -6,7 +6,11 @@ from django.urls import is_valid_path
 
 from rest_framework import status
 
-from baserow.config.db_routers import clear_db_state
+from baserow.config.db_routers import (
+    clear_db_state,
+    get_sticky_key_for_credentials,
+    set_sticky_key,
+)
 from baserow.core.handler import CoreHandler
 from baserow.throttling import ConcurrentUserRequestsThrottle
 
@@ -105,13 +109,21 @@ class ClearContextMiddleware:
 class ClearDBStateMiddleware:
     """
     Clearing the db state after every request, so that if a read-only replica is
-    configured, it will correctly use that one instead of the writer.
+    configured, it will correctly use that one instead of the writer. The
+    authorization header is used as sticky key, so that the requests made with the
+    same credentials read their own writes.
     """
 
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
         self.get_response = get_response
 
     def __call__(self, request):
-        response = self.get_response(request)
-        clear_db_state()
+        authorization = request.headers.get("authorization")
+        if authorization:
+            set_sticky_key(get_sticky_key_for_credentials(authorization))
+
+        try:
+            response = self.get_response(request)
+        finally:
+            clear_db_state()
         return response
@@ -145,6 +145,11 @@ def clear_cache():
     _generate_search_table_model.cache_clear()
     _workspace_search_table_exists.cache_clear()
 
+    # Generated row serializer classes cache
+    from baserow.contrib.database.api.rows.serializers import row_serializer_class_cache
+
+    row_serializer_class_cache.clear()
+
     # Thread-local cache
     with local_cache.context():
         yield
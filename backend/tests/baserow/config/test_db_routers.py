@@ -0,0 +1,149 @@
+from unittest.mock import patch
+
+from django.db import DatabaseError
+from django.test import override_settings
+
+import pytest
+
+from baserow.config.db_routers import (
+    DEFAULT_DB_ALIAS,
+    ReadReplicaRouter,
+    ReplicaHealthTracker,
+    choose_replica,
+    clear_db_state,
+    get_sticky_key_for_credentials,
+    is_write_mode,
+    replica_health_tracker,
+    set_sticky_key,
+)
+from baserow.middleware import ClearDBStateMiddleware
+
+REPLICAS = ["read_1", "read_2"]
+
+
+@pytest.fixture(autouse=True)
+def reset_db_router_state():
+    clear_db_state()
+    replica_health_tracker.reset()
+    yield
+    clear_db_state()
+    replica_health_tracker.reset()
+
+
+def test_db_for_read_without_replicas_uses_default():
+    assert ReadReplicaRouter().db_for_read(None) == DEFAULT_DB_ALIAS
+
+
+@patch("baserow.config.db_routers.DATABASE_READ_REPLICAS", REPLICAS)
+@patch.object(ReplicaHealthTracker, "_measure_lag", return_value=0.0)
+def test_db_for_read_uses_replica_until_write(mock_measure_lag):
+    router = ReadReplicaRouter()
+
+    assert router.db_for_read(None) in REPLICAS
+    assert router.db_for_write(None) == DEFAULT_DB_ALIAS
+    assert is_write_mode()
+    assert router.db_for_read(None) == DEFAULT_DB_ALIAS
+
+    clear_db_state()
+    assert router.db_for_read(None) in REPLICAS
+
+
+@patch("baserow.config.db_routers.DATABASE_READ_REPLICAS", REPLICAS)
+@override_settings(
+    BASEROW_READ_REPLICA_MAX_LAG_SECONDS=10,
+    BASEROW_READ_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS=60,
+)
+def test_replica_health_tracker_skips_lagging_and_unhealthy_replicas():
+    tracker = ReplicaHealthTracker()
+
+    with patch.object(
+        ReplicaHealthTracker, "_measure_lag", side_effect=[20.0, 1.0]
+    ) as mock_measure_lag:
+        assert tracker.get_available_replicas() == {"read_2": 1.0}
+        # The lags are only measured once per interval.
+        assert tracker.get_available_replicas() == {"read_2": 1.0}
+        assert mock_measure_lag.call_count == 2
+
+    tracker.reset()
+    with patch("baserow.config.db_routers.connections") as mock_connections:
+        mock_connections.__getitem__.side_effect = DatabaseError("down")
+        assert tracker.get_available_replicas() == {}
+        assert tracker.get_lags() == {"read_1": None, "read_2": None}
+
+
+@patch("baserow.config.db_routers.DATABASE_READ_REPLICAS", REPLICAS)
+@patch.object(ReplicaHealthTracker, "_measure_lag", return_value=None)
+def test_db_for_read_uses_default_if_no_replica_is_available(mock_measure_lag):
+    assert ReadReplicaRouter().db_for_read(None) == DEFAULT_DB_ALIAS
+
+
+def test_choose_replica_prefers_replicas_with_less_lag():
+    assert choose_replica({"read_1": 3.0}) == "read_1"
+
+    with patch("baserow.config.db_routers.random.choices") as mock_choices:
+        mock_choices.return_value = ["read_1"]
+        choose_replica({"read_1": 0.0, "read_2": 3.0})
+        assert mock_choices.call_args.kwargs["weights"] == [1.0, 0.25]
+
+
+@patch("baserow.config.db_routers.DATABASE_READ_REPLICAS", REPLICAS)
+@patch.object(ReplicaHealthTracker, "_measure_lag", return_value=0.0)
+@override_settings(BASEROW_READ_REPLICA_STICKY_SECONDS=5)
+def test_db_for_read_is_sticky_to_primary_after_a_write(mock_measure_lag):
+    router = ReadReplicaRouter()
+
+    set_sticky_key("client_1")
+    router.db_for_write(None)
+    clear_db_state()
+
+    set_sticky_key("client_1")
+    assert router.db_for_read(None) == DEFAULT_DB_ALIAS
+    clear_db_state()
+
+    set_sticky_key("client_2")
+    assert router.db_for_read(None) in REPLICAS
+    clear_db_state()
+
+    assert router.db_for_read(None) in REPLICAS
+
+
+@patch("baserow.config.db_routers.DATABASE_READ_REPLICAS", REPLICAS)
+@patch.object(ReplicaHealthTracker, "_measure_lag", return_value=0.0)
+@override_settings(BASEROW_READ_REPLICA_STICKY_SECONDS=0)
+def test_db_for_read_stickiness_can_be_disabled(mock_measure_lag):
+    router = ReadReplicaRouter()
+
+    set_sticky_key("client_1")
+    router.db_for_write(None)
+    clear_db_state()
+
+    set_sticky_key("client_1")
+    assert router.db_for_read(None) in REPLICAS
+
+
+@patch("baserow.config.db_routers.DATABASE_READ_REPLICAS", REPLICAS)
+@patch.object(ReplicaHealthTracker, "_measure_lag", return_value=0.0)
+@override_settings(BASEROW_READ_REPLICA_STICKY_SECONDS=5)
+def test_clear_db_state_middleware_uses_authorization_header_as_sticky_key(
+    mock_measure_lag, rf
+):
+    router = ReadReplicaRouter()
+    routed_reads = []
+
+    def write(request):
+        router.db_for_write(None)
+
+    def read(request):
+        routed_reads.append(router.db_for_read(None))
+
+    ClearDBStateMiddleware(write)(rf.get("/", HTTP_AUTHORIZATION="JWT token_1"))
+    assert not is_write_mode()
+
+    ClearDBStateMiddleware(read)(rf.get("/", HTTP_AUTHORIZATION="JWT token_1"))
+    ClearDBStateMiddleware(read)(rf.get("/", HTTP_AUTHORIZATION="JWT token_2"))
+    ClearDBStateMiddleware(read)(rf.get("/"))
+
+    assert routed_reads[0] == DEFAULT_DB_ALIAS
+    assert routed_reads[1] in REPLICAS
+    assert routed_reads[2] in REPLICAS
+    assert get_sticky_key_for_credentials("JWT token_1") != "JWT token_1"
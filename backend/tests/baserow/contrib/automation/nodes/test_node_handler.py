@@ -1,5 +1,8 @@
+import threading
 from unittest.mock import patch
 
+from django.test import override_settings
+
 import pytest
 
 from baserow.contrib.automation.automation_dispatch_context import (
@@ -13,6 +16,8 @@ from baserow.contrib.automation.nodes.handler import AutomationNodeHandler
 from baserow.contrib.automation.nodes.models import LocalBaserowCreateRowActionNode
 from baserow.contrib.automation.nodes.registries import automation_node_type_registry
 from baserow.contrib.integrations.local_baserow.models import LocalBaserowRowsCreated
+from baserow.core.services.exceptions import DispatchException
+from baserow.core.services.types import DispatchResult
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import MirrorDict
 from baserow.test_utils.helpers import AnyDict, AnyInt, AnyStr
@@ -633,3 +638,113 @@ def test_simulate_dispatch_node_dispatches_correct_edge_node(data_fixture):
         "output_uid": AnyStr(),
         "status": 200,
     }
+
+
+def create_parallel_http_request_branches(data_fixture, count):
+    workflow = data_fixture.create_automation_workflow(create_trigger=False)
+    trigger = data_fixture.create_local_baserow_rows_created_trigger_node(
+        workflow=workflow
+    )
+    branches = [
+        data_fixture.create_automation_node(
+            workflow=workflow,
+            type="http_request",
+            service=data_fixture.create_core_http_request_service(),
+        )
+        for _ in range(count)
+    ]
+    # Every branch directly follows the trigger.
+    for branch in branches:
+        branch.previous_node_id = trigger.id
+        branch.save()
+    return workflow, trigger, branches
+
+
+@pytest.mark.django_db
+@override_settings(AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES=3)
+@patch("baserow.contrib.automation.nodes.registries.ServiceHandler.dispatch_service")
+def test_dispatch_node_dispatches_independent_branches_in_parallel(
+    mock_dispatch_service, data_fixture
+):
+    workflow, trigger, branches = create_parallel_http_request_branches(data_fixture, 3)
+    barrier = threading.Barrier(3, timeout=5)
+    seen_results = {}
+
+    def dispatch_service(service, dispatch_context):
+        if service.id == trigger.service_id:
+            return DispatchResult(data={"trigger": True})
+        # Fails if the branches aren't dispatched concurrently.
+        barrier.wait()
+        seen_results[service.id] = set(dispatch_context.previous_nodes_results)
+        return DispatchResult(data={"service": service.id})
+
+    mock_dispatch_service.side_effect = dispatch_service
+
+    dispatch_context = AutomationDispatchContext(workflow, None)
+    AutomationNodeHandler().dispatch_node(trigger, dispatch_context)
+
+    # The results are registered in the order of the branches, and the branches
+    # don't see each other's results.
+    assert dispatch_context.dispatch_history == [trigger.id] + [
+        branch.id for branch in branches
+    ]
+    for branch in branches:
+        assert dispatch_context.previous_nodes_results[branch.id] == {
+            "service": branch.service_id
+        }
+        assert seen_results[branch.service_id] == {trigger.id}
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.automation.nodes.registries.ServiceHandler.dispatch_service")
+def test_dispatch_node_raises_error_of_failed_parallel_branch_in_order(
+    mock_dispatch_service, data_fixture
+):
+    workflow, trigger, branches = create_parallel_http_request_branches(data_fixture, 3)
+
+    def dispatch_service(service, dispatch_context):
+        if service.id == branches[1].service_id:
+            raise DispatchException("Failed")
+        return DispatchResult(data={"service": service.id})
+
+    mock_dispatch_service.side_effect = dispatch_service
+
+    dispatch_context = AutomationDispatchContext(workflow, None)
+    with pytest.raises(DispatchException):
+        AutomationNodeHandler().dispatch_node(trigger, dispatch_context)
+
+    assert dispatch_context.dispatch_history == [trigger.id, branches[0].id]
+
+
+@pytest.mark.django_db
+@override_settings(AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES=3)
+@patch("baserow.contrib.automation.nodes.registries.ServiceHandler.dispatch_service")
+def test_dispatch_node_doesnt_start_branches_after_a_branch_that_can_fail(
+    mock_dispatch_service, data_fixture
+):
+    workflow, trigger, branches = create_parallel_http_request_branches(data_fixture, 2)
+    # The first branch continues after its first node, so the second branch must
+    # only be dispatched once the whole first branch has succeeded.
+    follower = data_fixture.create_automation_node(
+        workflow=workflow,
+        type="smtp_email",
+        service=data_fixture.create_core_smtp_email_service(),
+    )
+    follower.previous_node_id = branches[0].id
+    follower.save()
+    dispatched_service_ids = []
+
+    def dispatch_service(service, dispatch_context):
+        dispatched_service_ids.append(service.id)
+        if service.id == branches[0].service_id:
+            raise DispatchException("Failed")
+        return DispatchResult(data={"service": service.id})
+
+    mock_dispatch_service.side_effect = dispatch_service
+
+    dispatch_context = AutomationDispatchContext(workflow, None)
+    with pytest.raises(DispatchException):
+        AutomationNodeHandler().dispatch_node(trigger, dispatch_context)
+
+    assert dispatched_service_ids == [trigger.service_id, branches[0].service_id]
+    assert dispatch_context.dispatch_history == [trigger.id]
@@ -459,3 +459,70 @@ def test_core_http_trigger_node_duplicating_workflow_sets_unique_uid(data_fixtur
 
     assert isinstance(duplicated_service.uid, uuid.UUID)
     assert str(duplicated_service.uid) != str(trigger_node.service.uid)
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.automation.workflows.service.AutomationWorkflowHandler.async_start_workflow"
+)
+def test_on_event_with_table_uses_trigger_routing_index(
+    mock_async_start_workflow, data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    workflow = data_fixture.create_automation_workflow(
+        user, state=WorkflowState.DRAFT, trigger_service_kwargs={"table": table}
+    )
+    trigger = workflow.get_trigger()
+    node_type = trigger.get_type()
+    services = trigger.service.get_type().model_class.objects.filter(table=table)
+    get_event_payload = MagicMock(return_value=[{"id": 1}])
+
+    node_type.on_event(services, get_event_payload, user=user, table=other_table)
+    node_type.on_event(services, get_event_payload, user=user, table=table)
+    with django_assert_num_queries(0):
+        node_type.on_event(services, get_event_payload, user=user, table=other_table)
+        node_type.on_event(services, get_event_payload, user=user, table=table)
+
+    # The workflow isn't live, so the payload doesn't have to be computed.
+    get_event_payload.assert_not_called()
+    mock_async_start_workflow.assert_not_called()
+
+    # Changing the workflow invalidates the index.
+    workflow.state = WorkflowState.LIVE
+    workflow.save()
+
+    node_type.on_event(services, get_event_payload, user=user, table=table)
+    get_event_payload.assert_called_once()
+    mock_async_start_workflow.assert_called_once()
+    assert mock_async_start_workflow.call_args[0][0].id == workflow.id
+    assert mock_async_start_workflow.call_args[0][1] == [{"id": 1}]
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.automation.workflows.service.AutomationWorkflowHandler.async_start_workflow"
+)
+def test_on_event_trigger_routing_index_invalidated_when_service_table_changes(
+    mock_async_start_workflow, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    workflow = data_fixture.create_automation_workflow(
+        user, state=WorkflowState.LIVE, trigger_service_kwargs={"table": table}
+    )
+    trigger = workflow.get_trigger()
+    node_type = trigger.get_type()
+    services = trigger.service.get_type().model_class.objects.filter(table=other_table)
+
+    node_type.on_event(services, [{"id": 1}], user=user, table=other_table)
+    mock_async_start_workflow.assert_not_called()
+
+    service = trigger.service.specific
+    service.table = other_table
+    service.save()
+
+    node_type.on_event(services, [{"id": 1}], user=user, table=other_table)
+    mock_async_start_workflow.assert_called_once()
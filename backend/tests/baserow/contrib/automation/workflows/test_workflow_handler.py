@@ -8,6 +8,7 @@ import pytest
 from freezegun import freeze_time
 
 from baserow.contrib.automation.history.constants import HistoryStatusChoices
+from baserow.contrib.automation.history.handler import AutomationHistoryHandler
 from baserow.contrib.automation.models import AutomationWorkflow
 from baserow.contrib.automation.nodes.node_types import (
     CorePeriodicTriggerNodeType,
@@ -561,6 +562,34 @@ def test_check_is_rate_limited_raises_if_above_limit():
         )
 
 
+@override_settings(
+    AUTOMATION_WORKFLOW_RATE_LIMIT_CACHE_EXPIRY_SECONDS=5,
+    AUTOMATION_WORKFLOW_RATE_LIMIT_MAX_RUNS=5,
+)
+def test_check_is_rate_limited_uses_sliding_window():
+    handler = AutomationWorkflowHandler()
+    with freeze_time("2025-08-01 14:00:00"):
+        for _ in range(3):
+            handler._check_is_rate_limited(100)
+
+    with freeze_time("2025-08-01 14:00:03"):
+        for _ in range(2):
+            handler._check_is_rate_limited(100)
+        with pytest.raises(AutomationWorkflowRateLimited):
+            handler._check_is_rate_limited(100)
+
+    # Only the first 3 runs left the window.
+    with freeze_time("2025-08-01 14:00:05.500"):
+        for _ in range(3):
+            handler._check_is_rate_limited(100)
+        with pytest.raises(AutomationWorkflowRateLimited):
+            handler._check_is_rate_limited(100)
+
+    # Other workflows have their own window.
+    with freeze_time("2025-08-01 14:00:05.500"):
+        handler._check_is_rate_limited(101)
+
+
 @pytest.mark.django_db
 def test_disable_workflow_disables_original_workflow(data_fixture):
     original_workflow = data_fixture.create_automation_workflow()
@@ -596,7 +625,9 @@ def test_disable_workflow_disables_published_workflow(data_fixture):
 
 @override_settings(AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS=5)
 @pytest.mark.django_db
-def test_check_too_many_errors_raises_if_above_limit(data_fixture):
+def test_check_too_many_errors_raises_if_above_limit(
+    data_fixture, django_capture_on_commit_callbacks
+):
     original_workflow = data_fixture.create_automation_workflow()
 
     for _ in range(4):
@@ -608,10 +639,11 @@ def test_check_too_many_errors_raises_if_above_limit(data_fixture):
     AutomationWorkflowHandler()._check_too_many_errors(original_workflow)
 
     # This 6th error should cause True to be returned
-    data_fixture.create_automation_workflow_history(
-        workflow=original_workflow,
-        status=HistoryStatusChoices.ERROR,
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        data_fixture.create_automation_workflow_history(
+            workflow=original_workflow,
+            status=HistoryStatusChoices.ERROR,
+        )
 
     with pytest.raises(AutomationWorkflowTooManyErrors) as e:
         AutomationWorkflowHandler()._check_too_many_errors(original_workflow)
@@ -655,6 +687,77 @@ def test_check_too_many_errors_returns_none_if_below_limit(data_fixture):
     AutomationWorkflowHandler()._check_too_many_errors(original_workflow)
 
 
+@override_settings(AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS=3)
+@pytest.mark.django_db
+def test_check_too_many_errors_maintains_error_streak_without_queries(
+    data_fixture, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    original_workflow = data_fixture.create_automation_workflow()
+    data_fixture.create_automation_workflow_history(
+        workflow=original_workflow, status=HistoryStatusChoices.ERROR
+    )
+    data_fixture.create_automation_workflow_history(
+        workflow=original_workflow, status=HistoryStatusChoices.STARTED
+    )
+
+    # The streak is calculated from the history the first time.
+    AutomationWorkflowHandler()._check_too_many_errors(original_workflow)
+
+    with django_assert_num_queries(0):
+        AutomationWorkflowHandler()._check_too_many_errors(original_workflow)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(2):
+            data_fixture.create_automation_workflow_history(
+                workflow=original_workflow, status=HistoryStatusChoices.ERROR
+            )
+
+    with django_assert_num_queries(0):
+        with pytest.raises(AutomationWorkflowTooManyErrors):
+            AutomationWorkflowHandler()._check_too_many_errors(original_workflow)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        data_fixture.create_automation_workflow_history(
+            workflow=original_workflow, status=HistoryStatusChoices.DISABLED
+        )
+
+    with django_assert_num_queries(0):
+        AutomationWorkflowHandler()._check_too_many_errors(original_workflow)
+
+
+@override_settings(AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS=5)
+@pytest.mark.django_db
+def test_error_streak_is_updated_once_per_status_change_after_commit(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    original_workflow = data_fixture.create_automation_workflow()
+    handler = AutomationHistoryHandler()
+    assert handler.get_error_streak(original_workflow, 5) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        history = data_fixture.create_automation_workflow_history(
+            workflow=original_workflow, status=HistoryStatusChoices.STARTED
+        )
+        history.status = HistoryStatusChoices.ERROR
+        history.save()
+        # Saving the entry again without changing its status must not count the
+        # same run twice.
+        history.message = "Failed"
+        history.save()
+
+    assert handler.get_error_streak(original_workflow, 5) == 1
+
+    # The streak isn't updated before the transaction is committed, so that a run
+    # which is rolled back doesn't change it.
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        data_fixture.create_automation_workflow_history(
+            workflow=original_workflow, status=HistoryStatusChoices.ERROR
+        )
+
+    assert len(callbacks) == 1
+    assert handler.get_error_streak(original_workflow, 5) == 1
+
+
 @patch(f"{WORKFLOWS_MODULE}.handler.automation_workflow_updated")
 @patch(f"{WORKFLOWS_MODULE}.handler.AutomationWorkflowHandler.async_start_workflow")
 @pytest.mark.django_db
@@ -796,3 +899,57 @@ def test_toggle_simulate_mode_on_immediate(
 
     mock_automation_workflow_updated.send.assert_called_once()
     mock_async_start_workflow.assert_called_once()
+
+
+@override_settings(AUTOMATION_WORKFLOW_EVENT_BATCH_WINDOW_SECONDS=5)
+@patch(f"{WORKFLOWS_MODULE}.tasks.start_workflow_celery_task.delay")
+@patch(f"{HANDLER_MODULE}.flush_workflow_events_celery_task.apply_async")
+@pytest.mark.django_db
+def test_async_start_workflow_combines_events_within_window(
+    mock_apply_async, mock_start_workflow_delay, data_fixture
+):
+    workflow = data_fixture.create_automation_workflow(state=WorkflowState.LIVE)
+    handler = AutomationWorkflowHandler()
+    handler.pop_workflow_events(workflow.id)
+
+    handler.async_start_workflow(workflow, [{"id": 1}])
+    handler.async_start_workflow(workflow, [{"id": 2}, {"id": 3}])
+
+    # Only the first event of the window schedules a flush.
+    mock_apply_async.assert_called_once_with(args=(workflow.id,), countdown=5)
+
+    from baserow.contrib.automation.workflows.tasks import (
+        flush_workflow_events_celery_task,
+    )
+
+    flush_workflow_events_celery_task(workflow.id)
+    mock_start_workflow_delay.assert_called_once_with(
+        workflow.id, [{"id": 1}, {"id": 2}, {"id": 3}]
+    )
+
+    # Nothing is started if there are no new events, but a new event schedules a
+    # new flush.
+    flush_workflow_events_celery_task(workflow.id)
+    mock_start_workflow_delay.assert_called_once()
+    handler.async_start_workflow(workflow, [{"id": 4}])
+    assert mock_apply_async.call_count == 2
+    assert handler.pop_workflow_events(workflow.id) == [{"id": 4}]
+
+
+@override_settings(AUTOMATION_WORKFLOW_EVENT_BATCH_WINDOW_SECONDS=5)
+@patch(f"{HANDLER_MODULE}.start_workflow_celery_task.delay")
+@patch(f"{HANDLER_MODULE}.flush_workflow_events_celery_task.apply_async")
+@pytest.mark.django_db
+def test_async_start_workflow_does_not_combine_simulated_events(
+    mock_apply_async, mock_start_workflow_delay, data_fixture
+):
+    workflow = data_fixture.create_automation_workflow()
+    workflow.simulate_until_node = workflow.get_trigger()
+    workflow.save()
+
+    AutomationWorkflowHandler().async_start_workflow(workflow, [{"id": 1}])
+
+    mock_apply_async.assert_not_called()
+    mock_start_workflow_delay.assert_called_once_with(
+        workflow.id, [{"id": 1}], simulate_until_node_id=workflow.get_trigger().id
+    )
@@ -7,6 +7,7 @@ import pytest
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_202_ACCEPTED,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
@@ -2318,3 +2319,142 @@ def test_public_dispatch_data_source_with_refinements_referencing_trashed_field(
         "detail": "A data source sort is misconfigured: "
         "One or more sorted properties no longer exist.",
     }
+
+
+@pytest.mark.django_db
+def test_public_page_bootstrap_view(api_client, data_fixture, user_source_user_fixture):
+    user = user_source_user_fixture["user"]
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["Apple"], ["Banana"]],
+    )
+    page = user_source_user_fixture["page"]
+    element = data_fixture.create_builder_heading_element(page=page)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=user_source_user_fixture["integration"],
+        table=table,
+        row_id="2",
+    )
+    builder = page.builder
+    builder.workspace = None
+    builder.save()
+    data_fixture.create_builder_custom_domain(published_to=builder)
+
+    url = reverse(
+        "api:builder:domains:public_page_bootstrap", kwargs={"page_id": page.id}
+    )
+    user_token = user_source_user_fixture["user_source_user_token"]
+
+    response = api_client.post(
+        url, {}, format="json", HTTP_AUTHORIZATION=f"JWT {user_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert [e["id"] for e in response_json["elements"]] == [element.id]
+    assert [d["id"] for d in response_json["data_sources"]] == [data_source.id]
+    assert response_json["workflow_actions"] == []
+    assert response_json["data_source_contents"] == {str(data_source.id): {}}
+    etag = response["ETag"]
+
+    response = api_client.post(
+        url,
+        {},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {user_token}",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert not response.content
+
+    with patch(
+        "baserow.contrib.builder.api.domains.public_views.DataSourceService"
+        ".dispatch_page_data_sources",
+        return_value={data_source.id: {"id": 2}},
+    ):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {user_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["data_source_contents"] == {str(data_source.id): {"id": 2}}
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_public_page_bootstrap_view_etag_depends_on_role(
+    api_client, data_fixture, user_source_user_fixture
+):
+    page = user_source_user_fixture["page"]
+    data_fixture.create_builder_heading_element(
+        page=page,
+        visibility=Element.VISIBILITY_TYPES.LOGGED_IN,
+        roles=["foo_user_role"],
+        role_type=Element.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+    )
+    builder = page.builder
+    builder.workspace = None
+    builder.save()
+    data_fixture.create_builder_custom_domain(published_to=builder)
+    user_source = builder.user_sources.first().specific
+    other_user = user_source.table.get_model().objects.create(
+        **{
+            f"field_{user_source.email_field_id}": "other@bar.com",
+            f"field_{user_source.name_field_id}": "Other User",
+            f"field_{user_source.role_field_id}": "other_role",
+        }
+    )
+    other_user_token = (
+        UserSourceUser(
+            user_source,
+            None,
+            other_user.id,
+            "Other User",
+            "other@bar.com",
+            role="other_role",
+        )
+        .get_refresh_token()
+        .access_token
+    )
+    tokens = {
+        "foo_user_role": user_source_user_fixture["user_source_user_token"],
+        "other_role": other_user_token,
+    }
+
+    url = reverse(
+        "api:builder:domains:public_page_bootstrap", kwargs={"page_id": page.id}
+    )
+    responses = {
+        role: api_client.post(url, {}, format="json", HTTP_AUTHORIZATION=f"JWT {token}")
+        for role, token in tokens.items()
+    }
+
+    assert len(responses["foo_user_role"].json()["elements"]) == 1
+    assert responses["other_role"].json()["elements"] == []
+    assert responses["foo_user_role"]["ETag"] != responses["other_role"]["ETag"]
+
+    # The ETag of one role must not result in a 304 response for the other role.
+    response = api_client.post(
+        url,
+        {},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {tokens['foo_user_role']}",
+        HTTP_IF_NONE_MATCH=responses["other_role"]["ETag"],
+    )
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_public_page_bootstrap_view_page_does_not_exist(api_client):
+    url = reverse("api:builder:domains:public_page_bootstrap", kwargs={"page_id": 0})
+
+    response = api_client.post(url, {}, format="json")
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_PAGE_DOES_NOT_EXIST"
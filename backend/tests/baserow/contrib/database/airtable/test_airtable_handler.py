@@ -5,8 +5,10 @@ from unittest.mock import patch
 
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
+from django.test.utils import override_settings
 
 import pytest
+import requests
 import responses
 from rest_framework import serializers
 
@@ -183,6 +185,32 @@ def test_extract_schema():
     assert tables["tbl7glLIGtH8C8zGCzb"]["id"] == "tbl7glLIGtH8C8zGCzb"
 
 
+@pytest.mark.django_db
+@responses.activate
+@override_settings(BASEROW_AIRTABLE_IMPORT_MAX_CONCURRENT_REQUESTS=3)
+def test_fetch_json_concurrently():
+    for index in range(5):
+        responses.add(
+            responses.GET,
+            f"https://airtable.com/v0.3/view/viw{index}/readData",
+            status=200,
+            json={"data": {"id": f"viw{index}"}},
+        )
+
+    def fetch(view_id, stream):
+        assert stream is False
+        return requests.get(f"https://airtable.com/v0.3/view/{view_id}/readData")
+
+    results = AirtableHandler.fetch_json_concurrently(
+        fetch, [{"view_id": f"viw{index}"} for index in range(5)]
+    )
+
+    assert [result["data"]["id"] for result in results] == [
+        f"viw{index}" for index in range(5)
+    ]
+    assert len(responses.calls) == 5
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_to_baserow_database_export():
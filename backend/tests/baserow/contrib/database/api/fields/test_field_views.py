@@ -7,12 +7,14 @@ from rest_framework.status import (
     HTTP_200_OK,
     HTTP_202_ACCEPTED,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
 )
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, NumberField, TextField
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.tokens.handler import TokenHandler
@@ -135,6 +137,31 @@ def test_list_fields(api_client, data_fixture):
     assert response.json()["error"] == "ERROR_TABLE_DOES_NOT_EXIST"
 
 
+@pytest.mark.django_db
+def test_list_fields_conditional_request(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Old")
+
+    url = reverse("api:database:fields:list", kwargs={"table_id": table.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    FieldHandler().update_field(user, field, name="New")
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()[0]["name"] == "New"
+    assert response["ETag"] != etag
+
+
 @pytest.mark.django_db
 def test_list_read_only_field_types(api_client, data_fixture):
     user, jwt_token = data_fixture.create_user_and_token(
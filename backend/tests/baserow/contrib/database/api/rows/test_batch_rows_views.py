@@ -19,6 +19,7 @@ from rest_framework.status import (
     HTTP_409_CONFLICT,
 )
 
+from baserow.contrib.database.api.rows.serializers import row_serializer_class_cache
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
 from baserow.contrib.database.tokens.handler import TokenHandler
@@ -941,6 +942,9 @@ def test_batch_create_rows_num_of_queries(api_client, data_fixture):
 
     url = reverse("api:database:rows:batch", kwargs={"table_id": table_b.id})
 
+    # Both requests must generate the row serializer classes, so that only the
+    # number of rows differs between them.
+    row_serializer_class_cache.clear()
     with CaptureQueriesContext(connection) as create_one_row_ctx:
         request_body = {
             "items": [
@@ -967,6 +971,7 @@ def test_batch_create_rows_num_of_queries(api_client, data_fixture):
             HTTP_AUTHORIZATION=f"JWT {jwt_token}",
         )
 
+    row_serializer_class_cache.clear()
     with CaptureQueriesContext(connection) as create_multiple_rows_ctx:
         request_body2 = {
             "items": [
@@ -2230,6 +2235,9 @@ def test_batch_update_rows_num_of_queries(api_client, data_fixture):
     url = reverse("api:database:rows:batch", kwargs={"table_id": table_b.id})
 
     related_link_field = link_field.link_row_related_field
+    # Both requests must generate the row serializer classes, so that only the
+    # number of rows differs between them.
+    row_serializer_class_cache.clear()
     with CaptureQueriesContext(connection) as update_one_row_ctx:
         request_body = {
             "items": [
@@ -2258,6 +2266,7 @@ def test_batch_update_rows_num_of_queries(api_client, data_fixture):
             HTTP_AUTHORIZATION=f"JWT {jwt_token}",
         )
 
+    row_serializer_class_cache.clear()
     with CaptureQueriesContext(connection) as update_multiple_rows_ctx:
         request_body2 = {
             "items": [
@@ -5,6 +5,7 @@ from pytest_unordered import unordered
 from rest_framework import serializers
 
 from baserow.contrib.database.api.rows.serializers import (
+    FastRowListSerializer,
     RowSerializer,
     get_example_row_serializer_class,
     get_row_serializer_class,
@@ -654,3 +655,70 @@ def test_get_table_serializer_single_select_default(data_fixture):
     serializer_instance = serializer_class(data={"status": None})
     assert serializer_instance.is_valid()
     assert serializer_instance.data["status"] is None
+
+
+@pytest.mark.django_db
+def test_get_row_serializer_class_is_cached(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    number_field = data_fixture.create_number_field(table=table, name="Count")
+    model = table.get_model()
+
+    serializer_class = get_row_serializer_class(model, RowSerializer, is_response=True)
+    assert (
+        get_row_serializer_class(table.get_model(), RowSerializer, is_response=True)
+        is serializer_class
+    )
+    assert (
+        get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=True
+        )
+        is not serializer_class
+    )
+    assert (
+        get_row_serializer_class(
+            model, RowSerializer, is_response=True, field_ids=[text_field.id]
+        )
+        is not serializer_class
+    )
+    assert get_row_serializer_class(model, RowSerializer) is not serializer_class
+    # The kwargs per field can't be part of the cache key.
+    field_kwargs = {number_field.db_column: {"required": False}}
+    assert get_row_serializer_class(
+        model, field_kwargs=field_kwargs
+    ) is not get_row_serializer_class(model, field_kwargs=field_kwargs)
+
+    FieldHandler().update_field(user, number_field, new_type_name="text")
+    model = table.get_model()
+    updated_serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True
+    )
+    assert updated_serializer_class is not serializer_class
+    assert isinstance(
+        updated_serializer_class._declared_fields[number_field.db_column],
+        serializers.CharField,
+    )
+
+
+@pytest.mark.django_db
+def test_fast_row_list_serializer_matches_regular_serializer(data_fixture):
+    table, user, row, _, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    rows = list(model.objects.all().enhance_by_fields())
+
+    for user_field_names in [False, True]:
+        serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+        fast_serializer_class = get_row_serializer_class(
+            model,
+            RowSerializer,
+            is_response=True,
+            user_field_names=user_field_names,
+            use_fast_list_serializer=True,
+        )
+        fast_serializer = fast_serializer_class(rows, many=True)
+
+        assert isinstance(fast_serializer, FastRowListSerializer)
+        assert fast_serializer.data == serializer_class(rows, many=True).data
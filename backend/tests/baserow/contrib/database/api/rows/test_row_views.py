@@ -15,6 +15,7 @@ from pytest_unordered import unordered
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
@@ -489,6 +490,115 @@ def test_list_rows_order_by_type(api_client, data_fixture):
     assert response_json["results"][2]["id"] == row_1.id
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {date_field.db_column: None if i % 3 == 0 else f"2024-01-0{i % 4 + 1}"}
+            for i in range(10)
+        ],
+    )
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    for order_by in [
+        {},
+        {"order_by": f"field_{date_field.id}"},
+        {"order_by": f"-field_{date_field.id}"},
+    ]:
+        response = api_client.get(
+            url, {"size": 100, **order_by}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+        )
+        expected_ids = [row["id"] for row in response.json()["results"]]
+
+        ids = []
+        cursor = ""
+        while cursor is not None:
+            response = api_client.get(
+                url,
+                {"size": 3, "cursor": cursor, **order_by},
+                HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            )
+            response_json = response.json()
+            assert response.status_code == HTTP_200_OK, response_json
+            ids += [row["id"] for row in response_json["results"]]
+            cursor = response_json["next_cursor"]
+
+        assert ids == expected_ids
+
+    response = api_client.get(
+        f"{url}?size=201&cursor=", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
+@pytest.mark.django_db
+def test_list_rows_conditional_request(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    linked_table = data_fixture.create_database_table(database=table.database)
+    linked_primary = data_fixture.create_text_field(table=linked_table, primary=True)
+    text_field = data_fixture.create_text_field(table=table)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=linked_table
+    )
+    linked_row = RowHandler().create_row(
+        user, linked_table, {linked_primary.db_column: "a"}
+    )
+    row = RowHandler().create_row(
+        user, table, {text_field.db_column: "x", link_field.db_column: [linked_row.id]}
+    )
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(
+            url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+        )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert not response.content
+    # The rows must not be queried to answer a conditional request.
+    assert not any(
+        table.get_database_table_name() in query["sql"]
+        for query in captured.captured_queries
+    )
+
+    # Other query parameters result in a different response.
+    response = api_client.get(
+        url, {"size": 1}, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response["ETag"] != etag
+
+    # Changing the primary value of a linked row changes the response.
+    RowHandler().update_row_by_id(
+        user, linked_table, linked_row.id, {linked_primary.db_column: "b"}
+    )
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["results"][0][link_field.db_column][0]["value"] == "b"
+    etag = response["ETag"]
+
+    RowHandler().update_row_by_id(user, table, row.id, {text_field.db_column: "y"})
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["results"][0][text_field.db_column] == "y"
+    assert response["ETag"] != etag
+
+
 @pytest.mark.django_db
 def test_list_rows_adhoc_filtering_query_param_null_character(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -4,7 +4,9 @@ from typing import Any, Dict, List
 from unittest.mock import patch
 
 from django.core.cache import cache
+from django.db import connection
 from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from pytest_unordered import unordered
@@ -154,7 +156,7 @@ def test_list_rows(api_client, data_fixture):
     assert response_json["count"] == 4
     assert response_json["results"][0]["id"] == row_3.id
 
-    sort = data_fixture.create_view_sort(view=grid, field=text_field, order="ASC")
+    sort = ViewHandler().create_sort(user, grid, text_field, "ASC")
     url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
     response = api_client.get(url, **{"HTTP_AUTHORIZATION": f"JWT {token}"})
     response_json = response.json()
@@ -164,11 +166,9 @@ def test_list_rows(api_client, data_fixture):
     assert response_json["results"][1]["id"] == row_3.id
     assert response_json["results"][2]["id"] == row_4.id
     assert response_json["results"][3]["id"] == row_2.id
-    sort.delete()
+    ViewHandler().delete_sort(user, sort)
 
-    view_filter = data_fixture.create_view_filter(
-        view=grid, field=text_field, value="Green"
-    )
+    view_filter = ViewHandler().create_filter(user, grid, text_field, "equal", "Green")
     url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
     response = api_client.get(url, **{"HTTP_AUTHORIZATION": f"JWT {token}"})
     response_json = response.json()
@@ -176,7 +176,7 @@ def test_list_rows(api_client, data_fixture):
     assert response_json["count"] == 1
     assert len(response_json["results"]) == 1
     assert response_json["results"][0]["id"] == row_1.id
-    view_filter.delete()
+    ViewHandler().delete_filter(user, view_filter)
 
     url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
     response = api_client.get(
@@ -507,6 +507,109 @@ def test_list_rows_include_field_options(api_client, data_fixture):
     assert "filters_disabled" not in response_json
 
 
+@pytest.mark.django_db
+def test_list_rows_warm_cache_does_not_query_view_metadata(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    view_handler = ViewHandler()
+    view_handler.create_filter(user, grid, text_field, "contains", "a")
+    view_handler.create_sort(user, grid, number_field, "DESC")
+    view_handler.create_group_by(user, grid, text_field, "ASC", 200)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: "a", number_field.db_column: 1},
+            {text_field.db_column: "a", number_field.db_column: 2},
+            {text_field.db_column: "b", number_field.db_column: 3},
+        ],
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    metadata_tables = [
+        "database_viewfilter",
+        "database_viewfiltergroup",
+        "database_viewsort",
+        "database_viewgroupby",
+        "database_gridviewfieldoptions",
+    ]
+
+    responses = []
+    for _ in range(2):
+        with CaptureQueriesContext(connection) as captured:
+            response = api_client.get(
+                url,
+                {"include": "field_options"},
+                HTTP_AUTHORIZATION=f"JWT {token}",
+            )
+        assert response.status_code == HTTP_200_OK
+        responses.append(response.json())
+
+    assert responses[0] == responses[1]
+    assert [row["id"] for row in responses[1]["results"]] == [2, 1]
+    assert list(responses[1]["field_options"].keys()) == unordered(
+        [str(text_field.id), str(number_field.id)]
+    )
+    assert responses[1]["group_by_metadata"] == {
+        text_field.db_column: [{text_field.db_column: "a", "count": 2}]
+    }
+    assert not [
+        query["sql"]
+        for query in captured.captured_queries
+        if any(f'"{name}"' in query["sql"] for name in metadata_tables)
+    ]
+
+
+@pytest.mark.django_db
+def test_list_rows_view_metadata_cache_is_invalidated(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user, table, [{text_field.db_column: "a"}, {text_field.db_column: "b"}]
+    )
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+
+    def list_rows():
+        response = api_client.get(
+            url, {"include": "field_options"}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        return response.json()
+
+    assert len(list_rows()["results"]) == 2
+
+    view_filter = ViewHandler().create_filter(user, grid, text_field, "equal", "a")
+    assert [row["id"] for row in list_rows()["results"]] == [1]
+
+    ViewHandler().update_filter(user, view_filter, value="b")
+    assert [row["id"] for row in list_rows()["results"]] == [2]
+
+    ViewHandler().update_view(user, grid, filters_disabled=True)
+    assert len(list_rows()["results"]) == 2
+
+    ViewHandler().update_view(user, grid, filters_disabled=False)
+    ViewHandler().delete_filter(user, view_filter)
+    view_sort = ViewHandler().create_sort(user, grid, text_field, "DESC")
+    assert [row["id"] for row in list_rows()["results"]] == [2, 1]
+
+    ViewHandler().delete_sort(user, view_sort)
+    assert [row["id"] for row in list_rows()["results"]] == [1, 2]
+
+    ViewHandler().update_field_options(
+        user=user, view=grid, field_options={text_field.id: {"width": 300}}
+    )
+    assert list_rows()["field_options"][str(text_field.id)]["width"] == 300
+
+    # Field changes bump the table version, which is part of the cache key.
+    number_field = FieldHandler().create_field(user, table, "number", name="Number")
+    assert str(number_field.id) in list_rows()["field_options"]
+
+
 @pytest.mark.django_db
 def test_list_rows_include_row_metadata(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -5321,3 +5424,123 @@ def test_list_rows_with_page_and_invalid_numbers(api_client, data_fixture):
         assert response_json["results"][0][f"field_{text_field.id}"] == "0"
         assert response_json["results"][99][f"field_{text_field.id}"] == "99"
         assert count_calls == 0  # count is not called again
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=multiple_select_field, value="A")
+    option_b = data_fixture.create_select_option(field=multiple_select_field, value="B")
+    grid = data_fixture.create_grid_view(table=table)
+
+    texts = ["b", None, "a", "b", None, "c"]
+    numbers = [1, None, 2, 2]
+    options = [[], [option_b.id], [option_a.id, option_b.id], [option_a.id]]
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: texts[i % len(texts)],
+                number_field.db_column: numbers[i % len(numbers)],
+                multiple_select_field.db_column: options[i % len(options)],
+            }
+            for i in range(25)
+        ],
+    )
+
+    view_handler = ViewHandler()
+    view_handler.create_sort(user, grid, text_field, "asc")
+    view_handler.create_sort(user, grid, multiple_select_field, "desc")
+    view_handler.create_sort(user, grid, number_field, "desc")
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(f"{url}?size=200", HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    expected_ids = [row["id"] for row in response.json()["results"]]
+    assert len(expected_ids) == 25
+
+    ids = []
+    cursor = ""
+    pages = 0
+    while cursor is not None:
+        response = api_client.get(
+            f"{url}?size=4&cursor={cursor}", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK, response_json
+        assert "count" not in response_json
+        assert len(response_json["results"]) <= 4
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+        pages += 1
+
+    assert pages == 7
+    assert ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_list_rows_with_invalid_cursor(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(user, table, [{}, {}, {}])
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        f"{url}?size=2&cursor=invalid", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_PAGINATION_CURSOR"
+
+    response = api_client.get(
+        f"{url}?size=2&cursor=", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    cursor = response.json()["next_cursor"]
+
+    # The cursor can't be used anymore when the ordering changes.
+    ViewHandler().create_sort(user, grid, text_field, "desc")
+    response = api_client.get(
+        f"{url}?size=2&cursor={cursor}", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_PAGINATION_CURSOR"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_of_another_sort_field(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    other_text_field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: str(i), other_text_field.db_column: str(9 - i)}
+            for i in range(5)
+        ],
+    )
+    sort = ViewHandler().create_sort(user, grid, text_field, "asc")
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        f"{url}?size=2&cursor=", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    cursor = response.json()["next_cursor"]
+
+    # The ordering has the same shape, but sorts on another field, so the values
+    # in the cursor can't be compared anymore.
+    ViewHandler().delete_sort(user, sort)
+    ViewHandler().create_sort(user, grid, other_text_field, "asc")
+    response = api_client.get(
+        f"{url}?size=2&cursor={cursor}", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_PAGINATION_CURSOR"
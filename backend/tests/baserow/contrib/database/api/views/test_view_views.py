@@ -11,6 +11,7 @@ import pytest
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
@@ -300,6 +301,41 @@ def test_get_view(api_client, data_fixture):
     assert response.json()["error"] == "ERROR_VIEW_DOES_NOT_EXIST"
 
 
+@pytest.mark.django_db
+def test_list_and_get_views_conditional_request(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+
+    list_url = reverse("api:database:views:list", kwargs={"table_id": table.id})
+    item_url = reverse("api:database:views:item", kwargs={"view_id": view.id})
+    for url in [list_url, item_url]:
+        response = api_client.get(
+            url, {"include": "filters"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        etag = response["ETag"]
+
+        response = api_client.get(
+            url,
+            {"include": "filters"},
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+
+        ViewHandler().create_filter(user, view, field, "equal", "value")
+        response = api_client.get(
+            url,
+            {"include": "filters"},
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == HTTP_200_OK
+        assert response["ETag"] != etag
+
+
 @pytest.mark.django_db
 def test_delete_view(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
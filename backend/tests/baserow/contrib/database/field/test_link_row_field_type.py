@@ -592,6 +592,90 @@ def test_link_row_enhance_queryset(data_fixture, django_assert_num_queries):
             list(getattr(row, f"field_{link_row_field.id}").all())
 
 
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_link_row_enhance_queryset_display_values_only(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    example_table = data_fixture.create_database_table(database=database)
+    customers_table = data_fixture.create_database_table(database=database)
+    customers_primary = data_fixture.create_text_field(
+        table=customers_table, primary=True
+    )
+    cars_table = data_fixture.create_database_table(database=database)
+    cars_primary = data_fixture.create_text_field(table=cars_table, primary=True)
+
+    field_handler = FieldHandler()
+    row_handler = RowHandler()
+    customer_field_1 = field_handler.create_field(
+        user, example_table, "link_row", name="C1", link_row_table=customers_table
+    )
+    customer_field_2 = field_handler.create_field(
+        user, example_table, "link_row", name="C2", link_row_table=customers_table
+    )
+    car_field = field_handler.create_field(
+        user, example_table, "link_row", name="Car", link_row_table=cars_table
+    )
+
+    customer_1, customer_2 = row_handler.force_create_rows(
+        user,
+        customers_table,
+        [
+            {customers_primary.db_column: "John"},
+            {customers_primary.db_column: "Jane"},
+        ],
+    ).created_rows
+    car = row_handler.force_create_row(
+        user, cars_table, {cars_primary.db_column: "Volvo"}
+    )
+    row_handler.force_create_rows(
+        user,
+        example_table,
+        [
+            {
+                customer_field_1.db_column: [customer_2.id, customer_1.id],
+                customer_field_2.db_column: [customer_1.id],
+                car_field.db_column: [car.id],
+            },
+            {customer_field_1.db_column: [customer_2.id]},
+        ],
+    )
+
+    def get_display_values():
+        rows = example_table.get_model().objects.all()
+        rows = list(rows.enhance_by_fields(link_row_display_values_only=True))
+        return [
+            [
+                [str(related) for related in getattr(row, field.db_column).all()]
+                for field in [customer_field_1, customer_field_2, car_field]
+            ]
+            for row in rows
+        ]
+
+    expected = [[["John", "Jane"], ["John"], ["Volvo"]], [["Jane"], [], []]]
+
+    # The rows, the relations of all link row fields and the related rows of both
+    # related tables.
+    with django_assert_num_queries(4):
+        assert get_display_values() == expected
+
+    # The display values of the related rows are now cached.
+    with django_assert_num_queries(2):
+        assert get_display_values() == expected
+
+    row_handler.update_row_by_id(
+        user, customers_table, customer_1.id, {customers_primary.db_column: "Jack"}
+    )
+
+    with django_assert_num_queries(3):
+        assert get_display_values() == [
+            [["Jack", "Jane"], ["Jack"], ["Volvo"]],
+            [["Jane"], [], []],
+        ]
+
+
 @pytest.mark.django_db
 @pytest.mark.field_link_row
 def test_link_row_field_type_api_views(api_client, data_fixture):
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 
 import pytest
 from rest_framework import serializers
@@ -376,3 +377,31 @@ def test_number_field_serializer_default_with_required(data_fixture):
     assert serializer_field_without_default.required is True
     assert serializer_field_without_default.allow_null is False
     assert serializer_field_without_default.default is serializers.empty
+
+
+@pytest.mark.django_db
+def test_number_field_prepare_value_for_db_in_bulk(data_fixture):
+    field = data_fixture.create_number_field(
+        number_decimal_places=2, number_negative=False
+    )
+    field_type = field_type_registry.get_by_model(field)
+
+    prepared = field_type.prepare_value_for_db_in_bulk(
+        field,
+        {0: "1.50", 1: "", 2: "1.50", 3: 2, 4: None, 5: "-1", 6: "abc", 7: "-1"},
+        continue_on_error=True,
+    )
+
+    assert prepared[0] == Decimal("1.50")
+    assert prepared[1] is None
+    assert prepared[2] == Decimal("1.50")
+    assert prepared[3] == Decimal("2")
+    assert prepared[4] is None
+    assert isinstance(prepared[5], ValidationError)
+    assert prepared[5].code == "negative_not_allowed"
+    assert isinstance(prepared[6], ValidationError)
+    assert prepared[6].code == "invalid"
+    assert isinstance(prepared[7], ValidationError)
+
+    with pytest.raises(ValidationError):
+        field_type.prepare_value_for_db_in_bulk(field, {0: "1", 1: "abc"})
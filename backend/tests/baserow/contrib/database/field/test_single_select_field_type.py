@@ -745,6 +745,26 @@ def test_single_select_field_type_api_row_views(api_client, data_fixture):
     assert SelectOption.objects.all().count() == 3
 
 
+@pytest.mark.django_db
+def test_single_select_field_type_prepare_value_for_db_in_bulk_invalid_type(
+    data_fixture,
+):
+    field = data_fixture.create_single_select_field()
+    option_a = data_fixture.create_select_option(field=field, value="A")
+
+    prepared = SingleSelectFieldType().prepare_value_for_db_in_bulk(
+        field,
+        {0: "A", 1: ["A"], 2: option_a.id, 3: None, 4: "Unknown"},
+        continue_on_error=True,
+    )
+
+    assert prepared[0] == option_a
+    assert isinstance(prepared[1], ValidationError)
+    assert prepared[2] == option_a
+    assert prepared[3] is None
+    assert isinstance(prepared[4], ValidationError)
+
+
 @pytest.mark.django_db
 def test_single_select_field_type_get_order(data_fixture):
     user = data_fixture.create_user()
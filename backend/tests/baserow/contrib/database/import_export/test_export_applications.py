@@ -324,3 +324,89 @@ def test_export_with_rows_limit(
                 db_data = json.loads(db_data_file.read())
 
             assert len(db_data["tables"][0]["rows"]) == 1
+
+
+@pytest.mark.import_export_workspace
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE=2)
+def test_export_and_import_with_rows_streamed_to_files_zip(
+    data_fixture,
+    api_client,
+    tmpdir,
+    settings,
+    use_tmp_media_root,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text_field", order=0)
+    field_name = f"field_{text_field.id}"
+
+    data_fixture.create_import_export_trusted_source()
+
+    RowHandler().force_create_rows(
+        user=user,
+        table=table,
+        rows_values=[{text_field.id: f"row #{i}"} for i in range(5)],
+    )
+
+    resource = ImportExportHandler().export_workspace_applications(
+        applications=[table.database],
+        import_export_config=ImportExportConfig(
+            include_permission_data=False,
+            reduce_disk_space_usage=True,
+            only_structure=False,
+            stream_rows_to_files_zip=True,
+        ),
+    )
+
+    file_path = tmpdir.join(
+        settings.EXPORT_FILES_DIRECTORY, resource.get_archive_name()
+    )
+    assert file_path.isfile()
+
+    with zipfile.ZipFile(file_path, "r") as zip_ref:
+        with zip_ref.open(MANIFEST_NAME) as json_file:
+            json_data = json.load(json_file)
+            database_export = json_data["applications"]["database"]["items"][0]
+
+            db_export_path = database_export["files"]["schema"]
+            with zip_ref.open(db_export_path) as db_data_file:
+                db_data = json.loads(db_data_file.read())
+
+        serialized_table = db_data["tables"][0]
+        assert serialized_table["rows"] == []
+        assert serialized_table["rows_count"] == 5
+        rows_file = serialized_table["rows_file"]
+        assert rows_file in json_data["checksums"]
+        assert rows_file.startswith(f"database_table_{table.id}_rows_")
+
+        with zip_ref.open(rows_file) as rows_data_file:
+            serialized_rows = [json.loads(line) for line in rows_data_file]
+
+        assert [row[field_name] for row in serialized_rows] == [
+            f"row #{i}" for i in range(5)
+        ]
+
+        with open(file_path, "rb") as export_file:
+            content = export_file.read()
+
+    import_resource = data_fixture.create_import_export_resource(
+        created_by=user, original_name="export.zip", is_valid=True
+    )
+    data_fixture.create_import_export_resource_file(
+        resource=import_resource, content=content
+    )
+
+    imported_database = ImportExportHandler().import_workspace_applications(
+        user=user, workspace=workspace, resource=import_resource
+    )[0]
+
+    imported_table = imported_database.table_set.get()
+    imported_field = imported_table.field_set.get()
+    imported_model = imported_table.get_model()
+    assert [
+        getattr(row, f"field_{imported_field.id}")
+        for row in imported_model.objects.order_by("id")
+    ] == [f"row #{i}" for i in range(5)]
@@ -1911,3 +1911,127 @@ def test_update_rows_only_create_or_delete_differences_for_m2m_fields(data_fixtu
     assert set(multiselect_through.objects.values_list("id", flat=True)) == {2}
     assert set(multicollab_through.objects.values_list("id", flat=True)) == {2}
     assert set(link_through.objects.values_list("id", flat=True)) == {3}
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_force_update_rows_stream(send_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    speed_field = data_fixture.create_number_field(table=table, name="Max speed")
+    handler = RowHandler()
+
+    rows = handler.create_rows(user=user, table=table, rows_values=[{}, {}, {}])
+    rows = rows.created_rows
+
+    def rows_values():
+        yield {"id": rows[0].id, name_field.db_column: "Tesla"}
+        yield {"id": rows[1].id, speed_field.db_column: 240}
+        yield {"id": rows[2].id, name_field.db_column: "Audi"}
+        # The same row again, so the pending update of the first row is applied
+        # before this one.
+        yield {"id": rows[0].id, name_field.db_column: "Volvo"}
+        yield {"id": rows[1].id, name_field.db_column: "BMW"}
+
+    stats = handler.force_update_rows_stream(user, table, rows_values(), batch_size=2)
+
+    assert stats.rows_updated == 5
+    # [row 0, row 2] reach the batch size, [row 1 speed] is updated because row 1
+    # is streamed again, and then [row 0, row 1] reach the batch size.
+    assert stats.batches == 3
+    assert send_mock.call_count == 3
+    assert stats.updated_field_ids == {name_field.id, speed_field.id}
+    assert stats.rows_per_second > 0
+
+    updated = {row.id: row for row in table.get_model().objects.all()}
+    assert getattr(updated[rows[0].id], name_field.db_column) == "Volvo"
+    assert getattr(updated[rows[1].id], name_field.db_column) == "BMW"
+    assert getattr(updated[rows[1].id], speed_field.db_column) == 240
+    assert getattr(updated[rows[2].id], name_field.db_column) == "Audi"
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.rows.handler.SearchHandler.schedule_update_search_data"
+)
+def test_force_update_rows_stream_updates_search_data_when_stream_fails(
+    schedule_update_search_data_mock, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    handler = RowHandler()
+
+    rows = handler.create_rows(user=user, table=table, rows_values=[{}, {}, {}])
+    rows = rows.created_rows
+    schedule_update_search_data_mock.reset_mock()
+
+    def rows_values():
+        yield {"id": rows[0].id, name_field.db_column: "Tesla"}
+        yield {"id": rows[1].id, name_field.db_column: "Audi"}
+        yield {"id": rows[2].id, name_field.db_column: "Volvo"}
+        raise ValueError("Stream failed")
+
+    with pytest.raises(ValueError):
+        handler.force_update_rows_stream(user, table, rows_values(), batch_size=2)
+
+    # The first batch has been committed, so its search data must be updated.
+    updated = {row.id: row for row in table.get_model().objects.all()}
+    assert getattr(updated[rows[0].id], name_field.db_column) == "Tesla"
+    assert getattr(updated[rows[1].id], name_field.db_column) == "Audi"
+    assert getattr(updated[rows[2].id], name_field.db_column) is None
+    schedule_update_search_data_mock.assert_called_once()
+    assert schedule_update_search_data_mock.call_args.kwargs["row_ids"] == [
+        rows[0].id,
+        rows[1].id,
+    ]
+
+
+@pytest.mark.django_db
+def test_update_rows_stream(data_fixture):
+    user = data_fixture.create_user()
+    other_user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    handler = RowHandler()
+
+    rows = handler.create_rows(user=user, table=table, rows_values=[{}, {}, {}])
+    rows = rows.created_rows
+
+    def rows_values():
+        for row, name in zip(rows, ["Tesla", "Audi", "Volvo"]):
+            yield {"id": row.id, name_field.db_column: name}
+
+    with pytest.raises(UserNotInWorkspace):
+        handler.update_rows_stream(other_user, table, rows_values(), batch_size=2)
+
+    with patch.object(
+        RowHandler,
+        "_check_write_fields_values_permissions",
+        wraps=handler._check_write_fields_values_permissions,
+    ) as check_permissions_mock:
+        stats = handler.update_rows_stream(user, table, rows_values(), batch_size=2)
+
+    assert stats.rows_updated == 3
+    assert stats.batches == 2
+    # The permissions to write the values are checked for every batch.
+    assert check_permissions_mock.call_count == 2
+    updated = table.get_model().objects.order_by("id")
+    assert [getattr(row, name_field.db_column) for row in updated] == [
+        "Tesla",
+        "Audi",
+        "Volvo",
+    ]
+
+
+@pytest.mark.django_db
+def test_force_update_rows_stream_row_does_not_exist(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+
+    with pytest.raises(RowDoesNotExist):
+        RowHandler().force_update_rows_stream(
+            user, table, iter([{"id": 999, name_field.db_column: "Tesla"}])
+        )
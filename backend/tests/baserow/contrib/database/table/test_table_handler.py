@@ -749,6 +749,106 @@ def test_duplicate_table_after_link_row_field_moved_to_another_table(data_fixtur
         pytest.fail("Duplicating table failed: %s" % exc)
 
 
+@pytest.mark.django_db
+def test_duplicate_table_copies_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    related_primary = data_fixture.create_text_field(table=related_table, primary=True)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=single_select_field, value="A")
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_b = data_fixture.create_select_option(field=multiple_select_field, value="B")
+    field_handler = FieldHandler()
+    link_field = field_handler.create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+    self_link_field = field_handler.create_field(
+        user, table, "link_row", name="Self", link_row_table=table
+    )
+    created_by_field = field_handler.create_field(
+        user, table, "created_by", name="Created by"
+    )
+    last_modified_by_field = field_handler.create_field(
+        user, table, "last_modified_by", name="Last modified by"
+    )
+    collaborators_field = field_handler.create_field(
+        user, table, "multiple_collaborators", name="Collaborators"
+    )
+
+    row_handler = RowHandler()
+    related_1, related_2 = row_handler.force_create_rows(
+        user,
+        related_table,
+        [{related_primary.db_column: "R1"}, {related_primary.db_column: "R2"}],
+    ).created_rows
+    row_1, row_2, trashed_row = row_handler.force_create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: "Row 1",
+                single_select_field.db_column: option_a.id,
+                multiple_select_field.db_column: [option_b.id],
+                link_field.db_column: [related_2.id, related_1.id],
+                collaborators_field.db_column: [{"id": user.id}],
+            },
+            {text_field.db_column: "Row 2"},
+            {text_field.db_column: "Trashed"},
+        ],
+    ).created_rows
+    row_handler.force_update_rows(
+        user, table, [{"id": row_2.id, self_link_field.db_column: [row_1.id]}]
+    )
+    row_handler.delete_row(user, table, trashed_row)
+    row_handler.delete_row(user, related_table, related_1)
+
+    with patch(
+        "baserow.contrib.database.application_types.DatabaseApplicationType."
+        "_export_table_rows_serialized"
+    ) as mock_export_table_rows_serialized:
+        duplicated_table = TableHandler().duplicate_table(user, table)
+        mock_export_table_rows_serialized.assert_not_called()
+
+    fields = {f.name: f.specific for f in duplicated_table.field_set.all()}
+    new_option_a = fields[single_select_field.name].select_options.get()
+    new_option_b = fields[multiple_select_field.name].select_options.get()
+    assert new_option_a.id != option_a.id
+
+    model = duplicated_table.get_model()
+    new_row_1, new_row_2 = model.objects.all().order_by("id")
+    assert (new_row_1.id, new_row_2.id) == (row_1.id, row_2.id)
+    assert getattr(new_row_1, fields[text_field.name].db_column) == "Row 1"
+    assert getattr(new_row_1, fields[single_select_field.name].db_column) == (
+        new_option_a
+    )
+    assert list(
+        getattr(new_row_1, fields[multiple_select_field.name].db_column).all()
+    ) == [new_option_b]
+    # The relation to the trashed row is not copied.
+    assert [
+        r.id for r in getattr(new_row_1, fields[link_field.name].db_column).all()
+    ] == [related_2.id]
+    assert [
+        r.id for r in getattr(new_row_2, fields[self_link_field.name].db_column).all()
+    ] == [new_row_1.id]
+    assert new_row_1.created_on == row_1.created_on
+    assert new_row_1.trashed is False
+    assert new_row_1.created_by_id == user.id
+    assert new_row_2.last_modified_by_id == user.id
+    assert getattr(new_row_1, fields[created_by_field.name].db_column) == user
+    assert getattr(new_row_2, fields[last_modified_by_field.name].db_column) == user
+    assert list(
+        getattr(new_row_1, fields[collaborators_field.name].db_column).all()
+    ) == [user]
+
+    # The sequence must be reset, so that new rows can be created.
+    new_row = row_handler.force_create_row(user, duplicated_table, {})
+    assert new_row.id > new_row_2.id
+
+
 @pytest.mark.django_db()
 def test_create_last_modified_by_field(data_fixture):
     user = data_fixture.create_user()
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.conf import settings
 from django.db import connection
+from django.test import override_settings
 from django.urls import reverse
 
 import pytest
@@ -21,8 +22,9 @@ from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.trash.models import TrashedRows
+from baserow.contrib.database.trash.trash_types import RowTrashableItemType
 from baserow.contrib.database.views.handler import ViewHandler
-from baserow.core.exceptions import PermissionDenied
+from baserow.core.exceptions import PermissionDenied, TrashItemDoesNotExist
 from baserow.core.models import TrashEntry
 from baserow.core.trash.exceptions import (
     CannotRestoreChildBeforeParent,
@@ -68,7 +70,7 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    with django_assert_num_queries(14):
+    with django_assert_num_queries(16):
         TrashHandler.permanently_delete_marked_trash()
 
     row_2 = handler.create_row(user=user, table=table)
@@ -83,18 +85,10 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    # We only want 8 more queries when deleting 2 rows instead of 1 compared to
-    # above:
-    # 1. An extra query to open the second trash entries savepoint
-    # 2. An extra query to lookup the second trash entry
-    # 3. A query to lookup the extra row we are deleting
-    # 4. A query to delete said row
-    # 5. A query to delete it's trash entry.
-    # 6. A query to delete any related row comments.
-    # 7. An extra query to close the second trash entries savepoint
-    # If we weren't caching the table models an extra number of queries would be first
-    # performed to lookup the table information which breaks this assertion.
-    with django_assert_num_queries(21):
+    # The rows of the same table are deleted in bulk, so deleting 2 rows doesn't need
+    # any more queries than deleting 1. If we weren't caching the table models an
+    # extra number of queries would be performed to lookup the table information.
+    with django_assert_num_queries(16):
         TrashHandler.permanently_delete_marked_trash()
 
 
@@ -1572,3 +1566,74 @@ def test_trash_and_restore_rows_in_batch_will_restore_formula_fields(
     restored_row = send_mock.call_args[1]["rows"][0]
     assert getattr(restored_row, f_name.db_column) == "John"
     assert getattr(restored_row, f_f_name.db_column) == "John"
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE=2)
+def test_permanently_delete_marked_trash_deletes_rows_and_relations_in_bulk(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    other_table = data_fixture.create_database_table(database=database)
+    link_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        type_name="link_row",
+        name="Link",
+        link_row_table=other_table,
+    )
+    other_row = RowHandler().create_row(user=user, table=other_table)
+    rows = [
+        RowHandler().create_row(
+            user=user,
+            table=table,
+            values={f"field_{link_field.id}": [other_row.id]},
+        )
+        for _ in range(5)
+    ]
+    for row in rows[:3]:
+        TrashHandler.trash(user, database.workspace, database, row)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    TrashHandler.permanently_delete_marked_trash()
+
+    model = table.get_model()
+    through_model = model._meta.get_field(f"field_{link_field.id}").remote_field.through
+    assert list(
+        model.objects_and_trash.order_by("id").values_list("id", flat=True)
+    ) == [rows[3].id, rows[4].id]
+    assert through_model.objects.count() == 2
+    assert TrashEntry.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_permanently_delete_marked_trash_deletes_tables_before_their_rows(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    rows = [RowHandler().create_row(user=user, table=table) for _ in range(3)]
+    for row in rows:
+        TrashHandler.trash(user, database.workspace, database, row)
+    TrashHandler.trash(user, database.workspace, database, table)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    def permanently_delete_items(parent_id, trash_item_ids, *args):
+        assert not Table.objects_and_trash.filter(id=parent_id).exists()
+        raise TrashItemDoesNotExist()
+
+    with patch.object(
+        RowTrashableItemType,
+        "permanently_delete_items",
+        side_effect=permanently_delete_items,
+    ) as mock_permanently_delete_items:
+        TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 0
+    # All the row entries are handled at once after the table has been deleted.
+    mock_permanently_delete_items.assert_called_once_with(
+        table.id, [row.id for row in rows], {}
+    )
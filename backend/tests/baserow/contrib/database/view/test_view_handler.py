@@ -2126,9 +2126,13 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     # Should not appear in any results
     data_fixture.create_form_view(user, table=table, public=True)
 
-    # Public View 1 has filters which match row 1
+    # Public View 1 has filters which match row 1. The `contains_word` filter can't
+    # be evaluated in Python, so the checker has to query the database.
     data_fixture.create_view_filter(
-        view=public_grid_view, field=filtered_field, type="equal", value="FilterValue"
+        view=public_grid_view,
+        field=filtered_field,
+        type="contains_word",
+        value="FilterValue",
     )
     model = table.get_model()
     visible_row = model.objects.create(
@@ -2168,7 +2172,7 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     data_fixture.create_view_filter(
         view=another_public_grid_view,
         field=filtered_field,
-        type="equal",
+        type="contains_word",
         value="FilterValue",
     )
 
@@ -2190,6 +2194,198 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
+@pytest.mark.django_db
+def test_public_view_row_checker_evaluates_filters_in_python_without_queries(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=1
+    )
+    public_grid_view = data_fixture.create_grid_view(
+        user, table=table, public=True, filter_type="OR"
+    )
+    data_fixture.create_view_filter(
+        view=public_grid_view, field=text_field, type="contains", value="visible"
+    )
+    data_fixture.create_view_filter(
+        view=public_grid_view, field=number_field, type="higher_than", value="10"
+    )
+    model = table.get_model()
+    visible_row = model.objects.create(
+        **{f"field_{text_field.id}": "Is VISIBLE", f"field_{number_field.id}": 1}
+    )
+    other_visible_row = model.objects.create(
+        **{f"field_{text_field.id}": "", f"field_{number_field.id}": Decimal("11.5")}
+    )
+    invisible_row = model.objects.create(
+        **{f"field_{text_field.id}": "Hidden", f"field_{number_field.id}": None}
+    )
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table,
+        model,
+        only_include_views_which_want_realtime_events=True,
+        updated_field_ids=[text_field.id, number_field.id],
+    )
+
+    view_ptr_specific = public_grid_view.view_ptr.specific
+    with django_assert_num_queries(0):
+        assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
+            view_ptr_specific
+        ]
+        assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
+        assert row_checker.get_public_views_where_rows_are_visible(
+            [visible_row, other_visible_row, invisible_row]
+        ) == [
+            PublicViewRows(
+                view=view_ptr_specific,
+                allowed_row_ids={visible_row.id, other_visible_row.id},
+            )
+        ]
+
+
+@pytest.mark.django_db
+def test_public_view_row_checker_queries_rows_undecided_in_python(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=0
+    )
+    public_grid_view = data_fixture.create_grid_view(user, table=table, public=True)
+    data_fixture.create_view_filter(
+        view=public_grid_view, field=text_field, type="contains", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=public_grid_view, field=number_field, type="equal", value="2"
+    )
+    model = table.get_model()
+    decided_row = model.objects.create(
+        **{f"field_{text_field.id}": "a", f"field_{number_field.id}": 2}
+    )
+    # The database rounds the number to 2, but the in-memory value can't be compared.
+    rounded_row = model.objects.create(
+        **{f"field_{text_field.id}": "a", f"field_{number_field.id}": Decimal("1.6")}
+    )
+    # Non ASCII values are compared case insensitively by the database only.
+    non_ascii_row = model.objects.create(
+        **{f"field_{text_field.id}": "Ä", f"field_{number_field.id}": 2}
+    )
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table,
+        model,
+        only_include_views_which_want_realtime_events=True,
+        updated_field_ids=[text_field.id, number_field.id],
+    )
+
+    view_ptr_specific = public_grid_view.view_ptr.specific
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_rows_are_visible(
+            [decided_row, rounded_row, non_ascii_row]
+        ) == [
+            PublicViewRows(
+                view=view_ptr_specific,
+                allowed_row_ids={decided_row.id, rounded_row.id},
+            )
+        ]
+
+
+@pytest.mark.django_db
+def test_get_row_predicate_matches_the_sql_filters(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=single_select_field, value="A")
+    option_b = data_fixture.create_select_option(field=single_select_field, value="B")
+
+    model = table.get_model()
+    for text, number, boolean, option in [
+        ("Apple", Decimal("1.5"), True, option_a),
+        ("apple pie", Decimal("2"), False, option_b),
+        ("", None, False, None),
+        (None, Decimal("-3.25"), True, option_a),
+    ]:
+        model.objects.create(
+            **{
+                f"field_{text_field.id}": text,
+                f"field_{number_field.id}": number,
+                f"field_{boolean_field.id}": boolean,
+                f"field_{single_select_field.id}": option,
+            }
+        )
+
+    filters = [
+        (text_field, "equal", "Apple"),
+        (text_field, "equal", ""),
+        (text_field, "not_equal", "Apple"),
+        (text_field, "contains", "APPLE"),
+        (text_field, "contains", " "),
+        (text_field, "contains_not", "pie"),
+        (text_field, "empty", ""),
+        (text_field, "not_empty", ""),
+        (number_field, "equal", "2"),
+        (number_field, "equal", "invalid"),
+        (number_field, "not_equal", "invalid"),
+        (number_field, "higher_than", "1.5"),
+        (number_field, "higher_than_or_equal", "1.5"),
+        (number_field, "lower_than", "0"),
+        (number_field, "lower_than_or_equal", "2"),
+        (number_field, "empty", ""),
+        (number_field, "not_empty", ""),
+        (boolean_field, "boolean", "1"),
+        (boolean_field, "boolean", ""),
+        (boolean_field, "empty", ""),
+        (single_select_field, "single_select_equal", str(option_a.id)),
+        (single_select_field, "single_select_equal", "invalid"),
+        (single_select_field, "single_select_not_equal", str(option_a.id)),
+        (single_select_field, "single_select_is_any_of", f"{option_b.id},0"),
+        (single_select_field, "single_select_is_none_of", str(option_b.id)),
+        (single_select_field, "empty", ""),
+    ]
+
+    handler = ViewHandler()
+    rows = list(model.objects.all())
+    for filter_type in ["AND", "OR"]:
+        for field, view_filter_type, value in filters:
+            view = data_fixture.create_grid_view(
+                user, table=table, filter_type=filter_type
+            )
+            data_fixture.create_view_filter(
+                view=view, field=field, type=view_filter_type, value=value
+            )
+            group = data_fixture.create_view_filter_group(
+                view=view, filter_type="OR" if filter_type == "AND" else "AND"
+            )
+            data_fixture.create_view_filter(
+                view=view, field=text_field, type="contains", value="a", group=group
+            )
+            data_fixture.create_view_filter(
+                view=view, field=boolean_field, type="boolean", value="1", group=group
+            )
+
+            row_predicate = handler.get_row_predicate(view, model)
+            assert row_predicate is not None
+            expected_ids = set(
+                handler.apply_filters(view, model.objects.all()).values_list(
+                    "id", flat=True
+                )
+            )
+            assert {row.id for row in rows if row_predicate(row)} == expected_ids, (
+                filter_type,
+                view_filter_type,
+                value,
+            )
+
+
 @pytest.mark.django_db
 def test_cant_get_view_filter_when_view_trashed(data_fixture):
     user = data_fixture.create_user()
@@ -661,6 +661,104 @@ def test_custom_cleanup_failing_doesnt_rollback_other_successful_cleanups(
         assert Action.objects.first().id == action_which_will_fail.id
 
 
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.undo_redo
+def test_cleanup_deletes_actions_in_batches(data_fixture, settings):
+    settings.BASEROW_ACTION_CLEANUP_BATCH_SIZE = 2
+    now = datetime.now(tz=timezone.utc)
+    num_minutes_where_actions_will_be_old_enough_for_cleaning = timedelta(
+        minutes=int(settings.MINUTES_UNTIL_ACTION_CLEANED_UP) * 2
+    )
+    with transaction.atomic():
+        with freeze_time(
+            now - num_minutes_where_actions_will_be_old_enough_for_cleaning
+        ):
+            _create_two_no_custom_cleanup_actions(data_fixture)
+            _create_two_no_custom_cleanup_actions(data_fixture)
+            _create_an_action_with_custom_cleanup(data_fixture)
+            _create_an_action_with_custom_cleanup(data_fixture)
+            _create_an_action_with_custom_cleanup(data_fixture)
+
+    with freeze_time(now):
+        assert Action.objects.count() == 7
+        ActionHandler.clean_up_old_undoable_actions()
+        assert Action.objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.undo_redo
+def test_cleanup_stops_after_the_time_limit_and_continues_in_the_next_run(
+    data_fixture, settings
+):
+    settings.BASEROW_ACTION_CLEANUP_BATCH_SIZE = 2
+    settings.BASEROW_ACTION_CLEANUP_MAX_SECONDS = 0
+    now = datetime.now(tz=timezone.utc)
+    num_minutes_where_actions_will_be_old_enough_for_cleaning = timedelta(
+        minutes=int(settings.MINUTES_UNTIL_ACTION_CLEANED_UP) * 2
+    )
+    with transaction.atomic():
+        with freeze_time(
+            now - num_minutes_where_actions_will_be_old_enough_for_cleaning
+        ):
+            _create_two_no_custom_cleanup_actions(data_fixture)
+            _create_two_no_custom_cleanup_actions(data_fixture)
+            _create_an_action_with_custom_cleanup(data_fixture)
+            _create_an_action_with_custom_cleanup(data_fixture)
+            _create_an_action_with_custom_cleanup(data_fixture)
+
+    with freeze_time(now):
+        assert Action.objects.count() == 7
+        # Only a single batch of every kind of action is cleaned up per run.
+        ActionHandler.clean_up_old_undoable_actions()
+        assert Action.objects.count() == 3
+        ActionHandler.clean_up_old_undoable_actions()
+        assert Action.objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.undo_redo
+def test_cleanup_drops_the_backup_columns_of_the_same_table_together(
+    data_fixture, settings
+):
+    now = datetime.now(tz=timezone.utc)
+    num_minutes_where_actions_will_be_old_enough_for_cleaning = timedelta(
+        minutes=int(settings.MINUTES_UNTIL_ACTION_CLEANED_UP) * 2
+    )
+    with transaction.atomic():
+        with freeze_time(
+            now - num_minutes_where_actions_will_be_old_enough_for_cleaning
+        ):
+            user = data_fixture.create_user()
+            table = data_fixture.create_database_table(user=user)
+            for _ in range(2):
+                text_field = data_fixture.create_text_field(table=table)
+                action_type_registry.get_by_type(UpdateFieldActionType).do(
+                    user, text_field, "boolean"
+                )
+
+    def get_column_names():
+        with connection.cursor() as cursor:
+            return [
+                column.name
+                for column in connection.introspection.get_table_description(
+                    cursor, table.get_database_table_name()
+                )
+            ]
+
+    column_names_with_backups = get_column_names()
+
+    with freeze_time(now):
+        with CaptureQueriesContext(connection) as captured:
+            ActionHandler.clean_up_old_undoable_actions()
+        assert Action.objects.count() == 0
+
+    assert len(get_column_names()) == len(column_names_with_backups) - 2
+    drop_queries = [
+        query["sql"] for query in captured.captured_queries if "DROP" in query["sql"]
+    ]
+    assert len(drop_queries) == 1
+
+
 @pytest.mark.django_db
 @pytest.mark.undo_redo
 def test_undoing_multiple_actions_in_a_single_undo_operation(data_fixture):
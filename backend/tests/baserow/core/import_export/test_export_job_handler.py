@@ -1,7 +1,19 @@
+import hashlib
+import json
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test.utils import override_settings
+
 import pytest
+import zipstream
 
 from baserow.core.import_export.handler import ImportExportHandler
 from baserow.core.registries import ImportExportConfig
+from baserow.core.storage import ExportZipFile
 
 
 @pytest.mark.import_export_workspace
@@ -21,3 +33,49 @@ def test_create_export_file(data_fixture):
     )
 
     assert file_name is not None
+
+
+@pytest.mark.django_db
+def test_export_zip_file_streams_storage_files_and_checksums(tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    storage.save("files/image.png", ContentFile(b"Not really a PNG"))
+    storage.save("files/notes.txt", ContentFile(b"Hello World"))
+
+    def create_zip_file():
+        zip_file = ExportZipFile(
+            compress_level=settings.BASEROW_DEFAULT_ZIP_COMPRESS_LEVEL,
+            compress_type=zipstream.ZIP_DEFLATED,
+        )
+        zip_file.add_storage_file(storage, "files/image.png", "image.png")
+        zip_file.add_storage_file(storage, "files/notes.txt", "notes.txt")
+        return zip_file
+
+    zip_file = create_zip_file()
+    manifest_data = ImportExportHandler().create_manifest(
+        [], zip_file, ImportExportConfig(include_permission_data=False), storage
+    )
+    # The checksums are computed while the zip file is streamed.
+    assert zip_file.streamed_checksums == {}
+    assert manifest_data["checksums"] == {}
+
+    files_buffer = BytesIO(b"".join(zip_file))
+
+    expected_checksums = {
+        "image.png": hashlib.sha256(b"Not really a PNG").hexdigest(),
+        "notes.txt": hashlib.sha256(b"Hello World").hexdigest(),
+    }
+    assert zip_file.streamed_checksums == expected_checksums
+    assert manifest_data["checksums"] == expected_checksums
+    assert manifest_data["total_files"] == 4
+    with ZipFile(files_buffer) as streamed_zip_file:
+        assert streamed_zip_file.getinfo("image.png").compress_type == ZIP_STORED
+        assert streamed_zip_file.getinfo("notes.txt").compress_type == ZIP_DEFLATED
+        assert streamed_zip_file.read("notes.txt") == b"Hello World"
+        manifest = json.loads(streamed_zip_file.read("manifest.json"))
+        assert manifest["checksums"] == expected_checksums
+
+    with override_settings(BASEROW_EXPORT_ZIP_STORE_COMPRESSED_FILES=False):
+        files_buffer = BytesIO(b"".join(create_zip_file()))
+
+    with ZipFile(files_buffer) as streamed_zip_file:
+        assert streamed_zip_file.getinfo("image.png").compress_type == ZIP_DEFLATED
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import zipfile
 from unittest.mock import call, patch
@@ -8,6 +10,7 @@ import pytest
 
 from baserow.core.import_export.exceptions import ImportExportResourceInvalidFile
 from baserow.core.import_export.handler import ImportExportHandler
+from baserow.core.models import Application, UserFile
 from baserow.test_utils.zip_helpers import (
     add_file_to_zip,
     change_file_content_in_zip,
@@ -98,6 +101,71 @@ def test_import_with_modified_files(data_fixture, use_tmp_media_root, tmp_path):
     assert str(err.value) == "Checksum validation failed"
 
 
+@pytest.mark.import_export_workspace
+@pytest.mark.django_db(transaction=True)
+def test_import_with_modified_user_file_doesnt_store_it(
+    data_fixture, use_tmp_media_root, tmp_path
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+
+    data_fixture.create_import_export_trusted_source()
+
+    zip_name = "interesting_database_export_modified_user_file.zip"
+    resource = data_fixture.create_import_export_resource(
+        created_by=user, original_name=zip_name, is_valid=True
+    )
+
+    # The checksums of the files other than the application schemas are computed
+    # while the applications are imported. All of those files are user files here.
+    with zipfile.ZipFile(INTERESTING_DB_EXPORT_PATH, "r") as zip_file:
+        manifest = json.loads(zip_file.read("manifest.json"))
+    schema_file_names = {
+        item["files"]["schema"]
+        for application in manifest["applications"].values()
+        for item in application["items"]
+    }
+    file_to_change = next(
+        name for name in manifest["checksums"].keys() if name not in schema_file_names
+    )
+
+    new_zip_path = change_file_content_in_zip(
+        INTERESTING_DB_EXPORT_PATH,
+        f"{tmp_path}/{zip_name}",
+        file_to_change,
+        b"some new content",
+    )
+
+    with open(new_zip_path, "rb") as export_file:
+        content = export_file.read()
+        data_fixture.create_import_export_resource_file(
+            resource=resource, content=content
+        )
+
+    with pytest.raises(ImportExportResourceInvalidFile) as err:
+        ImportExportHandler().import_workspace_applications(
+            user=user,
+            workspace=workspace,
+            resource=resource,
+        )
+
+    assert str(err.value) == "Checksum validation failed"
+    resource.refresh_from_db()
+    assert resource.is_valid is False
+    # The checksum is validated before the user file is stored, so the database
+    # is rolled back without having stored the modified content.
+    assert not Application.objects_and_trash.filter(workspace=workspace).exists()
+    assert not UserFile.objects.filter(original_name=file_to_change).exists()
+    modified_sha256 = hashlib.sha256(b"some new content").hexdigest()
+    user_files_path = os.path.join(settings.MEDIA_ROOT, "user_files")
+    assert not any(
+        modified_sha256 in name
+        for name in (
+            os.listdir(user_files_path) if os.path.exists(user_files_path) else []
+        )
+    )
+
+
 @pytest.mark.import_export_workspace
 @pytest.mark.django_db(transaction=True)
 def test_import_with_unexpected_files(data_fixture, use_tmp_media_root, tmp_path):
@@ -9,6 +9,8 @@ from baserow.contrib.database.application_types import DatabaseApplicationType
 from baserow.contrib.database.exceptions import (
     DatabaseSnapshotMaxLocksExceededException,
 )
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.models import Table
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Snapshot
@@ -74,6 +76,51 @@ def test_perform_create_preserves_last_modified_by(data_fixture: Fixtures):
     assert model.objects.all()[1].last_modified_by is None
 
 
+@pytest.mark.django_db
+def test_perform_create_and_restore_preserve_user_reference_fields(
+    data_fixture: Fixtures,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    application = data_fixture.create_database_application(workspace=workspace, order=1)
+    table = data_fixture.create_database_table(user=user, database=application)
+    field_handler = FieldHandler()
+    text_field = field_handler.create_field(user, table, "text", name="Text")
+    created_by_field = field_handler.create_field(
+        user, table, "created_by", name="Created by"
+    )
+    last_modified_by_field = field_handler.create_field(
+        user, table, "last_modified_by", name="Last modified by"
+    )
+    RowHandler().force_create_rows(
+        user, table, [{text_field.db_column: "Row 1"}, {text_field.db_column: "Row 2"}]
+    )
+    snapshot = data_fixture.create_snapshot(
+        snapshot_from_application=application,
+        name="snapshot",
+        created_by=user,
+    )
+
+    def assert_user_references_preserved(database):
+        copied_table = Table.objects.get(database=database)
+        fields = {f.name: f for f in copied_table.field_set.all()}
+        model = copied_table.get_model()
+        rows = list(model.objects.all().order_by("id"))
+        assert len(rows) == 2
+        for row in rows:
+            assert row.created_by == user
+            assert row.last_modified_by == user
+            assert getattr(row, fields[created_by_field.name].db_column) == user
+            assert getattr(row, fields[last_modified_by_field.name].db_column) == user
+
+    SnapshotHandler().perform_create(snapshot, Progress(total=100))
+    snapshot.refresh_from_db()
+    assert_user_references_preserved(snapshot.snapshot_to_application)
+
+    restored = SnapshotHandler().perform_restore(snapshot, Progress(total=100))
+    assert_user_references_preserved(restored)
+
+
 @pytest.mark.django_db
 def test_perform_create_export_serialized_raises_operationalerror(
     data_fixture,
@@ -102,6 +102,16 @@ def test_get_versioned_cache_key(key):
     assert result == f"{VERSION}_{GLOBAL_CACHE_VERSION}_{key}__version_0"
 
 
+def test_global_cache_get_version():
+    assert global_cache.get_version("versioned-key") == 0
+
+    global_cache.invalidate("versioned-key")
+    assert global_cache.get_version("versioned-key") == 1
+
+    global_cache.invalidate(invalidate_key="shared-key")
+    assert global_cache.get_version("versioned-key", invalidate_key="shared-key") == 1
+
+
 def test_global_update_with_literal_default_value():
     def callback(data):
         return data + " world"
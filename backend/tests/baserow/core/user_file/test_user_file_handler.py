@@ -217,7 +217,8 @@ def test_upload_user_file(data_fixture, tmpdir):
     )
 
     assert len(storage.listdir(tmpdir / "thumbnails/tiny")[1]) == 4
-    assert len(storage.listdir(tmpdir / "user_files")[1]) == 7
+    # `another_name.txt` shares the stored file of `another.txt`.
+    assert len(storage.listdir(tmpdir / "user_files")[1]) == 6
 
     assert UserFile.objects.all().count() == 7
 
@@ -263,6 +264,76 @@ def test_upload_user_file_with_truncated_image(data_fixture, tmpdir):
     assert not file_path.isfile()
 
 
+@pytest.mark.django_db
+def test_upload_user_file_generates_thumbnails_in_background(
+    data_fixture,
+    tmpdir,
+    settings,
+    use_tmp_media_root,
+    django_capture_on_commit_callbacks,
+):
+    settings.BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND = True
+    settings.USER_THUMBNAILS = {"tiny": [21, 21], "card_cover": [300, 160]}
+    user = data_fixture.create_user()
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (1000, 800), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="JPEG")
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        user_file = handler.upload_user_file(user, "image.jpg", image_bytes)
+
+    assert user_file.is_image is True
+    assert user_file.thumbnails_pending is True
+    assert user_file.image_width == 1000
+    assert user_file.image_height == 800
+    assert tmpdir.join("user_files", user_file.name).isfile()
+    assert not tmpdir.join("thumbnails", "tiny", user_file.name).isfile()
+
+    assert len(callbacks) == 1
+    callbacks[0]()
+
+    user_file.refresh_from_db()
+    assert user_file.thumbnails_pending is False
+    assert user_file.is_image is True
+    tiny = Image.open(tmpdir.join("thumbnails", "tiny", user_file.name).open("rb"))
+    assert tiny.size == (21, 21)
+    card_cover = Image.open(
+        tmpdir.join("thumbnails", "card_cover", user_file.name).open("rb")
+    )
+    assert card_cover.size == (300, 160)
+
+
+@pytest.mark.django_db
+def test_failed_background_thumbnails_dont_change_is_image(
+    data_fixture,
+    tmpdir,
+    settings,
+    use_tmp_media_root,
+    django_capture_on_commit_callbacks,
+):
+    settings.BASEROW_USER_FILE_THUMBNAILS_IN_BACKGROUND = True
+    user = data_fixture.create_user()
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+    truncated_bytes = BytesIO(image_bytes.getvalue()[:-100])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user_file = handler.upload_user_file(
+            user, "truncated_image.png", truncated_bytes
+        )
+    serialized = user_file.serialize()
+
+    user_file.refresh_from_db()
+    assert user_file.thumbnails_pending is False
+    # The serialized user file, as stored in the cell values, must stay valid.
+    assert user_file.is_image is serialized["is_image"] is True
+
+
 @pytest.mark.django_db
 def test_upload_user_file_with_unsupported_image_format(
     data_fixture, tmpdir, open_test_file
@@ -286,6 +357,68 @@ def test_upload_user_file_with_unsupported_image_format(
     assert not file_path.isfile()
 
 
+@pytest.mark.django_db
+def test_upload_user_file_shares_stored_content(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    user_file = handler.upload_user_file(
+        user, "image.png", BytesIO(image_bytes.getvalue()), storage=storage
+    )
+    shared_user_file = handler.upload_user_file(
+        user, "copy.png", BytesIO(image_bytes.getvalue()), storage=storage
+    )
+    other_extension = handler.upload_user_file(
+        user, "copy.jpg", BytesIO(image_bytes.getvalue()), storage=storage
+    )
+
+    assert shared_user_file.id != user_file.id
+    assert shared_user_file.original_name == "copy.png"
+    assert shared_user_file.name == user_file.name
+    assert shared_user_file.is_image is True
+    assert shared_user_file.image_width == 100
+    assert shared_user_file.image_height == 140
+    assert other_extension.name != user_file.name
+    assert len(storage.listdir(tmpdir / "user_files")[1]) == 2
+    assert handler.get_user_file_by_name(shared_user_file.name).id == user_file.id
+
+    # The stored file is not shared if it's missing from the storage.
+    storage.delete(f"user_files/{user_file.name}")
+    restored_user_file = handler.upload_user_file(
+        user, "restored.png", BytesIO(image_bytes.getvalue()), storage=storage
+    )
+    assert restored_user_file.name != user_file.name
+    assert tmpdir.join("user_files", restored_user_file.name).isfile()
+
+    files_buffer = BytesIO()
+    with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
+        files_zip.writestr("a.png", image_bytes.getvalue())
+        files_zip.writestr("b.txt", b"Hello World")
+        files_zip.writestr("c.txt", b"Hello World")
+    files_buffer.seek(0)
+
+    imported = handler.import_user_files(
+        [
+            {"name": "a.png", "original_name": "imported.png"},
+            {"name": "b.txt", "original_name": "b.txt"},
+            {"name": "c.txt", "original_name": "c.txt"},
+        ],
+        ZipFile(files_buffer, "r"),
+        storage,
+    )
+
+    assert imported[("a.png", "imported.png")].name == restored_user_file.name
+    assert imported[("a.png", "imported.png")].is_image is True
+    assert imported[("b.txt", "b.txt")].id != imported[("c.txt", "c.txt")].id
+    assert imported[("b.txt", "b.txt")].name == imported[("c.txt", "c.txt")].name
+    assert len(storage.listdir(tmpdir / "user_files")[1]) == 3
+
+
 @pytest.mark.django_db
 @httpretty.activate(verbose=True, allow_net_connect=False)
 def test_upload_user_file_by_url(data_fixture, tmpdir):
@@ -875,3 +1008,67 @@ def test_import_user_file_returns_user_file_from_files_zip(tmpdir):
         mock_handle,
         storage=storage,
     )
+
+
+@pytest.mark.django_db
+def test_import_user_files(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    existing_user_file = handler.upload_user_file(
+        user, "existing.txt", ContentFile(b"Existing"), storage=storage
+    )
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    files_buffer = BytesIO()
+    with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
+        files_zip.writestr("a.txt", b"Hello World")
+        files_zip.writestr("b.txt", b"Hello World")
+        files_zip.writestr("image.png", image_bytes.getvalue())
+
+    files_buffer.seek(0)
+    files_zip = ZipFile(files_buffer, "r")
+    opened_names = []
+    original_open = files_zip.open
+
+    def open_and_track(name, *args, **kwargs):
+        opened_names.append(name)
+        return original_open(name, *args, **kwargs)
+
+    files_zip.open = open_and_track
+
+    serialized_user_files = [
+        {"name": "a.txt", "original_name": "hello.txt"},
+        # The same content with the same original name must result in the same file.
+        {"name": "b.txt", "original_name": "hello.txt"},
+        {"name": "image.png", "original_name": "image.png"},
+        # The hash is in the name, so it must not be read if it already exists.
+        {"name": existing_user_file.name, "original_name": "existing.txt"},
+    ]
+
+    imported = handler.import_user_files(serialized_user_files, files_zip, storage)
+
+    assert sorted(opened_names) == ["a.txt", "b.txt", "image.png"]
+    assert imported[(existing_user_file.name, "existing.txt")] == existing_user_file
+    hello = imported[("a.txt", "hello.txt")]
+    assert imported[("b.txt", "hello.txt")] is hello
+    assert hello.size == 11
+    assert hello.sha256_hash == (
+        "a591a6d40bf420404a011733cfb7b190d62c65bf0bcda32b57b277d9ad9f146e"
+    )
+    assert tmpdir.join("user_files", hello.name).read() == "Hello World"
+
+    image_user_file = imported[("image.png", "image.png")]
+    assert image_user_file.is_image is True
+    assert image_user_file.image_width == 100
+    assert image_user_file.image_height == 140
+    assert tmpdir.join("thumbnails", "tiny", image_user_file.name).isfile()
+
+    assert UserFile.objects.count() == 3
+    assert handler.import_user_files(serialized_user_files[:1], files_zip, storage)[
+        ("a.txt", "hello.txt")
+    ] == UserFile.objects.get(original_name="hello.txt")
@@ -1,13 +1,20 @@
+import mimetypes
+from urllib.parse import quote
 from urllib.request import Request
 
 from django.conf import settings
-from django.http import FileResponse
+from django.http import FileResponse, HttpResponse
 from django.utils.encoding import smart_str
+from django.utils.http import content_disposition_header
 
 from baserow_premium.license.exceptions import FeaturesNotAvailableError
 from baserow_premium.license.handler import LicenseHandler
 from drf_spectacular.utils import extend_schema
 from rest_framework.renderers import BaseRenderer
+from rest_framework.status import (
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
 from rest_framework.views import APIView
 
 from baserow.api.decorators import map_exceptions
@@ -16,9 +23,23 @@ from baserow_enterprise.api.authentication import (
     AuthenticateFromUserSessionAuthentication,
 )
 from baserow_enterprise.features import SECURE_FILE_SERVE
-from baserow_enterprise.secure_file_serve.constants import SecureFileServePermission
-from baserow_enterprise.secure_file_serve.exceptions import SecureFileServeException
-from baserow_enterprise.secure_file_serve.handler import SecureFileServeHandler
+from baserow_enterprise.secure_file_serve.constants import (
+    SecureFileServePermission,
+    SecureFileServeTransfer,
+)
+from baserow_enterprise.secure_file_serve.exceptions import (
+    RangeNotSatisfiable,
+    SecureFileServeException,
+)
+from baserow_enterprise.secure_file_serve.handler import (
+    SecureFile,
+    SecureFileServeHandler,
+)
+from baserow_enterprise.secure_file_serve.ranges import (
+    FileRange,
+    get_file_size,
+    parse_range_header,
+)
 
 from .errors import ERROR_SECURE_FILE_SERVE_EXCEPTION
 
@@ -55,11 +76,15 @@ class DownloadView(APIView):
             "Downloads a file using the backend and the secure file serve feature. "
             "The signed data is extracted from the URL and used to verify if the "
             "user has access to the file. If the permissions check passes and the "
-            "file exists, the file is served to the user."
+            "file exists, the file is served to the user. A single byte range can "
+            "be requested with the `Range` header, optionally made conditional with "
+            "the `If-Range` header."
             "\n\nThis is a **enterprise** feature."
         ),
         responses={
             200: {"description": "File download"},
+            206: {"description": "Partial file download"},
+            416: {"description": "The requested range is not satisfiable"},
             403: get_error_schema(["ERROR_SECURE_FILE_SERVE_EXCEPTION"]),
         },
         auth=[],
@@ -69,7 +94,7 @@ class DownloadView(APIView):
             SecureFileServeException: ERROR_SECURE_FILE_SERVE_EXCEPTION,
         }
     )
-    def get(self, request: Request, signed_data: str) -> FileResponse:
+    def get(self, request: Request, signed_data: str) -> HttpResponse:
         if not LicenseHandler.instance_has_feature(SECURE_FILE_SERVE):
             raise FeaturesNotAvailableError()
 
@@ -79,9 +104,91 @@ class DownloadView(APIView):
 
         download_file_name = request.GET.get("dl", "")
         as_attachment = bool(download_file_name)
+        file_name = smart_str(download_file_name or secure_file.name)
+
+        transfer = settings.BASEROW_SERVE_FILES_THROUGH_BACKEND_TRANSFER
+        if transfer == SecureFileServeTransfer.X_ACCEL_REDIRECT:
+            location = settings.BASEROW_SERVE_FILES_THROUGH_BACKEND_INTERNAL_LOCATION
+            return self.hand_off_to_web_server(
+                "X-Accel-Redirect",
+                location.rstrip("/") + "/" + quote(secure_file.path),
+                as_attachment,
+                file_name,
+            )
+        elif transfer == SecureFileServeTransfer.X_SENDFILE:
+            # Only files on a local disk can be sent by the web server, files in a
+            # remote storage are streamed by the backend instead.
+            local_path = secure_file.get_local_path()
+            if local_path is not None:
+                return self.hand_off_to_web_server(
+                    "X-Sendfile", local_path, as_attachment, file_name
+                )
+
+        return self.stream_file(request, secure_file, as_attachment, file_name)
 
-        return FileResponse(
-            secure_file.open(),
-            as_attachment=as_attachment,
-            filename=smart_str(download_file_name or secure_file.name),
+    def hand_off_to_web_server(
+        self, header: str, value: str, as_attachment: bool, file_name: str
+    ) -> HttpResponse:
+        """
+        Responds with an empty body and a header instructing the web server in front
+        of the backend to send the file itself. The web server then takes care of
+        the transfer and of range requests without the file content ever passing
+        through the Python process.
+        """
+
+        content_type, _ = mimetypes.guess_type(file_name)
+        response = HttpResponse(content_type=content_type or "application/octet-stream")
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment, file_name
         )
+        response[header] = value
+        return response
+
+    def stream_file(
+        self,
+        request: Request,
+        secure_file: SecureFile,
+        as_attachment: bool,
+        file_name: str,
+    ) -> HttpResponse:
+        """
+        Streams the file, or the single byte range requested with the `Range`
+        header, from the storage. The range is ignored if the `If-Range` header
+        doesn't match the entity tag of the file, so that a client resuming a
+        download of a changed file receives the new file completely.
+        """
+
+        file = secure_file.open()
+        size = get_file_size(file)
+        etag = secure_file.get_etag(size)
+
+        byte_range = None
+        range_header = request.META.get("HTTP_RANGE")
+        if_range_header = request.META.get("HTTP_IF_RANGE")
+        if range_header and (if_range_header is None or if_range_header == etag):
+            try:
+                byte_range = parse_range_header(range_header, size)
+            except RangeNotSatisfiable:
+                file.close()
+                response = HttpResponse(status=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+                response["Content-Range"] = f"bytes */{size}"
+                return response
+
+        if byte_range is None:
+            response = FileResponse(
+                file, as_attachment=as_attachment, filename=file_name
+            )
+        else:
+            start, end = byte_range
+            response = FileResponse(
+                FileRange(file, start, end),
+                as_attachment=as_attachment,
+                filename=file_name,
+                status=HTTP_206_PARTIAL_CONTENT,
+            )
+            response["Content-Length"] = end - start + 1
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = etag
+        return response
@@ -1,7 +1,10 @@
 import os
 
 from baserow.config.settings.utils import enum_member_by_value
-from baserow_enterprise.secure_file_serve.constants import SecureFileServePermission
+from baserow_enterprise.secure_file_serve.constants import (
+    SecureFileServePermission,
+    SecureFileServeTransfer,
+)
 
 
 def setup(settings):
@@ -57,6 +60,25 @@ def setup(settings):
         or None
     )
 
+    # Decides how the file content is sent to the client once the permissions have
+    # been checked. The X_ACCEL_REDIRECT and X_SENDFILE transfers hand the actual
+    # transfer, including range requests, over to the web server in front of the
+    # backend, so that the file isn't copied through the Python process.
+    serve_files_through_backend_transfer = (
+        os.getenv("BASEROW_SERVE_FILES_THROUGH_BACKEND_TRANSFER", "")
+        or SecureFileServeTransfer.STREAM.value
+    )
+    settings.BASEROW_SERVE_FILES_THROUGH_BACKEND_TRANSFER = enum_member_by_value(
+        SecureFileServeTransfer, serve_files_through_backend_transfer
+    )
+
+    # The internal web server location the storage files are served from when the
+    # X_ACCEL_REDIRECT transfer is used. The file path is appended to it.
+    settings.BASEROW_SERVE_FILES_THROUGH_BACKEND_INTERNAL_LOCATION = (
+        os.getenv("BASEROW_SERVE_FILES_THROUGH_BACKEND_INTERNAL_LOCATION", "")
+        or "/protected-media/"
+    )
+
     serve_files_through_backend = bool(
         os.getenv("BASEROW_SERVE_FILES_THROUGH_BACKEND", False)
     )
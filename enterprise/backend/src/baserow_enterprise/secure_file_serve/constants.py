@@ -7,4 +7,16 @@ class SecureFileServePermission(Enum):
     WORKSPACE_ACCESS = "WORKSPACE_ACCESS"
 
 
+class SecureFileServeTransfer(Enum):
+    # The backend reads the file from the storage and streams it to the client.
+    STREAM = "STREAM"
+    # The backend only checks the permissions and lets the web server (nginx, or
+    # Caddy with the bundled Caddyfile) serve the file from an internal location via
+    # the `X-Accel-Redirect` header.
+    X_ACCEL_REDIRECT = "X_ACCEL_REDIRECT"
+    # The backend only checks the permissions and lets the web server (Apache with
+    # mod_xsendfile, lighttpd) serve the local file via the `X-Sendfile` header.
+    X_SENDFILE = "X_SENDFILE"
+
+
 SECURE_FILE_SERVE_SIGNER_SALT = "secure_file_serve"
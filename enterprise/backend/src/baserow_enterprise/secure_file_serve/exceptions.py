@@ -1,3 +1,7 @@
 class SecureFileServeException(Exception):
     def __init__(self, message):
         self.message = message
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when none of the requested byte ranges overlap the file."""
@@ -1,4 +1,6 @@
+import hashlib
 from dataclasses import dataclass
+from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -27,6 +29,31 @@ class SecureFile:
         storage = get_default_storage()
         return storage.open(self.path, mode)
 
+    def get_local_path(self) -> Optional[str]:
+        """
+        Returns the absolute path of the file on the local filesystem or None if the
+        storage doesn't keep its files on a local disk, like an S3 bucket.
+        """
+
+        storage = get_default_storage()
+        try:
+            return storage.path(self.path)
+        except NotImplementedError:
+            return None
+
+    def get_etag(self, size: int) -> str:
+        """
+        Returns a strong entity tag for the file. Stored files are never modified in
+        place, so the path and the size are enough to identify the content without
+        having to read it.
+
+        :param size: The size of the file in bytes.
+        :return: The quoted entity tag.
+        """
+
+        digest = hashlib.sha256(f"{self.path}:{size}".encode()).hexdigest()
+        return f'"{digest[:32]}"'
+
 
 class SecureFileServeHandler:
     def unsign_data(self, signed_path: str) -> SecureFileServeSignerPayload:
@@ -0,0 +1,90 @@
+import io
+from typing import IO, Optional, Tuple
+
+from baserow_enterprise.secure_file_serve.exceptions import RangeNotSatisfiable
+
+
+def get_file_size(file: IO) -> int:
+    """
+    Returns the size of the provided file object without reading its content. Django
+    files expose the size directly, other file like objects are measured by seeking
+    to the end.
+
+    :param file: The file object to measure.
+    :return: The size of the file in bytes.
+    """
+
+    size = getattr(file, "size", None)
+    if size is not None:
+        return size
+
+    position = file.tell()
+    size = file.seek(0, io.SEEK_END)
+    file.seek(position)
+    return size
+
+
+def parse_range_header(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parses the value of a `Range` request header into the first and the last byte
+    position (inclusive) of the requested part of a file of the provided size. Only
+    a single byte range is supported, for anything else None is returned so that
+    the complete file is served instead, as allowed by RFC 9110.
+
+    :param range_header: The value of the `Range` header, e.g. `bytes=0-1023`.
+    :param size: The size of the complete file in bytes.
+    :return: A (start, end) tuple or None if the header must be ignored.
+    :raises RangeNotSatisfiable: If the range starts after the end of the file.
+    """
+
+    unit, _, byte_range = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in byte_range:
+        return None
+
+    first, separator, last = byte_range.strip().partition("-")
+    if not separator or not (first or last):
+        return None
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        # A suffix range, e.g. `bytes=-500`, requests the last bytes of the file.
+        suffix_length = int(last)
+        if suffix_length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - suffix_length), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+
+class FileRange:
+    """
+    Read only file like object that exposes a part of another file object. It's
+    given to the `FileResponse` to only stream the requested bytes of a file. On
+    purpose it doesn't expose `fileno`, `seek` or `tell` so that the response or a
+    WSGI file wrapper doesn't try to send the complete underlying file.
+    """
+
+    def __init__(self, file: IO, start: int, end: int):
+        file.seek(start)
+        self.file = file
+        self.remaining = end - start + 1
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+
+        if size is None or size < 0:
+            size = self.remaining
+        chunk = self.file.read(min(size, self.remaining))
+        self.remaining -= len(chunk)
+        return chunk
+
+    def close(self):
+        self.file.close()
@@ -11,8 +11,10 @@ from freezegun import freeze_time
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_202_ACCEPTED,
+    HTTP_206_PARTIAL_CONTENT,
     HTTP_402_PAYMENT_REQUIRED,
     HTTP_403_FORBIDDEN,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
 )
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.utils import datetime_from_epoch
@@ -20,7 +22,10 @@ from rest_framework_simplejwt.utils import datetime_from_epoch
 from baserow.core.context import clear_current_workspace_id, set_current_workspace_id
 from baserow.core.storage import get_default_storage
 from baserow.core.user.handler import UserHandler
-from baserow_enterprise.secure_file_serve.constants import SecureFileServePermission
+from baserow_enterprise.secure_file_serve.constants import (
+    SecureFileServePermission,
+    SecureFileServeTransfer,
+)
 
 
 def dummy_storage(tmpdir):
@@ -1032,3 +1037,110 @@ def test_exporting_csv_writes_file_to_storage_and_its_served_by_the_backend_with
 
         response = api_client.get(json["url"].replace("http://localhost:8000", ""))
         assert response.status_code == HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+@override_settings(
+    DEBUG=True,
+    BASEROW_SERVE_FILES_THROUGH_BACKEND=True,
+    STORAGES={
+        "default": {
+            "BACKEND": "baserow_enterprise.secure_file_serve.storage.EnterpriseFileStorage"
+        }
+    },
+)
+def test_files_can_be_downloaded_partially_with_range_header(
+    enable_enterprise, enterprise_data_fixture, api_client, tmpdir, use_tmp_media_root
+):
+    _, token = enterprise_data_fixture.create_user_and_token()
+
+    file = SimpleUploadedFile("test.txt", b"Hello World")
+    response = api_client.post(
+        reverse("api:user_files:upload_file"),
+        data={"file": file},
+        format="multipart",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+    backend_file_url = response.json()["url"].replace("http://localhost:8000", "")
+
+    response = api_client.get(backend_file_url)
+    assert response.status_code == HTTP_200_OK
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert b"".join(response.streaming_content) == b"Hello World"
+    etag = response.headers["ETag"]
+
+    response = api_client.get(backend_file_url, HTTP_RANGE="bytes=6-")
+    assert response.status_code == HTTP_206_PARTIAL_CONTENT
+    assert response.headers["Content-Range"] == "bytes 6-10/11"
+    assert response.headers["Content-Length"] == "5"
+    assert b"".join(response.streaming_content) == b"World"
+
+    response = api_client.get(
+        backend_file_url, HTTP_RANGE="bytes=-5", HTTP_IF_RANGE=etag
+    )
+    assert response.status_code == HTTP_206_PARTIAL_CONTENT
+    assert b"".join(response.streaming_content) == b"World"
+
+    # The range is ignored if the file doesn't match the one the client has.
+    response = api_client.get(
+        backend_file_url, HTTP_RANGE="bytes=0-4", HTTP_IF_RANGE='"outdated"'
+    )
+    assert response.status_code == HTTP_200_OK
+    assert b"".join(response.streaming_content) == b"Hello World"
+
+    response = api_client.get(backend_file_url, HTTP_RANGE="bytes=11-")
+    assert response.status_code == HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.headers["Content-Range"] == "bytes */11"
+
+
+@pytest.mark.django_db
+@override_settings(
+    DEBUG=True,
+    BASEROW_SERVE_FILES_THROUGH_BACKEND=True,
+    STORAGES={
+        "default": {
+            "BACKEND": "baserow_enterprise.secure_file_serve.storage.EnterpriseFileStorage"
+        }
+    },
+)
+def test_files_can_be_handed_off_to_the_web_server(
+    enable_enterprise, enterprise_data_fixture, api_client, tmpdir, use_tmp_media_root
+):
+    _, token = enterprise_data_fixture.create_user_and_token()
+
+    file = SimpleUploadedFile("test.txt", b"Hello World")
+    response = api_client.post(
+        reverse("api:user_files:upload_file"),
+        data={"file": file},
+        format="multipart",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+    backend_file_url = response.json()["url"].replace("http://localhost:8000", "")
+    file_name = response.json()["name"]
+    file_path = f"user_files/{file_name}"
+
+    with override_settings(
+        BASEROW_SERVE_FILES_THROUGH_BACKEND_TRANSFER=(
+            SecureFileServeTransfer.X_ACCEL_REDIRECT
+        ),
+        BASEROW_SERVE_FILES_THROUGH_BACKEND_INTERNAL_LOCATION="/protected-media/",
+    ):
+        response = api_client.get(backend_file_url + "?dl=download.txt")
+    assert response.status_code == HTTP_200_OK
+    assert response.content == b""
+    assert response.headers["X-Accel-Redirect"] == f"/protected-media/{file_path}"
+    assert response.headers["Content-Type"] == "text/plain"
+    assert (
+        response.headers["Content-Disposition"] == 'attachment; filename="download.txt"'
+    )
+
+    with override_settings(
+        BASEROW_SERVE_FILES_THROUGH_BACKEND_TRANSFER=SecureFileServeTransfer.X_SENDFILE
+    ):
+        response = api_client.get(backend_file_url)
+    assert response.status_code == HTTP_200_OK
+    assert response.content == b""
+    assert response.headers["X-Sendfile"] == get_default_storage().path(file_path)
+    assert response.headers["Content-Disposition"] == f'inline; filename="{file_name}"'
@@ -9,11 +9,15 @@ import pytest
 
 from baserow.core.context import clear_current_workspace_id, set_current_workspace_id
 from baserow_enterprise.secure_file_serve.constants import SecureFileServePermission
-from baserow_enterprise.secure_file_serve.exceptions import SecureFileServeException
+from baserow_enterprise.secure_file_serve.exceptions import (
+    RangeNotSatisfiable,
+    SecureFileServeException,
+)
 from baserow_enterprise.secure_file_serve.handler import (
     SecureFile,
     SecureFileServeHandler,
 )
+from baserow_enterprise.secure_file_serve.ranges import parse_range_header
 from baserow_enterprise.secure_file_serve.storage import (
     EnterpriseFileStorage,
     SecureFileServeSignerPayload,
@@ -397,3 +401,28 @@ def test_secure_file_handler_extract_file_info_or_raise_staff_user_outside_own_w
         with pytest.raises(SecureFileServeException) as error:
             handler.extract_file_info_or_raise(user=user_1, signed_data=signed_data)
             assert str(error.value) == "Can't access file"
+
+
+@pytest.mark.parametrize(
+    "range_header,expected_range",
+    [
+        ("bytes=0-4", (0, 4)),
+        ("bytes=6-", (6, 10)),
+        ("bytes=-5", (6, 10)),
+        ("bytes=-50", (0, 10)),
+        ("bytes=3-100", (3, 10)),
+        ("bytes=0-1,3-4", None),
+        ("items=0-4", None),
+        ("bytes=5-2", None),
+        ("bytes=-", None),
+        ("bytes=a-4", None),
+    ],
+)
+def test_parse_range_header(range_header, expected_range):
+    assert parse_range_header(range_header, 11) == expected_range
+
+
+@pytest.mark.parametrize("range_header", ["bytes=11-", "bytes=20-30", "bytes=-0"])
+def test_parse_range_header_not_satisfiable(range_header):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range_header(range_header, 11)
@@ -166,6 +166,7 @@ class TimelineViewView(APIView):
                 [
                     "ERROR_USER_NOT_IN_GROUP",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
@@ -332,6 +333,7 @@ class PublicTimelineViewRowsView(APIView):
                 [
                     "ERROR_USER_NOT_IN_GROUP",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
@@ -17,6 +17,16 @@ def setup(settings):
     # How many row comments can be requested at once.
     settings.ROW_COMMENT_PAGE_SIZE_LIMIT = 200
 
+    # How many prompts of the same workspace and generative AI type can be executed
+    # at the same time per worker process when generating AI field values.
+    settings.BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS = max(
+        int(os.getenv("BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS", "") or 4), 1
+    )
+    # The generated AI field values are written to the table in batches of this size.
+    settings.BASEROW_AI_FIELD_GENERATION_BATCH_SIZE = max(
+        int(os.getenv("BASEROW_AI_FIELD_GENERATION_BATCH_SIZE", "") or 50), 1
+    )
+
     settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_SERVICE_MAX_SERIES = int(
         os.getenv("BASEROW_PREMIUM_GROUPED_AGGREGATE_SERVICE_MAX_SERIES", "") or 3
     )
@@ -281,6 +281,31 @@ class AIFieldType(CollationSortMixin, SelectOptionBaseFieldType):
             row, field_name, value, id_mapping, cache, files_zip, storage
         )
 
+    def prepare_import_serialized_values(
+        self, field, values, cache, files_zip=None, storage=None
+    ):
+        baserow_field_type = self.get_baserow_field_type(field)
+        return baserow_field_type.prepare_import_serialized_values(
+            field, values, cache, files_zip, storage
+        )
+
+    def get_row_copy_sql_expression(
+        self,
+        field,
+        source_field,
+        source_column,
+        id_mapping,
+        workspace_id_for_user_references,
+    ):
+        baserow_field_type = self.get_baserow_field_type(field)
+        return baserow_field_type.get_row_copy_sql_expression(
+            field,
+            source_field,
+            source_column,
+            id_mapping,
+            workspace_id_for_user_references,
+        )
+
     def get_export_value(self, value, field_object, rich_value=False):
         baserow_field_type = self.get_baserow_field_type(field_object["field"])
         return baserow_field_type.get_export_value(value, field_object, rich_value)
@@ -1,3 +1,11 @@
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+from django.conf import settings
+from django.db import connections
+
 from baserow_premium.generative_ai.managers import AIFileManager
 
 from baserow.config.celery import app
@@ -22,6 +30,27 @@ from baserow.core.user.handler import User
 from .models import AIField
 from .registries import ai_field_output_registry
 
+_prompt_semaphores: Dict[Tuple[int, str], threading.BoundedSemaphore] = {}
+_prompt_semaphores_lock = threading.Lock()
+
+
+def get_prompt_semaphore(
+    workspace_id: int, generative_ai_type: str
+) -> threading.BoundedSemaphore:
+    """
+    Returns the semaphore limiting the number of prompts of the provided workspace
+    and generative AI type that are executed at the same time in this process, so
+    that multiple generation tasks together don't exceed the provider rate limits.
+    """
+
+    key = (workspace_id, generative_ai_type)
+    with _prompt_semaphores_lock:
+        if key not in _prompt_semaphores:
+            _prompt_semaphores[key] = threading.BoundedSemaphore(
+                settings.BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS
+            )
+        return _prompt_semaphores[key]
+
 
 @app.task(bind=True, queue="export")
 def generate_ai_values_for_rows(self, user_id: int, field_id: int, row_ids: list[int]):
@@ -30,7 +59,7 @@ def generate_ai_values_for_rows(self, user_id: int, field_id: int, row_ids: list
     ai_field = FieldHandler().get_field(
         field_id,
         base_queryset=AIField.objects.all()
-        .select_related("table__database__workspace")
+        .select_related("table__database__workspace", "ai_file_field")
         .prefetch_related("select_options"),
     )
     table = ai_field.table
@@ -73,69 +102,111 @@ def generate_ai_values_for_rows(self, user_id: int, field_id: int, row_ids: list
         raise exc
 
     ai_output_type = ai_field_output_registry.get(ai_field.ai_output_type)
+    with_files = ai_field.ai_file_field_id is not None and isinstance(
+        generative_ai_model_type, GenerativeAIWithFilesModelType
+    )
 
-    for i, row in enumerate(rows):
-        context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
-        message = str(
-            resolve_formula(
-                ai_field.ai_prompt, formula_runtime_function_registry, context
-            )
-        )
-
-        # The AI output type should be able to format the prompt because it can add
-        # additional instructions to it. The choice output type for example adds
-        # additional prompt trying to force the out, for example.
-        message = ai_output_type.format_prompt(message, ai_field)
+    semaphore = get_prompt_semaphore(workspace.id, generative_ai_model_type.type)
 
+    def generate_value(message, row):
         try:
-            if ai_field.ai_file_field_id is not None and isinstance(
-                generative_ai_model_type, GenerativeAIWithFilesModelType
-            ):
-                file_ids = AIFileManager.upload_files_from_file_field(
-                    ai_field, row, generative_ai_model_type, workspace=workspace
-                )
-                try:
-                    value = generative_ai_model_type.prompt_with_files(
+            with semaphore:
+                if with_files:
+                    file_ids = AIFileManager.upload_files_from_file_field(
+                        ai_field, row, generative_ai_model_type, workspace=workspace
+                    )
+                    try:
+                        value = generative_ai_model_type.prompt_with_files(
+                            ai_field.ai_generative_ai_model,
+                            message,
+                            file_ids=file_ids,
+                            workspace=workspace,
+                            temperature=ai_field.ai_temperature,
+                        )
+                    finally:
+                        generative_ai_model_type.delete_files(
+                            file_ids, workspace=workspace
+                        )
+                else:
+                    value = generative_ai_model_type.prompt(
                         ai_field.ai_generative_ai_model,
                         message,
-                        file_ids=file_ids,
                         workspace=workspace,
                         temperature=ai_field.ai_temperature,
                     )
-                except Exception as exc:
-                    raise exc
-                finally:
-                    generative_ai_model_type.delete_files(file_ids, workspace=workspace)
-            else:
-                value = generative_ai_model_type.prompt(
-                    ai_field.ai_generative_ai_model,
-                    message,
-                    workspace=workspace,
-                    temperature=ai_field.ai_temperature,
-                )
 
             # Because the AI output type can change the prompt to try to force the
             # output a certain way, then it should give the opportunity to parse the
             # output when it's given. With the choice output type, it will try to match
             # it to a `SelectOption`, for example.
-            value = ai_output_type.parse_output(value, ai_field)
-        except Exception as exc:
-            # If the prompt fails once, we should not continue with the other rows.
-            rows_ai_values_generation_error.send(
-                self,
-                user=user,
-                rows=rows[i:],
-                field=ai_field,
-                table=table,
-                error_message=str(exc),
-            )
-            raise exc
-
-        RowHandler().update_row_by_id(
-            user,
-            table,
-            row.id,
-            {ai_field.db_column: value},
-            model=model,
-            values_already_prepared=True,
+            return ai_output_type.parse_output(value, ai_field)
+        finally:
+            # The prompt thread shouldn't keep a database connection open.
+            connections.close_all()
+
+    # Rows resolving to the same prompt share the same generated value, so the
+    # futures are stored by the hash of the prompt. Prompts with files depend on
+    # the files of the row, and are therefore never shared.
+    futures = {}
+    batch_size = settings.BASEROW_AI_FIELD_GENERATION_BATCH_SIZE
+    executor = ThreadPoolExecutor(
+        max_workers=settings.BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS
+    )
+    failed = []
+
+    def generate_rows_values():
+        for batch_start in range(0, len(rows), batch_size):
+            batch = rows[batch_start : batch_start + batch_size]
+            batch_keys = []
+            for row in batch:
+                context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
+                message = str(
+                    resolve_formula(
+                        ai_field.ai_prompt, formula_runtime_function_registry, context
+                    )
+                )
+
+                # The AI output type should be able to format the prompt because it
+                # can add additional instructions to it. The choice output type for
+                # example adds additional prompt trying to force the out, for example.
+                message = ai_output_type.format_prompt(message, ai_field)
+
+                if with_files:
+                    key = row.id
+                else:
+                    key = hashlib.sha256(message.encode("utf-8")).hexdigest()
+                if key not in futures:
+                    futures[key] = executor.submit(generate_value, message, row)
+                batch_keys.append(key)
+
+            for index, (row, key) in enumerate(zip(batch, batch_keys)):
+                try:
+                    value = futures[key].result()
+                except Exception as exc:
+                    # The values generated before are still updated, but we should
+                    # not continue with the other rows.
+                    failed.append((batch_start + index, exc))
+                    return
+                yield {"id": row.id, ai_field.db_column: value}
+
+    try:
+        # The generated values are streamed into batches of the same size as the
+        # prompts, so that the rows of a batch are updated once their values have
+        # been generated.
+        RowHandler().update_rows_stream(
+            user, table, generate_rows_values(), model=model, batch_size=batch_size
+        )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if failed:
+        failed_index, error = failed[0]
+        rows_ai_values_generation_error.send(
+            self,
+            user=user,
+            rows=rows[failed_index:],
+            field=ai_field,
+            table=table,
+            error_message=str(error),
         )
+        raise error
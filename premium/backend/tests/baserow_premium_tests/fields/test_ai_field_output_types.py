@@ -48,7 +48,6 @@ def test_strict_enum_output_parser():
 def test_choice_output_type(premium_data_fixture, api_client):
     class TestAIChoiceOutputTypeGenerativeAIModelType(GenerativeAIModelType):
         type = "test_ai_choice_ouput_type"
-        i = 0
 
         def is_enabled(self, workspace=None):
             return True
@@ -57,8 +56,7 @@ def test_choice_output_type(premium_data_fixture, api_client):
             return ["test_1"]
 
         def prompt(self, model, prompt, workspace=None, temperature=None):
-            self.i += 1
-            if self.i == 1:
+            if "Motorcycle" in prompt:
                 # Existing option should be matches based on the string.
                 return "Object"
             else:
@@ -79,6 +77,7 @@ def test_choice_output_type(premium_data_fixture, api_client):
     table = premium_data_fixture.create_database_table(
         name="Example", database=database
     )
+    text_field = premium_data_fixture.create_text_field(table=table, name="text")
     field = premium_data_fixture.create_ai_field(
         table=table,
         order=0,
@@ -86,7 +85,7 @@ def test_choice_output_type(premium_data_fixture, api_client):
         ai_output_type="choice",
         ai_generative_ai_type="test_ai_choice_ouput_type",
         ai_generative_ai_model="test_1",
-        ai_prompt="'Option'",
+        ai_prompt=f"get('fields.field_{text_field.id}')",
     )
     option_1 = premium_data_fixture.create_select_option(
         field=field, value="Object", color="red"
@@ -97,8 +96,8 @@ def test_choice_output_type(premium_data_fixture, api_client):
     premium_data_fixture.create_select_option(field=field, value="Animal", color="blue")
 
     model = table.get_model()
-    row_1 = model.objects.create()
-    row_2 = model.objects.create()
+    row_1 = model.objects.create(**{text_field.db_column: "Motorcycle"})
+    row_2 = model.objects.create(**{text_field.db_column: "Banana"})
 
     generate_ai_values_for_rows(user.id, field.id, [row_1.id, row_2.id])
 
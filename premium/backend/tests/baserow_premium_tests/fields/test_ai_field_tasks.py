@@ -1,6 +1,8 @@
 from io import BytesIO
 from unittest.mock import patch
 
+from django.test.utils import override_settings
+
 import pytest
 from baserow_premium.fields.tasks import generate_ai_values_for_rows
 
@@ -252,3 +254,89 @@ def test_generate_ai_field_value_view_generative_ai_with_files(
     assert "Generated with files" in getattr(updated_row, field.db_column)
     assert "Test prompt" in getattr(updated_row, field.db_column)
     assert patched_rows_updated.call_args[1]["updated_field_ids"] == set([field.id])
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@override_settings(BASEROW_AI_FIELD_GENERATION_BATCH_SIZE=3)
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_generate_ai_field_value_dedupes_prompts_and_updates_in_batches(
+    patched_rows_updated, premium_data_fixture
+):
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    name = premium_data_fixture.create_text_field(table=table, name="name")
+    field = premium_data_fixture.create_ai_field(
+        table=table, name="ai", ai_prompt=f"get('fields.field_{name.id}')"
+    )
+
+    names = ["A", "B", "A", "A", "B", "C", "A"]
+    rows = (
+        RowHandler()
+        .create_rows(user, table, rows_values=[{name.db_column: n} for n in names])
+        .created_rows
+    )
+
+    with patch(
+        "baserow.test_utils.fixtures.generative_ai.TestGenerativeAIModelType.prompt",
+        autospec=True,
+        side_effect=lambda self, model, prompt, **kwargs: f"Generated: {prompt}",
+    ) as patched_prompt:
+        generate_ai_values_for_rows(user.id, field.id, [row.id for row in rows])
+
+    assert sorted(c[0][2] for c in patched_prompt.call_args_list) == ["A", "B", "C"]
+    assert patched_rows_updated.call_count == 3
+
+    model = table.get_model()
+    assert [getattr(row, field.db_column) for row in model.objects.order_by("id")] == [
+        f"Generated: {n}" for n in names
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@override_settings(BASEROW_AI_FIELD_GENERATION_BATCH_SIZE=2)
+@patch("baserow.contrib.database.rows.signals.rows_ai_values_generation_error.send")
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_generate_ai_field_value_stops_at_first_failing_prompt(
+    patched_rows_updated, patched_rows_ai_values_generation_error, premium_data_fixture
+):
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    name = premium_data_fixture.create_text_field(table=table, name="name")
+    field = premium_data_fixture.create_ai_field(
+        table=table, name="ai", ai_prompt=f"get('fields.field_{name.id}')"
+    )
+
+    rows = (
+        RowHandler()
+        .create_rows(user, table, rows_values=[{name.db_column: n} for n in "AABA"])
+        .created_rows
+    )
+
+    def prompt(self, model, prompt, **kwargs):
+        if prompt == "B":
+            raise GenerativeAIPromptError("Test error")
+        return f"Generated: {prompt}"
+
+    with patch(
+        "baserow.test_utils.fixtures.generative_ai.TestGenerativeAIModelType.prompt",
+        autospec=True,
+        side_effect=prompt,
+    ):
+        with pytest.raises(GenerativeAIPromptError):
+            generate_ai_values_for_rows(user.id, field.id, [row.id for row in rows])
+
+    assert patched_rows_updated.call_count == 1
+    assert [r.id for r in patched_rows_updated.call_args[1]["rows"]] == [
+        rows[0].id,
+        rows[1].id,
+    ]
+    assert patched_rows_ai_values_generation_error.call_count == 1
+    assert [
+        r.id for r in patched_rows_ai_values_generation_error.call_args[1]["rows"]
+    ] == [rows[2].id, rows[3].id]
@@ -5,6 +5,8 @@ export const IMPORT_SERIALIZED_IMPORTING_TABLE_DATA = 'importing-table-data-'
 export const EXPORT_SERIALIZED_EXPORTING = 'exporting'
 export const EXPORT_SERIALIZED_EXPORTING_TABLE = 'exporting-table-'
 export const EXPORT_WORKSPACE_CREATE_ARCHIVE = 'create-archive'
+export const IMPORT_WORKSPACE_EXTRACTING_FILES = 'extracting-files'
+export const IMPORT_WORKSPACE_VERIFYING_FILES = 'verifying-files'
 export const WORKSPACE_EXPORT_MANIFEST_FILENAME = 'manifest.json'
 export const WORKSPACE_EXPORT_MANIFEST_CANDIDATES = [
   WORKSPACE_EXPORT_MANIFEST_FILENAME,